@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — audit queries over 1M records.
+
+Fills an ``AuditLogger`` with RECORDS records spread over AGENTS agents and
+compares the indexed logger with a linear scan of the same records through
+``apply_filter`` (the previous implementation). Reports:
+
+- ``query_agent_limit_10`` — one agent's first 10 records, with
+  ``total_matched``;
+- ``query_agent_outcome_since`` — one agent's denials in the newest tenth of
+  the log;
+- ``latest_10``;
+- ``linear_agent_limit_10`` — the same query as the first, by linear scan;
+- ``page_all`` and ``page_peak_bytes`` — the time to read every record
+  through ``iter_query``, and the tracemalloc peak of a second pass.
+
+Usage::
+
+    python bench_audit_query.py > results/audit_query.json
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from bench import to_scenario_result
+
+from aumos_governance import AuditConfig, AuditLogger
+from aumos_governance.audit.query import AuditFilter, apply_filter
+from aumos_governance.audit.record import GovernanceDecisionContext
+from aumos_governance.types import GovernanceOutcome
+
+RECORDS = 1_000_000
+AGENTS = 1_000
+ITERATIONS = 1_000
+LINEAR_ITERATIONS = 3
+
+
+def _fill() -> tuple[AuditLogger, float]:
+    logger = AuditLogger(AuditConfig(max_records=RECORDS))
+    contexts = [
+        GovernanceDecisionContext(agent_id=f"agent-{i}", action_type="tool_call")
+        for i in range(AGENTS)
+    ]
+    outcomes = (GovernanceOutcome.ALLOW, GovernanceOutcome.DENY)
+    started = time.perf_counter()
+    logger.log_many(
+        (outcomes[i % 7 == 0], "decision", None, contexts[i % AGENTS])
+        for i in range(RECORDS)
+    )
+    return logger, time.perf_counter() - started
+
+
+def main() -> None:
+    gc.collect()
+    logger, fill_seconds = _fill()
+    records = logger.query().records
+    recent = records[-RECORDS // 10].timestamp
+    by_agent = AuditFilter(agent_id="agent-7", limit=10)
+    by_agent_outcome = AuditFilter(
+        agent_id="agent-7", outcome=GovernanceOutcome.DENY, since=recent
+    )
+
+    scenarios = [
+        to_scenario_result("query_agent_limit_10", ITERATIONS, lambda: logger.query(by_agent)),
+        to_scenario_result(
+            "query_agent_outcome_since", ITERATIONS, lambda: logger.query(by_agent_outcome)
+        ),
+        to_scenario_result("latest_10", ITERATIONS, lambda: logger.latest(10)),
+        to_scenario_result(
+            "linear_agent_limit_10",
+            LINEAR_ITERATIONS,
+            lambda records=records: apply_filter(records, by_agent),
+        ),
+    ]
+    del records
+
+    gc.collect()
+    started = time.perf_counter()
+    paged = sum(1 for _ in logger.iter_query())
+    page_seconds = time.perf_counter() - started
+    tracemalloc.start()
+    sum(1 for _ in logger.iter_query())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    json.dump(
+        {
+            "records": RECORDS,
+            "fill_seconds": fill_seconds,
+            "page_all": {"records": paged, "seconds": page_seconds},
+            "page_peak_bytes": peak,
+            "scenarios": [s.to_dict() for s in scenarios],
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — audit log spilled to disk segments.
+
+Logs RECORDS records through an ``AuditLogger`` that keeps MAX_RECORDS in
+memory and spills the rest to segment files in a temporary directory. Most
+records belong to AGENTS agents; one agent, ``agent-rare``, appears only in
+the last RARE records. Reports:
+
+- ``fill_seconds``, ``max_rss_bytes`` (peak resident memory of the
+  process), ``disk_bytes`` and ``segments``;
+- ``query_recent_since`` — records from the newest 1% of the log, which
+  skips every older segment by its timestamp range;
+- ``query_rare_agent`` — ``agent-rare``'s records, which skips segments whose
+  bloom filter rules the agent out;
+- ``query_agent_limit_10`` — the first 10 records of a common agent, with
+  ``total_matched`` (reads every segment);
+- ``latest_10``.
+
+Usage::
+
+    python bench_audit_spill.py > results/audit_spill.json
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from bench import to_scenario_result
+
+from aumos_governance import AuditConfig, AuditLogger, AuditSpillConfig
+from aumos_governance.audit.query import AuditFilter
+from aumos_governance.audit.record import GovernanceDecisionContext
+from aumos_governance.types import GovernanceOutcome
+
+RECORDS = 1_000_000
+MAX_RECORDS = 10_000
+AGENTS = 1_000
+RARE = 2_000
+SEGMENT_BYTES = 16 * 1024 * 1024
+ITERATIONS = 3
+
+
+def _fill(directory: str) -> tuple[AuditLogger, float]:
+    logger = AuditLogger(
+        AuditConfig(
+            max_records=MAX_RECORDS,
+            spill=AuditSpillConfig(directory=directory, segment_max_bytes=SEGMENT_BYTES),
+        )
+    )
+    contexts = [
+        GovernanceDecisionContext(agent_id=f"agent-{i}", action_type="tool_call")
+        for i in range(AGENTS)
+    ]
+    rare = GovernanceDecisionContext(agent_id="agent-rare", action_type="tool_call")
+    outcomes = (GovernanceOutcome.ALLOW, GovernanceOutcome.DENY)
+    started = time.perf_counter()
+    for batch in range(0, RECORDS, MAX_RECORDS):
+        logger.log_many(
+            (
+                outcomes[i % 7 == 0],
+                "decision",
+                None,
+                rare if i >= RECORDS - RARE and i % 2 else contexts[i % AGENTS],
+            )
+            for i in range(batch, min(batch + MAX_RECORDS, RECORDS))
+        )
+    return logger, time.perf_counter() - started
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        logger, fill_seconds = _fill(directory)
+        names = os.listdir(directory)
+        disk_bytes = sum(os.path.getsize(os.path.join(directory, name)) for name in names)
+        segments = sum(name.endswith(".jsonl") for name in names)
+
+        recent = logger.latest(RECORDS // 100)[0].timestamp
+        scenarios = [
+            to_scenario_result(
+                "query_recent_since",
+                ITERATIONS,
+                lambda: logger.query(AuditFilter(since=recent, limit=10)),
+            ),
+            to_scenario_result(
+                "query_rare_agent",
+                ITERATIONS,
+                lambda: logger.query(AuditFilter(agent_id="agent-rare", limit=10)),
+            ),
+            to_scenario_result(
+                "query_agent_limit_10",
+                ITERATIONS,
+                lambda: logger.query(AuditFilter(agent_id="agent-7", limit=10)),
+            ),
+            to_scenario_result("latest_10", ITERATIONS, lambda: logger.latest(10)),
+        ]
+        logger.close()
+    # ru_maxrss is reported in kilobytes on Linux.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    json.dump(
+        {
+            "records": RECORDS,
+            "max_records": MAX_RECORDS,
+            "fill_seconds": fill_seconds,
+            "max_rss_bytes": max_rss,
+            "disk_bytes": disk_bytes,
+            "segments": segments,
+            "scenarios": [s.to_dict() for s in scenarios],
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — audit outcome statistics over 1M records.
+
+Fills an ``AuditLogger`` with RECORDS records from AGENTS agents and compares
+what a dashboard poll costs:
+
+- ``aggregate_outcomes`` — ``aggregate_outcomes(logger.query().records)``,
+  walking every record;
+- ``stats`` — ``AuditLogger.stats()``, read from counters maintained on
+  append and eviction (the per-agent breakdown grows with AGENTS, not with
+  RECORDS);
+- ``stats_window_15`` — ``stats(window_minutes=15)``, adding the sliding
+  window denial rate.
+
+It also reports ``log_many_seconds`` for the fill, which includes keeping the
+counters up to date.
+
+Usage::
+
+    python bench_audit_stats.py > results/audit_stats.json
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+
+from bench import to_scenario_result
+
+from aumos_governance import AuditConfig, AuditLogger
+from aumos_governance.audit.query import aggregate_outcomes
+from aumos_governance.audit.record import GovernanceDecisionContext
+from aumos_governance.types import GovernanceOutcome
+
+RECORDS = 1_000_000
+AGENTS = 100
+ITERATIONS = 1_000
+WALK_ITERATIONS = 3
+
+
+def main() -> None:
+    logger = AuditLogger(AuditConfig(max_records=RECORDS))
+    contexts = [
+        GovernanceDecisionContext(agent_id=f"agent-{i}", action_type="tool_call")
+        for i in range(AGENTS)
+    ]
+    outcomes = (GovernanceOutcome.ALLOW, GovernanceOutcome.DENY)
+    started = time.perf_counter()
+    logger.log_many(
+        (outcomes[i % 7 == 0], "decision", None, contexts[i % AGENTS]) for i in range(RECORDS)
+    )
+    log_many_seconds = time.perf_counter() - started
+
+    scenarios = [
+        to_scenario_result(
+            "aggregate_outcomes",
+            WALK_ITERATIONS,
+            lambda: aggregate_outcomes(logger.query().records),
+        ),
+        to_scenario_result("stats", ITERATIONS, logger.stats),
+        to_scenario_result("stats_window_15", ITERATIONS, lambda: logger.stats(window_minutes=15)),
+    ]
+    json.dump(
+        {
+            "records": RECORDS,
+            "log_many_seconds": log_many_seconds,
+            "scenarios": [s.to_dict() for s in scenarios],
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — budget period reset checks.
+
+Compares the per-call reset test the manager used to run
+(``should_reset``, which recomputes the next reset date) with the
+precomputed ``next_reset_at`` comparison now on the hot path, times
+``check_budget`` and ``record_spending``, and reports how long the
+background scheduler takes to reset many categories at one period
+boundary.
+
+Usage::
+
+    python bench_budget_resets.py > results/budget_resets.json
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+
+from bench import ScenarioResult, to_scenario_result
+
+from aumos_governance import BudgetConfig, BudgetManager, ResetSchedulerConfig
+from aumos_governance.budget import should_reset
+
+ITERATIONS = 50_000
+SCHEDULED_CATEGORIES = 10_000
+
+
+def _manager() -> BudgetManager:
+    manager = BudgetManager()
+    manager.create_budget("llm", limit=1e12, period="monthly")
+    return manager
+
+
+def bench_should_reset() -> ScenarioResult:
+    envelope = _manager()._tracker.get("llm")
+    assert envelope is not None
+
+    def run() -> None:
+        should_reset(envelope.period, envelope.last_reset)
+
+    return to_scenario_result("should_reset", ITERATIONS, run)
+
+
+def bench_deadline_check() -> ScenarioResult:
+    envelope = _manager()._tracker.get("llm")
+    assert envelope is not None
+
+    def run() -> None:
+        _ = time.time() >= envelope.next_reset_at
+
+    return to_scenario_result("next_reset_at_check", ITERATIONS, run)
+
+
+def bench_check_budget() -> ScenarioResult:
+    manager = _manager()
+
+    def run() -> None:
+        manager.check_budget("llm", 1.0)
+
+    return to_scenario_result("check_budget", ITERATIONS, run)
+
+
+def bench_record_spending() -> ScenarioResult:
+    manager = _manager()
+
+    def run() -> None:
+        manager.record_spending("llm", 0.01)
+
+    return to_scenario_result("record_spending", ITERATIONS, run)
+
+
+def measure_scheduled_resets() -> dict[str, object]:
+    """Return the wall-clock time to reset every category at one boundary."""
+    manager = BudgetManager(
+        BudgetConfig(reset_scheduler=ResetSchedulerConfig(enabled=True, tick_seconds=3600))
+    )
+    for i in range(SCHEDULED_CATEGORIES):
+        manager.create_budget(f"daily-{i}", limit=100.0, period="daily")
+        manager.record_spending(f"daily-{i}", 1.0)
+    envelope = manager._tracker.get("daily-0")
+    assert envelope is not None and manager._scheduler is not None
+    started = time.perf_counter_ns()
+    reset = manager._scheduler.run_pending(now=envelope.next_reset_at + 1)
+    elapsed_ns = time.perf_counter_ns() - started
+    manager.close()
+    return {
+        "categories": SCHEDULED_CATEGORIES,
+        "reset": reset,
+        "total_ms": round(elapsed_ns / 1e6, 2),
+        "per_category_ns": elapsed_ns // max(reset, 1),
+    }
+
+
+def main() -> None:
+    scenarios = [
+        bench_should_reset(),
+        bench_deadline_check(),
+        bench_check_budget(),
+        bench_record_spending(),
+    ]
+    json.dump(
+        {
+            "scenarios": [s.to_dict() for s in scenarios],
+            "scheduled_resets": measure_scheduled_resets(),
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
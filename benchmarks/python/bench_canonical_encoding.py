@@ -0,0 +1,192 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — canonical record encoding for hash chains.
+
+Builds RECORDS records in each hash-chained log and reports append and verify
+throughput next to the ``json.dumps`` reference encoding the logs used before:
+
+- ``HashChainedAuditLog`` (aumos-governance): ``append``, ``verify_chain``,
+  and record hashing against hashing the same fields with ``json.dumps`` of
+  a dict;
+- ``HashChain`` (agent-audit-trail): ``append`` and ``verify`` against
+  ``json.dumps`` of the pending dict, and of ``model_dump`` during
+  verification.
+
+Before timing, every record's canonical encoding is checked byte for byte
+against the reference, and the run fails on any difference. ``orjson`` in
+the output says whether the optional accelerator was installed.
+
+Usage::
+
+    python bench_canonical_encoding.py > results/canonical_encoding.json
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+import time
+from collections.abc import Callable
+
+from audit_trail.canonical import canonical_json, encode_record, orjson
+from audit_trail.chain import HashChain
+from audit_trail.record import build_pending_record, finalise_record
+from audit_trail.types import AuditRecord, GovernanceDecisionInput
+from aumos_governance import ChainedAuditRecord, HashChainedAuditLog
+
+RECORDS = 100_000
+AGENTS = 1_000
+
+
+def _per_sec(fn: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    fn()
+    return RECORDS / (time.perf_counter() - started)
+
+
+def _reference_json(value: object) -> str:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def _reference_pending(record: AuditRecord) -> dict[str, object]:
+    dumped = record.model_dump(mode="json", exclude={"record_hash"})
+    return {k: v for k, v in dumped.items() if v is not None}
+
+
+def _sha256(canonical: str, previous_hash: str) -> str:
+    return hashlib.sha256((canonical + "\n" + previous_hash).encode("utf-8")).hexdigest()
+
+
+def _reference_record_hash(record: ChainedAuditRecord) -> str:
+    fields = {
+        "record_id": record.record_id,
+        "timestamp": record.timestamp,
+        "agent_id": record.agent_id,
+        "action": record.action,
+        "decision": record.decision,
+        "details": record.details,
+        "previous_hash": record.previous_hash,
+    }
+    serialised = json.dumps(fields, separators=(",", ":"), sort_keys=False)
+    return hashlib.sha256(serialised.encode("utf-8")).hexdigest()
+
+
+def _governance() -> dict[str, float]:
+    log = HashChainedAuditLog(max_size=RECORDS)
+    details = [{"sequence": i, "tool": "search", "cost": i * 0.25} for i in range(RECORDS)]
+
+    def append() -> None:
+        for i in range(RECORDS):
+            log.append(f"agent-{i % AGENTS}", "tool_call", "allow", details[i])
+
+    append_per_sec = _per_sec(append)
+    records = list(log._chain)
+    for record in records:
+        if _reference_record_hash(record) != record.record_hash:
+            raise RuntimeError(f"record {record.record_id} differs from json.dumps")
+
+    def hashes() -> None:
+        compute = HashChainedAuditLog._compute_record_hash
+        for record in records:
+            compute(
+                record_id=record.record_id,
+                timestamp=record.timestamp,
+                agent_id=record.agent_id,
+                action=record.action,
+                decision=record.decision,
+                details=record.details,
+                previous_hash=record.previous_hash,
+            )
+
+    def reference_hashes() -> None:
+        for record in records:
+            _reference_record_hash(record)
+
+    def verify() -> None:
+        valid, error = log.verify_chain()
+        if not valid:
+            raise RuntimeError(error)
+
+    return {
+        "append_per_sec": append_per_sec,
+        "verify_per_sec": _per_sec(verify),
+        "record_hashes_per_sec": _per_sec(hashes),
+        "reference_hashes_per_sec": _per_sec(reference_hashes),
+    }
+
+
+def _audit_trail() -> dict[str, float]:
+    decisions = [
+        GovernanceDecisionInput(
+            agent_id=f"agent-{i % AGENTS}",
+            action="tool_call",
+            permitted=i % 10 != 0,
+            trust_level=2,
+            budget_used=i * 0.25,
+            reason="within budget",
+            metadata={"sequence": i, "tool": "search"},
+        )
+        for i in range(RECORDS)
+    ]
+    pendings = [build_pending_record(d, "0" * 64) for d in decisions]
+    chain = HashChain()
+    records: list[AuditRecord] = []
+
+    def append() -> None:
+        for decision in decisions:
+            records.append(chain.append(build_pending_record(decision, chain.last_hash())))
+
+    def reference_append() -> None:
+        previous_hash = "0" * 64
+        for decision in decisions:
+            pending = build_pending_record(decision, previous_hash)
+            previous_hash = _sha256(_reference_json(pending), previous_hash)
+            finalise_record(pending, previous_hash)
+
+    def verify() -> None:
+        result = chain.verify(records)
+        if not result.valid:
+            raise RuntimeError(result)
+
+    def reference_verify() -> None:
+        for record in records:
+            expected = _sha256(
+                _reference_json(_reference_pending(record)), record.previous_hash
+            )
+            if expected != record.record_hash:
+                raise RuntimeError(f"record {record.id} failed reference verification")
+
+    append_per_sec = _per_sec(append)
+    for pending, record in zip(pendings, records):
+        if canonical_json(pending) != _reference_json(pending):
+            raise RuntimeError(f"pending {pending['id']} differs from json.dumps")
+        if encode_record(record) != _reference_json(_reference_pending(record)):
+            raise RuntimeError(f"record {record.id} differs from model_dump")
+
+    return {
+        "append_per_sec": append_per_sec,
+        "reference_append_per_sec": _per_sec(reference_append),
+        "verify_per_sec": _per_sec(verify),
+        "reference_verify_per_sec": _per_sec(reference_verify),
+    }
+
+
+def main() -> None:
+    json.dump(
+        {
+            "records": RECORDS,
+            "orjson": orjson is not None,
+            "aumos_governance": _governance(),
+            "audit_trail": _audit_trail(),
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
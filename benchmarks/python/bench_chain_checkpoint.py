@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — checkpointed hash-chain verification.
+
+Builds a ``HashChainedAuditLog`` of RECORDS records, verifies it once to
+obtain a signed checkpoint, appends NEW records and compares:
+
+- ``verify_full`` — ``verify_chain()`` over every retained record;
+- ``verify_since_checkpoint`` — ``verify_chain(since=checkpoint)``, which
+  hashes only the NEW records;
+- ``checkpoint_store_round_trip`` — saving the checkpoint to a
+  ``CheckpointStore`` and reading it back.
+
+Usage::
+
+    python bench_chain_checkpoint.py > results/chain_checkpoint.json
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench import to_scenario_result
+
+from aumos_governance import CheckpointStore, HashChainedAuditLog
+
+RECORDS = 1_000_000
+NEW = 1_000
+AGENTS = 1_000
+ITERATIONS = 3
+STORE_ITERATIONS = 100
+
+
+def _verified(valid: bool, error: str | None) -> None:
+    if not valid:
+        raise RuntimeError(error)
+
+
+def main() -> None:
+    log = HashChainedAuditLog(max_size=RECORDS + NEW, checkpoint_key=b"bench-key")
+    started = time.perf_counter()
+    for i in range(RECORDS):
+        log.append(f"agent-{i % AGENTS}", "tool_call", "allow", {"sequence": i})
+    build_seconds = time.perf_counter() - started
+
+    _verified(*log.verify_chain())
+    checkpoint = log.last_checkpoint
+    for i in range(NEW):
+        log.append(f"agent-{i % AGENTS}", "tool_call", "allow", {"sequence": RECORDS + i})
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = CheckpointStore(Path(directory) / "checkpoints.jsonl")
+
+        def round_trip() -> None:
+            if checkpoint is not None:
+                store.save(checkpoint)
+            store.latest()
+
+        scenarios = [
+            to_scenario_result(
+                "verify_full", ITERATIONS, lambda: _verified(*log.verify_chain())
+            ),
+            to_scenario_result(
+                "verify_since_checkpoint",
+                ITERATIONS,
+                lambda: _verified(*log.verify_chain(since=checkpoint)),
+            ),
+            to_scenario_result("checkpoint_store_round_trip", STORE_ITERATIONS, round_trip),
+        ]
+
+    json.dump(
+        {
+            "records": RECORDS,
+            "new_records": NEW,
+            "build_seconds": build_seconds,
+            "scenarios": [s.to_dict() for s in scenarios],
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — parallel hash-chain verification.
+
+Builds a ``HashChainedAuditLog`` of RECORDS records and times
+``verify_chain`` with 1, 2, 4, ... worker processes up to the number of
+CPUs. Reports ``build_seconds`` and, per worker count, the mean time and the
+speedup over a single worker. Every run must report the chain as valid.
+
+RECORDS defaults to 1M; set it to 10_000_000 for the full-size chain, which
+needs several GB of memory.
+
+Usage::
+
+    python bench_chain_verify.py > results/chain_verify.json
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+
+from bench import to_scenario_result
+
+from aumos_governance import HashChainedAuditLog
+
+RECORDS = 1_000_000
+AGENTS = 1_000
+CHUNK_SIZE = 10_000
+ITERATIONS = 3
+
+
+def _worker_counts() -> list[int]:
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def _verify(log: HashChainedAuditLog, workers: int) -> None:
+    valid, error = log.verify_chain(workers=workers, chunk_size=CHUNK_SIZE)
+    if not valid:
+        raise RuntimeError(error)
+
+
+def main() -> None:
+    log = HashChainedAuditLog(max_size=RECORDS)
+    started = time.perf_counter()
+    for i in range(RECORDS):
+        log.append(f"agent-{i % AGENTS}", "tool_call", "allow", {"sequence": i})
+    build_seconds = time.perf_counter() - started
+
+    scenarios = [
+        to_scenario_result(
+            f"verify_chain_workers_{workers}",
+            ITERATIONS,
+            lambda workers=workers: _verify(log, workers),
+        )
+        for workers in _worker_counts()
+    ]
+    serial_ns = scenarios[0].mean_ns
+    speedup = {s.name: serial_ns / s.mean_ns for s in scenarios if s.mean_ns > 0}
+
+    json.dump(
+        {
+            "records": RECORDS,
+            "chunk_size": CHUNK_SIZE,
+            "cpus": os.cpu_count(),
+            "build_seconds": build_seconds,
+            "speedup": speedup,
+            "scenarios": [s.to_dict() for s in scenarios],
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
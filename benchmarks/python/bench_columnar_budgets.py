@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — budgets with 100k categories.
+
+Creates CATEGORIES budget categories, charges CHARGED of them once, and
+compares the default ``CategoryTracker`` (one envelope object per category)
+with ``ColumnarCategoryTracker`` (NumPy columns, envelope views only for
+categories that are used). Reports, for each tracker:
+
+- ``retained_bytes`` — tracemalloc memory held after setup;
+- ``summary``, ``utilizations`` and ``top_k_by_utilization(20)`` timings
+  using the shared harness in ``bench.py``;
+- ``record_spending_many`` for BATCH transactions spread over the charged
+  categories.
+
+Requires NumPy (``pip install 'aumos-governance[columnar]'``).
+
+Usage::
+
+    python bench_columnar_budgets.py > results/columnar_budgets.json
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import tracemalloc
+
+from bench import ScenarioResult, to_scenario_result
+
+from aumos_governance import BudgetManager
+from aumos_governance.budget.columnar import ColumnarCategoryTracker
+
+CATEGORIES = 100_000
+CHARGED = 1_000
+BATCH = 1_000
+DASHBOARD_ITERATIONS = 10
+
+
+def _build(columnar: bool) -> BudgetManager:
+    manager = BudgetManager(tracker=ColumnarCategoryTracker() if columnar else None)
+    for i in range(CATEGORIES):
+        manager.create_budget(f"tenant-{i}:model", limit=100.0, period="monthly")
+    for i in range(CHARGED):
+        manager.record_spending(f"tenant-{i * (CATEGORIES // CHARGED)}:model", 1.0 + i % 50)
+    return manager
+
+
+def measure(columnar: bool) -> tuple[dict[str, object], list[ScenarioResult]]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    manager = _build(columnar)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    label = "columnar" if columnar else "default"
+    charged = [f"tenant-{i * (CATEGORIES // CHARGED)}:model" for i in range(CHARGED)]
+    batch = [charged[i % CHARGED] for i in range(BATCH)]
+    amounts = [0.001] * BATCH
+    scenarios = [
+        to_scenario_result(f"summary_{label}", DASHBOARD_ITERATIONS, manager.summary),
+        to_scenario_result(f"utilizations_{label}", DASHBOARD_ITERATIONS, manager.utilizations),
+        to_scenario_result(
+            f"top_k_by_utilization_{label}",
+            DASHBOARD_ITERATIONS,
+            lambda: manager.top_k_by_utilization(20),
+        ),
+        to_scenario_result(
+            f"record_spending_many_{label}",
+            DASHBOARD_ITERATIONS,
+            lambda: manager.record_spending_many(batch, amounts),
+        ),
+    ]
+    return {"tracker": label, "categories": CATEGORIES, "retained_bytes": retained}, scenarios
+
+
+def main() -> None:
+    memory: list[dict[str, object]] = []
+    scenarios: list[ScenarioResult] = []
+    for columnar in (False, True):
+        footprint, results = measure(columnar)
+        memory.append(footprint)
+        scenarios += results
+    json.dump(
+        {"scenarios": [s.to_dict() for s in scenarios], "memory": memory},
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — loading 1M consent grants.
+
+Builds GRANTS grants over AGENTS agents and reports, in seconds:
+
+- ``record_consent`` — RECORD_SAMPLE grants recorded one call at a time;
+- ``bulk_load`` — all grants through ``ConsentManager.bulk_load``;
+- ``export_snapshot`` — writing them to a binary snapshot, with its size;
+- ``load_snapshot`` — loading that snapshot into a new manager, and the
+  tracemalloc memory retained afterwards;
+- ``first_check`` / ``warm_check`` — a ``check_consent`` that decodes an
+  agent from the snapshot, and one for an agent already decoded.
+
+Usage::
+
+    python bench_consent_bulk.py > results/consent_bulk.json
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from aumos_governance.consent.manager import ConsentManager
+
+GRANTS = 1_000_000
+AGENTS = 100_000
+RECORD_SAMPLE = 100_000
+
+
+def _grants(count: int) -> list[dict[str, Any]]:
+    expires_at = datetime.now(tz=timezone.utc) + timedelta(days=30)
+    per_agent = GRANTS // AGENTS
+    return [
+        {
+            "agent_id": f"agent-{i // per_agent}",
+            "data_type": f"pii.field-{i % per_agent}",
+            "purpose": "support" if i % 3 == 0 else None,
+            "granted_by": "importer",
+            "expires_at": expires_at if i % 2 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def _seconds(action: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    action()
+    return round(time.perf_counter() - started, 3)
+
+
+def bench_import(path: Path) -> dict[str, Any]:
+    grants = _grants(GRANTS)
+    sequential = ConsentManager()
+    source = ConsentManager()
+    results: dict[str, Any] = {
+        "record_consent": {
+            "grants": RECORD_SAMPLE,
+            "seconds": _seconds(
+                lambda: [sequential.record_consent(**g) for g in grants[:RECORD_SAMPLE]]
+            ),
+        },
+        "bulk_load_seconds": _seconds(lambda: source.bulk_load(grants)),
+        "export_snapshot_seconds": _seconds(lambda: source.export_snapshot(path)),
+    }
+    results["snapshot_bytes"] = path.stat().st_size
+    return results
+
+
+def bench_load(path: Path) -> dict[str, Any]:
+    loaded = ConsentManager()
+    results: dict[str, Any] = {"load_snapshot_seconds": _seconds(lambda: loaded.load_snapshot(path))}
+
+    started = time.perf_counter_ns()
+    loaded.check_consent("agent-4242", "pii.field-3")
+    results["first_check_ns"] = time.perf_counter_ns() - started
+    started = time.perf_counter_ns()
+    loaded.check_consent("agent-4242", "pii.field-4")
+    results["warm_check_ns"] = time.perf_counter_ns() - started
+    results["active_after_load"] = loaded.count_active()
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    measured = ConsentManager()
+    measured.load_snapshot(path)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    results["load_snapshot_retained_bytes"] = sum(
+        stat.size_diff for stat in after.compare_to(before, "filename")
+    )
+    return results
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "consent.snap"
+        results = {"grants": GRANTS, "agents": AGENTS, **bench_import(path)}
+        gc.collect()
+        results.update(bench_load(path))
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — hierarchical consent lookups.
+
+Gives one agent GRANTS exact grants of the form ``"pii.<n>.field"`` plus
+the wildcard grants ``"pii.*"`` and ``"*"``, for each size in GRANT_COUNTS,
+and times ``ConsentStore.find`` for:
+
+- ``exact`` — a data type with its own grant;
+- ``wildcard`` — a data type covered only by ``"pii.*"``;
+- ``fallback`` — a data type covered only by ``"*"``;
+- ``purpose_wildcard`` — a grant matched through a ``"support.*"`` purpose.
+
+The lookup walks one trie node per data-type segment, so the timings should
+not grow with the number of grants.
+
+Usage::
+
+    python bench_consent_hierarchy.py > results/consent_hierarchy.json
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+
+from bench import ScenarioResult, to_scenario_result
+
+from aumos_governance.consent.store import ConsentRecord, ConsentStore
+
+GRANT_COUNTS = (10, 1_000, 10_000)
+ITERATIONS = 100_000
+
+
+def _store(grants: int) -> ConsentStore:
+    store = ConsentStore()
+    for n in range(grants):
+        store.put(ConsentRecord(agent_id="agent", data_type=f"pii.{n}.field", granted_by="bench"))
+    store.put(ConsentRecord(agent_id="agent", data_type="pii.*", granted_by="bench"))
+    store.put(ConsentRecord(agent_id="agent", data_type="*", granted_by="bench"))
+    store.put(ConsentRecord(
+        agent_id="agent", data_type="tickets.*", purpose="support.*", granted_by="bench"
+    ))
+    return store
+
+
+def main() -> None:
+    scenarios: list[ScenarioResult] = []
+    for grants in GRANT_COUNTS:
+        store = _store(grants)
+        lookups = {
+            "exact": ("pii.3.field", None),
+            "wildcard": ("pii.email.work", None),
+            "fallback": ("logs.access", None),
+            "purpose_wildcard": ("tickets.open", "support.billing"),
+        }
+        for name, (data_type, purpose) in lookups.items():
+            assert store.find("agent", data_type, purpose) is not None
+            scenarios.append(to_scenario_result(
+                f"find_{name}_{grants}",
+                ITERATIONS,
+                lambda store=store, data_type=data_type, purpose=purpose: store.find(
+                    "agent", data_type, purpose
+                ),
+            ))
+    json.dump({"scenarios": [s.to_dict() for s in scenarios]}, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — consent store with 1M grants.
+
+Fills a ``ConsentStore`` with GRANTS grants spread over AGENTS agents
+(GRANTS // AGENTS data types each); every other agent's grants expire in a
+day. Reports:
+
+- ``fill_seconds`` and ``retained_bytes`` — time and tracemalloc memory to
+  store every grant;
+- ``put``, ``find``, ``list_for_agent``, ``count`` and
+  ``remove_all_for_agent`` timings, which depend on the number of grants of
+  one agent rather than on the size of the store;
+- ``purge_expired`` — the time to evict every expiring grant in one sweep,
+  run with ``now`` set past their expiry.
+
+Usage::
+
+    python bench_consent_index.py > results/consent_index.json
+"""
+
+from __future__ import annotations
+
+import gc
+import itertools
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from bench import to_scenario_result
+
+from aumos_governance.consent.store import ConsentRecord, ConsentStore
+
+GRANTS = 1_000_000
+AGENTS = 100_000
+ITERATIONS = 50_000
+
+DATA_TYPES = [f"data-{i}" for i in range(GRANTS // AGENTS)]
+
+
+def _fill() -> tuple[ConsentStore, float]:
+    expires_at = datetime.now(tz=timezone.utc) + timedelta(days=1)
+    store = ConsentStore()
+    started = time.perf_counter()
+    for agent in range(AGENTS):
+        agent_id = f"agent-{agent}"
+        for data_type in DATA_TYPES:
+            store.put(ConsentRecord(
+                agent_id=agent_id,
+                data_type=data_type,
+                granted_by="bench",
+                expires_at=expires_at if agent % 2 else None,
+            ))
+    return store, time.perf_counter() - started
+
+
+def main() -> None:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    store, fill_seconds = _fill()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    agents = itertools.cycle(f"agent-{i}" for i in range(0, AGENTS, 7))
+    removed = (f"agent-{i}" for i in itertools.count(0, 2))  # agents without expiry
+    record = ConsentRecord(agent_id="agent-0", data_type="extra", granted_by="bench")
+    scenarios = [
+        to_scenario_result("put", ITERATIONS, lambda: store.put(record)),
+        to_scenario_result(
+            "find", ITERATIONS, lambda: store.find(next(agents), "data-3", "support")
+        ),
+        to_scenario_result("list_for_agent", ITERATIONS, lambda: store.list_for_agent(next(agents))),
+        to_scenario_result("count", ITERATIONS, store.count),
+        to_scenario_result(
+            "remove_all_for_agent", ITERATIONS // 10, lambda: store.remove_all_for_agent(next(removed))
+        ),
+    ]
+
+    started = time.perf_counter()
+    evicted = store.purge_expired(datetime.now(tz=timezone.utc) + timedelta(days=2))
+    purge_seconds = time.perf_counter() - started
+
+    json.dump(
+        {
+            "scenarios": [s.to_dict() for s in scenarios],
+            "grants": GRANTS,
+            "agents": AGENTS,
+            "fill_seconds": round(fill_seconds, 2),
+            "retained_bytes": retained,
+            "purge_expired": {"evicted": evicted, "seconds": round(purge_seconds, 3)},
+            "remaining": store.count(),
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — per-decision overhead of the sync path.
+
+Compares three ways of obtaining a decision for the same action:
+
+- ``asyncio_run``       — ``asyncio.run(engine.evaluate(action))``, the
+                          pattern ``evaluate_sync`` used to follow.
+- ``thread_loop``       — a one-shot ``ThreadPoolExecutor`` running a fresh
+                          event loop, the old fallback inside a running loop.
+- ``evaluate_sync``     — the native synchronous evaluation core.
+
+Also reports ``checks_only``: the trust, budget and consent checks called
+directly, which is the floor the engine overhead should approach.
+
+Usage::
+
+    python bench_engine_sync.py > results/engine_sync.json
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import json
+import sys
+
+from bench import ScenarioResult, to_scenario_result
+
+from aumos_governance import GovernanceAction, GovernanceEngine, TrustLevel
+
+ITERATIONS = 20_000
+
+
+def _build_engine() -> tuple[GovernanceEngine, GovernanceAction]:
+    engine = GovernanceEngine()
+    engine.trust.set_level("bench-agent", TrustLevel.L3_ACT_APPROVE)
+    engine.budget.create_budget("llm", limit=1_000_000.0, period="monthly")
+    engine.consent.record_consent(
+        "bench-agent", "user_data", purpose="support", granted_by="bench"
+    )
+    action = GovernanceAction(
+        agent_id="bench-agent",
+        required_trust_level=TrustLevel.L2_SUGGEST,
+        budget_category="llm",
+        budget_amount=0.01,
+        data_type="user_data",
+        purpose="support",
+        action_type="tool_call",
+    )
+    return engine, action
+
+
+def bench_checks_only() -> ScenarioResult:
+    engine, action = _build_engine()
+
+    def run() -> None:
+        engine.trust.check_level("bench-agent", TrustLevel.L2_SUGGEST)
+        engine.budget.check_budget("llm", 0.01)
+        engine.consent.check_consent("bench-agent", "user_data", "support")
+
+    return to_scenario_result("checks_only", ITERATIONS, run)
+
+
+def bench_asyncio_run() -> ScenarioResult:
+    engine, action = _build_engine()
+
+    def run() -> None:
+        asyncio.run(engine.evaluate(action))
+
+    return to_scenario_result("asyncio_run", ITERATIONS // 10, run)
+
+
+def bench_thread_loop() -> ScenarioResult:
+    engine, action = _build_engine()
+
+    def run() -> None:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(asyncio.run, engine.evaluate(action)).result()
+
+    return to_scenario_result("thread_loop", ITERATIONS // 10, run)
+
+
+def bench_evaluate_sync() -> ScenarioResult:
+    engine, action = _build_engine()
+
+    def run() -> None:
+        engine.evaluate_sync(action)
+
+    return to_scenario_result("evaluate_sync", ITERATIONS, run)
+
+
+def main() -> None:
+    scenarios = [
+        bench_checks_only(),
+        bench_asyncio_run(),
+        bench_thread_loop(),
+        bench_evaluate_sync(),
+    ]
+    json.dump({"scenarios": [s.to_dict() for s in scenarios]}, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
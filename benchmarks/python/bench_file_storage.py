@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — audit-trail FileStorage group commit.
+
+Logs RECORDS decisions through ``AuditLogger`` into a ``FileStorage`` from
+1, 16 and 256 concurrent tasks and reports decisions per second for each
+durability policy (``never``, ``batch``, ``interval``), next to the previous
+behaviour of opening the file with aiofiles for every record.
+
+Usage::
+
+    python bench_file_storage.py > results/file_storage.json
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import aiofiles
+from audit_trail import AuditLogger, FileStorage, GovernanceDecisionInput
+from audit_trail.types import AuditRecord
+
+RECORDS = 20_000
+CONCURRENCY = (1, 16, 256)
+SYNC_INTERVAL_MS = 10.0
+
+
+class _OpenPerAppendStorage(FileStorage):
+    """FileStorage.append as it was: one aiofiles open and write per record."""
+
+    async def append(self, record: AuditRecord) -> None:
+        line = json.dumps(record.model_dump(mode="json", exclude_none=False)) + "\n"
+        async with aiofiles.open(self._file_path, mode="a", encoding="utf-8") as handle:
+            await handle.write(line)
+
+
+async def _log_all(storage: FileStorage, tasks: int) -> float:
+    logger = AuditLogger(storage=storage)
+    decision = GovernanceDecisionInput(agent_id="agent-1", action="tool_call", permitted=True)
+
+    async def worker() -> None:
+        for _ in range(RECORDS // tasks):
+            await logger.log(decision)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(tasks)))
+    await storage.close()
+    return (RECORDS // tasks) * tasks / (time.perf_counter() - started)
+
+
+def main() -> None:
+    results: dict[str, dict[int, float]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        storages = {
+            "open_per_append": lambda path: _OpenPerAppendStorage(path),
+            "never": lambda path: FileStorage(path, durability="never"),
+            "batch": lambda path: FileStorage(path, durability="batch"),
+            "interval": lambda path: FileStorage(
+                path, durability="interval", sync_interval_ms=SYNC_INTERVAL_MS
+            ),
+        }
+        for name, make in storages.items():
+            results[name] = {}
+            for tasks in CONCURRENCY:
+                path = Path(directory) / f"{name}-{tasks}.ndjson"
+                results[name][tasks] = asyncio.run(_log_all(make(path), tasks))
+
+    json.dump(
+        {
+            "records": RECORDS,
+            "sync_interval_ms": SYNC_INTERVAL_MS,
+            "decisions_per_sec": results,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
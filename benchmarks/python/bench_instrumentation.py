@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — cost of latency instrumentation.
+
+With instrumentation disabled no timing wrappers are installed; the only
+code left on the decision path is the stage loop's check of one boolean
+attribute per applicable stage. This script reports:
+
+- ``evaluate_sync`` and ``evaluate_lean`` with instrumentation disabled and
+  enabled, using the shared harness in ``bench.py``;
+- ``disabled_overhead`` — the measured cost of the per-stage attribute
+  checks, as nanoseconds and as a percentage of a disabled decision;
+- ``enabled_overhead`` — the percentage by which enabled instrumentation
+  slows each entry point.
+
+Usage::
+
+    python bench_instrumentation.py > results/instrumentation.json
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+
+from bench import ScenarioResult, to_scenario_result
+
+from aumos_governance import (
+    AuditConfig,
+    GovernanceAction,
+    GovernanceConfig,
+    GovernanceEngine,
+    InstrumentationConfig,
+    TrustLevel,
+)
+
+ITERATIONS = 20_000
+FLAG_CHECK_ROUNDS = 1_000_000
+
+
+def _build_engine(enabled: bool) -> tuple[GovernanceEngine, GovernanceAction]:
+    engine = GovernanceEngine(
+        GovernanceConfig(
+            audit=AuditConfig(max_records=1_000_000),
+            instrumentation=InstrumentationConfig(enabled=enabled),
+        )
+    )
+    engine.trust.set_level("bench-agent", TrustLevel.L3_ACT_APPROVE)
+    engine.budget.create_budget("llm", limit=1_000_000.0, period="monthly")
+    engine.consent.record_consent(
+        "bench-agent", "user_data", purpose="support", granted_by="bench"
+    )
+    action = GovernanceAction(
+        agent_id="bench-agent",
+        required_trust_level=TrustLevel.L2_SUGGEST,
+        budget_category="llm",
+        budget_amount=0.01,
+        data_type="user_data",
+        purpose="support",
+        action_type="tool_call",
+    )
+    return engine, action
+
+
+def bench_entry_point(method: str, enabled: bool) -> ScenarioResult:
+    engine, action = _build_engine(enabled)
+    evaluate = getattr(engine, method)
+
+    def run() -> None:
+        evaluate(action)
+
+    label = "enabled" if enabled else "disabled"
+    return to_scenario_result(f"{method}_{label}", ITERATIONS, run)
+
+
+def measure_flag_checks(engine: GovernanceEngine, stages: int) -> float:
+    """Return the nanoseconds spent on ``stages`` checks of the stage-timing flag."""
+    started = time.perf_counter_ns()
+    for _ in range(FLAG_CHECK_ROUNDS):
+        for _ in range(stages):
+            if engine._time_stages:  # noqa: SLF001 — the flag under measurement
+                pass
+    with_checks = time.perf_counter_ns() - started
+
+    started = time.perf_counter_ns()
+    for _ in range(FLAG_CHECK_ROUNDS):
+        for _ in range(stages):
+            pass
+    empty = time.perf_counter_ns() - started
+    return max(with_checks - empty, 0) / FLAG_CHECK_ROUNDS
+
+
+def _overhead_pct(base: ScenarioResult, other: ScenarioResult) -> float:
+    return round((other.mean_ns - base.mean_ns) / base.mean_ns * 100, 2)
+
+
+def main() -> None:
+    scenarios: list[ScenarioResult] = []
+    enabled_overhead: dict[str, float] = {}
+    for method in ("evaluate_sync", "evaluate_lean"):
+        disabled = bench_entry_point(method, enabled=False)
+        enabled = bench_entry_point(method, enabled=True)
+        scenarios += [disabled, enabled]
+        enabled_overhead[method] = _overhead_pct(disabled, enabled)
+
+    engine, _ = _build_engine(enabled=False)
+    check_ns = measure_flag_checks(engine, stages=len(engine.stage_names()))
+    decision_ns = scenarios[0].mean_ns
+    json.dump(
+        {
+            "scenarios": [s.to_dict() for s in scenarios],
+            "disabled_overhead": {
+                "flag_checks_ns": round(check_ns, 2),
+                "pct_of_evaluate_sync": round(check_ns / decision_ns * 100, 3),
+            },
+            "enabled_overhead_pct": enabled_overhead,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — memory per decision, eager vs lean.
+
+Compares ``evaluate_sync``, which builds a Pydantic result for every check,
+a ``GovernanceDecisionContext``, an ``AuditRecord`` and a
+``GovernanceDecision``, with ``evaluate_lean``, which builds slotted objects
+and defers reason text and audit models until they are read.
+
+For each path, tracemalloc reports per decision:
+
+- ``retained_bytes`` / ``retained_blocks`` — memory still held after the
+  decision, i.e. the decision object plus its audit log entry.
+- ``peak_bytes`` — the high-water mark of a single evaluation, including
+  temporaries that are freed before it returns.
+
+Timing scenarios use the shared harness in ``bench.py``.
+
+Usage::
+
+    python bench_lean_decisions.py > results/lean_decisions.json
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Callable
+
+from bench import ScenarioResult, to_scenario_result
+
+from aumos_governance import (
+    AuditConfig,
+    GovernanceAction,
+    GovernanceConfig,
+    GovernanceEngine,
+    TrustLevel,
+)
+
+ITERATIONS = 20_000
+ALLOCATION_SAMPLES = 5_000
+
+
+def _build_engine() -> tuple[GovernanceEngine, GovernanceAction]:
+    engine = GovernanceEngine(GovernanceConfig(audit=AuditConfig(max_records=1_000_000)))
+    engine.trust.set_level("bench-agent", TrustLevel.L3_ACT_APPROVE)
+    engine.budget.create_budget("llm", limit=1_000_000.0, period="monthly")
+    engine.consent.record_consent(
+        "bench-agent", "user_data", purpose="support", granted_by="bench"
+    )
+    action = GovernanceAction(
+        agent_id="bench-agent",
+        required_trust_level=TrustLevel.L2_SUGGEST,
+        budget_category="llm",
+        budget_amount=0.01,
+        data_type="user_data",
+        purpose="support",
+        action_type="tool_call",
+    )
+    return engine, action
+
+
+def measure_allocations(
+    name: str, evaluate: Callable[[GovernanceEngine, GovernanceAction], object]
+) -> dict[str, object]:
+    """Return retained and peak memory per decision for ``evaluate``."""
+    engine, action = _build_engine()
+    for _ in range(100):
+        evaluate(engine, action)
+
+    gc.collect()
+    kept: list[object] = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(ALLOCATION_SAMPLES):
+        kept.append(evaluate(engine, action))
+    after = tracemalloc.take_snapshot()
+
+    tracemalloc.reset_peak()
+    current, _ = tracemalloc.get_traced_memory()
+    evaluate(engine, action)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    diff = after.compare_to(before, "filename")
+    retained_bytes = sum(stat.size_diff for stat in diff)
+    retained_blocks = sum(stat.count_diff for stat in diff)
+    return {
+        "name": name,
+        "samples": ALLOCATION_SAMPLES,
+        "retained_bytes": retained_bytes // ALLOCATION_SAMPLES,
+        "retained_blocks": retained_blocks // ALLOCATION_SAMPLES,
+        "peak_bytes": peak - current,
+    }
+
+
+def bench_evaluate_sync() -> ScenarioResult:
+    engine, action = _build_engine()
+
+    def run() -> None:
+        engine.evaluate_sync(action)
+
+    return to_scenario_result("evaluate_sync", ITERATIONS, run)
+
+
+def bench_evaluate_lean() -> ScenarioResult:
+    engine, action = _build_engine()
+
+    def run() -> None:
+        engine.evaluate_lean(action)
+
+    return to_scenario_result("evaluate_lean", ITERATIONS, run)
+
+
+def bench_evaluate_lean_to_model() -> ScenarioResult:
+    engine, action = _build_engine()
+
+    def run() -> None:
+        engine.evaluate_lean(action).to_model()
+
+    return to_scenario_result("evaluate_lean_to_model", ITERATIONS, run)
+
+
+def main() -> None:
+    scenarios = [
+        bench_evaluate_sync(),
+        bench_evaluate_lean(),
+        bench_evaluate_lean_to_model(),
+    ]
+    allocations = [
+        measure_allocations("evaluate_sync", lambda e, a: e.evaluate_sync(a)),
+        measure_allocations("evaluate_lean", lambda e, a: e.evaluate_lean(a)),
+    ]
+    json.dump(
+        {
+            "scenarios": [s.to_dict() for s in scenarios],
+            "allocations_per_decision": allocations,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
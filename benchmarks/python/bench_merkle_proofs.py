@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — Merkle inclusion and consistency proofs.
+
+Appends SIZES[-1] record hashes to a ``MerkleAccumulator`` and, each time the
+tree reaches one of SIZES, measures:
+
+- ``inclusion_proof_<size>`` / ``verify_inclusion_<size>`` — proving and
+  checking a record in the middle of the tree;
+- ``consistency_proof_<size>`` / ``verify_consistency_<size>`` — proving and
+  checking that the tree of half the size is a prefix;
+- ``root_<size>``.
+
+Also reports the append rate, the proof lengths per size and the peak
+resident memory of the process. Add 100_000_000 to SIZES for the full-size
+log; it needs about 6.4 GB for retained nodes.
+
+Usage::
+
+    python bench_merkle_proofs.py > results/merkle_proofs.json
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import resource
+import sys
+import time
+
+from bench import to_scenario_result
+
+from aumos_governance import MerkleAccumulator, verify_consistency, verify_inclusion
+
+SIZES = (10_000, 100_000, 1_000_000)
+ITERATIONS = 1_000
+
+
+def _record_hash(index: int) -> str:
+    return hashlib.sha256(index.to_bytes(8, "big")).hexdigest()
+
+
+def main() -> None:
+    tree = MerkleAccumulator()
+    scenarios = []
+    proof_lengths: dict[int, dict[str, int]] = {}
+    append_seconds = 0.0
+    for size in SIZES:
+        hashes = [_record_hash(index) for index in range(tree.size, size)]
+        started = time.perf_counter()
+        tree.extend(hashes)
+        append_seconds += time.perf_counter() - started
+
+        middle = size // 2
+        record_hash = _record_hash(middle)
+        root = tree.root()
+        old_root = tree.root(middle)
+        inclusion = tree.inclusion_proof(middle)
+        consistency = tree.consistency_proof(middle)
+        if not verify_inclusion(inclusion, record_hash, root):
+            raise RuntimeError("inclusion proof rejected")
+        if not verify_consistency(consistency, old_root, root):
+            raise RuntimeError("consistency proof rejected")
+        proof_lengths[size] = {
+            "inclusion": len(inclusion.path),
+            "consistency": len(consistency.path),
+        }
+        scenarios += [
+            to_scenario_result(
+                f"inclusion_proof_{size}", ITERATIONS, lambda m=middle: tree.inclusion_proof(m)
+            ),
+            to_scenario_result(
+                f"verify_inclusion_{size}",
+                ITERATIONS,
+                lambda p=inclusion, h=record_hash, r=root: verify_inclusion(p, h, r),
+            ),
+            to_scenario_result(
+                f"consistency_proof_{size}",
+                ITERATIONS,
+                lambda m=middle: tree.consistency_proof(m),
+            ),
+            to_scenario_result(
+                f"verify_consistency_{size}",
+                ITERATIONS,
+                lambda p=consistency, o=old_root, r=root: verify_consistency(p, o, r),
+            ),
+            to_scenario_result(f"root_{size}", ITERATIONS, tree.root),
+        ]
+
+    json.dump(
+        {
+            "sizes": list(SIZES),
+            "appends_per_sec": SIZES[-1] / append_seconds if append_seconds else 0,
+            # ru_maxrss is reported in kilobytes on Linux.
+            "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+            "proof_lengths": proof_lengths,
+            "scenarios": [s.to_dict() for s in scenarios],
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — cost of durable state.
+
+With ``PersistenceConfig.journal_path`` set, every trust, consent and budget
+change is also queued for an append-only journal that a background thread
+writes with group commit. Reads are served from memory as before. This
+script reports:
+
+- ``decide_and_spend`` — ``evaluate_sync`` followed by ``record_spending``
+  (one journalled change per decision), in memory and with the journal;
+- ``evaluate_sync`` — a read-only decision, in memory and with the journal;
+- ``journal_throughput_ratio`` — journalled throughput as a fraction of the
+  in-memory throughput for each of the above;
+- ``warm_start`` — the time to restore an engine from a compacted journal of
+  WARM_AGENTS trust assignments, WARM_AGENTS consent records and
+  WARM_CATEGORIES budget categories.
+
+Usage::
+
+    python bench_persistence.py > results/persistence.json
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench import ScenarioResult, to_scenario_result
+
+from aumos_governance import (
+    AuditConfig,
+    GovernanceAction,
+    GovernanceConfig,
+    GovernanceEngine,
+    PersistenceConfig,
+    TrustLevel,
+)
+
+ITERATIONS = 20_000
+WARM_AGENTS = 50_000
+WARM_CATEGORIES = 1_000
+
+ACTION = GovernanceAction(
+    agent_id="bench-agent",
+    required_trust_level=TrustLevel.L2_SUGGEST,
+    budget_category="llm",
+    budget_amount=0.01,
+    data_type="user_data",
+    purpose="support",
+    action_type="tool_call",
+)
+
+
+def _build_engine(journal: Path | None) -> GovernanceEngine:
+    persistence = PersistenceConfig(journal_path=str(journal) if journal else None)
+    engine = GovernanceEngine(
+        GovernanceConfig(audit=AuditConfig(max_records=1_000_000), persistence=persistence)
+    )
+    engine.trust.set_level("bench-agent", TrustLevel.L3_ACT_APPROVE)
+    engine.budget.create_budget("llm", limit=1e12, period="lifetime")
+    engine.consent.record_consent(
+        "bench-agent", "user_data", purpose="support", granted_by="bench"
+    )
+    return engine
+
+
+def bench_decisions(workdir: Path, journalled: bool) -> list[ScenarioResult]:
+    label = "journal" if journalled else "memory"
+    engine = _build_engine(workdir / f"{label}.journal" if journalled else None)
+
+    def decide_and_spend() -> None:
+        if engine.evaluate_sync(ACTION).allowed:
+            engine.budget.record_spending("llm", 0.01)
+
+    def evaluate() -> None:
+        engine.evaluate_sync(ACTION)
+
+    try:
+        return [
+            to_scenario_result(f"decide_and_spend_{label}", ITERATIONS, decide_and_spend),
+            to_scenario_result(f"evaluate_sync_{label}", ITERATIONS, evaluate),
+        ]
+    finally:
+        engine.close()
+
+
+def measure_warm_start(workdir: Path) -> dict[str, float]:
+    journal = workdir / "warm.journal"
+    engine = _build_engine(journal)
+    for i in range(WARM_AGENTS):
+        engine.trust.set_level(f"agent-{i}", TrustLevel.L3_ACT_APPROVE)
+        engine.consent.record_consent(f"agent-{i}", "user_data", None, granted_by="bench")
+    for i in range(WARM_CATEGORIES):
+        engine.budget.create_budget(f"category-{i}", limit=100.0, period="monthly")
+        engine.budget.record_spending(f"category-{i}", 1.0)
+    engine.checkpoint()
+    engine.close()
+
+    started = time.perf_counter_ns()
+    restored = _build_engine(journal)
+    elapsed_ns = time.perf_counter_ns() - started
+    agents = len(restored.trust.list_agents())
+    restored.close()
+    return {
+        "journal_bytes": journal.stat().st_size,
+        "restored_agents": agents,
+        "restore_ms": round(elapsed_ns / 1e6, 1),
+    }
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        memory = bench_decisions(workdir, journalled=False)
+        journal = bench_decisions(workdir, journalled=True)
+        warm_start = measure_warm_start(workdir)
+    ratios = {
+        m.name.removesuffix("_memory"): round(j.ops_per_sec / m.ops_per_sec, 3)
+        for m, j in zip(memory, journal, strict=True)
+    }
+    json.dump(
+        {
+            "scenarios": [s.to_dict() for s in memory + journal],
+            "journal_throughput_ratio": ratios,
+            "warm_start": warm_start,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — concurrent trust and consent reads.
+
+Trust assignments and consent grants are copy-on-write snapshots: readers
+take no lock. This script runs 1, 4, 16 and 64 reader threads, each calling
+``TrustManager.check_level`` and ``ConsentManager.check_consent`` in a loop,
+while one writer thread keeps publishing new snapshots. For each thread count
+it reports aggregate reads per second and the number of reader errors (which
+should always be zero).
+
+On a standard CPython build the GIL serialises the readers, so throughput
+stays roughly flat as threads are added. On a free-threaded build
+(``python3.13t`` and later) readers run in parallel; ``gil_enabled`` in the
+output says which case was measured.
+
+Usage::
+
+    python bench_snapshot_reads.py > results/snapshot_reads.json
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+
+from aumos_governance import ConsentManager, TrustLevel, TrustManager
+
+THREAD_COUNTS = (1, 4, 16, 64)
+READS_PER_RUN = 200_000
+AGENTS = 1_000
+
+
+def _build_managers() -> tuple[TrustManager, ConsentManager]:
+    trust = TrustManager()
+    consent = ConsentManager()
+    for i in range(AGENTS):
+        trust.set_level(f"agent-{i}", TrustLevel.L3_ACT_APPROVE)
+        consent.record_consent(f"agent-{i}", "user_data", "support", granted_by="bench")
+    return trust, consent
+
+
+def run_readers(threads: int) -> dict[str, object]:
+    """Return throughput for ``threads`` readers sharing READS_PER_RUN reads."""
+    trust, consent = _build_managers()
+    per_thread = READS_PER_RUN // threads
+    stop_writer = threading.Event()
+    errors: list[BaseException] = []
+    writes = 0
+
+    def writer() -> None:
+        nonlocal writes
+        while not stop_writer.is_set():
+            agent = f"agent-{writes % AGENTS}"
+            trust.set_level(agent, TrustLevel.L3_ACT_APPROVE)
+            consent.record_consent(agent, "user_data", "support", granted_by="bench")
+            writes += 1
+            time.sleep(0.001)
+
+    def reader(offset: int) -> None:
+        try:
+            for i in range(per_thread):
+                agent = f"agent-{(offset + i) % AGENTS}"
+                trust.check_level(agent, TrustLevel.L2_SUGGEST)
+                consent.check_consent(agent, "user_data", "support")
+        except BaseException as exc:
+            errors.append(exc)
+
+    writer_thread = threading.Thread(target=writer)
+    readers = [threading.Thread(target=reader, args=(n * 7,)) for n in range(threads)]
+    writer_thread.start()
+    started = time.perf_counter_ns()
+    for thread in readers:
+        thread.start()
+    for thread in readers:
+        thread.join()
+    elapsed_ns = time.perf_counter_ns() - started
+    stop_writer.set()
+    writer_thread.join()
+
+    reads = per_thread * threads
+    return {
+        "threads": threads,
+        "reads": reads,
+        "snapshot_writes": writes,
+        "reads_per_sec": round(reads / (elapsed_ns / 1e9)),
+        "errors": len(errors),
+    }
+
+
+def main() -> None:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    json.dump(
+        {
+            "gil_enabled": True if is_gil_enabled is None else is_gil_enabled(),
+            "runs": [run_readers(threads) for threads in THREAD_COUNTS],
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
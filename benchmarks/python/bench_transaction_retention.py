@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+aumos-governance SDK benchmark — memory per budget category by retention.
+
+Records an increasing number of transactions against one category and
+reports, via tracemalloc, the memory still held afterwards with the default
+retention (every transaction kept) and with ``max_transactions`` bounding the
+in-memory history. ``record_spending`` timing uses the shared harness in
+``bench.py``.
+
+Usage::
+
+    python bench_transaction_retention.py > results/transaction_retention.json
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import tracemalloc
+
+from bench import ScenarioResult, to_scenario_result
+
+from aumos_governance import BudgetConfig, BudgetManager, TransactionRetentionConfig
+
+VOLUMES = (1_000, 10_000, 100_000)
+MAX_TRANSACTIONS = 1_000
+ITERATIONS = 20_000
+
+
+def _manager(max_transactions: int | None) -> BudgetManager:
+    config = BudgetConfig(
+        retention=TransactionRetentionConfig(max_transactions=max_transactions)
+    )
+    manager = BudgetManager(config)
+    manager.create_budget("llm", limit=1e12, period="lifetime")
+    return manager
+
+
+def measure_memory(max_transactions: int | None, volume: int) -> dict[str, object]:
+    """Return the bytes retained by one category after ``volume`` transactions."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    manager = _manager(max_transactions)
+    for _ in range(volume):
+        manager.record_spending("llm", 0.01)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del manager
+    return {
+        "max_transactions": max_transactions,
+        "transactions": volume,
+        "retained_bytes": retained,
+    }
+
+
+def bench_record_spending(max_transactions: int | None) -> ScenarioResult:
+    manager = _manager(max_transactions)
+
+    def run() -> None:
+        manager.record_spending("llm", 0.01)
+
+    label = "all" if max_transactions is None else f"last_{max_transactions}"
+    return to_scenario_result(f"record_spending_keep_{label}", ITERATIONS, run)
+
+
+def main() -> None:
+    scenarios = [bench_record_spending(None), bench_record_spending(MAX_TRANSACTIONS)]
+    memory = [
+        measure_memory(max_transactions, volume)
+        for max_transactions in (None, MAX_TRANSACTIONS)
+        for volume in VOLUMES
+    ]
+    json.dump(
+        {
+            "scenarios": [s.to_dict() for s in scenarios],
+            "memory_per_category": memory,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ Public API surface:
     Classes:
         AuditLogger             — Primary logger: log(), query(), verify(), export_records(), count()
         HashChain               — Low-level hash-chain management (append + verify)
+        MerkleAccumulator       — Append-only Merkle tree for inclusion/consistency proofs
         AuditQuery              — Composable query facade over any AuditStorage backend
         MemoryStorage           — Volatile in-memory storage (default)
         FileStorage             — Append-only NDJSON file storage
@@ -26,13 +27,14 @@ Public API surface:
     Types:
         AuditRecord, GovernanceDecisionInput, AuditFilter,
         ChainVerificationResult, ChainVerificationSuccess,
-        ChainVerificationFailure, AuditStorage,
+        ChainVerificationFailure, InclusionProof, ConsistencyProof, AuditStorage,
         TrustCheckSnapshot, BudgetCheckSnapshot, ConsentCheckSnapshot
 """
 
 from audit_trail.chain import HashChain
 from audit_trail.export_formats import export_cef, export_csv, export_json, export_records
 from audit_trail.logger import AuditLogger
+from audit_trail.merkle import MerkleAccumulator, verify_consistency, verify_inclusion
 from audit_trail.query import AuditQuery
 from audit_trail.record import build_pending_record, finalise_record
 from audit_trail.storage.file import FileStorage
@@ -44,7 +46,9 @@ from audit_trail.types import (
     ChainVerificationFailure,
     ChainVerificationResult,
     ChainVerificationSuccess,
+    ConsistencyProof,
     GovernanceDecisionInput,
+    InclusionProof,
 )
 
 from audit_trail.otel_conventions import GOVERNANCE_SEMANTIC_CONVENTIONS
@@ -59,6 +63,7 @@ __all__ = [
     # Core classes
     "AuditLogger",
     "HashChain",
+    "MerkleAccumulator",
     "AuditQuery",
     # Storage
     "MemoryStorage",
@@ -79,6 +84,11 @@ __all__ = [
     "ChainVerificationResult",
     "ChainVerificationSuccess",
     "ChainVerificationFailure",
+    "InclusionProof",
+    "ConsistencyProof",
+    # Merkle proof verification
+    "verify_inclusion",
+    "verify_consistency",
     # OpenTelemetry
     "GOVERNANCE_SEMANTIC_CONVENTIONS",
     "GovernanceOTelExporter",
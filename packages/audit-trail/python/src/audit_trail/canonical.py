@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+Canonical JSON encoding for hash-chain digests.
+
+The chain hashes ``json.dumps(pending, sort_keys=True, ensure_ascii=False,
+separators=(",", ":"))``.  The functions here return exactly that string
+with less work per record:
+
+- ``canonical_json`` reuses one configured ``json.JSONEncoder`` instead of
+  building a new one per call.  When the optional ``orjson`` package is
+  installed it encodes the values it writes identically: exact ``str``,
+  ``bool``, ``None``, ``int`` within 64 bits and ``float`` whose ``repr``
+  has no exponent, in lists and str-keyed dicts.  Other floats are written
+  differently by orjson ("1e16" against "1e+16", null for NaN), so any
+  value containing one stays on the standard encoder.
+- ``encode_record`` rebuilds a stored record's pending dict straight from
+  its fields, in canonical order, instead of ``model_dump(mode="json")``.
+  The fields are typed scalars and need no conversion; only ``metadata``
+  goes through pydantic's serializer, so the result is the same as the
+  dump's.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from audit_trail.types import AuditRecord
+
+try:  # Optional accelerator; output is identical without it.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+# Fields hashed by the chain, in canonical (sorted) order.
+_FIELDS: tuple[str, ...] = tuple(sorted(set(AuditRecord.model_fields) - {"record_hash"}))
+
+# Serializes metadata as AuditRecord.model_dump(mode="json") does.
+_METADATA: TypeAdapter[dict[str, Any]] = TypeAdapter(dict[str, Any])
+
+_ORJSON_INT_MIN = -(2**63)
+_ORJSON_INT_MAX = 2**64 - 1
+
+
+def canonical_json(value: object) -> str:
+    """
+    Return ``json.dumps(value, sort_keys=True, ensure_ascii=False,
+    separators=(",", ":"))``.
+    """
+    if orjson is not None and _orjson_exact(value):
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+        except orjson.JSONEncodeError:  # e.g. lone surrogates in a string
+            pass
+    return _ENCODER.encode(value)
+
+
+def encode_record(record: AuditRecord) -> str:
+    """
+    Return the canonical JSON of a stored record's pending form: every field
+    except ``record_hash``, with None values omitted.
+
+    Identical to ``canonical_json`` of
+    ``record.model_dump(mode="json", exclude={"record_hash"})`` with None
+    values dropped.
+    """
+    values = record.__dict__
+    pending: dict[str, object] = {}
+    for name in _FIELDS:
+        value = values[name]
+        kind = type(value)
+        if kind is str or kind is bool or kind is int or kind is float:
+            pending[name] = value
+        elif kind is dict:
+            pending[name] = _METADATA.dump_python(value, mode="json")
+        elif value is not None:
+            return _encode_dumped(record)
+    return canonical_json(pending)
+
+
+def _encode_dumped(record: AuditRecord) -> str:
+    """The reference path: dump the record through pydantic and encode it."""
+    dumped = record.model_dump(mode="json", exclude={"record_hash"})
+    return canonical_json({k: v for k, v in dumped.items() if v is not None})
+
+
+def _orjson_exact(value: object) -> bool:
+    """
+    Whether orjson writes ``value`` exactly as the standard encoder does.
+
+    Only the exact built-in types qualify; subclasses such as enums, and
+    types orjson supports natively but ``json`` rejects, are left to the
+    standard encoder.
+    """
+    if isinstance(value, dict) and type(value) is dict:
+        for key in value:
+            if type(key) is not str:
+                return False
+        items: Any = value.values()
+    elif isinstance(value, list) and type(value) is list:
+        items = value
+    else:
+        items = (value,)
+    for item in items:
+        kind = type(item)
+        if kind is str or kind is bool or item is None:
+            continue
+        if kind is int:
+            if not _ORJSON_INT_MIN <= item <= _ORJSON_INT_MAX:
+                return False
+        elif kind is float:
+            # repr() switches to exponent notation outside [1e-4, 1e16);
+            # NaN fails both comparisons.
+            magnitude = abs(item)
+            if not (magnitude == 0.0 or 1e-4 <= magnitude < 1e16):
+                return False
+        elif kind is dict or kind is list:
+            if not _orjson_exact(item):
+                return False
+        else:
+            return False
+    return True
@@ -7,16 +7,29 @@ SHA-256 hash chain for immutable audit record linkage.
 Each record is linked to its predecessor via a SHA-256 digest, making
 retrospective tampering detectable — any modification to a record invalidates
 every subsequent hash in the chain.
+
+Every record also stores the ``previous_hash`` it was chained to, so its own
+hash can be recomputed without the records before it.  ``find_chain_break``
+uses this to recompute hashes for chunks of a chain in a process pool and
+check the links in a single linear pass.
 """
 
 from __future__ import annotations
 
 import hashlib
-import json
-from typing import Any
+import multiprocessing
+import os
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Literal
 
+from audit_trail.canonical import canonical_json, encode_record
+from audit_trail.merkle import MerkleAccumulator
 from audit_trail.record import finalise_record
 from audit_trail.types import AuditRecord, ChainVerificationResult
+from audit_trail.types import ConsistencyProof, InclusionProof
 from audit_trail.types import ChainVerificationSuccess, ChainVerificationFailure
 
 # The hash value that precedes the very first record in any chain.
@@ -24,6 +37,15 @@ from audit_trail.types import ChainVerificationSuccess, ChainVerificationFailure
 # and makes the genesis condition explicit and detectable.
 GENESIS_HASH: str = "0" * 64
 
+# Records per task when hashes are recomputed in a process pool.
+DEFAULT_CHUNK_SIZE: int = 10_000
+
+# Pool workers are forked so that they inherit the records to verify.
+_START_METHODS = multiprocessing.get_all_start_methods()
+
+# The records being verified, in a pool worker.
+_worker_records: Sequence[AuditRecord] = ()
+
 
 def _canonicalise(pending: dict[str, Any]) -> str:
     """
@@ -31,9 +53,11 @@ def _canonicalise(pending: dict[str, Any]) -> str:
 
     Keys are sorted alphabetically so that two dicts with the same fields in
     different insertion orders produce identical digests.  This protects against
-    subtle chain breaks caused by non-deterministic serialisation.
+    subtle chain breaks caused by non-deterministic serialisation.  The output
+    is that of ``json.dumps(pending, sort_keys=True, ensure_ascii=False,
+    separators=(",", ":"))``, produced by ``audit_trail.canonical``.
     """
-    return json.dumps(pending, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return canonical_json(pending)
 
 
 def _compute_hash(pending: dict[str, Any], previous_hash: str) -> str:
@@ -44,10 +68,174 @@ def _compute_hash(pending: dict[str, Any], previous_hash: str) -> str:
     Input: ``<canonicalJSON>\\n<previousHash>``
     The newline separator ensures the two fields cannot overlap.
     """
-    payload = _canonicalise(pending) + "\n" + previous_hash
+    return _digest(_canonicalise(pending), previous_hash)
+
+
+def _recompute_hash(record: AuditRecord) -> str:
+    """
+    Recompute a stored record's hash from its own fields and ``previous_hash``.
+
+    The pending form is every field except ``record_hash``, with None values
+    omitted as ``build_pending_record`` does; ``encode_record`` serialises it
+    without dumping the model to a dict.
+    """
+    return _digest(encode_record(record), record.previous_hash)
+
+
+def _digest(canonical: str, previous_hash: str) -> str:
+    payload = canonical + "\n" + previous_hash
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
+@dataclass(frozen=True)
+class ChainBreak:
+    """
+    The first discrepancy found by ``find_chain_break``.
+
+    Parameters
+    ----------
+    index:
+        Zero-based index of the offending record.
+    field:
+        ``"previous_hash"`` when the record does not link to its predecessor,
+        ``"record_hash"`` when its content no longer matches its hash.
+    expected:
+        The predecessor's hash (or the genesis hash) for a broken link; the
+        recomputed digest for an altered record.
+    """
+
+    index: int
+    field: Literal["previous_hash", "record_hash"]
+    expected: str
+
+
+def find_chain_break(
+    records: Sequence[AuditRecord],
+    workers: int | None = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ChainBreak | None:
+    """
+    Locate the first discrepancy in a chain of records, or return None.
+
+    The ``previous_hash`` links are compared in one pass.  Hashes are then
+    recomputed for the records before the first broken link — each against
+    its own stored ``previous_hash``, which equals its predecessor's hash
+    there — in chunks spread over a process pool when ``workers`` is greater
+    than 1.  The result is the same for any ``workers``: the earliest failing
+    record, with a broken link taking precedence over a hash mismatch on the
+    same record, exactly as a serial walk reports it.
+
+    Parameters
+    ----------
+    records:
+        Records in chain order (oldest first).
+    workers:
+        Number of worker processes used to recompute hashes.  ``None`` uses
+        one per CPU.  Workers are forked from this process and inherit
+        ``records``, which is only safe while no other thread runs; with 1,
+        when the records fit in a single chunk, when other threads are
+        running, or where ``fork`` is unavailable (Windows), hashes are
+        recomputed in this process.
+    chunk_size:
+        Number of records hashed per pool task.
+
+    Raises
+    ------
+    ValueError
+        If ``workers`` or ``chunk_size`` is less than 1.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}.")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}.")
+
+    linked = len(records)
+    expected_previous_hash = GENESIS_HASH
+    for index, record in enumerate(records):
+        if record.previous_hash != expected_previous_hash:
+            linked = index
+            break
+        expected_previous_hash = record.record_hash
+
+    if workers == 1 or linked <= chunk_size or not _can_fork():
+        altered = _scan_chunk(records, 0, linked)
+    else:
+        altered = _scan_in_pool(records, linked, workers, chunk_size)
+    if altered is not None:
+        return ChainBreak(altered[0], "record_hash", altered[1])
+    if linked < len(records):
+        return ChainBreak(linked, "previous_hash", expected_previous_hash)
+    return None
+
+
+def _scan_chunk(records: Sequence[AuditRecord], lo: int, hi: int) -> tuple[int, str] | None:
+    """
+    The index and recomputed hash of the first record in ``records[lo:hi]``
+    whose ``record_hash`` does not match, or None.
+    """
+    for index in range(lo, hi):
+        record = records[index]
+        expected_hash = _recompute_hash(record)
+        if record.record_hash != expected_hash:
+            return index, expected_hash
+    return None
+
+
+def _scan_in_pool(
+    records: Sequence[AuditRecord], stop: int, workers: int, chunk_size: int
+) -> tuple[int, str] | None:
+    """
+    Run ``_scan_chunk`` over ``records[:stop]`` in a pool of forked processes.
+    Chunk results are examined in order; chunks after the first mismatch are
+    cancelled.
+
+    The workers inherit ``records`` when they are forked, so a task carries
+    only its index range: pickling the records themselves would cost more
+    than hashing them.
+    """
+    bounds = range(0, stop, chunk_size)
+    pool = ProcessPoolExecutor(
+        max_workers=min(workers, len(bounds)),
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_adopt_records,
+        initargs=(records,),
+    )
+    try:
+        futures = [
+            pool.submit(_scan_worker_chunk, lo, min(lo + chunk_size, stop)) for lo in bounds
+        ]
+        for future in futures:
+            altered = future.result()
+            if altered is not None:
+                return altered
+        return None
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _can_fork() -> bool:
+    """
+    Whether hashes may be recomputed in forked workers: ``fork`` must be
+    available and this must be the only running thread.  A child forked
+    while another thread holds a lock (the logging, import or allocator
+    locks, or one of ours) inherits it held and can deadlock.
+    """
+    return "fork" in _START_METHODS and threading.active_count() == 1
+
+
+def _adopt_records(records: Sequence[AuditRecord]) -> None:
+    """Pool initializer: keep the records inherited from the parent."""
+    global _worker_records
+    _worker_records = records
+
+
+def _scan_worker_chunk(lo: int, hi: int) -> tuple[int, str] | None:
+    """Pool task: ``_scan_chunk`` over the inherited records."""
+    return _scan_chunk(_worker_records, lo, hi)
+
+
 class HashChain:
     """
     Maintains the running hash state of an append-only audit log.
@@ -61,10 +249,22 @@ class HashChain:
         Seed the chain at a known tip.  Pass the stored last hash when
         restoring chain state from durable storage.  Defaults to the genesis
         hash (64 zeros).
+    merkle:
+        Accumulator that receives the hash of every record appended, enabling
+        ``merkle_root``, ``inclusion_proof`` and ``consistency_proof``.  When
+        restoring a chain, extend it with the stored records' hashes first so
+        that leaf positions match chain positions.
     """
 
-    def __init__(self, initial_hash: str | None = None) -> None:
+    def __init__(
+        self,
+        initial_hash: str | None = None,
+        merkle: MerkleAccumulator | None = None,
+    ) -> None:
         self._last_record_hash: str = initial_hash or GENESIS_HASH
+        self._merkle = merkle
+        # record id -> leaf index of the records appended through this chain.
+        self._positions: dict[str, int] = {}
 
     def append(self, pending: dict[str, Any]) -> AuditRecord:
         """
@@ -76,16 +276,35 @@ class HashChain:
         """
         record_hash = _compute_hash(pending, self._last_record_hash)
         self._last_record_hash = record_hash
-        return finalise_record(pending, record_hash)
+        record = finalise_record(pending, record_hash)
+        if self._merkle is not None:
+            self._positions[record.id] = self._merkle.append(record_hash)
+        return record
 
-    def verify(self, records: list[AuditRecord]) -> ChainVerificationResult:
+    def verify(
+        self,
+        records: list[AuditRecord],
+        workers: int | None = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ChainVerificationResult:
         """
-        Walk every record in ``records`` from index 0 and re-derive each
+        Check every ``previous_hash`` link from index 0 and re-derive each
         expected hash from scratch, comparing it against the stored value.
 
         A failure at index ``i`` means record ``i`` was altered or the chain
         was seeded with a different genesis hash.
 
+        Parameters
+        ----------
+        records:
+            Records in chain order (oldest first).
+        workers:
+            Number of worker processes used to recompute hashes (``None``
+            for one per CPU).  The result does not depend on it; see
+            ``find_chain_break``.
+        chunk_size:
+            Number of records hashed per pool task.
+
         Returns
         -------
         ChainVerificationSuccess
@@ -93,44 +312,28 @@ class HashChain:
         ChainVerificationFailure
             At the first detected discrepancy, with index and reason.
         """
-        expected_previous_hash = GENESIS_HASH
-
-        for index, record in enumerate(records):
-            # Verify the previousHash link.
-            if record.previous_hash != expected_previous_hash:
-                return ChainVerificationFailure(
-                    record_count=len(records),
-                    broken_at=index,
-                    reason=(
-                        f"Record at index {index} has previous_hash "
-                        f'"{record.previous_hash}" but expected '
-                        f'"{expected_previous_hash}".'
-                    ),
-                )
-
-            # Reconstruct the pending dict (everything except record_hash)
-            # and re-compute the digest.
-            pending = record.model_dump(mode="json", exclude={"record_hash"})
-            # Exclude None values to match how build_pending_record omits them.
-            pending = {k: v for k, v in pending.items() if v is not None}
-
-            expected_hash = _compute_hash(pending, expected_previous_hash)
-
-            if record.record_hash != expected_hash:
-                return ChainVerificationFailure(
-                    record_count=len(records),
-                    broken_at=index,
-                    reason=(
-                        f'Record at index {index} (id="{record.id}") has '
-                        f'record_hash "{record.record_hash}" but recomputed '
-                        f'hash is "{expected_hash}". '
-                        f"Record content may have been altered."
-                    ),
-                )
-
-            expected_previous_hash = record.record_hash
-
-        return ChainVerificationSuccess(record_count=len(records))
+        broken = find_chain_break(records, workers, chunk_size)
+        if broken is None:
+            return ChainVerificationSuccess(record_count=len(records))
+
+        index = broken.index
+        record = records[index]
+        if broken.field == "previous_hash":
+            reason = (
+                f"Record at index {index} has previous_hash "
+                f'"{record.previous_hash}" but expected '
+                f'"{broken.expected}".'
+            )
+        else:
+            reason = (
+                f'Record at index {index} (id="{record.id}") has '
+                f'record_hash "{record.record_hash}" but recomputed '
+                f'hash is "{broken.expected}". '
+                f"Record content may have been altered."
+            )
+        return ChainVerificationFailure(
+            record_count=len(records), broken_at=index, reason=reason
+        )
 
     def last_hash(self) -> str:
         """
@@ -138,3 +341,55 @@ class HashChain:
         hash when no records have been appended yet.
         """
         return self._last_record_hash
+
+    def merkle_root(self, size: int | None = None) -> str:
+        """
+        Return the hex Merkle root over the first ``size`` records (default:
+        all of them).
+
+        Raises
+        ------
+        ValueError
+            If the chain has no Merkle accumulator.
+        """
+        return self._require_merkle().root(size)
+
+    def inclusion_proof(self, record_id: str, size: int | None = None) -> InclusionProof:
+        """
+        Prove that a record appended through this chain is in the Merkle tree
+        of ``size`` records (default: all records).  Check the proof with
+        ``audit_trail.merkle.verify_inclusion`` against a published root.
+
+        Raises
+        ------
+        ValueError
+            If the chain has no Merkle accumulator, no record with
+            ``record_id`` was appended through it, or the record is not among
+            the first ``size``.
+        """
+        merkle = self._require_merkle()
+        position = self._positions.get(record_id)
+        if position is None:
+            raise ValueError(f"No record with id {record_id!r} was appended to this chain.")
+        return merkle.inclusion_proof(position, size)
+
+    def consistency_proof(
+        self, old_size: int, new_size: int | None = None
+    ) -> ConsistencyProof:
+        """
+        Prove that the Merkle tree of ``old_size`` records is a prefix of the
+        tree of ``new_size`` records (default: all records).  Check the proof
+        with ``audit_trail.merkle.verify_consistency``.
+
+        Raises
+        ------
+        ValueError
+            If the chain has no Merkle accumulator or the sizes are out of
+            range.
+        """
+        return self._require_merkle().consistency_proof(old_size, new_size)
+
+    def _require_merkle(self) -> MerkleAccumulator:
+        if self._merkle is None:
+            raise ValueError("This HashChain was created without a MerkleAccumulator.")
+        return self._merkle
@@ -115,3 +115,12 @@ class AuditLogger:
     async def count(self) -> int:
         """Return the total number of records currently in the store."""
         return await self._storage.count()
+
+    async def close(self) -> None:
+        """
+        Close the storage backend, waiting for records still being written.
+
+        Call it before the process exits so that every logged record reaches
+        storage under its durability policy.
+        """
+        await self._storage.close()
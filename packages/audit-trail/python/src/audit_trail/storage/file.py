@@ -5,9 +5,16 @@
 Append-only file storage backend.
 
 Records are stored one JSON object per line (NDJSON / JSON Lines format).
-The file is opened in append mode on construction and never truncated or
-rewritten — callers relying on immutability should secure the file with
-OS-level permissions (e.g., chown root + chmod 444 after rotation).
+The file is opened in append mode on the first append, kept open until
+``close()``, and never truncated or rewritten — callers relying on
+immutability should secure the file with OS-level permissions (e.g., chown
+root + chmod 444 after rotation).
+
+Appends are group-committed.  Records queue in memory while a single writer
+task writes them out batch by batch from a worker thread; everything that
+arrives while one batch is being written (and fsynced) goes out together in
+the next, so concurrent ``AuditLogger.log`` calls share one write and one
+fsync.  Records reach the file in the order their appends were called.
 
 Reading always parses the entire file from disk so that the in-process view
 stays consistent with anything written by concurrent processes.
@@ -15,9 +22,11 @@ stays consistent with anything written by concurrent processes.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 from pathlib import Path
+from typing import Literal, TextIO
 
 import aiofiles
 import aiofiles.os
@@ -25,6 +34,11 @@ import aiofiles.os
 from audit_trail.storage.interface import AuditStorage
 from audit_trail.types import AuditFilter, AuditRecord
 
+# When FileStorage.append counts a record as written; see FileStorage.
+Durability = Literal["batch", "interval", "never"]
+
+DURABILITY_POLICIES: frozenset[str] = frozenset({"batch", "interval", "never"})
+
 
 def _apply_filter(records: list[AuditRecord], audit_filter: AuditFilter) -> list[AuditRecord]:
     results: list[AuditRecord] = list(records)
@@ -62,20 +76,123 @@ class FileStorage(AuditStorage):
     """
     Persistent, append-only NDJSON file storage backend.
 
+    ``append`` returns once the batch holding its record is durable under
+    the ``durability`` policy:
+
+    - ``"never"`` — the batch has been written and flushed to the operating
+      system, which is as far as a per-append open and close ever got.  A
+      power loss can drop records whose appends have returned.
+    - ``"batch"`` — the batch has also been fsynced.
+    - ``"interval"`` — as ``"batch"``, but the writer waits until
+      ``sync_interval_ms`` have passed since the previous fsync before
+      writing, so bursts of appends share fewer, larger batches.
+
     Parameters
     ----------
     file_path:
         Path to the NDJSON file.  The file is created if it does not exist.
+    durability:
+        ``"never"`` (default), ``"batch"`` or ``"interval"``.
+    sync_interval_ms:
+        Minimum time between fsyncs under ``"interval"``.
+
+    Raises
+    ------
+    ValueError
+        If ``durability`` is not a known policy or ``sync_interval_ms`` is
+        not positive.
     """
 
-    def __init__(self, file_path: str | Path) -> None:
+    def __init__(
+        self,
+        file_path: str | Path,
+        durability: Durability = "never",
+        sync_interval_ms: float = 100.0,
+    ) -> None:
+        if durability not in DURABILITY_POLICIES:
+            raise ValueError(
+                f"durability must be one of {sorted(DURABILITY_POLICIES)}, "
+                f"got {durability!r}."
+            )
+        if sync_interval_ms <= 0:
+            raise ValueError(f"sync_interval_ms must be positive, got {sync_interval_ms}.")
         self._file_path = Path(file_path)
+        self._durability = durability
+        self._sync_interval = sync_interval_ms / 1000
+        # Owned by the writer task's worker thread while a batch is written.
+        self._handle: TextIO | None = None
+        self._queue: list[tuple[str, asyncio.Future[None]]] = []
+        self._writer: asyncio.Task[None] | None = None
+        self._last_sync = float("-inf")
+
+    @property
+    def durability(self) -> Durability:
+        """The policy deciding when ``append`` returns."""
+        return self._durability
 
     async def append(self, record: AuditRecord) -> None:
         # model_dump with mode="json" ensures all values are JSON-serialisable.
         line = json.dumps(record.model_dump(mode="json", exclude_none=False)) + "\n"
-        async with aiofiles.open(self._file_path, mode="a", encoding="utf-8") as file_handle:
-            await file_handle.write(line)
+        loop = asyncio.get_running_loop()
+        written: asyncio.Future[None] = loop.create_future()
+        # Queue before the first await so the file order is the call order.
+        self._queue.append((line, written))
+        if self._writer is None:
+            self._writer = loop.create_task(self._write_batches())
+        await written
+
+    async def close(self) -> None:
+        """
+        Wait for queued appends to be written, then close the file handle.
+
+        A later ``append`` reopens the file.
+        """
+        while self._writer is not None:
+            await asyncio.wait([self._writer])
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            await asyncio.to_thread(handle.close)
+
+    async def _write_batches(self) -> None:
+        """Write queued records batch by batch until the queue is empty."""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._queue:
+                if self._durability == "interval":
+                    delay = self._last_sync + self._sync_interval - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                batch, self._queue = self._queue, []
+                try:
+                    await asyncio.to_thread(self._write, "".join(line for line, _ in batch))
+                except Exception as exc:
+                    for _, written in batch:
+                        if not written.done():
+                            written.set_exception(exc)
+                    continue
+                self._last_sync = loop.time()
+                for _, written in batch:
+                    if not written.done():
+                        written.set_result(None)
+        finally:
+            self._writer = None
+
+    def _write(self, data: str) -> None:
+        """Write one batch through the long-lived handle; runs in a worker thread."""
+        handle = self._handle
+        if handle is None:
+            handle = self._handle = _open_for_append(self._file_path)
+        try:
+            handle.write(data)
+            handle.flush()
+            if self._durability != "never":
+                os.fsync(handle.fileno())
+        except BaseException:
+            # The file may now end in a partial line; the next batch reopens
+            # it and starts on a fresh line.
+            self._handle = None
+            handle.close()
+            raise
 
     async def query(self, audit_filter: AuditFilter) -> list[AuditRecord]:
         all_records = await self.all()
@@ -119,3 +236,17 @@ class FileStorage(AuditStorage):
         with open(path, encoding="utf-8") as file_handle:
             lines = [line.strip() for line in file_handle if line.strip()]
         return lines[-1] if lines else None
+
+
+def _open_for_append(path: Path) -> TextIO:
+    """
+    Open ``path`` for appending.  If a crash or failed write left the file
+    ending in a partial line, terminate it so the next record stays readable.
+    """
+    handle = open(path, mode="a", encoding="utf-8")  # noqa: SIM115
+    if handle.tell() > 0:
+        with open(path, mode="rb") as raw:
+            raw.seek(-1, os.SEEK_END)
+            if raw.read(1) != b"\n":
+                handle.write("\n")
+    return handle
@@ -20,7 +20,8 @@ class AuditStorage(ABC):
     Contract for audit record persistence backends.
 
     The interface is intentionally minimal — callers interact with the full
-    AuditLogger API; storage backends only need to satisfy these four operations.
+    AuditLogger API; storage backends only need to satisfy these four operations,
+    and may override ``close`` to release what they hold.
     """
 
     @abstractmethod
@@ -53,3 +54,10 @@ class AuditStorage(ABC):
     async def count(self) -> int:
         """Return the total number of records in the store."""
         ...
+
+    async def close(self) -> None:  # noqa: B027 - optional hook, not abstract
+        """
+        Finish pending writes and release any resources held by the backend.
+
+        The default does nothing.
+        """
@@ -102,4 +102,33 @@ class ChainVerificationFailure(BaseModel):
 
 ChainVerificationResult = ChainVerificationSuccess | ChainVerificationFailure
 
+
+class InclusionProof(BaseModel):
+    """
+    Proof that a record is a leaf of a Merkle tree over the chain.
+
+    ``path`` holds the hex digests of the sibling subtrees from the leaf up to
+    the root.  Check it with ``audit_trail.merkle.verify_inclusion``.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    index: int
+    tree_size: int
+    path: tuple[str, ...]
+
+
+class ConsistencyProof(BaseModel):
+    """
+    Proof that the Merkle tree of ``old_size`` records is a prefix of the
+    tree of ``new_size`` records.  Check it with
+    ``audit_trail.merkle.verify_consistency``.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    old_size: int
+    new_size: int
+    path: tuple[str, ...]
+
 ExportFormat = str  # "json" | "csv" | "cef"
@@ -12,12 +12,9 @@ modifying any data.
 
 from __future__ import annotations
 
-import hashlib
-import json
-from typing import Literal
-
 from pydantic import BaseModel, Field
 
+from audit_trail.chain import DEFAULT_CHUNK_SIZE, find_chain_break
 from audit_trail.types import AuditRecord
 
 # The genesis hash used as the previous_hash of the very first record.
@@ -65,48 +62,34 @@ class VerificationResult(BaseModel, frozen=True):
     )
 
 
-# ---------------------------------------------------------------------------
-# Internal helpers
-# ---------------------------------------------------------------------------
-
-
-def _canonicalise(pending: dict[str, object]) -> str:
-    """
-    Produce a deterministic JSON string from a pending record dict.
-
-    Keys are sorted so that identical fields in different insertion orders
-    produce the same digest.
-    """
-    return json.dumps(pending, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
-
-
-def _compute_hash(pending: dict[str, object], previous_hash: str) -> str:
-    """
-    Recompute the SHA-256 digest for a pending record dict.
-
-    The input is ``<canonicalJSON>\\n<previousHash>`` which matches the
-    convention used by ``audit_trail.chain.HashChain``.
-    """
-    payload = _canonicalise(pending) + "\n" + previous_hash
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
-
-
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 
-def verify_chain(records: list[AuditRecord]) -> VerificationResult:
+def verify_chain(
+    records: list[AuditRecord],
+    workers: int | None = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> VerificationResult:
     """
     Verify the SHA-256 hash chain integrity of a list of audit records.
 
-    Walks every record from index 0 and re-derives each expected hash
-    from scratch. Verification stops at the first detected discrepancy.
+    Checks every ``previous_hash`` link from index 0 and re-derives each
+    expected hash from scratch. The first discrepancy is reported.
+
+    With ``workers`` greater than 1, hashes are recomputed for chunks of the
+    chain in a process pool of forked workers, unless other threads are
+    running (see ``audit_trail.chain.find_chain_break``); the result is
+    identical to a single-process run.
 
     This function is purely read-only and does not modify any records.
 
     Args:
         records: List of AuditRecord instances in chain order (oldest first).
+        workers: Number of worker processes used to recompute hashes, or
+            None for one per CPU.
+        chunk_size: Number of records hashed per pool task.
 
     Returns:
         A VerificationResult indicating whether the chain is intact
@@ -120,61 +103,47 @@ def verify_chain(records: list[AuditRecord]) -> VerificationResult:
             first_broken_link=None,
         )
 
-    expected_previous_hash = GENESIS_HASH
-
-    for index, record in enumerate(records):
-        # Check the previous_hash link
-        if record.previous_hash != expected_previous_hash:
-            return VerificationResult(
-                tamper_detected=True,
-                total_records=len(records),
-                total_verified=index,
-                first_broken_link=BrokenLink(
-                    index=index,
-                    record_id=record.id,
-                    expected_hash=expected_previous_hash,
-                    actual_hash=record.previous_hash,
-                    issue=(
-                        f"Record at index {index} has previous_hash "
-                        f'"{record.previous_hash}" but expected '
-                        f'"{expected_previous_hash}".'
-                    ),
-                ),
-            )
-
-        # Reconstruct the pending dict (everything except record_hash)
-        pending = record.model_dump(mode="json", exclude={"record_hash"})
-        # Exclude None values to match how build_pending_record omits them
-        pending = {k: v for k, v in pending.items() if v is not None}
-
-        expected_hash = _compute_hash(pending, expected_previous_hash)
-
-        if record.record_hash != expected_hash:
-            return VerificationResult(
-                tamper_detected=True,
-                total_records=len(records),
-                total_verified=index,
-                first_broken_link=BrokenLink(
-                    index=index,
-                    record_id=record.id,
-                    expected_hash=expected_hash,
-                    actual_hash=record.record_hash,
-                    issue=(
-                        f"Record at index {index} (id={record.id!r}) has "
-                        f'record_hash "{record.record_hash}" but recomputed '
-                        f'hash is "{expected_hash}". '
-                        f"Record content may have been altered."
-                    ),
-                ),
-            )
-
-        expected_previous_hash = record.record_hash
+    broken = find_chain_break(records, workers, chunk_size)
+    if broken is None:
+        return VerificationResult(
+            tamper_detected=False,
+            total_records=len(records),
+            total_verified=len(records),
+            first_broken_link=None,
+        )
 
+    index = broken.index
+    record = records[index]
+    if broken.field == "previous_hash":
+        link = BrokenLink(
+            index=index,
+            record_id=record.id,
+            expected_hash=broken.expected,
+            actual_hash=record.previous_hash,
+            issue=(
+                f"Record at index {index} has previous_hash "
+                f'"{record.previous_hash}" but expected '
+                f'"{broken.expected}".'
+            ),
+        )
+    else:
+        link = BrokenLink(
+            index=index,
+            record_id=record.id,
+            expected_hash=broken.expected,
+            actual_hash=record.record_hash,
+            issue=(
+                f"Record at index {index} (id={record.id!r}) has "
+                f'record_hash "{record.record_hash}" but recomputed '
+                f'hash is "{broken.expected}". '
+                f"Record content may have been altered."
+            ),
+        )
     return VerificationResult(
-        tamper_detected=False,
+        tamper_detected=True,
         total_records=len(records),
-        total_verified=len(records),
-        first_broken_link=None,
+        total_verified=index,
+        first_broken_link=link,
     )
 
 
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 MuVeraAI Corporation
+"""Shared fixtures for agent-audit-trail tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from audit_trail.chain import HashChain
+from audit_trail.record import build_pending_record
+from audit_trail.types import AuditRecord, GovernanceDecisionInput
+
+
+def build_records(count: int, chain: HashChain | None = None) -> list[AuditRecord]:
+    """Append ``count`` deterministic decisions to ``chain`` (a new one by default)."""
+    chain = chain or HashChain()
+    records: list[AuditRecord] = []
+    for index in range(count):
+        decision = GovernanceDecisionInput(
+            agent_id=f"agent-{index % 3}",
+            action="send_email" if index % 2 else "read_file",
+            permitted=index % 5 != 0,
+            trust_level=index % 4,
+            budget_used=index * 0.5,
+            reason=f"decision {index}",
+            metadata={"sequence": index},
+        )
+        pending = build_pending_record(
+            decision,
+            chain.last_hash(),
+            record_id=f"record-{index:04d}",
+            timestamp=f"2026-03-01T00:00:{index % 60:02d}.000Z",
+        )
+        records.append(chain.append(pending))
+    return records
+
+
+@pytest.fixture
+def records() -> list[AuditRecord]:
+    """Fifty records forming an intact chain."""
+    return build_records(50)
@@ -0,0 +1,181 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 MuVeraAI Corporation
+"""Tests for audit_trail.canonical, with and without orjson."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+from conftest import build_records
+
+from audit_trail import canonical
+from audit_trail.canonical import canonical_json, encode_record
+from audit_trail.chain import GENESIS_HASH, HashChain
+from audit_trail.record import build_pending_record
+from audit_trail.types import AuditRecord, GovernanceDecisionInput
+
+VALUES: dict[str, Any] = {
+    "scalars": {"b": True, "a": None, "c": False, "d": 0, "e": -1, "f": "text"},
+    "plain_floats": [0.0, -0.0, 0.1, 1e-4, 123.456, 9999999999999998.0, -2.5],
+    "exponent_floats": [1e16, 1e-5, 1.5e300, -2.2250738585072014e-308, 5e-324],
+    "non_finite_floats": [float("nan"), float("inf"), float("-inf")],
+    "big_ints": [2**63 - 1, 2**63, 2**64 - 1, 2**64, -(2**63), -(2**63) - 1, 10**40],
+    "non_ascii": ["naïve", "日本語", "\U0001f600 non-BMP", "  ", "\x00\x1f\x7f"],
+    "lone_surrogates": ["\ud800", "a\udfffb", ["\udc00"]],
+    "nested": {"z": [1, {"y": [None, 1e16]}], "a": {"c": "\U0001f600", "b": 2**70}},
+    "escapes": {'quote"': "back\\slash", "tab": "\t\n\r"},
+    "empty": [{}, [], ""],
+}
+
+GOLDEN_DECISION = GovernanceDecisionInput(
+    agent_id="agent-ü",
+    action="pay",
+    permitted=False,
+    budget_used=1e16,
+    budget_remaining=1e-05,
+    reason="naïve \U0001f600",
+    metadata={
+        "big": 2**70,
+        "neg": -(2**63) - 1,
+        "rate": 0.1,
+        "nested": [1, None, True, {"b": " ", "a": 1.5e300}],
+    },
+)
+GOLDEN_CANONICAL = (
+    '{"action":"pay","agent_id":"agent-ü","budget_remaining":1e-05,'
+    '"budget_used":1e+16,"id":"golden","metadata":{"big":1180591620717411303424,'
+    '"neg":-9223372036854775809,"nested":[1,null,true,{"a":1.5e+300,"b":" "}],'
+    '"rate":0.1},"permitted":false,"previous_hash":"' + GENESIS_HASH + '",'
+    '"reason":"naïve \U0001f600","timestamp":"2026-03-01T00:00:00.000Z"}'
+)
+GOLDEN_HASH = "15b982658abcaf5c5acd3dfd325decae695d041d125c018cc637a9cd73168ae5"
+# record_hash of the first three records from conftest.build_records.
+GOLDEN_CHAIN = (
+    "adb378d781a3d47650693cf38dc59bfc19534490d94227dd35ef18e570a018c6",
+    "5c5b437f9173486247b25d72c800aefb74264886d6dfd594a3f7f91b33a37c72",
+    "5be3dc309c3d1cb372bb84a2c51c1fd933e6acea22834cced50a6149e063a2b5",
+)
+
+
+def _reference(value: object) -> str:
+    """The encoding the chain has always hashed."""
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def _reference_record(record: AuditRecord) -> str:
+    """The reference encoding of a stored record's pending form."""
+    dumped = record.model_dump(mode="json", exclude={"record_hash"})
+    return _reference({k: v for k, v in dumped.items() if v is not None})
+
+
+def _record(**fields: object) -> AuditRecord:
+    """A stored record with the given optional fields."""
+    return AuditRecord(
+        id="record",
+        timestamp="2026-03-01T00:00:00.000Z",
+        agent_id="agent-1",
+        action="read_file",
+        permitted=True,
+        previous_hash=GENESIS_HASH,
+        record_hash="1" * 64,
+        **fields,  # type: ignore[arg-type]
+    )
+
+
+@pytest.fixture(params=["orjson", "json"], autouse=True)
+def encoder(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run each test with orjson installed and with the standard encoder only."""
+    if request.param == "orjson":
+        monkeypatch.setattr(canonical, "orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(canonical, "orjson", None)
+    return str(request.param)
+
+
+# ---------------------------------------------------------------------------
+# canonical_json
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("name", sorted(VALUES))
+def test_canonical_json_matches_json_dumps(name: str) -> None:
+    value = VALUES[name]
+    assert canonical_json(value) == _reference(value)
+    if isinstance(value, dict):
+        for item in value.values():
+            assert canonical_json(item) == _reference(item)
+    else:
+        for item in value:
+            assert canonical_json(item) == _reference(item)
+            assert canonical_json({"value": item}) == _reference({"value": item})
+
+
+def test_canonical_json_of_subclasses_matches_json_dumps() -> None:
+    class Label(str):
+        pass
+
+    class Count(int):
+        pass
+
+    value = {"label": Label("x"), "count": Count(3), "flag": True}
+    assert canonical_json(value) == _reference(value)
+
+
+# ---------------------------------------------------------------------------
+# encode_record
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("name", sorted(VALUES))
+def test_encode_record_matches_model_dump(name: str) -> None:
+    record = _record(metadata={"value": VALUES[name]}, reason="r\U0001f600")
+    assert encode_record(record) == _reference_record(record)
+
+
+@pytest.mark.parametrize(
+    "budget_used",
+    [0.5, 1e16, 1e-5, float("nan"), float("inf"), 2**70],
+)
+def test_encode_record_float_fields_match_model_dump(budget_used: float) -> None:
+    record = _record(budget_used=budget_used, budget_remaining=-budget_used, trust_level=3)
+    assert encode_record(record) == _reference_record(record)
+
+
+def test_encode_record_handles_surrogate_keys_as_model_dump_does() -> None:
+    metadata = {"key\ud83d": 1}
+    assert canonical_json(metadata) == _reference(metadata)
+    record = _record(metadata=metadata)
+    assert encode_record(record) == _reference_record(record)
+
+    nested = _record(metadata={"value": [metadata]})
+    with pytest.raises(UnicodeEncodeError):
+        _reference_record(nested)
+    with pytest.raises(UnicodeEncodeError):
+        encode_record(nested)
+
+
+def test_encode_record_omits_none_fields() -> None:
+    record = _record()
+    assert encode_record(record) == _reference_record(record)
+    assert "metadata" not in encode_record(record)
+
+
+# ---------------------------------------------------------------------------
+# Golden digests
+# ---------------------------------------------------------------------------
+
+
+def test_golden_record_hash() -> None:
+    pending = build_pending_record(
+        GOLDEN_DECISION, GENESIS_HASH, record_id="golden", timestamp="2026-03-01T00:00:00.000Z"
+    )
+    assert canonical_json(pending) == GOLDEN_CANONICAL
+    record = HashChain().append(pending)
+    assert record.record_hash == GOLDEN_HASH
+    assert encode_record(record) == GOLDEN_CANONICAL
+
+
+def test_golden_chain_hashes() -> None:
+    assert tuple(record.record_hash for record in build_records(3)) == GOLDEN_CHAIN
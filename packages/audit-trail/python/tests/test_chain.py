@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 MuVeraAI Corporation
+"""Tests for audit_trail.chain.find_chain_break and the verifiers built on it."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+
+import pytest
+from conftest import build_records
+
+from audit_trail import chain as chain_module
+from audit_trail.chain import GENESIS_HASH, ChainBreak, HashChain, find_chain_break
+from audit_trail.types import AuditRecord, ChainVerificationFailure, ChainVerificationSuccess
+from aumos_audit.tamper_verify import verify_chain
+
+FORGED_HASH = "f" * 64
+
+
+def _serial_break(records: list[AuditRecord]) -> ChainBreak | None:
+    """The first discrepancy found by a record-by-record walk of the chain."""
+    expected_previous_hash = GENESIS_HASH
+    for index, record in enumerate(records):
+        if record.previous_hash != expected_previous_hash:
+            return ChainBreak(index, "previous_hash", expected_previous_hash)
+        pending = record.model_dump(mode="json", exclude={"record_hash"})
+        pending = {k: v for k, v in pending.items() if v is not None}
+        canonical = json.dumps(pending, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        payload = canonical + "\n" + expected_previous_hash
+        expected_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        if record.record_hash != expected_hash:
+            return ChainBreak(index, "record_hash", expected_hash)
+        expected_previous_hash = record.record_hash
+    return None
+
+
+def _alter(records: list[AuditRecord], index: int) -> None:
+    """Change the content of ``records[index]`` without rehashing it."""
+    records[index] = records[index].model_copy(update={"reason": "rewritten"})
+
+
+def _unlink(records: list[AuditRecord], index: int) -> None:
+    """Point ``records[index]`` at a hash that is not its predecessor's."""
+    records[index] = records[index].model_copy(update={"previous_hash": FORGED_HASH})
+
+
+# ---------------------------------------------------------------------------
+# find_chain_break
+# ---------------------------------------------------------------------------
+
+
+TAMPERING = {
+    "intact": [],
+    "altered_first": [(_alter, 0)],
+    "altered_last": [(_alter, 49)],
+    "altered_at_chunk_edge": [(_alter, 21)],
+    "unlinked_first": [(_unlink, 0)],
+    "unlinked_middle": [(_unlink, 30)],
+    "unlinked_and_altered": [(_unlink, 30), (_alter, 30)],
+    "altered_before_unlinked": [(_alter, 12), (_unlink, 30)],
+    "unlinked_before_altered": [(_unlink, 12), (_alter, 30)],
+}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("case", sorted(TAMPERING))
+def test_find_chain_break_matches_serial_walk(
+    records: list[AuditRecord], case: str, workers: int
+) -> None:
+    for tamper, index in TAMPERING[case]:
+        tamper(records, index)
+    broken = find_chain_break(records, workers=workers, chunk_size=7)
+    assert broken == _serial_break(records)
+    if TAMPERING[case]:
+        assert broken is not None
+
+
+def test_broken_link_takes_precedence_on_the_same_record(records: list[AuditRecord]) -> None:
+    _unlink(records, 30)
+    _alter(records, 30)
+    assert find_chain_break(records, workers=2, chunk_size=7) == ChainBreak(
+        30, "previous_hash", records[29].record_hash
+    )
+
+
+def test_find_chain_break_of_empty_chain() -> None:
+    assert find_chain_break([], workers=2, chunk_size=1) is None
+
+
+def test_find_chain_break_stays_in_process_while_other_threads_run(
+    records: list[AuditRecord], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def no_pool(*args: object, **kwargs: object) -> None:
+        raise AssertionError("forked while another thread was running")
+
+    monkeypatch.setattr(chain_module, "ProcessPoolExecutor", no_pool)
+    _alter(records, 30)
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        broken = find_chain_break(records, workers=2, chunk_size=7)
+    finally:
+        stop.set()
+        thread.join()
+    assert broken == _serial_break(records)
+    assert broken is not None
+
+
+@pytest.mark.parametrize(("workers", "chunk_size"), [(0, 10), (1, 0)])
+def test_find_chain_break_rejects_invalid_arguments(
+    records: list[AuditRecord], workers: int, chunk_size: int
+) -> None:
+    with pytest.raises(ValueError):
+        find_chain_break(records, workers=workers, chunk_size=chunk_size)
+
+
+# ---------------------------------------------------------------------------
+# HashChain.verify and tamper_verify.verify_chain
+# ---------------------------------------------------------------------------
+
+
+def test_hash_chain_verify_reports_intact_chain(records: list[AuditRecord]) -> None:
+    assert HashChain().verify(records, workers=2, chunk_size=7) == ChainVerificationSuccess(
+        record_count=50
+    )
+
+
+def test_hash_chain_verify_reasons(records: list[AuditRecord]) -> None:
+    altered = list(records)
+    _alter(altered, 5)
+    recomputed = _serial_break(altered)
+    assert recomputed is not None
+    assert HashChain().verify(altered) == ChainVerificationFailure(
+        record_count=50,
+        broken_at=5,
+        reason=(
+            f'Record at index 5 (id="record-0005") has record_hash '
+            f'"{records[5].record_hash}" but recomputed hash is '
+            f'"{recomputed.expected}". Record content may have been altered.'
+        ),
+    )
+
+    _unlink(records, 8)
+    assert HashChain().verify(records) == ChainVerificationFailure(
+        record_count=50,
+        broken_at=8,
+        reason=(
+            f'Record at index 8 has previous_hash "{FORGED_HASH}" but expected '
+            f'"{records[7].record_hash}".'
+        ),
+    )
+
+
+def test_tamper_verify_reports_intact_chain(records: list[AuditRecord]) -> None:
+    result = verify_chain(records, workers=2, chunk_size=7)
+    assert not result.tamper_detected
+    assert result.total_verified == 50
+    assert result.first_broken_link is None
+    assert verify_chain([]).total_records == 0
+
+
+def test_tamper_verify_reports_altered_record(records: list[AuditRecord]) -> None:
+    original_hash = records[40].record_hash
+    _alter(records, 40)
+    recomputed = _serial_break(records)
+    assert recomputed is not None
+
+    result = verify_chain(records, workers=2, chunk_size=7)
+    link = result.first_broken_link
+    assert result.tamper_detected
+    assert result.total_verified == 40
+    assert link is not None
+    assert (link.index, link.record_id) == (40, "record-0040")
+    assert (link.expected_hash, link.actual_hash) == (recomputed.expected, original_hash)
+    assert link.issue == (
+        f"Record at index 40 (id='record-0040') has record_hash "
+        f'"{original_hash}" but recomputed hash is "{recomputed.expected}". '
+        f"Record content may have been altered."
+    )
+
+
+def test_tamper_verify_reports_broken_link(records: list[AuditRecord]) -> None:
+    _unlink(records, 40)
+    _alter(records, 40)
+
+    result = verify_chain(records, workers=2, chunk_size=7)
+    link = result.first_broken_link
+    assert result.total_verified == 40
+    assert link is not None
+    assert (link.expected_hash, link.actual_hash) == (records[39].record_hash, FORGED_HASH)
+    assert link.issue == (
+        f'Record at index 40 has previous_hash "{FORGED_HASH}" but expected '
+        f'"{records[39].record_hash}".'
+    )
+
+
+def test_chain_longer_than_one_chunk_verifies_serially_and_in_pool() -> None:
+    records = build_records(120)
+    _alter(records, 97)
+    serial = find_chain_break(records, workers=1, chunk_size=16)
+    assert serial == _serial_break(records)
+    assert find_chain_break(records, workers=3, chunk_size=16) == serial
@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 MuVeraAI Corporation
+"""Tests for audit_trail.storage.file.FileStorage and AuditLogger.close."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+from conftest import build_records
+
+from audit_trail import AuditLogger, FileStorage, GovernanceDecisionInput, MemoryStorage
+from audit_trail.storage import file as file_module
+from audit_trail.types import ChainVerificationSuccess
+
+
+def _decision(index: int) -> GovernanceDecisionInput:
+    """A distinct decision for call number ``index``."""
+    return GovernanceDecisionInput(
+        agent_id=f"agent-{index % 4}", action="tool_call", permitted=True, metadata={"n": index}
+    )
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    """Location of the NDJSON file under test."""
+    return tmp_path / "audit.ndjson"
+
+
+@pytest.fixture
+def fsyncs(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Records the time of every fsync issued by FileStorage."""
+    calls: list[float] = []
+    monkeypatch.setattr(file_module.os, "fsync", lambda fd: calls.append(time.monotonic()))
+    return calls
+
+
+# ---------------------------------------------------------------------------
+# Ordering and group commit
+# ---------------------------------------------------------------------------
+
+
+async def test_concurrent_logs_are_written_in_call_order(path: Path) -> None:
+    storage = FileStorage(path, durability="batch")
+    logger = AuditLogger(storage=storage)
+    logged = await asyncio.gather(*(logger.log(_decision(index)) for index in range(200)))
+    await logger.close()
+
+    stored = await storage.all()
+    assert [record.id for record in stored] == [record.id for record in logged]
+    assert [record.metadata for record in stored] == [{"n": index} for index in range(200)]
+    assert await logger.verify() == ChainVerificationSuccess(record_count=200)
+
+
+async def test_never_does_not_fsync(path: Path, fsyncs: list[float]) -> None:
+    storage = FileStorage(path)
+    for record in build_records(3):
+        await storage.append(record)
+    await asyncio.gather(*(storage.append(record) for record in build_records(20)))
+    await storage.close()
+    assert fsyncs == []
+    assert await storage.count() == 23
+
+
+async def test_batch_fsyncs_once_per_batch(path: Path, fsyncs: list[float]) -> None:
+    storage = FileStorage(path, durability="batch")
+    for record in build_records(3):
+        await storage.append(record)
+    assert len(fsyncs) == 3
+
+    # Appends that arrive together are written and fsynced together.
+    await asyncio.gather(*(storage.append(record) for record in build_records(20)))
+    assert len(fsyncs) == 4
+    await storage.close()
+    assert await storage.count() == 23
+
+
+async def test_interval_spaces_fsyncs(path: Path, fsyncs: list[float]) -> None:
+    storage = FileStorage(path, durability="interval", sync_interval_ms=50)
+    for record in build_records(4):
+        await storage.append(record)
+    await storage.close()
+
+    assert len(fsyncs) == 4
+    gaps = [later - earlier for earlier, later in zip(fsyncs, fsyncs[1:], strict=False)]
+    assert min(gaps) >= 0.045
+
+
+async def test_interval_batches_appends_made_while_waiting(
+    path: Path, fsyncs: list[float]
+) -> None:
+    storage = FileStorage(path, durability="interval", sync_interval_ms=50)
+    await storage.append(build_records(1)[0])
+    # The writer now waits for the interval; these appends join one batch.
+    await asyncio.gather(*(storage.append(record) for record in build_records(10)))
+    await storage.close()
+    assert len(fsyncs) == 2
+
+
+# ---------------------------------------------------------------------------
+# Failures and recovery
+# ---------------------------------------------------------------------------
+
+
+async def test_write_error_reaches_every_append_in_the_batch(
+    path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail(fd: int) -> None:
+        raise OSError("disk full")
+
+    storage = FileStorage(path, durability="batch")
+    monkeypatch.setattr(file_module.os, "fsync", fail)
+    results = await asyncio.gather(
+        *(storage.append(record) for record in build_records(5)), return_exceptions=True
+    )
+    assert [type(result) for result in results] == [OSError] * 5
+    assert all(str(result) == "disk full" for result in results)
+
+    # The handle was dropped; the next batch reopens the file and succeeds.
+    monkeypatch.undo()
+    await storage.append(build_records(1)[0])
+    await storage.close()
+    assert await storage.count() == 6
+
+
+async def test_partial_trailing_line_is_terminated_on_reopen(path: Path) -> None:
+    records = build_records(3)
+    storage = FileStorage(path)
+    await storage.append(records[0])
+    await storage.close()
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write('{"id": "torn", "timest')
+
+    await storage.append(records[1])
+    await storage.append(records[2])
+    await storage.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[1] == '{"id": "torn", "timest'
+    assert len(lines) == 4
+    assert [record.id for record in await storage.all()] == [record.id for record in records]
+
+
+# ---------------------------------------------------------------------------
+# close
+# ---------------------------------------------------------------------------
+
+
+async def test_logger_close_flushes_and_closes_file_storage(path: Path) -> None:
+    storage = FileStorage(path, durability="batch")
+    logger = AuditLogger(storage=storage)
+    pending = [asyncio.ensure_future(logger.log(_decision(index))) for index in range(10)]
+    await asyncio.sleep(0)
+    await logger.close()
+
+    assert all(future.done() for future in pending)
+    assert storage._handle is None
+    assert await storage.count() == 10
+
+    # A later log reopens the file.
+    await logger.log(_decision(10))
+    await logger.close()
+    assert await logger.count() == 11
+
+
+async def test_logger_close_with_memory_storage_is_a_no_op() -> None:
+    logger = AuditLogger(storage=MemoryStorage())
+    await logger.log(_decision(0))
+    await logger.close()
+    assert await logger.count() == 1
+
+
+def test_file_storage_rejects_invalid_policies(path: Path) -> None:
+    with pytest.raises(ValueError):
+        FileStorage(path, durability="always")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        FileStorage(path, durability="interval", sync_interval_ms=0)
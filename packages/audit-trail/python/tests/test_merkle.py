@@ -0,0 +1,188 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 MuVeraAI Corporation
+"""Tests for audit_trail.merkle against a reference RFC 6962 tree."""
+
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+from conftest import build_records
+
+from audit_trail.chain import HashChain
+from audit_trail.merkle import MerkleAccumulator, verify_consistency, verify_inclusion
+from audit_trail.types import ConsistencyProof, InclusionProof
+
+SIZES = range(1, 34)
+LEAVES = [hashlib.sha256(f"record {index}".encode()).hexdigest() for index in range(max(SIZES))]
+
+
+def _reference_root(leaves: list[str]) -> bytes:
+    """MTH(D[n]) from RFC 6962 section 2.1."""
+    if not leaves:
+        return hashlib.sha256(b"").digest()
+    if len(leaves) == 1:
+        return hashlib.sha256(b"\x00" + bytes.fromhex(leaves[0])).digest()
+    split = _split(len(leaves))
+    return hashlib.sha256(
+        b"\x01" + _reference_root(leaves[:split]) + _reference_root(leaves[split:])
+    ).digest()
+
+
+def _reference_path(index: int, leaves: list[str]) -> list[bytes]:
+    """PATH(m, D[n]) from RFC 6962 section 2.1.1."""
+    if len(leaves) <= 1:
+        return []
+    split = _split(len(leaves))
+    if index < split:
+        return _reference_path(index, leaves[:split]) + [_reference_root(leaves[split:])]
+    return _reference_path(index - split, leaves[split:]) + [_reference_root(leaves[:split])]
+
+
+def _reference_subproof(old_size: int, leaves: list[str], complete: bool) -> list[bytes]:
+    """SUBPROOF(m, D[n], b) from RFC 6962 section 2.1.2."""
+    if old_size == len(leaves):
+        return [] if complete else [_reference_root(leaves)]
+    split = _split(len(leaves))
+    if old_size <= split:
+        return _reference_subproof(old_size, leaves[:split], complete) + [
+            _reference_root(leaves[split:])
+        ]
+    return _reference_subproof(old_size - split, leaves[split:], False) + [
+        _reference_root(leaves[:split])
+    ]
+
+
+def _split(width: int) -> int:
+    """Largest power of two strictly below ``width``."""
+    return 1 << ((width - 1).bit_length() - 1)
+
+
+def _hex(nodes: list[bytes]) -> tuple[str, ...]:
+    return tuple(node.hex() for node in nodes)
+
+
+@pytest.fixture(scope="module")
+def accumulator() -> MerkleAccumulator:
+    """An accumulator holding every leaf of LEAVES."""
+    merkle = MerkleAccumulator()
+    merkle.extend(LEAVES)
+    return merkle
+
+
+# ---------------------------------------------------------------------------
+# Roots and proofs
+# ---------------------------------------------------------------------------
+
+
+def test_empty_tree_root() -> None:
+    assert MerkleAccumulator().root() == (
+        "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+    )
+
+
+def test_roots_match_reference_tree(accumulator: MerkleAccumulator) -> None:
+    for size in SIZES:
+        expected = _reference_root(LEAVES[:size]).hex()
+        assert accumulator.root(size) == expected
+        frontier_only = MerkleAccumulator(retain_nodes=False)
+        frontier_only.extend(LEAVES[:size])
+        assert frontier_only.root() == expected
+
+
+def test_inclusion_proofs_match_reference_and_verify(accumulator: MerkleAccumulator) -> None:
+    for size in SIZES:
+        root = accumulator.root(size)
+        for index in range(size):
+            proof = accumulator.inclusion_proof(index, size)
+            assert proof == InclusionProof(
+                index=index,
+                tree_size=size,
+                path=_hex(_reference_path(index, LEAVES[:size])),
+            )
+            assert verify_inclusion(proof, LEAVES[index], root)
+
+
+def test_consistency_proofs_match_reference_and_verify(accumulator: MerkleAccumulator) -> None:
+    for new_size in SIZES:
+        new_root = accumulator.root(new_size)
+        for old_size in range(new_size + 1):
+            proof = accumulator.consistency_proof(old_size, new_size)
+            expected: list[bytes] = []
+            if 0 < old_size < new_size:
+                expected = _reference_subproof(old_size, LEAVES[:new_size], True)
+            assert proof == ConsistencyProof(
+                old_size=old_size, new_size=new_size, path=_hex(expected)
+            )
+            assert verify_consistency(proof, accumulator.root(old_size), new_root)
+
+
+# ---------------------------------------------------------------------------
+# Rejected proofs
+# ---------------------------------------------------------------------------
+
+
+def test_inclusion_proof_rejects_wrong_leaf_root_or_path(accumulator: MerkleAccumulator) -> None:
+    proof = accumulator.inclusion_proof(5, 13)
+    root = accumulator.root(13)
+    assert not verify_inclusion(proof, LEAVES[6], root)
+    assert not verify_inclusion(proof, LEAVES[5], accumulator.root(12))
+    assert not verify_inclusion(proof.model_copy(update={"index": 4}), LEAVES[5], root)
+    assert not verify_inclusion(proof.model_copy(update={"path": proof.path[:-1]}), LEAVES[5], root)
+    assert not verify_inclusion(
+        proof.model_copy(update={"path": (*proof.path, proof.path[0])}), LEAVES[5], root
+    )
+    assert not verify_inclusion(proof.model_copy(update={"path": ("zz",)}), LEAVES[5], root)
+    assert not verify_inclusion(proof.model_copy(update={"index": 13}), LEAVES[5], root)
+
+
+def test_consistency_proof_rejects_wrong_roots_or_path(accumulator: MerkleAccumulator) -> None:
+    proof = accumulator.consistency_proof(6, 21)
+    old_root, new_root = accumulator.root(6), accumulator.root(21)
+    assert not verify_consistency(proof, accumulator.root(5), new_root)
+    assert not verify_consistency(proof, old_root, accumulator.root(20))
+    truncated = proof.model_copy(update={"path": proof.path[1:]})
+    assert not verify_consistency(truncated, old_root, new_root)
+    assert not verify_consistency(proof.model_copy(update={"path": ()}), old_root, new_root)
+    assert not verify_consistency(proof.model_copy(update={"old_size": 22}), old_root, new_root)
+
+
+def test_accumulator_rejects_out_of_range_arguments(accumulator: MerkleAccumulator) -> None:
+    size = accumulator.size
+    with pytest.raises(ValueError):
+        accumulator.root(size + 1)
+    with pytest.raises(ValueError):
+        accumulator.inclusion_proof(size)
+    with pytest.raises(ValueError):
+        accumulator.consistency_proof(5, 4)
+    frontier_only = MerkleAccumulator(retain_nodes=False)
+    frontier_only.extend(LEAVES[:4])
+    with pytest.raises(ValueError):
+        frontier_only.inclusion_proof(0)
+    with pytest.raises(ValueError):
+        frontier_only.root(3)
+
+
+# ---------------------------------------------------------------------------
+# HashChain integration
+# ---------------------------------------------------------------------------
+
+
+def test_hash_chain_proves_its_records() -> None:
+    chain = HashChain(merkle=MerkleAccumulator())
+    records = build_records(21, chain)
+    hashes = [record.record_hash for record in records]
+    root = chain.merkle_root()
+    assert root == _reference_root(hashes).hex()
+
+    for index, record in enumerate(records):
+        proof = chain.inclusion_proof(record.id)
+        assert proof.path == _hex(_reference_path(index, hashes))
+        assert verify_inclusion(proof, record.record_hash, root)
+
+    proof = chain.consistency_proof(8)
+    assert verify_consistency(proof, chain.merkle_root(8), root)
+    with pytest.raises(ValueError):
+        chain.inclusion_proof("missing")
+    with pytest.raises(ValueError):
+        HashChain().merkle_root()
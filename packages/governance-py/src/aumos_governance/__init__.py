@@ -28,20 +28,45 @@ Quick start::
 from __future__ import annotations
 
 from aumos_governance.audit.logger import AuditLogger
-from aumos_governance.audit_chain import ChainedAuditRecord, HashChainedAuditLog
-from aumos_governance.audit.query import AuditFilter, AuditQueryResult, aggregate_outcomes
+from aumos_governance.audit_chain import (
+    ChainedAuditRecord,
+    CheckpointStore,
+    HashChainedAuditLog,
+    VerificationCheckpoint,
+)
+from aumos_governance.audit.query import (
+    AuditFilter,
+    AuditPage,
+    AuditQueryResult,
+    aggregate_outcomes,
+)
 from aumos_governance.audit.record import AuditRecord, GovernanceDecisionContext
+from aumos_governance.audit.write_behind import AuditWriteBehind
 from aumos_governance.budget.manager import BudgetCheckResult, BudgetManager
+from aumos_governance.cache import DecisionCache
 from aumos_governance.config import (
     AuditConfig,
+    AuditSpillConfig,
     BudgetConfig,
+    CacheConfig,
     ConsentConfig,
     GovernanceConfig,
+    InstrumentationConfig,
+    PersistenceConfig,
+    ResetSchedulerConfig,
+    StageConfig,
+    TransactionRetentionConfig,
     TrustConfig,
+    WriteBehindConfig,
 )
 from aumos_governance.consent.manager import ConsentCheckResult, ConsentManager
 from aumos_governance.consent.store import ConsentRecord
-from aumos_governance.engine import GovernanceAction, GovernanceDecision, GovernanceEngine
+from aumos_governance.engine import (
+    GovernanceAction,
+    GovernanceDecision,
+    GovernanceEngine,
+    LeanDecision,
+)
 from aumos_governance.errors import (
     AumOSGovernanceError,
     BudgetExceededError,
@@ -50,8 +75,19 @@ from aumos_governance.errors import (
     ConsentDeniedError,
     ConsentNotFoundError,
     InvalidPeriodError,
+    ReservationNotFoundError,
     TrustLevelError,
 )
+from aumos_governance.instrumentation import Instrumentation, LatencyHistogram
+from aumos_governance.merkle import (
+    ConsistencyProof,
+    InclusionProof,
+    MerkleAccumulator,
+    verify_consistency,
+    verify_inclusion,
+)
+from aumos_governance.persistence import JournalBackend, StateBackend
+from aumos_governance.stages import GovernanceStage, StageContext
 from aumos_governance.trust.manager import SetLevelOptions, TrustManager
 from aumos_governance.trust.validator import TrustCheckResult
 from aumos_governance.types import (
@@ -75,12 +111,28 @@ __all__ = [
     "GovernanceConfig",
     "TrustConfig",
     "BudgetConfig",
+    "TransactionRetentionConfig",
+    "ResetSchedulerConfig",
     "ConsentConfig",
     "AuditConfig",
+    "AuditSpillConfig",
+    "CacheConfig",
+    "WriteBehindConfig",
+    "StageConfig",
+    "InstrumentationConfig",
+    "PersistenceConfig",
     # Engine
     "GovernanceEngine",
     "GovernanceAction",
     "GovernanceDecision",
+    "LeanDecision",
+    "GovernanceStage",
+    "StageContext",
+    "DecisionCache",
+    "Instrumentation",
+    "LatencyHistogram",
+    "StateBackend",
+    "JournalBackend",
     # Trust
     "TrustManager",
     "TrustCheckResult",
@@ -95,13 +147,23 @@ __all__ = [
     # Audit
     "AuditLogger",
     "AuditFilter",
+    "AuditPage",
     "AuditQueryResult",
     "AuditRecord",
     "GovernanceDecisionContext",
+    "AuditWriteBehind",
     "aggregate_outcomes",
     # Hash-chained audit
     "HashChainedAuditLog",
     "ChainedAuditRecord",
+    "VerificationCheckpoint",
+    "CheckpointStore",
+    # Merkle proofs
+    "MerkleAccumulator",
+    "InclusionProof",
+    "ConsistencyProof",
+    "verify_inclusion",
+    "verify_consistency",
     # Errors
     "AumOSGovernanceError",
     "TrustLevelError",
@@ -111,5 +173,6 @@ __all__ = [
     "ConsentNotFoundError",
     "ConfigurationError",
     "InvalidPeriodError",
+    "ReservationNotFoundError",
     "__version__",
 ]
@@ -3,16 +3,37 @@
 from __future__ import annotations
 
 from aumos_governance.audit.logger import AuditLogger
-from aumos_governance.audit.query import AuditFilter, AuditQueryResult, apply_filter, aggregate_outcomes
-from aumos_governance.audit.record import AuditRecord, GovernanceDecisionContext, create_record
+from aumos_governance.audit.index import AuditIndex
+from aumos_governance.audit.query import (
+    AuditFilter,
+    AuditPage,
+    AuditQueryResult,
+    aggregate_outcomes,
+    apply_filter,
+    summarise_outcomes,
+)
+from aumos_governance.audit.record import (
+    AuditRecord,
+    DeferredAuditRecord,
+    GovernanceDecisionContext,
+    create_record,
+)
+from aumos_governance.audit.spill import AuditSpill
+from aumos_governance.audit.write_behind import AuditWriteBehind
 
 __all__ = [
     "AuditLogger",
     "AuditFilter",
+    "AuditIndex",
+    "AuditPage",
     "AuditQueryResult",
     "AuditRecord",
+    "AuditSpill",
+    "AuditWriteBehind",
+    "DeferredAuditRecord",
     "GovernanceDecisionContext",
     "apply_filter",
     "aggregate_outcomes",
     "create_record",
+    "summarise_outcomes",
 ]
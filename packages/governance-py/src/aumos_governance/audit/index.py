@@ -0,0 +1,365 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+"""
+Bounded, indexed storage for audit entries.
+
+:class:`AuditIndex` holds the entries retained by an
+:class:`~aumos_governance.audit.logger.AuditLogger` in a ring buffer and gives
+each entry a *sequence number* when it is appended. Sequence numbers only
+increase, so they double as keyset cursors: the position of an entry never
+changes while it is retained, unlike its offset in a list.
+
+Alongside the ring, the index maps every ``agent_id``, ``outcome``,
+``action_type`` and ``resource`` value to the ascending sequence numbers of
+the entries carrying it. When the ring overwrites its oldest entry, that
+entry's sequence number is dropped from the front of each of its lists, so
+the indexes always describe exactly the retained entries. Timestamps are
+kept per entry; while they are in order (the usual case) ``since`` and
+``until`` are resolved by binary search. Outcome counts per minute are kept
+the same way, so per-key and per-minute counts are available without
+visiting the entries.
+
+The index is not thread-safe; the logger serialises access to it.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from typing import Any
+
+from aumos_governance.audit.query import AuditFilter
+from aumos_governance.audit.record import AuditRecord, DeferredAuditRecord
+
+AuditEntry = AuditRecord | DeferredAuditRecord
+
+# Index keys of an entry: (agent_id, outcome, action_type, resource).
+_Keys = tuple[Any, ...]
+# A retained entry: (sequence, entry, timestamp, keys).
+_Slot = tuple[int, AuditEntry, float, _Keys]
+
+_INDEXED = 4
+_FIELDS = {"agent_id": 0, "outcome": 1, "action_type": 2, "resource": 3}
+
+
+def entry_keys(entry: AuditEntry) -> _Keys:
+    """Return the ``(agent_id, outcome, action_type, resource)`` of ``entry``."""
+    if isinstance(entry, DeferredAuditRecord):
+        agent_id, action_type, resource = entry.index_keys()
+        return (agent_id, entry.outcome, action_type, resource)
+    ctx = entry.context
+    if ctx is None:
+        return (None, entry.outcome, None, None)
+    return (ctx.agent_id, entry.outcome, ctx.action_type, ctx.resource)
+
+
+def entry_timestamp(entry: AuditEntry) -> float:
+    """Return the creation time of ``entry`` as a POSIX timestamp."""
+    if isinstance(entry, DeferredAuditRecord):
+        return entry.created_at
+    return entry.timestamp.timestamp()
+
+
+def _wanted(audit_filter: AuditFilter) -> _Keys:
+    """Return the filter's indexed criteria in index order."""
+    return (
+        audit_filter.agent_id,
+        audit_filter.outcome,
+        audit_filter.action_type,
+        audit_filter.resource,
+    )
+
+
+def _posix(moment: datetime) -> float:
+    """POSIX timestamp of ``moment``; naive datetimes are taken as UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class _Postings:
+    """Ascending sequence numbers with amortised O(1) removal from the front."""
+
+    __slots__ = ("seqs", "head")
+
+    def __init__(self) -> None:
+        self.seqs: list[int] = []
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.seqs) - self.head
+
+    def popleft(self) -> None:
+        self.head += 1
+        # Compact once the dead prefix is at least half of the list.
+        if self.head * 2 >= len(self.seqs):
+            del self.seqs[: self.head]
+            self.head = 0
+
+    def between(self, lo: int, hi: int) -> Iterator[int]:
+        """Yield the sequence numbers in ``[lo, hi)``."""
+        seqs = self.seqs
+        start = bisect_left(seqs, lo, self.head)
+        end = bisect_left(seqs, hi, start)
+        for position in range(start, end):
+            yield seqs[position]
+
+
+class AuditIndex:
+    """
+    Ring buffer of audit entries with secondary indexes.
+
+    Args:
+        capacity: Maximum number of entries retained. Appending beyond it
+            evicts the oldest entry.
+        first_seq: Sequence number of the first entry appended.
+    """
+
+    def __init__(self, capacity: int, first_seq: int = 0) -> None:
+        self._capacity = capacity
+        self._slots: list[_Slot] = []
+        # Sequence number stored at _slots[0] once the ring has been filled
+        # from empty; reset by clear() so numbering continues.
+        self._base = first_seq
+        self._first = first_seq
+        self._next = first_seq
+        self._indexes: tuple[dict[Any, _Postings], ...] = tuple(
+            {} for _ in range(_INDEXED)
+        )
+        # Newest sequence number whose timestamp is earlier than that of the
+        # entry before it; while it is not retained, timestamps are sorted.
+        self._inversion = -1
+        self._last_timestamp = float("-inf")
+        # Minute (POSIX seconds // 60) -> outcome -> number of retained entries.
+        self._minutes: dict[int, dict[Any, int]] = {}
+
+    def __len__(self) -> int:
+        return self._next - self._first
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest retained entry."""
+        return self._first
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next appended entry will receive."""
+        return self._next
+
+    def append(self, entry: AuditEntry) -> AuditEntry | None:
+        """
+        Append ``entry``.
+
+        Returns:
+            The entry evicted to make room, or None.
+        """
+        seq = self._next
+        keys = entry_keys(entry)
+        timestamp = entry_timestamp(entry)
+        if timestamp < self._last_timestamp:
+            self._inversion = seq
+        self._last_timestamp = timestamp
+
+        minute = self._minutes.get(int(timestamp // 60))
+        if minute is None:
+            minute = self._minutes[int(timestamp // 60)] = {}
+        outcome = keys[1]
+        minute[outcome] = minute.get(outcome, 0) + 1
+
+        evicted: AuditEntry | None = None
+        slot: _Slot = (seq, entry, timestamp, keys)
+        if seq - self._first == self._capacity:
+            position = (seq - self._base) % self._capacity
+            old = self._slots[position]
+            evicted = old[1]
+            self._unindex(old)
+            self._slots[position] = slot
+            self._first += 1
+        else:
+            self._slots.append(slot)
+        for index, key in zip(self._indexes, keys, strict=True):
+            if key is not None:
+                postings = index.get(key)
+                if postings is None:
+                    postings = index[key] = _Postings()
+                postings.seqs.append(seq)
+        self._next = seq + 1
+        return evicted
+
+    def extend(self, entries: Iterable[AuditEntry]) -> list[AuditEntry]:
+        """Append ``entries`` in order and return the entries evicted."""
+        evicted = []
+        for entry in entries:
+            old = self.append(entry)
+            if old is not None:
+                evicted.append(old)
+        return evicted
+
+    def clear(self) -> int:
+        """Drop every entry; sequence numbers keep increasing afterwards."""
+        cleared = len(self)
+        self._slots = []
+        self._base = self._first = self._next
+        self._indexes = tuple({} for _ in range(_INDEXED))
+        self._inversion = -1
+        self._last_timestamp = float("-inf")
+        self._minutes = {}
+        return cleared
+
+    def counts(self, field: str) -> dict[Any, int]:
+        """
+        Return the number of retained entries per value of ``field``.
+
+        Args:
+            field: ``"agent_id"``, ``"outcome"``, ``"action_type"`` or
+                ``"resource"``. Entries without a value are not counted.
+        """
+        return {key: len(postings) for key, postings in self._indexes[_FIELDS[field]].items()}
+
+    def minute_counts(self, first: int, last: int) -> dict[int, dict[Any, int]]:
+        """
+        Return outcome counts of retained entries per minute in ``[first, last]``.
+
+        Minutes are POSIX timestamps divided by 60; minutes without entries
+        are omitted. The result is ordered by minute. The cost depends on the
+        number of minutes, not on the number of entries.
+        """
+        minutes = self._minutes
+        if last - first < len(minutes):
+            chosen = [minute for minute in range(first, last + 1) if minute in minutes]
+        else:
+            chosen = sorted(minute for minute in minutes if first <= minute <= last)
+        return {minute: dict(minutes[minute]) for minute in chosen}
+
+    def latest(self, n: int) -> list[AuditEntry]:
+        """Return the ``n`` newest entries, oldest first."""
+        start = max(self._first, self._next - n)
+        return [self._slot(seq)[1] for seq in range(start, self._next)]
+
+    def scan(self, audit_filter: AuditFilter, after: int | None = None) -> Iterator[_Slot]:
+        """
+        Yield the retained slots matching ``audit_filter`` in sequence order.
+
+        ``limit`` and ``offset`` are ignored. The smallest posting list among
+        the filter's indexed criteria drives the scan, narrowed to the
+        ``since`` / ``until`` range when timestamps are in order; remaining
+        criteria are checked against each slot's stored keys, so no entry is
+        materialised.
+
+        Args:
+            audit_filter: The criteria.
+            after: Only yield entries with a larger sequence number.
+        """
+        plan = self._plan(audit_filter, after)
+        if plan is None:
+            return
+        lo, hi, driver, _ = plan
+        checks = [
+            (field, key)
+            for field, key in enumerate(_wanted(audit_filter))
+            if key is not None
+        ]
+        since = _posix(audit_filter.since) if audit_filter.since is not None else None
+        until = _posix(audit_filter.until) if audit_filter.until is not None else None
+        seqs = range(lo, hi) if driver is None else driver.between(lo, hi)
+        for seq in seqs:
+            slot = self._slot(seq)
+            _, _, timestamp, keys = slot
+            if since is not None and timestamp < since:
+                continue
+            if until is not None and timestamp >= until:
+                continue
+            if checks and any(keys[field] != key for field, key in checks):
+                continue
+            yield slot
+
+    def count(self, audit_filter: AuditFilter) -> int:
+        """
+        Return the number of retained entries matching ``audit_filter``.
+
+        When the posting list and time range alone decide the answer, it is
+        computed by binary search without visiting the entries.
+        """
+        plan = self._plan(audit_filter, None)
+        if plan is None:
+            return 0
+        lo, hi, driver, exact = plan
+        if exact:
+            if driver is None:
+                return hi - lo
+            seqs = driver.seqs
+            start = bisect_left(seqs, lo, driver.head)
+            return bisect_left(seqs, hi, start) - start
+        return sum(1 for _ in self.scan(audit_filter))
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _plan(
+        self, audit_filter: AuditFilter, after: int | None
+    ) -> tuple[int, int, _Postings | None, bool] | None:
+        """
+        Work out how to scan for ``audit_filter``.
+
+        Returns:
+            ``(lo, hi, driver, exact)``: the sequence range to scan, the
+            posting list to drive the scan (None to visit every entry in the
+            range) and whether every entry the driver yields in the range
+            matches. None when nothing can match.
+        """
+        lo = self._first if after is None else max(self._first, after + 1)
+        hi = self._next
+        sorted_window = self._inversion <= self._first
+        if sorted_window:
+            if audit_filter.since is not None:
+                lo = self._first_at_or_after(_posix(audit_filter.since), lo, hi)
+            if audit_filter.until is not None:
+                hi = self._first_at_or_after(_posix(audit_filter.until), lo, hi)
+        if lo >= hi:
+            return None
+
+        driver: _Postings | None = None
+        criteria = 0
+        for index, key in zip(self._indexes, _wanted(audit_filter), strict=True):
+            if key is None:
+                continue
+            criteria += 1
+            postings = index.get(key)
+            if postings is None:
+                return None
+            if driver is None or len(postings) < len(driver):
+                driver = postings
+        timed = audit_filter.since is not None or audit_filter.until is not None
+        return lo, hi, driver, criteria <= 1 and (sorted_window or not timed)
+
+    def _slot(self, seq: int) -> _Slot:
+        return self._slots[(seq - self._base) % self._capacity]
+
+    def _unindex(self, slot: _Slot) -> None:
+        """Remove an evicted slot from the indexes; it heads each of its lists."""
+        minute_key = int(slot[2] // 60)
+        minute = self._minutes[minute_key]
+        outcome = slot[3][1]
+        if minute[outcome] == 1:
+            del minute[outcome]
+            if not minute:
+                del self._minutes[minute_key]
+        else:
+            minute[outcome] -= 1
+        for index, key in zip(self._indexes, slot[3], strict=True):
+            if key is not None:
+                postings = index[key]
+                postings.popleft()
+                if not postings:
+                    del index[key]
+
+    def _first_at_or_after(self, timestamp: float, lo: int, hi: int) -> int:
+        """Binary search for the first sequence in ``[lo, hi)`` at or after ``timestamp``."""
+        while lo < hi:
+            middle = (lo + hi) // 2
+            if self._slot(middle)[2] < timestamp:
+                lo = middle + 1
+            else:
+                hi = middle
+        return lo
@@ -2,17 +2,49 @@
 # Copyright (c) 2026 MuVeraAI Corporation
 from __future__ import annotations
 
-import collections
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any
 
-from aumos_governance.audit.query import AuditFilter, AuditQueryResult, apply_filter
+from aumos_governance.audit.index import AuditIndex
+from aumos_governance.audit.query import (
+    AuditFilter,
+    AuditPage,
+    AuditQueryResult,
+    summarise_outcomes,
+)
 from aumos_governance.audit.record import (
     AuditRecord,
+    DeferredAuditRecord,
     GovernanceDecisionContext,
     create_record,
 )
+from aumos_governance.audit.spill import AuditSpill, SpilledRecord, scan_segment
 from aumos_governance.config import AuditConfig
+from aumos_governance.deferred import Deferred
+from aumos_governance.instrumentation import Instrumentation
 from aumos_governance.types import GovernanceOutcome
 
+# Operations timed when an Instrumentation is attached.
+_INSTRUMENTED = (
+    "log",
+    "log_many",
+    "log_deferred",
+    "log_entries",
+    "query",
+    "query_page",
+    "stats",
+)
+
+# In-memory entries collected per lock acquisition when scanning.
+_ITER_BATCH = 256
+
+# A stored entry in either tier.
+_Entry = AuditRecord | DeferredAuditRecord | SpilledRecord
+
 
 class AuditLogger:
     """
@@ -21,9 +53,16 @@ class AuditLogger:
     Audit logging is RECORDING ONLY. There is no anomaly detection,
     pattern analysis, or counterfactual generation.
 
-    All records are stored in-memory in a bounded deque. When
+    All records are stored in-memory in a bounded ring buffer
+    (:class:`~aumos_governance.audit.index.AuditIndex`). When
     :attr:`~AuditConfig.max_records` is reached, the oldest record
-    is evicted to make room for the new one.
+    is evicted to make room for the new one — or, with
+    :attr:`AuditConfig.spill <aumos_governance.config.AuditConfig.spill>`
+    configured, written to an on-disk segment
+    (:class:`~aumos_governance.audit.spill.AuditSpill`) that queries read
+    transparently. Stored records are indexed by agent_id, outcome,
+    action_type and resource, so queries only visit the records that can
+    match, and only the records returned are materialised.
 
     Example::
 
@@ -36,11 +75,25 @@ class AuditLogger:
         results = logger.query(AuditFilter(outcome=GovernanceOutcome.ALLOW))
     """
 
-    def __init__(self, config: AuditConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: AuditConfig | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
         self._config = config or AuditConfig()
-        self._records: collections.deque[AuditRecord] = collections.deque(
-            maxlen=self._config.max_records
-        )
+        self._spill: AuditSpill | None = None
+        first_seq = 0
+        if self._config.spill.directory is not None:
+            self._spill = AuditSpill(self._config.spill)
+            first_seq = self._spill.next_seq
+        self._index = AuditIndex(self._config.max_records, first_seq)
+        # Evicted entries not yet written to the spill, oldest first; the
+        # first has sequence number _evicted_first.
+        self._evicted: list[AuditRecord | DeferredAuditRecord] = []
+        self._evicted_first = first_seq
+        self._lock = threading.Lock()
+        if instrumentation is not None:
+            instrumentation.instrument(self, "audit", _INSTRUMENTED)
 
     # ------------------------------------------------------------------
     # Public API
@@ -52,6 +105,7 @@ class AuditLogger:
         decision: str,
         reasons: list[str] | None = None,
         context: GovernanceDecisionContext | None = None,
+        record_id: str | None = None,
     ) -> AuditRecord:
         """
         Record a governance decision.
@@ -64,6 +118,8 @@ class AuditLogger:
             decision: A concise summary of the decision (e.g. ``'Action denied'``).
             reasons: Optional list of reasons collected from governance checks.
             context: Optional :class:`GovernanceDecisionContext` with metadata.
+            record_id: Optional pre-assigned record ID. A new UUID is
+                generated when omitted.
 
         Returns:
             The created :class:`~aumos_governance.audit.record.AuditRecord`.
@@ -74,15 +130,106 @@ class AuditLogger:
             decision=decision,
             reasons=reasons,
             context=stored_context,
+            record_id=record_id,
         )
-        self._records.append(record)
+        with self._lock:
+            self._append(record)
         return record
 
+    def log_many(
+        self,
+        entries: Iterable[
+            tuple[GovernanceOutcome, str, list[str] | None, GovernanceDecisionContext | None]
+        ],
+    ) -> list[AuditRecord]:
+        """
+        Record several governance decisions in one bulk append.
+
+        Each entry is an ``(outcome, decision, reasons, context)`` tuple with
+        the same meaning as the arguments of :meth:`log`. Records are built
+        first and then appended to the store in a single operation, in the
+        order given.
+
+        Args:
+            entries: The decisions to record.
+
+        Returns:
+            The created :class:`~aumos_governance.audit.record.AuditRecord`
+            objects, in input order.
+        """
+        include_context = self._config.include_context
+        records = [
+            create_record(
+                outcome=outcome,
+                decision=decision,
+                reasons=reasons,
+                context=context if include_context else None,
+            )
+            for outcome, decision, reasons, context in entries
+        ]
+        with self._lock:
+            self._extend(records)
+        return records
+
+    def log_deferred(
+        self,
+        record_id: str,
+        outcome: GovernanceOutcome,
+        decision: str | Deferred[str],
+        reasons: Sequence[str | Deferred[str]],
+        context: Deferred[GovernanceDecisionContext] | None = None,
+        keys: tuple[str | None, str | None, str | None] | None = None,
+    ) -> None:
+        """
+        Record a governance decision without building its record yet.
+
+        Stores a :class:`~aumos_governance.audit.record.DeferredAuditRecord`
+        that counts towards :attr:`~AuditConfig.max_records` like any other
+        entry. Its :class:`~aumos_governance.audit.record.AuditRecord` —
+        decision text, reasons and context included — is built the first time
+        it is returned by :meth:`query` or :meth:`latest`.
+
+        Args:
+            record_id: The pre-assigned record ID.
+            outcome: The :class:`~aumos_governance.types.GovernanceOutcome`.
+            decision: The decision summary, possibly deferred.
+            reasons: Reason strings, any of which may be deferred.
+            context: Optional deferred :class:`GovernanceDecisionContext`.
+            keys: Optional ``(agent_id, action_type, resource)`` of the
+                context, used to index the entry without resolving the
+                context.
+        """
+        stored_context = context if self._config.include_context else None
+        entry = DeferredAuditRecord(record_id, outcome, decision, reasons, stored_context, keys)
+        with self._lock:
+            self._append(entry)
+
+    def log_entries(self, entries: Iterable[AuditRecord | DeferredAuditRecord]) -> None:
+        """
+        Store already-built audit entries in one bulk append.
+
+        This is the default sink for write-behind delivery
+        (:class:`~aumos_governance.audit.write_behind.AuditWriteBehind`).
+        Entries are stored exactly as given — callers are responsible for
+        honouring :attr:`~AuditConfig.include_context` — and deferred entries
+        are materialised on read.
+
+        Args:
+            entries: The entries to store, in order.
+        """
+        with self._lock:
+            self._extend(entries)
+
     def query(self, audit_filter: AuditFilter | None = None) -> AuditQueryResult:
         """
         Query stored audit records.
 
-        Returns all records when no filter is provided.
+        Returns all records when no filter is provided. Only the page
+        selected by ``offset`` and ``limit`` is materialised; see
+        :meth:`iter_query` and :meth:`query_page` for reading large result
+        sets incrementally. With spilling enabled, spilled records are
+        included, oldest first; ``total_matched`` then requires reading every
+        segment that may hold a match.
 
         Args:
             audit_filter: Optional :class:`~aumos_governance.audit.query.AuditFilter`
@@ -93,24 +240,181 @@ class AuditLogger:
             An :class:`~aumos_governance.audit.query.AuditQueryResult` containing
             matching records and aggregate metadata.
         """
-        all_records = list(self._records)
         effective_filter = audit_filter or AuditFilter()
-        return apply_filter(records=all_records, audit_filter=effective_filter)
+        start = effective_filter.offset
+        stop = start + effective_filter.limit if effective_filter.limit > 0 else None
+        page: list[_Entry]
+        if self._spill is None:
+            with self._lock:
+                total = self._index.count(effective_filter)
+                page = [
+                    slot[1] for slot in islice(self._index.scan(effective_filter), start, stop)
+                ]
+        else:
+            total = 0
+            page = []
+            for _, entry in self._scan(effective_filter, None, [-1]):
+                if total >= start and (stop is None or total < stop):
+                    page.append(entry)
+                total += 1
+        return AuditQueryResult(
+            records=[self._materialise(entry) for entry in page],
+            total_matched=total,
+            filter_applied=effective_filter,
+        )
+
+    def query_page(
+        self,
+        audit_filter: AuditFilter | None = None,
+        after: int | None = None,
+        limit: int = 100,
+    ) -> AuditPage:
+        """
+        Return one page of matching records using a keyset cursor.
+
+        ``limit`` and ``offset`` on the filter are ignored; pages are
+        delimited by ``after`` and the ``limit`` argument instead. Records
+        evicted since the previous page are skipped, unless spilling is
+        enabled, in which case they are read from disk.
+
+        Example::
+
+            page = logger.query_page(AuditFilter(agent_id="agent-1"))
+            while page.has_more:
+                page = logger.query_page(
+                    AuditFilter(agent_id="agent-1"), after=page.next_cursor
+                )
+
+        Args:
+            audit_filter: Optional filter criteria.
+            after: The ``next_cursor`` of the previous page, or None to
+                start from the oldest stored record.
+            limit: Maximum number of records in the page. Must be >= 1.
+
+        Returns:
+            An :class:`~aumos_governance.audit.query.AuditPage`.
+
+        Raises:
+            ValueError: If ``limit`` is less than 1.
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be >= 1; got {limit}.")
+        effective_filter = audit_filter or AuditFilter()
+        scanned = [-1 if after is None else after]
+        found = list(islice(self._scan(effective_filter, after, scanned), limit + 1))
+        has_more = len(found) > limit
+        del found[limit:]
+        return AuditPage(
+            records=[self._materialise(entry) for _, entry in found],
+            # A short page has scanned everything stored so far.
+            next_cursor=found[-1][0] if has_more else scanned[0],
+            has_more=has_more,
+        )
+
+    def iter_query(
+        self,
+        audit_filter: AuditFilter | None = None,
+        after: int | None = None,
+    ) -> Iterator[AuditRecord]:
+        """
+        Yield matching records oldest-first without building the full list.
+
+        Records are read in small batches, each under a short lock hold, and
+        materialised as they are yielded. Records logged while iterating are
+        included; records evicted before the iterator reaches them are
+        skipped unless spilling is enabled. ``offset`` and ``limit`` on the
+        filter are honoured.
+
+        Args:
+            audit_filter: Optional filter criteria.
+            after: Optional cursor (an :attr:`AuditPage.next_cursor
+                <aumos_governance.audit.query.AuditPage.next_cursor>`) to
+                start after.
+
+        Yields:
+            Matching :class:`~aumos_governance.audit.record.AuditRecord` objects.
+        """
+        effective_filter = audit_filter or AuditFilter()
+        stop = effective_filter.offset + effective_filter.limit if effective_filter.limit else None
+        matches = self._scan(effective_filter, after, [-1])
+        for _, entry in islice(matches, effective_filter.offset, stop):
+            yield self._materialise(entry)
 
     def count(self) -> int:
-        """Return the total number of stored audit records."""
-        return len(self._records)
+        """Return the total number of stored audit records, spilled ones included."""
+        with self._lock:
+            if self._spill is None:
+                return len(self._index)
+            self._flush_evicted()
+            return len(self._index) + len(self._spill)
+
+    def stats(self, window_minutes: int | None = None) -> dict[str, Any]:
+        """
+        Return outcome counts for the records held in memory.
+
+        The counts are maintained as records are stored and evicted, so the
+        cost does not depend on the number of records. Spilled records are
+        not included.
+
+        Args:
+            window_minutes: Also report the records logged in the last
+                ``window_minutes`` minutes, the current minute included.
+                Must be >= 1.
+
+        Returns:
+            ``allow``, ``deny``, ``allow_with_caveat``, ``total`` and
+            ``denial_rate`` as from
+            :func:`~aumos_governance.audit.query.aggregate_outcomes`;
+            ``by_agent`` and ``by_action_type`` mapping each value to its
+            number of records; and, with ``window_minutes``, ``window``: the
+            same outcome counts over the window plus ``per_minute``, one
+            entry per minute that has records, keyed by the minute's start
+            as an ISO 8601 UTC string.
+
+        Raises:
+            ValueError: If ``window_minutes`` is less than 1.
+        """
+        if window_minutes is not None and window_minutes < 1:
+            raise ValueError(f"window_minutes must be >= 1; got {window_minutes}.")
+        with self._lock:
+            total = len(self._index)
+            outcomes = self._index.counts("outcome")
+            by_agent = self._index.counts("agent_id")
+            by_action_type = self._index.counts("action_type")
+            minutes = None
+            if window_minutes is not None:
+                now = int(time.time() // 60)
+                minutes = self._index.minute_counts(now - window_minutes + 1, now)
+
+        stats = summarise_outcomes(outcomes, total)
+        stats["by_agent"] = by_agent
+        stats["by_action_type"] = by_action_type
+        if minutes is not None:
+            window: dict[str, int] = {}
+            per_minute = {}
+            for minute, counts in minutes.items():
+                for outcome, count in counts.items():
+                    window[outcome] = window.get(outcome, 0) + count
+                start = datetime.fromtimestamp(minute * 60, tz=timezone.utc).isoformat()
+                per_minute[start] = summarise_outcomes(counts, sum(counts.values()))
+            stats["window"] = {
+                **summarise_outcomes(window, sum(window.values())),
+                "per_minute": per_minute,
+            }
+        return stats
 
     def clear(self) -> int:
         """
-        Remove all stored audit records.
+        Remove all audit records held in memory.
+
+        Spilled segments are immutable and are not removed.
 
         Returns:
             The number of records that were cleared.
         """
-        count = len(self._records)
-        self._records.clear()
-        return count
+        with self._lock:
+            self._flush_evicted()
+            return self._index.clear()
 
     def latest(self, n: int = 10) -> list[AuditRecord]:
         """
@@ -125,5 +429,103 @@ class AuditLogger:
         """
         if n < 1:
             raise ValueError(f"n must be >= 1; got {n}.")
-        records = list(self._records)
-        return records[-n:]
+        with self._lock:
+            entries: list[_Entry] = list(self._index.latest(n))
+            if len(entries) < n and self._spill is not None:
+                self._flush_evicted()
+                spilled = self._spill.tail(n - len(entries), self._index.first_seq)
+                entries[:0] = spilled
+        return [self._materialise(entry) for entry in entries]
+
+    def close(self) -> None:
+        """
+        Move the records held in memory to disk and seal the open segment.
+
+        Does nothing unless spilling is enabled. The logger remains usable;
+        later evictions start a new segment.
+        """
+        if self._spill is None:
+            return
+        with self._lock:
+            self._flush_evicted()
+            first = self._index.first_seq
+            retained = self._index.latest(len(self._index))
+            self._spill.write(first, retained)
+            self._index.clear()
+            self._spill.close()
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _append(self, entry: AuditRecord | DeferredAuditRecord) -> None:
+        """Store ``entry``, queueing the entry it evicts for the spill. Caller holds the lock."""
+        first = self._index.first_seq
+        evicted = self._index.append(entry)
+        if evicted is not None and self._spill is not None:
+            if not self._evicted:
+                self._evicted_first = first
+            self._evicted.append(evicted)
+            if len(self._evicted) >= self._config.spill.batch_size:
+                self._flush_evicted()
+
+    def _extend(self, entries: Iterable[AuditRecord | DeferredAuditRecord]) -> None:
+        """Store ``entries``, queueing those they evict for the spill. Caller holds the lock."""
+        first = self._index.first_seq
+        evicted = self._index.extend(entries)
+        if evicted and self._spill is not None:
+            if not self._evicted:
+                self._evicted_first = first
+            self._evicted.extend(evicted)
+            if len(self._evicted) >= self._config.spill.batch_size:
+                self._flush_evicted()
+
+    def _flush_evicted(self) -> None:
+        """Write the queued evicted entries to the spill. Caller holds the lock."""
+        if self._spill is None or not self._evicted:
+            return
+        self._spill.write(self._evicted_first, self._evicted)
+        self._evicted = []
+
+    def _scan(
+        self, audit_filter: AuditFilter, after: int | None, scanned: list[int]
+    ) -> Iterator[tuple[int, _Entry]]:
+        """
+        Yield ``(seq, entry)`` for matching entries in both tiers, oldest first.
+
+        Spilled segments are read without holding the lock; in-memory entries
+        are collected in batches under it. When the generator is exhausted,
+        ``scanned[0]`` is the sequence number after which no stored entry has
+        been examined yet.
+        """
+        cursor = -1 if after is None else after
+        while True:
+            with self._lock:
+                first = self._index.first_seq
+                if self._spill is not None and cursor + 1 < first:
+                    self._flush_evicted()
+                    segments = self._spill.candidates(audit_filter, cursor, first)
+                    batch = None
+                else:
+                    slots = list(islice(self._index.scan(audit_filter, cursor), _ITER_BATCH))
+                    batch = [(slot[0], slot[1]) for slot in slots]
+                    if len(batch) < _ITER_BATCH:
+                        scanned[0] = max(cursor, self._index.next_seq - 1)
+            if batch is None:
+                for path, first_seq, count in segments:
+                    yield from scan_segment(path, first_seq, count, audit_filter, cursor, first)
+                cursor = first - 1
+                continue
+            yield from batch
+            if len(batch) < _ITER_BATCH:
+                return
+            cursor = batch[-1][0]
+
+    @staticmethod
+    def _materialise(entry: _Entry) -> AuditRecord:
+        """Return ``entry`` as an :class:`AuditRecord`."""
+        if isinstance(entry, DeferredAuditRecord):
+            return entry.materialise()
+        if isinstance(entry, dict):
+            return AuditRecord.model_validate(entry)
+        return entry
@@ -2,6 +2,7 @@
 # Copyright (c) 2026 MuVeraAI Corporation
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any
 
@@ -55,6 +56,28 @@ class AuditQueryResult(BaseModel, frozen=True):
     filter_applied: AuditFilter
 
 
+class AuditPage(BaseModel, frozen=True):
+    """
+    One page of a keyset-paginated audit query.
+
+    Cursors are sequence numbers the logger assigns as entries are stored,
+    so a page boundary does not shift when old records are evicted or new
+    ones arrive.
+
+    Attributes:
+        records: The matching audit records, ordered oldest-first.
+        next_cursor: Pass as ``after`` to read the records following this
+            page. When the page is empty it still advances past everything
+            already scanned, so it can be used to poll for new records.
+        has_more: True if matching records after ``next_cursor`` were
+            already stored when the page was read.
+    """
+
+    records: list[AuditRecord]
+    next_cursor: int
+    has_more: bool
+
+
 def apply_filter(
     records: list[AuditRecord],
     audit_filter: AuditFilter,
@@ -141,13 +164,25 @@ def aggregate_outcomes(records: list[AuditRecord]) -> dict[str, Any]:
         if outcome_key in counts:
             counts[outcome_key] += 1
 
-    total = len(records)
-    denial_rate = counts[GovernanceOutcome.DENY] / total if total > 0 else 0.0
+    return summarise_outcomes(counts, len(records))
+
+
+def summarise_outcomes(counts: Mapping[str, int], total: int) -> dict[str, Any]:
+    """
+    Build the :func:`aggregate_outcomes` summary from precomputed counts.
+
+    Args:
+        counts: Number of records per outcome; missing outcomes count as 0.
+        total: Total number of records, including any other outcomes.
 
+    Returns:
+        The same keys as :func:`aggregate_outcomes`.
+    """
+    deny = counts.get(GovernanceOutcome.DENY, 0)
     return {
-        "allow": counts[GovernanceOutcome.ALLOW],
-        "deny": counts[GovernanceOutcome.DENY],
-        "allow_with_caveat": counts[GovernanceOutcome.ALLOW_WITH_CAVEAT],
+        "allow": counts.get(GovernanceOutcome.ALLOW, 0),
+        "deny": deny,
+        "allow_with_caveat": counts.get(GovernanceOutcome.ALLOW_WITH_CAVEAT, 0),
         "total": total,
-        "denial_rate": denial_rate,
+        "denial_rate": deny / total if total > 0 else 0.0,
     }
@@ -2,12 +2,15 @@
 # Copyright (c) 2026 MuVeraAI Corporation
 from __future__ import annotations
 
+import time
 import uuid
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from aumos_governance.deferred import Deferred, resolve_text
 from aumos_governance.types import GovernanceOutcome
 
 
@@ -62,11 +65,79 @@ class AuditRecord(BaseModel, frozen=True):
     )
 
 
+class DeferredAuditRecord:
+    """
+    An audit entry whose :class:`AuditRecord` is built on first read.
+
+    Written by :meth:`~aumos_governance.audit.logger.AuditLogger.log_deferred`
+    on the allocation-light evaluation path. The record ID, outcome and
+    creation time are fixed when the entry is logged; the decision text,
+    reasons and context are rendered only when the entry is read through
+    the logger, after which the materialised record is reused.
+
+    ``keys`` optionally carries the ``(agent_id, action_type, resource)`` the
+    context will contain, so the logger can index the entry without resolving
+    the context. It is ignored when there is no context.
+    """
+
+    __slots__ = (
+        "record_id",
+        "outcome",
+        "created_at",
+        "_keys",
+        "_decision",
+        "_reasons",
+        "_context",
+        "_record",
+    )
+
+    def __init__(
+        self,
+        record_id: str,
+        outcome: GovernanceOutcome,
+        decision: str | Deferred[str],
+        reasons: Sequence[str | Deferred[str]],
+        context: Deferred[GovernanceDecisionContext] | None,
+        keys: tuple[str | None, str | None, str | None] | None = None,
+    ) -> None:
+        self.record_id = record_id
+        self.outcome = outcome
+        self.created_at = time.time()
+        self._keys = keys
+        self._decision = decision
+        self._reasons = reasons
+        self._context = context
+        self._record: AuditRecord | None = None
+
+    def materialise(self) -> AuditRecord:
+        """Return the equivalent :class:`AuditRecord`, building it once."""
+        if self._record is None:
+            self._record = AuditRecord(
+                record_id=self.record_id,
+                outcome=self.outcome,
+                decision=resolve_text(self._decision),
+                reasons=[resolve_text(part) for part in self._reasons],
+                context=self._context.resolve() if self._context is not None else None,
+                timestamp=datetime.fromtimestamp(self.created_at, tz=timezone.utc),
+            )
+        return self._record
+
+    def index_keys(self) -> tuple[str | None, str | None, str | None]:
+        """Return the ``(agent_id, action_type, resource)`` of the context."""
+        if self._context is None:
+            return (None, None, None)
+        if self._keys is not None:
+            return self._keys
+        ctx = self._context.resolve()
+        return (ctx.agent_id, ctx.action_type, ctx.resource)
+
+
 def create_record(
     outcome: GovernanceOutcome,
     decision: str,
     reasons: list[str] | None = None,
     context: GovernanceDecisionContext | None = None,
+    record_id: str | None = None,
 ) -> AuditRecord:
     """
     Construct an :class:`AuditRecord`.
@@ -79,11 +150,21 @@ def create_record(
         decision: A concise human-readable summary of the decision.
         reasons: Optional list of reason strings collected during evaluation.
         context: Optional :class:`GovernanceDecisionContext`.
+        record_id: Optional pre-assigned record ID. A new UUID is generated
+            when omitted.
 
     Returns:
         A frozen :class:`AuditRecord`.
     """
+    if record_id is None:
+        return AuditRecord(
+            outcome=outcome,
+            decision=decision,
+            reasons=reasons or [],
+            context=context,
+        )
     return AuditRecord(
+        record_id=record_id,
         outcome=outcome,
         decision=decision,
         reasons=reasons or [],
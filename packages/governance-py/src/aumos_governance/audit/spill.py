@@ -0,0 +1,452 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+"""
+On-disk segments for audit records evicted from memory.
+
+With :attr:`AuditSpillConfig.directory
+<aumos_governance.config.AuditSpillConfig.directory>` set, the
+:class:`~aumos_governance.audit.logger.AuditLogger` writes every record its
+in-memory tail evicts to an :class:`AuditSpill` instead of discarding it.
+Records are appended, one JSON object per line, to the open segment file
+``audit-<first sequence>.jsonl``. A segment is sealed once it reaches
+:attr:`~aumos_governance.config.AuditSpillConfig.segment_max_bytes` or
+:attr:`~aumos_governance.config.AuditSpillConfig.segment_max_age_seconds`;
+sealing writes ``audit-<first sequence>.meta.json`` holding the segment's
+record count, timestamp range and a bloom filter of its agent IDs, after
+which the segment is never modified.
+
+Queries read a segment only if its timestamp range overlaps the filter and,
+when the filter names an agent, its bloom filter may contain that agent.
+Each line of a segment holds the record with the next sequence number, so
+keyset cursors span both tiers.
+
+A segment left without metadata by an interrupted process is sealed when the
+directory is next opened; a trailing partial line is discarded.
+
+The spill is not thread-safe; the logger serialises access to it.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import math
+import os
+import time
+from collections.abc import Callable, Iterator, Sequence
+from datetime import datetime
+from typing import IO, Any
+
+from aumos_governance.audit.index import _posix
+from aumos_governance.audit.query import AuditFilter
+from aumos_governance.audit.record import AuditRecord, DeferredAuditRecord
+from aumos_governance.config import AuditSpillConfig
+
+# Target false-positive rate of the per-segment agent_id bloom filters.
+_BLOOM_ERROR = 0.01
+
+# A record read back from a segment, as decoded from its JSON line.
+SpilledRecord = dict[str, Any]
+
+
+class _BloomFilter:
+    """A fixed-size bloom filter over strings, using double hashing."""
+
+    __slots__ = ("bits", "size", "hashes")
+
+    def __init__(self, bits: bytearray, hashes: int) -> None:
+        self.bits = bits
+        self.size = len(bits) * 8
+        self.hashes = hashes
+
+    @classmethod
+    def of(cls, values: set[str]) -> _BloomFilter:
+        """Return a filter sized for ``values`` at :data:`_BLOOM_ERROR`."""
+        count = max(len(values), 1)
+        size = max(64, math.ceil(-count * math.log(_BLOOM_ERROR) / math.log(2) ** 2))
+        bloom = cls(bytearray((size + 7) // 8), max(1, round(size / count * math.log(2))))
+        for value in values:
+            for position in bloom._positions(value):
+                bloom.bits[position >> 3] |= 1 << (position & 7)
+        return bloom
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, str):
+            return False
+        bits = self.bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value)
+        )
+
+    def _positions(self, value: str) -> Iterator[int]:
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (first + i * second) % self.size
+
+
+class _Segment:
+    """One segment file and what is known about its records."""
+
+    __slots__ = (
+        "path",
+        "first_seq",
+        "count",
+        "size",
+        "min_timestamp",
+        "max_timestamp",
+        "opened_at",
+        "agents",
+        "bloom",
+    )
+
+    def __init__(self, path: str, first_seq: int) -> None:
+        self.path = path
+        self.first_seq = first_seq
+        self.count = 0
+        self.size = 0
+        self.min_timestamp = math.inf
+        self.max_timestamp = -math.inf
+        self.opened_at = time.time()
+        # Exact agent IDs while the segment is open; the bloom filter once sealed.
+        self.agents: set[str] | None = set()
+        self.bloom: _BloomFilter | None = None
+
+    @property
+    def end_seq(self) -> int:
+        """Sequence number after the segment's last record."""
+        return self.first_seq + self.count
+
+    def may_contain(self, agent_id: str) -> bool:
+        if self.agents is not None:
+            return agent_id in self.agents
+        return self.bloom is not None and agent_id in self.bloom
+
+    def add(self, timestamp: float, agent_id: str | None, size: int) -> None:
+        self.count += 1
+        self.size += size
+        self.min_timestamp = min(self.min_timestamp, timestamp)
+        self.max_timestamp = max(self.max_timestamp, timestamp)
+        if agent_id is not None and self.agents is not None:
+            self.agents.add(agent_id)
+
+    def seal(self) -> None:
+        """Replace the agent set with a bloom filter and write the metadata file."""
+        self.bloom = _BloomFilter.of(self.agents or set())
+        self.agents = None
+        meta = {
+            "first_seq": self.first_seq,
+            "count": self.count,
+            "size": self.size,
+            "min_timestamp": self.min_timestamp if self.count else None,
+            "max_timestamp": self.max_timestamp if self.count else None,
+            "bloom": base64.b64encode(bytes(self.bloom.bits)).decode("ascii"),
+            "bloom_hashes": self.bloom.hashes,
+        }
+        temporary = f"{_meta_path(self.path)}.tmp"
+        with open(temporary, "w", encoding="utf-8") as meta_file:
+            json.dump(meta, meta_file)
+            meta_file.flush()
+            os.fsync(meta_file.fileno())
+        os.replace(temporary, _meta_path(self.path))
+
+    @classmethod
+    def load(cls, path: str) -> _Segment:
+        """Open a sealed segment from its metadata file."""
+        with open(_meta_path(path), encoding="utf-8") as meta_file:
+            meta = json.load(meta_file)
+        segment = cls(path, meta["first_seq"])
+        segment.count = meta["count"]
+        segment.size = meta["size"]
+        if segment.count:
+            segment.min_timestamp = meta["min_timestamp"]
+            segment.max_timestamp = meta["max_timestamp"]
+        segment.agents = None
+        segment.bloom = _BloomFilter(
+            bytearray(base64.b64decode(meta["bloom"])), meta["bloom_hashes"]
+        )
+        return segment
+
+    @classmethod
+    def recover(cls, path: str, first_seq: int) -> _Segment:
+        """Seal a segment whose metadata was never written."""
+        segment = cls(path, first_seq)
+        with open(path, "rb+") as data:
+            complete = 0
+            for line in data:
+                if not line.endswith(b"\n"):
+                    break
+                record = json.loads(line)
+                agent = (record.get("context") or {}).get("agent_id")
+                segment.add(_timestamp(record["timestamp"]), agent, len(line))
+                complete += len(line)
+            data.truncate(complete)
+        segment.seal()
+        return segment
+
+
+class AuditSpill:
+    """
+    The on-disk tier of an :class:`~aumos_governance.audit.logger.AuditLogger`.
+
+    Args:
+        config: Directory and segment rotation settings; ``directory`` must
+            be set. It is created if missing.
+    """
+
+    def __init__(self, config: AuditSpillConfig) -> None:
+        if config.directory is None:
+            raise ValueError("AuditSpillConfig.directory must be set to spill audit records.")
+        self._config = config
+        self._directory = config.directory
+        os.makedirs(self._directory, exist_ok=True)
+        self._segments: list[_Segment] = []
+        for name in sorted(os.listdir(self._directory)):
+            if not (name.startswith("audit-") and name.endswith(".jsonl")):
+                continue
+            path = os.path.join(self._directory, name)
+            if os.path.exists(_meta_path(path)):
+                segment = _Segment.load(path)
+            else:
+                segment = _Segment.recover(path, int(name[len("audit-") : -len(".jsonl")]))
+            self._segments.append(segment)
+        self._open: _Segment | None = None
+        self._file: IO[bytes] | None = None
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number after the newest spilled record."""
+        return self._segments[-1].end_seq if self._segments else 0
+
+    def __len__(self) -> int:
+        return sum(segment.count for segment in self._segments)
+
+    def write(self, first_seq: int, entries: Sequence[AuditRecord | DeferredAuditRecord]) -> None:
+        """
+        Append evicted entries, which carry consecutive sequence numbers.
+
+        Deferred entries are materialised. A new segment is started when the
+        open one is full, too old or would leave a gap in the numbering.
+
+        Args:
+            first_seq: Sequence number of ``entries[0]``.
+            entries: The entries, oldest first.
+        """
+        for seq, entry in enumerate(entries, first_seq):
+            record = entry.materialise() if isinstance(entry, DeferredAuditRecord) else entry
+            line = record.model_dump_json().encode("utf-8") + b"\n"
+            segment, data = self._segment_for(seq)
+            data.write(line)
+            agent = record.context.agent_id if record.context is not None else None
+            segment.add(_posix(record.timestamp), agent, len(line))
+        if self._file is not None:
+            self._file.flush()
+
+    def seal(self) -> None:
+        """Seal the open segment, if any."""
+        if self._open is None or self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        if self._open.count:
+            self._open.seal()
+        else:
+            self._segments.remove(self._open)
+            os.remove(self._open.path)
+        self._open = None
+
+    def close(self) -> None:
+        """Seal the open segment. Later writes start a new segment."""
+        self.seal()
+
+    def candidates(
+        self, audit_filter: AuditFilter, after: int, before: int
+    ) -> list[tuple[str, int, int]]:
+        """
+        Return the segment ranges that may hold matches between two sequences.
+
+        Call with the logger's lock held; the result can be read with
+        :func:`scan_segment` after the lock is released.
+
+        Args:
+            audit_filter: The criteria; only the time range and ``agent_id``
+                are used to skip segments.
+            after: Only sequence numbers greater than this are wanted.
+            before: Only sequence numbers less than this are wanted.
+
+        Returns:
+            ``(path, first_seq, count)`` per segment, oldest first, where
+            ``count`` is the number of lines written so far.
+        """
+        since = _posix(audit_filter.since) if audit_filter.since is not None else None
+        until = _posix(audit_filter.until) if audit_filter.until is not None else None
+        agent_id = audit_filter.agent_id
+        chosen = []
+        for segment in self._segments:
+            if segment.end_seq <= after + 1 or segment.first_seq >= before or not segment.count:
+                continue
+            if since is not None and segment.max_timestamp < since:
+                continue
+            if until is not None and segment.min_timestamp >= until:
+                continue
+            if agent_id is not None and not segment.may_contain(agent_id):
+                continue
+            chosen.append((segment.path, segment.first_seq, segment.count))
+        return chosen
+
+    def tail(self, n: int, before: int) -> list[SpilledRecord]:
+        """Return up to ``n`` of the newest records before sequence ``before``, oldest first."""
+        records: list[SpilledRecord] = []
+        for segment in reversed(self._segments):
+            if len(records) >= n:
+                break
+            if segment.first_seq >= before or not segment.count:
+                continue
+            wanted = n - len(records)
+            lines = [
+                line
+                for seq, line in _lines(segment.path, segment.first_seq, segment.count)
+                if seq < before
+            ]
+            records[:0] = [json.loads(line) for line in lines[-wanted:]]
+        return records
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _segment_for(self, seq: int) -> tuple[_Segment, IO[bytes]]:
+        """Return the segment ``seq`` goes to and its file, rotating if needed."""
+        segment, data = self._open, self._file
+        if segment is not None and data is not None and (
+            segment.end_seq != seq
+            or segment.size >= self._config.segment_max_bytes
+            or (
+                self._config.segment_max_age_seconds is not None
+                and time.time() - segment.opened_at >= self._config.segment_max_age_seconds
+            )
+        ):
+            self.seal()
+            segment = data = None
+        if segment is None or data is None:
+            path = os.path.join(self._directory, f"audit-{seq:012d}.jsonl")
+            segment = self._open = _Segment(path, seq)
+            self._segments.append(segment)
+            data = self._file = open(path, "ab")  # noqa: SIM115
+        return segment, data
+
+
+def scan_segment(
+    path: str,
+    first_seq: int,
+    count: int,
+    audit_filter: AuditFilter,
+    after: int,
+    before: int,
+) -> Iterator[tuple[int, SpilledRecord]]:
+    """
+    Yield ``(seq, record)`` for records of a segment matching ``audit_filter``.
+
+    Lines that cannot contain the filter's agent_id, action_type, resource or
+    outcome are rejected on their bytes, before JSON decoding.
+
+    Args:
+        path: The segment file.
+        first_seq: Sequence number of its first line.
+        count: Number of lines to read.
+        audit_filter: The criteria.
+        after: Only sequence numbers greater than this are wanted.
+        before: Only sequence numbers less than this are wanted.
+    """
+    needles = _needles(audit_filter)
+    matches = _record_matcher(audit_filter)
+    for seq, line in _lines(path, first_seq, count):
+        if seq <= after or seq >= before:
+            continue
+        if needles and not all(needle in line for needle in needles):
+            continue
+        record = json.loads(line)
+        if matches(record):
+            yield seq, record
+
+
+def _lines(path: str, first_seq: int, count: int) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(seq, line)`` for the first ``count`` lines of a segment."""
+    with open(path, "rb") as data:
+        for seq, line in enumerate(data, first_seq):
+            if seq >= first_seq + count:
+                return
+            yield seq, line
+
+
+def _needles(audit_filter: AuditFilter) -> list[bytes]:
+    """
+    Return byte strings every line matching ``audit_filter`` contains.
+
+    Only values that serialise verbatim are used, so a needle never rejects
+    a matching line; the decoded record is still checked afterwards.
+    """
+    needles = []
+    for field, value in (
+        ("agent_id", audit_filter.agent_id),
+        ("action_type", audit_filter.action_type),
+        ("resource", audit_filter.resource),
+        ("outcome", audit_filter.outcome),
+    ):
+        if value is None or not (value.isascii() and value.isprintable()):
+            continue
+        if '"' in value or "\\" in value:
+            continue
+        needles.append(f'"{field}":"{value}"'.encode())
+    return needles
+
+
+def _record_matcher(audit_filter: AuditFilter) -> Callable[[SpilledRecord], bool]:
+    """
+    Return a predicate testing a spilled record against ``audit_filter``.
+
+    The decoded JSON is tested directly, so only matching records need to be
+    validated into :class:`~aumos_governance.audit.record.AuditRecord`.
+    """
+    since = _posix(audit_filter.since) if audit_filter.since is not None else None
+    until = _posix(audit_filter.until) if audit_filter.until is not None else None
+    wanted = [
+        (field, value)
+        for field, value in (
+            ("agent_id", audit_filter.agent_id),
+            ("action_type", audit_filter.action_type),
+            ("resource", audit_filter.resource),
+        )
+        if value is not None
+    ]
+    outcome = audit_filter.outcome
+
+    def matches(record: SpilledRecord) -> bool:
+        if outcome is not None and record["outcome"] != outcome:
+            return False
+        if since is not None or until is not None:
+            timestamp = _timestamp(record["timestamp"])
+            if since is not None and timestamp < since:
+                return False
+            if until is not None and timestamp >= until:
+                return False
+        if wanted:
+            ctx = record.get("context")
+            if ctx is None:
+                return False
+            return all(ctx.get(field) == value for field, value in wanted)
+        return True
+
+    return matches
+
+
+def _meta_path(path: str) -> str:
+    return f"{path[: -len('.jsonl')]}.meta.json"
+
+
+def _timestamp(value: str) -> float:
+    """POSIX timestamp of an ISO 8601 string as written by pydantic."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
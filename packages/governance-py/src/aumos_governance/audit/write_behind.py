@@ -0,0 +1,213 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+"""
+Write-behind delivery of audit entries.
+
+When :attr:`~aumos_governance.config.WriteBehindConfig.enabled` is True the
+engine does not store audit records on the decision path. It pushes a
+:class:`~aumos_governance.audit.record.DeferredAuditRecord` — record ID,
+outcome, timestamp and deferred text — onto a bounded queue, and a
+background thread hands the queue to a sink in batches. The default sink is
+:meth:`AuditLogger.log_entries <aumos_governance.audit.logger.AuditLogger.log_entries>`.
+
+Audit logging remains RECORDING ONLY; this module changes when records are
+stored, never what is stored.
+"""
+from __future__ import annotations
+
+import collections
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+
+from aumos_governance.audit.record import AuditRecord, DeferredAuditRecord
+from aumos_governance.config import WriteBehindConfig
+
+logger = logging.getLogger("aumos.governance.audit")
+
+AuditEntry = AuditRecord | DeferredAuditRecord
+AuditSink = Callable[[Sequence[AuditEntry]], None]
+
+
+class AuditWriteBehind:
+    """
+    Bounded queue drained into an audit sink by a background thread.
+
+    Backpressure when the queue is full is governed by
+    :attr:`~aumos_governance.config.WriteBehindConfig.policy`:
+
+    - ``"block"`` — :meth:`submit` waits until the writer frees space, so
+      backpressure never discards an entry.
+    - ``"drop_oldest"`` — the oldest queued entry is discarded to make room.
+    - ``"drop_newest"`` — the incoming entry is discarded.
+
+    Dropped entries are counted in :meth:`stats`. Under every policy, a batch
+    whose sink call raises is logged, counted in ``sink_errors`` and
+    discarded; it is not retried. Call :meth:`flush` to wait
+    until everything submitted so far has reached the sink, and :meth:`close`
+    at shutdown.
+
+    Example::
+
+        writer = AuditWriteBehind(WriteBehindConfig(enabled=True), logger.log_entries)
+        writer.submit(record)
+        writer.flush()
+        writer.close()
+    """
+
+    def __init__(self, config: WriteBehindConfig, sink: AuditSink) -> None:
+        self._config = config
+        self._sink = sink
+        self._queue: collections.deque[AuditEntry] = collections.deque()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._closed = False
+        self._submitted = 0
+        self._written = 0
+        self._dropped = 0
+        self._batches = 0
+        self._sink_errors = 0
+        self._thread = threading.Thread(
+            target=self._run, name="aumos-audit-write-behind", daemon=True
+        )
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, entry: AuditEntry) -> bool:
+        """
+        Queue ``entry`` for delivery to the sink.
+
+        Args:
+            entry: The audit entry to deliver.
+
+        Returns:
+            True if the entry was queued, False if it was dropped under the
+            ``"drop_newest"`` policy.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+        """
+        capacity = self._config.queue_size
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Audit write-behind queue is closed.")
+            if len(self._queue) >= capacity:
+                policy = self._config.policy
+                if policy == "drop_newest":
+                    self._dropped += 1
+                    return False
+                if policy == "drop_oldest":
+                    self._queue.popleft()
+                    self._dropped += 1
+                else:
+                    while len(self._queue) >= capacity and not self._closed:
+                        self._cond.wait()
+                    if self._closed:
+                        raise RuntimeError("Audit write-behind queue is closed.")
+            self._queue.append(entry)
+            self._submitted += 1
+            if len(self._queue) >= self._config.batch_size:
+                self._cond.notify_all()
+            return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Block until every queued entry has been handed to the sink.
+
+        Args:
+            timeout: Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            True if the queue drained, False if ``timeout`` elapsed first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._cond.notify_all()
+            while self._queue or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout: float | None = None) -> bool:
+        """
+        Flush outstanding entries and stop the writer thread.
+
+        Further calls to :meth:`submit` raise ``RuntimeError``. Calling
+        :meth:`close` more than once is harmless.
+
+        Args:
+            timeout: Maximum seconds to wait for the flush.
+
+        Returns:
+            True if the queue drained before the writer stopped.
+        """
+        drained = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return drained
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return a snapshot of the writer counters.
+
+        Returns:
+            Dict with ``submitted``, ``written``, ``dropped``, ``batches``,
+            ``sink_errors``, ``queued`` and ``queue_size``.
+        """
+        with self._cond:
+            return {
+                "submitted": self._submitted,
+                "written": self._written,
+                "dropped": self._dropped,
+                "batches": self._batches,
+                "sink_errors": self._sink_errors,
+                "queued": len(self._queue),
+                "queue_size": self._config.queue_size,
+            }
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        """Writer thread: hand batches to the sink until closed."""
+        batch_size = self._config.batch_size
+        interval = self._config.flush_interval_seconds
+        while True:
+            with self._cond:
+                if not self._queue and not self._closed:
+                    self._cond.wait(interval)
+                if not self._queue:
+                    if self._closed:
+                        return
+                    continue
+                count = min(batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._in_flight = count
+                # Space was freed for producers blocked under "block".
+                self._cond.notify_all()
+
+            try:
+                self._sink(batch)
+            except Exception:
+                logger.exception("Audit sink failed; %d entries were not stored.", count)
+                failed = True
+            else:
+                failed = False
+
+            with self._cond:
+                self._in_flight = 0
+                self._batches += 1
+                if failed:
+                    self._sink_errors += 1
+                else:
+                    self._written += count
+                self._cond.notify_all()
@@ -8,18 +8,48 @@ of the immediately preceding record. Appending a new record links it
 cryptographically to all prior records so that any retrospective modification
 of an earlier entry is detectable by re-verifying the chain.
 
+Because every record stores the ``previous_hash`` it was chained to, its own
+hash can be recomputed without the records before it. Only the comparison of
+each ``previous_hash`` with the preceding ``record_hash`` is sequential, so
+:meth:`HashChainedAuditLog.verify_chain` can recompute hashes for chunks of
+the chain in a process pool and then check the links in one linear pass.
+
+Verification can also be incremental. A successful run leaves a
+:class:`VerificationCheckpoint` naming the newest record it covered, signed
+with HMAC-SHA256 when the log has a ``checkpoint_key``. Passing that
+checkpoint back as ``since`` checks only the records appended after it, and
+:class:`CheckpointStore` keeps checkpoints in a JSON-lines file between
+runs. When the log evicts its oldest records, it remembers the hash of the
+last evicted one. That hash anchors the first retained record in place of
+the genesis hash.
+
+A log created with a :class:`~aumos_governance.merkle.MerkleAccumulator`
+also adds every record hash to a Merkle tree, so inclusion and consistency
+proofs take O(log n) rather than a walk of the chain.
+
 Audit logging is RECORDING ONLY.  This module contains no anomaly detection,
 pattern analysis, or counterfactual generation.
 """
 from __future__ import annotations
 
 import hashlib
+import hmac
 import json
+import multiprocessing
+import os
+import threading
 import uuid
 from collections import deque
-from dataclasses import dataclass, field
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Optional
+from itertools import islice
+from json.encoder import encode_basestring_ascii
+from typing import IO, Any, Optional
+
+from aumos_governance.errors import ConfigurationError
+from aumos_governance.merkle import ConsistencyProof, InclusionProof, MerkleAccumulator
 
 
 @dataclass(frozen=True)
@@ -51,6 +81,54 @@ class ChainedAuditRecord:
     record_hash: str
 
 
+@dataclass(frozen=True)
+class VerificationCheckpoint:
+    """
+    The newest record covered by a successful chain verification.
+
+    Attributes:
+        index: Position of the record in the chain, counted from the first
+            record ever appended (evicted records included).
+        record_id: The record's ``record_id``.
+        record_hash: The record's ``record_hash``; the next record must link
+            to it.
+        verified_at: ISO 8601 UTC timestamp of the verification.
+        signature: HMAC-SHA256 hex digest of the other fields under the log's
+            ``checkpoint_key``, or an empty string when the log has no key.
+    """
+
+    index: int
+    record_id: str
+    record_hash: str
+    verified_at: str
+    signature: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the checkpoint as a JSON-compatible dict."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> VerificationCheckpoint:
+        """Build a checkpoint from the output of :meth:`to_dict`."""
+        return cls(
+            index=int(data["index"]),
+            record_id=str(data["record_id"]),
+            record_hash=str(data["record_hash"]),
+            verified_at=str(data["verified_at"]),
+            signature=str(data.get("signature", "")),
+        )
+
+
+# Records per task when verify_chain() recomputes hashes in a process pool.
+_DEFAULT_CHUNK_SIZE = 10_000
+
+# Pool workers are forked so that they inherit the records to verify.
+_START_METHODS = multiprocessing.get_all_start_methods()
+
+# Encodes record details as json.dumps(details, separators=(",", ":")) does.
+_DETAILS_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
 # ---------------------------------------------------------------------------
 # HashChainedAuditLog
 # ---------------------------------------------------------------------------
@@ -62,7 +140,8 @@ class HashChainedAuditLog:
 
     Records are stored in an in-memory deque with an optional size cap.  When
     the cap is reached the oldest record is evicted (the chain integrity check
-    covers only the records currently in memory).
+    covers only the records currently in memory, starting from the hash of the
+    last evicted record).
 
     This class is a drop-in addition to :class:`~aumos_governance.audit.logger.AuditLogger`;
     it does not replace it.  Use both when you require both queryable records
@@ -76,13 +155,43 @@ class HashChainedAuditLog:
 
         valid, error = log.verify_chain()
         assert valid, error
+
+    Args:
+        max_size: Maximum number of records retained in memory.
+        checkpoint_key: Secret used to sign the checkpoints this log produces
+            and to check those passed to :meth:`verify_chain`. When None,
+            checkpoints are unsigned and accepted as given.
+        merkle: An empty accumulator to receive every appended record's
+            hash, enabling :meth:`merkle_root`, :meth:`inclusion_proof` and
+            :meth:`consistency_proof`. It covers the whole history, including
+            evicted records.
+
+    Raises:
+        ValueError: If ``merkle`` already holds leaves.
     """
 
     _GENESIS_HASH: str = hashlib.sha256(b"AUMOS_GENESIS_BLOCK").hexdigest()
 
-    def __init__(self, max_size: int = 10_000) -> None:
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        checkpoint_key: Optional[bytes] = None,
+        merkle: Optional[MerkleAccumulator] = None,
+    ) -> None:
+        if merkle is not None and merkle.size:
+            raise ValueError("merkle must be an empty MerkleAccumulator.")
         self._chain: deque[ChainedAuditRecord] = deque(maxlen=max_size)
         self._last_hash: str = self._GENESIS_HASH
+        self._checkpoint_key = checkpoint_key
+        # Number of records evicted so far, i.e. the chain position of
+        # _chain[0], and the record_hash of the last one evicted.
+        self._evicted = 0
+        self._anchor_hash: str = self._GENESIS_HASH
+        self._checkpoint: Optional[VerificationCheckpoint] = None
+        self._merkle = merkle
+        # record_id -> chain position of the retained records, kept for
+        # inclusion proofs.
+        self._positions: dict[str, int] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -132,56 +241,206 @@ class HashChainedAuditLog:
             record_hash=record_hash,
         )
 
+        if len(self._chain) == self._chain.maxlen:
+            oldest = self._chain[0]
+            self._anchor_hash = oldest.record_hash
+            self._evicted += 1
+            if self._merkle is not None:
+                del self._positions[oldest.record_id]
+        if self._merkle is not None:
+            self._positions[record_id] = self._merkle.append(record_hash)
         self._chain.append(record)
         self._last_hash = record_hash
         return record
 
-    def verify_chain(self) -> tuple[bool, Optional[str]]:
+    def verify_chain(
+        self,
+        workers: Optional[int] = 1,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        since: Optional[VerificationCheckpoint] = None,
+    ) -> tuple[bool, Optional[str]]:
         """
-        Verify the integrity of the entire in-memory chain.
+        Verify the integrity of the in-memory chain.
 
-        Walks every record from oldest to newest and confirms that:
+        Confirms, from oldest to newest record, that:
         1. Each record's ``previous_hash`` matches the hash of the record
-           that preceded it (or the genesis hash for the first record).
+           that preceded it (for the first retained record: the hash of the
+           last evicted record, or the genesis hash if none was evicted).
         2. Each record's ``record_hash`` matches the recomputed hash of its
            canonical fields.
 
+        With ``since``, only the records after that checkpoint are checked,
+        the first of them against the checkpoint's ``record_hash``. The
+        checkpoint's record must still match it if it is retained, and its
+        signature must be valid if the log has a ``checkpoint_key``. A
+        checkpoint older than the retained window cannot be linked to it, so
+        the whole window is verified from its anchor instead.
+
+        On success, :attr:`last_checkpoint` is set to a new checkpoint for
+        the newest record verified.
+
+        The links are checked in one pass first; hashes are then recomputed
+        for the records before the first broken link, in chunks spread over a
+        process pool when ``workers`` is greater than 1. The result is the
+        same for any ``workers``: the earliest failing record is reported,
+        and a broken link takes precedence over a hash mismatch on the same
+        record.
+
+        Records are numbered by chain position, counted from the first record
+        ever appended.
+
+        Args:
+            workers: Number of worker processes used to recompute hashes.
+                ``None`` uses one per CPU. Workers are forked from this
+                process, which is only safe while no other thread runs;
+                with 1, when the records fit in a single chunk, when other
+                threads are running, or where ``fork`` is unavailable
+                (Windows), hashes are recomputed in this process.
+            chunk_size: Number of records hashed per pool task.
+            since: A checkpoint from an earlier verification to resume from.
+
         Returns:
             A ``(is_valid, error_message)`` tuple.  ``error_message`` is
             ``None`` when the chain is valid.
-        """
-        records = list(self._chain)
-        if not records:
-            return True, None
-
-        expected_previous = self._GENESIS_HASH
 
-        for index, record in enumerate(records):
-            if record.previous_hash != expected_previous:
+        Raises:
+            ValueError: If ``workers`` or ``chunk_size`` is less than 1.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}.")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}.")
+
+        chain = self._chain
+        offset = self._evicted
+        start = 0
+        expected_previous = self._anchor_hash
+        if since is not None:
+            if self._checkpoint_key is not None and not hmac.compare_digest(
+                since.signature, self._sign(since)
+            ):
+                return False, f"Checkpoint at record {since.index}: signature mismatch."
+            position = since.index - offset
+            if position >= len(chain):
                 return False, (
-                    f"Record {index} (id={record.record_id}): "
-                    f"previous_hash mismatch. "
-                    f"Expected {expected_previous!r}, got {record.previous_hash!r}."
+                    f"Checkpoint at record {since.index} is beyond the newest "
+                    f"record ({offset + len(chain) - 1})."
                 )
+            if position >= 0:
+                record = chain[position]
+                if (record.record_id, record.record_hash) != (
+                    since.record_id,
+                    since.record_hash,
+                ):
+                    return False, (
+                        f"Record {since.index} (id={record.record_id}): "
+                        f"does not match the checkpoint "
+                        f"(id={since.record_id}, hash={since.record_hash!r})."
+                    )
+            if position >= -1:
+                start = position + 1
+                expected_previous = since.record_hash
+
+        # Only the records after ``start`` are copied, from the newest end.
+        records = list(islice(reversed(chain), len(chain) - start))
+        records.reverse()
+        first = offset + start
+
+        linked = len(records)
+        for index, record in enumerate(records):
+            if record.previous_hash != expected_previous:
+                linked = index
+                break
+            expected_previous = record.record_hash
 
-            recomputed = self._compute_record_hash(
-                record_id=record.record_id,
-                timestamp=record.timestamp,
-                agent_id=record.agent_id,
-                action=record.action,
-                decision=record.decision,
-                details=record.details,
-                previous_hash=record.previous_hash,
+        altered = _first_altered(records, linked, workers, chunk_size)
+        if altered is not None:
+            record = records[altered]
+            return False, (
+                f"Record {first + altered} (id={record.record_id}): "
+                f"record_hash mismatch — record may have been tampered with."
             )
-            if record.record_hash != recomputed:
-                return False, (
-                    f"Record {index} (id={record.record_id}): "
-                    f"record_hash mismatch — record may have been tampered with."
+        if linked < len(records):
+            record = records[linked]
+            return False, (
+                f"Record {first + linked} (id={record.record_id}): "
+                f"previous_hash mismatch. "
+                f"Expected {expected_previous!r}, got {record.previous_hash!r}."
+            )
+
+        if records:
+            newest = records[-1]
+            self._checkpoint = self._signed(
+                VerificationCheckpoint(
+                    index=first + len(records) - 1,
+                    record_id=newest.record_id,
+                    record_hash=newest.record_hash,
+                    verified_at=datetime.now(tz=timezone.utc).isoformat(),
                 )
+            )
+        elif since is not None:
+            self._checkpoint = self._signed(
+                replace(since, verified_at=datetime.now(tz=timezone.utc).isoformat())
+            )
+        return True, None
 
-            expected_previous = record.record_hash
+    @property
+    def last_checkpoint(self) -> Optional[VerificationCheckpoint]:
+        """
+        Checkpoint left by the most recent successful :meth:`verify_chain`
+        of a non-empty chain, or None.
+        """
+        return self._checkpoint
 
-        return True, None
+    def merkle_root(self, size: Optional[int] = None) -> str:
+        """
+        Return the hex Merkle root over the first ``size`` records appended
+        (default: all of them).
+
+        Raises:
+            ConfigurationError: If the log has no Merkle accumulator.
+        """
+        return self._require_merkle().root(size)
+
+    def inclusion_proof(
+        self, record_id: str, size: Optional[int] = None
+    ) -> InclusionProof:
+        """
+        Prove that a retained record is in the Merkle tree of ``size``
+        records (default: all records appended so far).
+
+        Check the proof with :func:`~aumos_governance.merkle.verify_inclusion`
+        against a published :meth:`merkle_root`. Records that have been
+        evicted can still be proven by position through the accumulator.
+
+        Raises:
+            ValueError: If no retained record has ``record_id``, or it was
+                appended after the first ``size`` records.
+            ConfigurationError: If the log has no Merkle accumulator.
+        """
+        merkle = self._require_merkle()
+        position = self._positions.get(record_id)
+        if position is None:
+            raise ValueError(f"No retained record has id {record_id!r}.")
+        return merkle.inclusion_proof(position, size)
+
+    def consistency_proof(
+        self, old_size: int, new_size: Optional[int] = None
+    ) -> ConsistencyProof:
+        """
+        Prove that the Merkle tree of the first ``old_size`` records is a
+        prefix of the tree of ``new_size`` records (default: all records).
+
+        Check the proof with
+        :func:`~aumos_governance.merkle.verify_consistency`.
+
+        Raises:
+            ValueError: If the sizes are out of range.
+            ConfigurationError: If the log has no Merkle accumulator.
+        """
+        return self._require_merkle().consistency_proof(old_size, new_size)
 
     def get_records(
         self, agent_id: Optional[str] = None
@@ -209,6 +468,33 @@ class HashChainedAuditLog:
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _require_merkle(self) -> MerkleAccumulator:
+        if self._merkle is None:
+            raise ConfigurationError(
+                "HashChainedAuditLog was created without a MerkleAccumulator."
+            )
+        return self._merkle
+
+    def _sign(self, checkpoint: VerificationCheckpoint) -> str:
+        """HMAC-SHA256 of the checkpoint's fields, or "" without a key."""
+        if self._checkpoint_key is None:
+            return ""
+        payload = json.dumps(
+            [
+                checkpoint.index,
+                checkpoint.record_id,
+                checkpoint.record_hash,
+                checkpoint.verified_at,
+            ],
+            separators=(",", ":"),
+        )
+        return hmac.new(
+            self._checkpoint_key, payload.encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+
+    def _signed(self, checkpoint: VerificationCheckpoint) -> VerificationCheckpoint:
+        return replace(checkpoint, signature=self._sign(checkpoint))
+
     @staticmethod
     def _genesis_hash() -> str:
         """Return the well-known genesis hash constant."""
@@ -229,16 +515,190 @@ class HashChainedAuditLog:
         Compute the SHA-256 digest for a record's canonical fields.
 
         The canonical representation is a JSON object with keys in a fixed
-        order, serialised without trailing whitespace.
-        """
-        canonical: dict[str, object] = {
-            "record_id": record_id,
-            "timestamp": timestamp,
-            "agent_id": agent_id,
-            "action": action,
-            "decision": decision,
-            "details": details,
-            "previous_hash": previous_hash,
-        }
-        serialised = json.dumps(canonical, separators=(",", ":"), sort_keys=False)
+        order, serialised without trailing whitespace. It is the output of
+        ``json.dumps(canonical, separators=(",", ":"))``, assembled from
+        pre-encoded keys instead of building and encoding a dict per record.
+        """
+        quote = encode_basestring_ascii
+        try:
+            serialised = "".join(
+                (
+                    '{"record_id":',
+                    quote(record_id),
+                    ',"timestamp":',
+                    quote(timestamp),
+                    ',"agent_id":',
+                    quote(agent_id),
+                    ',"action":',
+                    quote(action),
+                    ',"decision":',
+                    quote(decision),
+                    ',"details":',
+                    _DETAILS_ENCODER.encode(details),
+                    ',"previous_hash":',
+                    quote(previous_hash),
+                    "}",
+                )
+            )
+        except TypeError:
+            # A field that is not a string: let json.dumps encode it (or
+            # raise) exactly as before.
+            canonical: dict[str, object] = {
+                "record_id": record_id,
+                "timestamp": timestamp,
+                "agent_id": agent_id,
+                "action": action,
+                "decision": decision,
+                "details": details,
+                "previous_hash": previous_hash,
+            }
+            serialised = json.dumps(canonical, separators=(",", ":"), sort_keys=False)
         return hashlib.sha256(serialised.encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# CheckpointStore
+# ---------------------------------------------------------------------------
+
+
+class CheckpointStore:
+    """
+    Append-only JSON-lines file of verification checkpoints.
+
+    Each :meth:`save` appends one line and fsyncs the file. A line left
+    incomplete by a crash is skipped when reading.
+
+    Example::
+
+        store = CheckpointStore("/var/lib/agent/audit-checkpoints.jsonl")
+        valid, error = log.verify_chain(since=store.latest())
+        if valid and log.last_checkpoint is not None:
+            store.save(log.last_checkpoint)
+
+    Args:
+        path: The checkpoint file; created by the first :meth:`save`.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._path = os.fspath(path)
+
+    def save(self, checkpoint: VerificationCheckpoint) -> None:
+        """Append ``checkpoint`` to the file and flush it to disk."""
+        line = json.dumps(checkpoint.to_dict(), separators=(",", ":")) + "\n"
+        with open(self._path, "a+b") as handle:
+            # Start on a fresh line if the previous write was torn.
+            if handle.tell() and not self._ends_with_newline(handle):
+                line = "\n" + line
+            handle.write(line.encode("utf-8"))
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def latest(self) -> Optional[VerificationCheckpoint]:
+        """Return the most recently saved checkpoint, or None."""
+        if not os.path.exists(self._path):
+            return None
+        latest: Optional[VerificationCheckpoint] = None
+        with open(self._path, encoding="utf-8") as handle:
+            for line in handle:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    latest = VerificationCheckpoint.from_dict(json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    continue
+        return latest
+
+    @staticmethod
+    def _ends_with_newline(handle: IO[bytes]) -> bool:
+        handle.seek(-1, os.SEEK_END)
+        return handle.read(1) == b"\n"
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+
+def _first_altered(
+    records: Sequence[ChainedAuditRecord],
+    stop: int,
+    workers: int,
+    chunk_size: int,
+) -> Optional[int]:
+    """
+    Return the index of the first record before ``stop`` whose stored
+    ``record_hash`` differs from the hash recomputed against its own
+    ``previous_hash``, or None.
+
+    With more than one worker and more than one chunk, the chunks are hashed
+    in a pool of forked processes and examined in order; chunks after the
+    first mismatch are cancelled. The workers inherit ``records`` when they
+    are forked, so a task carries only its index range: pickling the records
+    themselves would cost more than hashing them. Where ``fork`` is not
+    available, or other threads are running (see :func:`_can_fork`), the
+    records are hashed in this process.
+    """
+    if workers == 1 or stop <= chunk_size or not _can_fork():
+        return _scan_chunk(records, 0, stop)
+    bounds = range(0, stop, chunk_size)
+    pool = ProcessPoolExecutor(
+        max_workers=min(workers, len(bounds)),
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_adopt_records,
+        initargs=(records,),
+    )
+    try:
+        futures = [
+            pool.submit(_scan_worker_chunk, lo, min(lo + chunk_size, stop)) for lo in bounds
+        ]
+        for future in futures:
+            altered = future.result()
+            if altered is not None:
+                return altered
+        return None
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _can_fork() -> bool:
+    """
+    Whether hashes may be recomputed in forked workers: ``fork`` must be
+    available and this must be the only running thread. A child forked
+    while another thread holds a lock (the logging, import or allocator
+    locks, or one of ours) inherits it held and can deadlock.
+    """
+    return "fork" in _START_METHODS and threading.active_count() == 1
+
+
+# The records being verified, in a pool worker.
+_worker_records: Sequence[ChainedAuditRecord] = ()
+
+
+def _adopt_records(records: Sequence[ChainedAuditRecord]) -> None:
+    """Pool initializer: keep the records inherited from the parent."""
+    global _worker_records
+    _worker_records = records
+
+
+def _scan_worker_chunk(lo: int, hi: int) -> Optional[int]:
+    """Pool task: index of the first altered record in ``records[lo:hi]``, or None."""
+    return _scan_chunk(_worker_records, lo, hi)
+
+
+def _scan_chunk(records: Sequence[ChainedAuditRecord], lo: int, hi: int) -> Optional[int]:
+    """Index of the first altered record in ``records[lo:hi]``, or None."""
+    compute = HashChainedAuditLog._compute_record_hash
+    for index in range(lo, hi):
+        record = records[index]
+        recomputed = compute(
+            record_id=record.record_id,
+            timestamp=record.timestamp,
+            agent_id=record.agent_id,
+            action=record.action,
+            decision=record.decision,
+            details=record.details,
+            previous_hash=record.previous_hash,
+        )
+        if record.record_hash != recomputed:
+            return index
+    return None
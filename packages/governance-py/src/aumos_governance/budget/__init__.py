@@ -3,8 +3,19 @@
 from __future__ import annotations
 
 from aumos_governance.budget.manager import BudgetCheckResult, BudgetManager
-from aumos_governance.budget.policy import apply_rollover, next_reset_date, should_reset
-from aumos_governance.budget.tracker import BudgetEnvelope, CategoryTracker, SpendingTransaction
+from aumos_governance.budget.policy import (
+    apply_rollover,
+    next_reset_date,
+    reset_deadline,
+    should_reset,
+)
+from aumos_governance.budget.scheduler import BudgetResetScheduler, TimerWheel
+from aumos_governance.budget.tracker import (
+    BudgetEnvelope,
+    CategoryTracker,
+    SpendingTransaction,
+    TransactionLog,
+)
 
 __all__ = [
     "BudgetManager",
@@ -12,7 +23,11 @@ __all__ = [
     "CategoryTracker",
     "BudgetEnvelope",
     "SpendingTransaction",
+    "TransactionLog",
+    "BudgetResetScheduler",
+    "TimerWheel",
     "next_reset_date",
+    "reset_deadline",
     "should_reset",
     "apply_rollover",
 ]
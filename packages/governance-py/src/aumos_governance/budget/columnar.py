@@ -0,0 +1,365 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+"""
+Column-oriented budget storage for very large numbers of categories.
+
+:class:`ColumnarCategoryTracker` keeps every category's limit, effective
+limit, spent, reserved and period start in NumPy blocks rather than one
+object per category, with a dict mapping each category to its row. A
+category only gets a :class:`~aumos_governance.budget.tracker.BudgetEnvelope`
+view (and a transaction log) once something reads or charges it, so creating
+hundreds of thousands of categories stays cheap, and :meth:`snapshot`,
+:meth:`utilizations` and :meth:`top_k_by_utilization` are computed over
+whole columns at once.
+
+Blocks have a fixed number of rows and are never reallocated, so views stay
+valid while new categories are added.
+
+Requires NumPy, installed with ``pip install 'aumos-governance[columnar]'``.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager
+from datetime import date
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from aumos_governance.budget.shared import (
+    _EFFECTIVE_LIMIT,
+    _LAST_RESET,
+    _LIMIT,
+    _RESERVED,
+    _SPENT,
+    SharedBudgetEnvelope,
+)
+from aumos_governance.budget.tracker import BudgetEnvelope, CategoryTracker, _state_entry
+from aumos_governance.config import TransactionRetentionConfig
+from aumos_governance.persistence import StateBackend, StateEntry
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+# Fields per row, laid out as in the shared-memory table.
+_FIELDS = 5
+_BLOCK_ROWS = 4096
+
+
+def _numpy() -> ModuleType:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "NumPy must be installed to use ColumnarCategoryTracker. "
+            "Install it with: pip install 'aumos-governance[columnar]'"
+        ) from exc
+    return numpy
+
+
+class ColumnarBudgetEnvelope(SharedBudgetEnvelope):
+    """
+    A :class:`~aumos_governance.budget.tracker.BudgetEnvelope` whose counters
+    are one row of a :class:`ColumnarCategoryTracker` block.
+
+    Created by the tracker on first access to a category; do not instantiate
+    directly.
+    """
+
+    __slots__ = ()
+
+
+class ColumnarCategoryTracker(CategoryTracker):
+    """
+    A :class:`~aumos_governance.budget.tracker.CategoryTracker` storing its
+    counters in NumPy columns.
+
+    Plug it into a manager with ``BudgetManager(tracker=ColumnarCategoryTracker())``;
+    the manager's API and semantics are unchanged. Per-category locks are
+    created on first use.
+
+    Example::
+
+        tracker = ColumnarCategoryTracker()
+        manager = BudgetManager(tracker=tracker)
+        for tenant in tenants:
+            manager.create_budget(f"{tenant}:gpt-4o", limit=50.0)
+        hottest = manager.top_k_by_utilization(20)
+
+    Args:
+        retention: Transaction history retention for categories that have
+            been charged, as for
+            :class:`~aumos_governance.budget.tracker.CategoryTracker`.
+        backend: Optional persistence backend, as for
+            :class:`~aumos_governance.budget.tracker.CategoryTracker`.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+
+    def __init__(
+        self,
+        retention: TransactionRetentionConfig | None = None,
+        backend: StateBackend | None = None,
+    ) -> None:
+        self._np = _numpy()
+        self._blocks: list[NDArray[np.float64]] = []
+        # Flat float views of each block, shared with the envelope views.
+        self._views: list[memoryview[float]] = []
+        self._names: list[str] = []
+        self._periods: list[str] = []
+        self._index: dict[str, int] = {}
+        self._table_lock = threading.Lock()
+        super().__init__(retention, backend)
+
+    def create(self, category: str, limit: float, period: str) -> BudgetEnvelope:
+        """
+        Add a row for a new category.
+
+        The returned view is not retained: categories that are created but
+        never charged or read cost one row and no per-category objects.
+
+        Raises:
+            ValueError: If ``category`` already exists (see
+                :meth:`CategoryTracker.create
+                <aumos_governance.budget.tracker.CategoryTracker.create>` for
+                restored categories).
+        """
+        restored = self._attach_restored(category, limit, period)
+        if restored is not None:
+            return restored
+        with self._table_lock:
+            if category in self._index:
+                raise ValueError(
+                    f"Budget category '{category}' already exists. "
+                    "Use update() to modify it."
+                )
+            row = self._append_row(category, limit, period, limit, 0.0, date.today())
+            envelope = self._view(category, row)
+        if self._backend is not None:
+            self._backend.append(_state_entry(envelope))
+        return envelope
+
+    def get(self, category: str) -> BudgetEnvelope | None:
+        """Return the envelope view for ``category``, or None if not found."""
+        envelope = self._envelopes.get(category)
+        if envelope is not None:
+            return envelope
+        row = self._index.get(category)
+        if row is None:
+            return None
+        with self._table_lock:
+            envelope = self._envelopes.get(category)
+            if envelope is None:
+                envelope = self._envelopes[category] = self._view(category, row)
+            return envelope
+
+    def lock(self, category: str) -> AbstractContextManager[object]:
+        """
+        Return the lock guarding ``category``, creating it on first use.
+
+        Raises:
+            KeyError: If ``category`` does not exist.
+        """
+        lock = self._locks.get(category)
+        if lock is not None:
+            return lock
+        if category not in self._index:
+            raise KeyError(category)
+        with self._table_lock:
+            return self._locks.setdefault(category, threading.Lock())
+
+    def all_categories(self) -> list[str]:
+        """Return every category name, in creation order."""
+        return list(self._names)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Return plain-dict snapshots for every category, computed column-wise."""
+        names, rows = self._rows()
+        columns = self._derived(rows)
+        # Few distinct period starts exist, so each is formatted once.
+        iso_dates = {
+            ordinal: date.fromordinal(int(ordinal)).isoformat()
+            for ordinal in set(rows[:, _LAST_RESET].tolist())
+        }
+        last_reset = [iso_dates[ordinal] for ordinal in rows[:, _LAST_RESET].tolist()]
+        envelopes = self._envelopes
+        counts = [
+            envelope.transactions.count if envelope is not None else 0
+            for envelope in map(envelopes.get, names)
+        ]
+        return [
+            {
+                "category": name,
+                "limit": limit,
+                "effective_limit": effective_limit,
+                "spent": spent,
+                "reserved": reserved,
+                "remaining": remaining,
+                "utilization": utilization,
+                "period": period,
+                "last_reset": reset,
+                "transaction_count": count,
+            }
+            for (
+                name, limit, effective_limit, spent, reserved, remaining,
+                utilization, period, reset, count,
+            ) in zip(
+                names,
+                columns["limit"].tolist(),
+                columns["effective_limit"].tolist(),
+                columns["spent"].tolist(),
+                columns["reserved"].tolist(),
+                columns["remaining"].tolist(),
+                columns["utilization"].tolist(),
+                self._periods[: len(names)],
+                last_reset,
+                counts,
+                strict=True,
+            )
+        ]
+
+    def utilizations(self) -> dict[str, float]:
+        """Return each category's utilization, computed over the whole column."""
+        names, rows = self._rows()
+        return dict(zip(names, self._derived(rows)["utilization"].tolist(), strict=True))
+
+    def top_k_by_utilization(self, k: int) -> list[tuple[str, float]]:
+        """
+        Return the ``k`` most utilized categories, highest first.
+
+        Uses a partial partition, so the cost is linear in the number of
+        categories rather than a full sort. Ties keep creation order.
+        """
+        names, rows = self._rows()
+        if k <= 0 or not names:
+            return []
+        np = self._np
+        utilization = self._derived(rows)["utilization"]
+        if k < len(names):
+            chosen = np.sort(np.argpartition(-utilization, k - 1)[:k])
+        else:
+            chosen = np.arange(len(names))
+        ordered = chosen[np.argsort(-utilization[chosen], kind="stable")]
+        return [(names[row], float(utilization[row])) for row in ordered.tolist()]
+
+    def columns(self) -> dict[str, Any]:
+        """
+        Return the current state as columns.
+
+        Returns:
+            ``"category"`` (list of names) and NumPy arrays ``"limit"``,
+            ``"effective_limit"``, ``"spent"``, ``"reserved"``,
+            ``"remaining"`` and ``"utilization"``, all in creation order.
+            The arrays are copies.
+        """
+        names, rows = self._rows()
+        return {"category": names, **self._derived(rows)}
+
+    def state_entries(self) -> Iterator[StateEntry]:
+        """Yield one ``budget.state`` entry per category."""
+        names, rows = self._rows()
+        for row, (name, values) in enumerate(zip(names, rows.tolist(), strict=True)):
+            yield {
+                "op": "budget.state",
+                "category": name,
+                "limit": values[_LIMIT],
+                "period": self._periods[row],
+                "effective_limit": values[_EFFECTIVE_LIMIT],
+                "spent": values[_SPENT],
+                "last_reset": date.fromordinal(int(values[_LAST_RESET])).isoformat(),
+            }
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _append_row(
+        self,
+        category: str,
+        limit: float,
+        period: str,
+        effective_limit: float,
+        spent: float,
+        last_reset: date,
+    ) -> int:
+        """Write a new row and return its index. Caller holds the table lock."""
+        row = len(self._names)
+        block, offset = divmod(row, _BLOCK_ROWS)
+        if block == len(self._blocks):
+            new_block = self._np.zeros((_BLOCK_ROWS, _FIELDS), dtype=self._np.float64)
+            self._blocks.append(new_block)
+            self._views.append(memoryview(new_block.reshape(-1)).cast("B").cast("d"))
+        values = self._blocks[block][offset]
+        values[_LIMIT] = limit
+        values[_EFFECTIVE_LIMIT] = effective_limit
+        values[_SPENT] = spent
+        values[_RESERVED] = 0.0
+        values[_LAST_RESET] = float(last_reset.toordinal())
+        self._names.append(category)
+        self._periods.append(period)
+        # Published last: a category is visible once its row is complete.
+        self._index[category] = row
+        return row
+
+    def _view(self, category: str, row: int) -> ColumnarBudgetEnvelope:
+        """Return a new envelope view of ``row``."""
+        block, offset = divmod(row, _BLOCK_ROWS)
+        values = self._views[block]
+        base = offset * _FIELDS
+        return ColumnarBudgetEnvelope(
+            category=category,
+            limit=values[base + _LIMIT],
+            period=self._periods[row],
+            values=values,
+            base=base,
+            transactions=self._new_log(),
+        )
+
+    def _rows(self) -> tuple[list[str], NDArray[np.float64]]:
+        """Return the category names and a copy of their rows."""
+        with self._table_lock:
+            names = list(self._names)
+            blocks = list(self._blocks)
+        if not blocks:
+            return names, self._np.zeros((0, _FIELDS), dtype=self._np.float64)
+        return names, self._np.concatenate(blocks)[: len(names)]
+
+    def _derived(self, rows: NDArray[np.float64]) -> dict[str, NDArray[np.float64]]:
+        """Return the stored and computed columns for ``rows``."""
+        np = self._np
+        effective_limit = rows[:, _EFFECTIVE_LIMIT]
+        spent = rows[:, _SPENT]
+        reserved = rows[:, _RESERVED]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            utilization = np.where(
+                effective_limit == 0.0,
+                np.where(spent > 0, np.inf, 0.0),
+                spent / effective_limit,
+            )
+        return {
+            "limit": rows[:, _LIMIT].copy(),
+            "effective_limit": effective_limit.copy(),
+            "spent": spent.copy(),
+            "reserved": reserved.copy(),
+            "remaining": effective_limit - spent - reserved,
+            "utilization": utilization,
+        }
+
+    def _restore(self, entries: Iterable[StateEntry]) -> None:
+        """Append a row for every category described by backend entries."""
+        latest: dict[str, StateEntry] = {}
+        for state in entries:
+            latest[state["category"]] = state
+        with self._table_lock:
+            for category, state in latest.items():
+                self._append_row(
+                    category,
+                    state["limit"],
+                    state["period"],
+                    state["effective_limit"],
+                    state["spent"],
+                    date.fromisoformat(state["last_reset"]),
+                )
+                self._restored.add(category)
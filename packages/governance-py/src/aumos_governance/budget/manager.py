@@ -2,14 +2,39 @@
 # Copyright (c) 2026 MuVeraAI Corporation
 from __future__ import annotations
 
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import ExitStack
+
 from pydantic import BaseModel
 
-from aumos_governance.budget.policy import apply_rollover, should_reset
-from aumos_governance.budget.tracker import CategoryTracker, SpendingTransaction
+from aumos_governance.budget.policy import apply_rollover
+from aumos_governance.budget.scheduler import BudgetResetScheduler
+from aumos_governance.budget.tracker import BudgetEnvelope, CategoryTracker, SpendingTransaction
 from aumos_governance.config import BudgetConfig
-from aumos_governance.errors import BudgetExceededError, BudgetNotFoundError, InvalidPeriodError
+from aumos_governance.deferred import Deferred
+from aumos_governance.errors import (
+    BudgetExceededError,
+    BudgetNotFoundError,
+    ConfigurationError,
+    InvalidPeriodError,
+    ReservationNotFoundError,
+)
+from aumos_governance.instrumentation import Instrumentation
+from aumos_governance.persistence import StateBackend, StateEntry
 from aumos_governance.types import BUDGET_PERIOD_VALUES
 
+# Operations timed when an Instrumentation is attached.
+_INSTRUMENTED = (
+    "record_spending",
+    "record_spending_many",
+    "check_budget",
+    "check_budget_lean",
+    "reserve",
+    "settle",
+    "cancel",
+)
+
 
 class BudgetCheckResult(BaseModel, frozen=True):
     """
@@ -43,6 +68,17 @@ class BudgetManager:
 
     All data is stored in-memory. A new BudgetManager starts empty.
 
+    Mutations and checks take a per-category lock, so the manager may be
+    shared between threads and unrelated categories never contend. Pass a
+    :class:`~aumos_governance.budget.shared.SharedMemoryCategoryTracker` as
+    ``tracker`` to share spending counters between worker processes, a
+    :class:`~aumos_governance.budget.columnar.ColumnarCategoryTracker` to
+    hold very many categories in NumPy columns, an
+    :class:`~aumos_governance.instrumentation.Instrumentation` as
+    ``instrumentation`` to record per-operation latency histograms, and a
+    :class:`~aumos_governance.persistence.StateBackend` as ``backend`` to
+    restore categories and their spending after a restart.
+
     Example::
 
         manager = BudgetManager(BudgetConfig(allow_overdraft=False))
@@ -52,9 +88,38 @@ class BudgetManager:
         assert result.allowed is True
     """
 
-    def __init__(self, config: BudgetConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: BudgetConfig | None = None,
+        tracker: CategoryTracker | None = None,
+        instrumentation: Instrumentation | None = None,
+        backend: StateBackend | None = None,
+    ) -> None:
+        if tracker is not None and backend is not None:
+            raise ConfigurationError(
+                "Pass a backend to the tracker, not to the BudgetManager, "
+                "when supplying a tracker."
+            )
         self._config = config or BudgetConfig()
-        self._tracker = CategoryTracker()
+        self._tracker = (
+            tracker
+            if tracker is not None
+            else CategoryTracker(self._config.retention, backend)
+        )
+        # Outstanding reservations: reservation_id -> (category, amount).
+        self._reservations: dict[str, tuple[str, float]] = {}
+        self._scheduler: BudgetResetScheduler | None = None
+        if self._config.reset_scheduler.enabled:
+            self._scheduler = BudgetResetScheduler(
+                self, self._config.reset_scheduler.tick_seconds
+            )
+            for category in self._tracker.all_categories():
+                envelope = self._tracker.get(category)
+                if envelope is not None:
+                    self._scheduler.schedule(category, envelope.next_reset_at)
+            self._scheduler.start()
+        if instrumentation is not None:
+            instrumentation.instrument(self, "budget", _INSTRUMENTED)
 
     # ------------------------------------------------------------------
     # Public API
@@ -86,7 +151,9 @@ class BudgetManager:
             raise ValueError(f"Budget limit must be >= 0; got {limit}.")
         if period not in BUDGET_PERIOD_VALUES:
             raise InvalidPeriodError(period)
-        self._tracker.create(category=category, limit=limit, period=period)
+        envelope = self._tracker.create(category=category, limit=limit, period=period)
+        if self._scheduler is not None:
+            self._scheduler.schedule(category, envelope.next_reset_at)
 
     def record_spending(
         self,
@@ -123,36 +190,110 @@ class BudgetManager:
         if envelope is None:
             raise BudgetNotFoundError(category)
 
-        self._maybe_reset(category)
-        # Re-fetch after potential reset.
-        envelope = self._tracker.get(category)
-        assert envelope is not None  # noqa: S101 — guaranteed above
+        with self._tracker.lock(category):
+            if time.time() >= envelope.next_reset_at:
+                self._reset(envelope)
+
+            if not self._config.allow_overdraft:
+                projected = envelope.spent + envelope.reserved + amount
+                if projected > envelope.effective_limit:
+                    raise BudgetExceededError(
+                        category=category,
+                        requested=amount,
+                        available=envelope.remaining,
+                    )
+
+            return self._tracker.record(
+                category=category, amount=amount, description=description
+            )
+
+    def record_spending_many(
+        self,
+        categories: Sequence[str],
+        amounts: Sequence[float],
+        description: str | None = None,
+    ) -> list[SpendingTransaction]:
+        """
+        Record several transactions at once, all or nothing.
 
-        if not self._config.allow_overdraft:
-            projected = envelope.spent + amount
-            if projected > envelope.effective_limit:
-                raise BudgetExceededError(
-                    category=category,
-                    requested=amount,
-                    available=envelope.remaining,
-                )
+        ``categories[i]`` is charged ``amounts[i]``; a category may appear
+        more than once. Every involved category is locked (in sorted order)
+        for the duration of the call, due period resets are applied, and
+        when overdraft is not allowed each category's combined amount is
+        checked before anything is recorded.
+
+        Args:
+            categories: The category charged by each transaction.
+            amounts: The amount of each transaction. Each must be positive.
+            description: Optional description stored with every transaction.
+
+        Returns:
+            The created transactions, in input order.
 
-        return self._tracker.record(category=category, amount=amount, description=description)
+        Raises:
+            BudgetNotFoundError: If any category does not exist.
+            BudgetExceededError: If any category's combined amount would
+                exceed its limit and overdraft is not allowed. No
+                transaction is recorded.
+            ValueError: If the sequences differ in length or an amount is
+                not positive.
+        """
+        if len(categories) != len(amounts):
+            raise ValueError(
+                f"Got {len(categories)} categories but {len(amounts)} amounts."
+            )
+        totals: dict[str, float] = {}
+        for category, amount in zip(categories, amounts, strict=True):
+            if amount <= 0:
+                raise ValueError(f"Spending amount must be positive; got {amount}.")
+            totals[category] = totals.get(category, 0.0) + amount
+        envelopes: dict[str, BudgetEnvelope] = {}
+        for category in totals:
+            envelope = self._tracker.get(category)
+            if envelope is None:
+                raise BudgetNotFoundError(category)
+            envelopes[category] = envelope
+
+        with ExitStack() as locks:
+            for category in sorted(envelopes):
+                locks.enter_context(self._tracker.lock(category))
+            now = time.time()
+            for envelope in envelopes.values():
+                if now >= envelope.next_reset_at:
+                    self._reset(envelope)
+            if not self._config.allow_overdraft:
+                for category, total in totals.items():
+                    envelope = envelopes[category]
+                    if envelope.spent + envelope.reserved + total > envelope.effective_limit:
+                        raise BudgetExceededError(
+                            category=category,
+                            requested=total,
+                            available=envelope.remaining,
+                        )
+            return [
+                self._tracker.record(category=category, amount=amount, description=description)
+                for category, amount in zip(categories, amounts, strict=True)
+            ]
 
     def check_budget(
         self,
         category: str,
         amount: float,
+        committed: float = 0.0,
     ) -> BudgetCheckResult:
         """
         Check whether a spending amount is within the available budget.
 
-        This is a read-only operation — it does not record any spending
-        or modify any state.
+        This does not record any spending. Like :meth:`record_spending` it
+        first applies a period reset that has fallen due, so both always see
+        the same period.
 
         Args:
             category: The budget category to check.
             amount: The amount to check against the remaining budget.
+            committed: Amount the caller has already approved against this
+                category but not yet recorded (e.g. earlier actions in the
+                same batch). It is treated as spent for this check only.
 
         Returns:
             A :class:`BudgetCheckResult` describing the outcome.
@@ -164,31 +305,173 @@ class BudgetManager:
         if envelope is None:
             raise BudgetNotFoundError(category)
 
-        available = envelope.remaining
-        allowed = amount <= available
+        with self._tracker.lock(category):
+            if time.time() >= envelope.next_reset_at:
+                self._reset(envelope)
+            return self._build_check_result(category, envelope, amount, committed)
+
+    def reserve(
+        self,
+        category: str,
+        amount: float,
+        reservation_id: str,
+    ) -> BudgetCheckResult:
+        """
+        Atomically check a spending amount and, if allowed, hold it.
+
+        The check and the hold happen under the category's lock, so
+        concurrent callers can never jointly reserve more than the remaining
+        budget. Reserved amounts count against :attr:`BudgetCheckResult.available`
+        for every other caller until the reservation is settled with
+        :meth:`settle` or released with :meth:`cancel`.
+
+        When the check fails nothing is reserved and ``reservation_id`` is
+        not registered.
 
-        if allowed:
-            reason = (
-                f"Category '{category}': {amount:.4f} requested, "
-                f"{available:.4f} available ({envelope.spent:.4f} of "
-                f"{envelope.effective_limit:.4f} spent)."
+        Args:
+            category: The budget category to reserve against.
+            amount: The amount to hold. Must be >= 0.
+            reservation_id: Caller-chosen unique identifier for the hold
+                (the engine uses the decision's ``audit_record_id``).
+
+        Returns:
+            A :class:`BudgetCheckResult` describing the outcome.
+
+        Raises:
+            BudgetNotFoundError: If ``category`` does not exist.
+            ValueError: If ``amount`` is negative or ``reservation_id`` is
+                already outstanding.
+        """
+        if amount < 0:
+            raise ValueError(f"Reservation amount must be >= 0; got {amount}.")
+        envelope = self._tracker.get(category)
+        if envelope is None:
+            raise BudgetNotFoundError(category)
+
+        with self._tracker.lock(category):
+            if reservation_id in self._reservations:
+                raise ValueError(f"Reservation '{reservation_id}' is already outstanding.")
+            if time.time() >= envelope.next_reset_at:
+                self._reset(envelope)
+            result = self._build_check_result(category, envelope, amount, 0.0)
+            if result.allowed:
+                self._hold(category, amount, reservation_id)
+            return result
+
+    def check_budget_lean(
+        self,
+        category: str,
+        amount: float,
+        committed: float = 0.0,
+        reservation_id: str | None = None,
+    ) -> tuple[bool, Deferred[str]]:
+        """
+        Allocation-light form of :meth:`check_budget` / :meth:`reserve`.
+
+        Performs the same check under the same lock but returns the verdict
+        and a reason whose text is only rendered when it is read, instead of
+        a :class:`BudgetCheckResult`. Used by
+        :meth:`~aumos_governance.engine.GovernanceEngine.evaluate_lean`.
+
+        Args:
+            category: The budget category to check.
+            amount: The amount to check against the remaining budget.
+            committed: See :meth:`check_budget`.
+            reservation_id: When given, an allowed amount is held exactly as
+                :meth:`reserve` would hold it.
+
+        Returns:
+            ``(allowed, reason)``.
+
+        Raises:
+            BudgetNotFoundError: If ``category`` does not exist.
+            ValueError: If reserving and ``amount`` is negative or
+                ``reservation_id`` is already outstanding.
+        """
+        if reservation_id is not None and amount < 0:
+            raise ValueError(f"Reservation amount must be >= 0; got {amount}.")
+        envelope = self._tracker.get(category)
+        if envelope is None:
+            raise BudgetNotFoundError(category)
+
+        with self._tracker.lock(category):
+            if time.time() >= envelope.next_reset_at:
+                self._reset(envelope)
+            available = envelope.remaining - committed
+            allowed = amount <= available
+            if allowed and reservation_id is not None:
+                self._hold(category, amount, reservation_id)
+            return allowed, Deferred(
+                budget_reason,
+                category,
+                amount,
+                available,
+                envelope.spent + committed,
+                envelope.effective_limit,
             )
-        else:
-            reason = (
-                f"Category '{category}': {amount:.4f} requested but only "
-                f"{available:.4f} remains ({envelope.spent:.4f} of "
-                f"{envelope.effective_limit:.4f} spent)."
+
+    def settle(
+        self,
+        reservation_id: str,
+        actual_amount: float,
+        description: str | None = None,
+    ) -> SpendingTransaction | None:
+        """
+        Release a reservation and record what was actually spent.
+
+        The actual amount is always recorded — it reflects spending that has
+        already happened — so settling above the reserved amount can push
+        the category past its limit even when overdraft is disabled.
+
+        Args:
+            reservation_id: The identifier passed to :meth:`reserve`.
+            actual_amount: The amount actually spent. Must be >= 0; zero
+                releases the hold without recording a transaction.
+            description: Optional description stored with the transaction.
+
+        Returns:
+            The recorded :class:`~aumos_governance.budget.tracker.SpendingTransaction`,
+            or None when ``actual_amount`` is zero.
+
+        Raises:
+            ReservationNotFoundError: If the reservation is not outstanding.
+            ValueError: If ``actual_amount`` is negative.
+        """
+        if actual_amount < 0:
+            raise ValueError(f"Settled amount must be >= 0; got {actual_amount}.")
+        reservation = self._reservations.pop(reservation_id, None)
+        if reservation is None:
+            raise ReservationNotFoundError(reservation_id)
+        category, reserved = reservation
+
+        with self._tracker.lock(category):
+            self._tracker.release(category, reserved)
+            if actual_amount == 0:
+                return None
+            envelope = self._tracker.get(category)
+            if envelope is not None and time.time() >= envelope.next_reset_at:
+                self._reset(envelope)
+            return self._tracker.record(
+                category=category, amount=actual_amount, description=description
             )
 
-        return BudgetCheckResult(
-            allowed=allowed,
-            category=category,
-            requested=amount,
-            available=available,
-            limit=envelope.effective_limit,
-            spent=envelope.spent,
-            reason=reason,
-        )
+    def cancel(self, reservation_id: str) -> None:
+        """
+        Release a reservation without recording any spending.
+
+        Args:
+            reservation_id: The identifier passed to :meth:`reserve`.
+
+        Raises:
+            ReservationNotFoundError: If the reservation is not outstanding.
+        """
+        reservation = self._reservations.pop(reservation_id, None)
+        if reservation is None:
+            raise ReservationNotFoundError(reservation_id)
+        category, reserved = reservation
+
+        with self._tracker.lock(category):
+            self._tracker.release(category, reserved)
 
     def get_utilization(self, category: str) -> float:
         """
@@ -205,10 +488,58 @@ class BudgetManager:
             raise BudgetNotFoundError(category)
         return envelope.utilization
 
+    def spending_stats(self, category: str) -> dict[str, object]:
+        """
+        Return the current period's spending aggregates for ``category``.
+
+        The aggregates are exact even when
+        :attr:`~aumos_governance.config.TransactionRetentionConfig.max_transactions`
+        limits the transactions kept in memory.
+
+        Returns:
+            See :meth:`~aumos_governance.budget.tracker.TransactionLog.stats`.
+
+        Raises:
+            BudgetNotFoundError: If ``category`` does not exist.
+        """
+        envelope = self._tracker.get(category)
+        if envelope is None:
+            raise BudgetNotFoundError(category)
+        with self._tracker.lock(category):
+            return envelope.transactions.stats()
+
     def list_categories(self) -> list[str]:
         """Return all registered budget category names."""
         return self._tracker.all_categories()
 
+    def utilizations(self) -> dict[str, float]:
+        """
+        Return every category's utilization (spent / effective limit).
+
+        Computed from stored state without applying due period resets, like
+        :meth:`summary`.
+        """
+        return self._tracker.utilizations()
+
+    def top_k_by_utilization(self, k: int) -> list[tuple[str, float]]:
+        """
+        Return the ``k`` most utilized categories as ``(category, utilization)``
+        pairs, highest first.
+
+        Raises:
+            ValueError: If ``k`` is negative.
+        """
+        if k < 0:
+            raise ValueError(f"k must be >= 0; got {k}.")
+        return self._tracker.top_k_by_utilization(k)
+
+    def state_entries(self) -> Iterator[StateEntry]:
+        """
+        Yield one ``budget.state`` entry per category, for compacting a
+        :class:`~aumos_governance.persistence.StateBackend`.
+        """
+        return self._tracker.state_entries()
+
     def summary(self) -> list[dict[str, object]]:
         """
         Return a summary snapshot of all budget envelopes.
@@ -216,24 +547,113 @@ class BudgetManager:
         Returns:
             List of dicts, one per category, with fields:
             ``category``, ``limit``, ``effective_limit``, ``spent``,
-            ``remaining``, ``utilization``, ``period``, ``last_reset``,
+            ``reserved``, ``remaining``, ``utilization``, ``period``, ``last_reset``,
             ``transaction_count``.
         """
         return self._tracker.snapshot()
 
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Stop the background reset scheduler, if running, and flush and close
+        the transaction spill file, if configured.
+
+        Args:
+            timeout: Maximum seconds to wait for the scheduler thread.
+        """
+        if self._scheduler is not None:
+            self._scheduler.close(timeout)
+        self._tracker.close()
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _maybe_reset(self, category: str) -> None:
-        """Reset the budget for ``category`` if the period has elapsed."""
+    def _reset(self, envelope: BudgetEnvelope) -> None:
+        """Start a new period for ``envelope``. Caller holds the category lock."""
+        new_limit = apply_rollover(
+            spent=envelope.spent,
+            limit=envelope.limit,
+            rollover_on_reset=self._config.rollover_on_reset,
+        )
+        self._tracker.reset(category=envelope.category, new_effective_limit=new_limit)
+
+    def _apply_due_reset(self, category: str, now: float) -> tuple[bool, int | None]:
+        """
+        Reset ``category`` if its period ended by ``now``. Used by
+        :class:`~aumos_governance.budget.scheduler.BudgetResetScheduler`.
+
+        Returns:
+            ``(reset_applied, next_reset_at)``; the deadline is None if the
+            category no longer exists.
+        """
         envelope = self._tracker.get(category)
         if envelope is None:
-            return
-        if should_reset(period=envelope.period, last_reset=envelope.last_reset):
-            new_limit = apply_rollover(
-                spent=envelope.spent,
-                limit=envelope.limit,
-                rollover_on_reset=self._config.rollover_on_reset,
-            )
-            self._tracker.reset(category=category, new_effective_limit=new_limit)
+            return False, None
+        with self._tracker.lock(category):
+            due = now >= envelope.next_reset_at
+            if due:
+                self._reset(envelope)
+            return due, envelope.next_reset_at
+
+    @staticmethod
+    def _build_check_result(
+        category: str,
+        envelope: BudgetEnvelope,
+        amount: float,
+        committed: float,
+    ) -> BudgetCheckResult:
+        """Evaluate ``amount`` against ``envelope``. Caller holds the category lock."""
+        available = envelope.remaining - committed
+        spent = envelope.spent + committed
+        return BudgetCheckResult(
+            allowed=amount <= available,
+            category=category,
+            requested=amount,
+            available=available,
+            limit=envelope.effective_limit,
+            spent=spent,
+            reason=budget_reason(category, amount, available, spent, envelope.effective_limit),
+        )
+
+    def _hold(self, category: str, amount: float, reservation_id: str) -> None:
+        """Register a reservation. Caller holds the category lock."""
+        if reservation_id in self._reservations:
+            raise ValueError(f"Reservation '{reservation_id}' is already outstanding.")
+        self._tracker.reserve(category, amount)
+        self._reservations[reservation_id] = (category, amount)
+
+
+def budget_reason(
+    category: str,
+    amount: float,
+    available: float,
+    spent: float,
+    limit: float,
+) -> str:
+    """
+    Render the human-readable reason for a budget check.
+
+    Shared by :meth:`BudgetManager.check_budget` and the deferred reasons
+    produced by :meth:`BudgetManager.check_budget_lean`.
+
+    Args:
+        category: The budget category evaluated.
+        amount: The amount requested.
+        available: The budget available at the time of the check.
+        spent: The amount counted as spent for the check.
+        limit: The effective limit of the category.
+
+    Returns:
+        The reason string.
+    """
+    if amount <= available:
+        return (
+            f"Category '{category}': {amount:.4f} requested, "
+            f"{available:.4f} available ({spent:.4f} of "
+            f"{limit:.4f} spent)."
+        )
+    return (
+        f"Category '{category}': {amount:.4f} requested but only "
+        f"{available:.4f} remains ({spent:.4f} of "
+        f"{limit:.4f} spent)."
+    )
@@ -2,11 +2,15 @@
 # Copyright (c) 2026 MuVeraAI Corporation
 from __future__ import annotations
 
-from datetime import date, timedelta
+import sys
+from datetime import date, datetime, time, timedelta
 
 from aumos_governance.errors import InvalidPeriodError
 from aumos_governance.types import BUDGET_PERIOD_VALUES
 
+# Deadline of budgets that never reset.
+NEVER_RESETS = sys.maxsize
+
 
 def next_reset_date(period: str, from_date: date | None = None) -> date:
     """
@@ -71,6 +75,31 @@ def should_reset(period: str, last_reset: date, as_of: date | None = None) -> bo
     return reference >= reset_on
 
 
+def reset_deadline(period: str, last_reset: date) -> int:
+    """
+    Return when a budget last reset on ``last_reset`` is next due to reset.
+
+    The deadline is the POSIX timestamp of local midnight at the start of
+    :func:`next_reset_date`, so ``time.time() >= reset_deadline(...)`` agrees
+    with :func:`should_reset` and costs a single comparison.
+
+    Args:
+        period: The budget period string.
+        last_reset: The date on which the budget was last reset.
+
+    Returns:
+        The deadline in whole seconds, or :data:`NEVER_RESETS` for
+        ``'lifetime'`` budgets.
+
+    Raises:
+        InvalidPeriodError: If ``period`` is not a valid value.
+    """
+    reset_on = next_reset_date(period, from_date=last_reset)
+    if reset_on == date.max:
+        return NEVER_RESETS
+    return int(datetime.combine(reset_on, time.min).timestamp())
+
+
 def apply_rollover(
     spent: float,
     limit: float,
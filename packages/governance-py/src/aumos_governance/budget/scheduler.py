@@ -0,0 +1,244 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+"""
+Background period resets for budget categories.
+
+Every :class:`~aumos_governance.budget.tracker.BudgetEnvelope` carries a
+precomputed ``next_reset_at`` deadline, and the manager applies a due reset
+inline before any check or spend. With
+:attr:`~aumos_governance.config.ResetSchedulerConfig.enabled` set, a
+:class:`BudgetResetScheduler` additionally performs resets at period
+boundaries on a background thread, so that work stays off the request path.
+
+Deadlines are kept in a :class:`TimerWheel`: scheduling, cancelling and
+firing cost O(1) per category however many categories are registered.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from aumos_governance.budget.policy import NEVER_RESETS
+
+if TYPE_CHECKING:
+    from aumos_governance.budget.manager import BudgetManager
+
+logger = logging.getLogger("aumos.governance.budget")
+
+_K = TypeVar("_K", bound=Hashable)
+
+
+class TimerWheel(Generic[_K]):
+    """
+    Hierarchical timing wheel of keys and integer deadlines (in ticks).
+
+    Level ``n`` has ``2**slot_bits`` slots, each spanning
+    ``2**(slot_bits * n)`` ticks. A key is stored at the lowest level whose
+    window contains its deadline and cascades one level down each time the
+    wheel above it turns. Deadlines beyond the top level are held aside and
+    placed once they come within range.
+
+    Example::
+
+        wheel: TimerWheel[str] = TimerWheel(now=0)
+        wheel.schedule("llm", 90)
+        assert wheel.advance(89) == []
+        assert wheel.advance(90) == [("llm", 90)]
+    """
+
+    def __init__(self, now: int, levels: int = 5, slot_bits: int = 6) -> None:
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._levels = levels
+        self._wheels: list[list[dict[_K, int]]] = [
+            [{} for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        self._due: dict[_K, int] = {}
+        self._overflow: dict[_K, int] = {}
+        # Key -> the slot (or due/overflow dict) currently holding it.
+        self._where: dict[_K, dict[_K, int]] = {}
+        self._now = now
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def schedule(self, key: _K, deadline: int) -> None:
+        """Schedule ``key`` to fire at tick ``deadline``, replacing any earlier entry."""
+        self.cancel(key)
+        self._place(key, deadline)
+
+    def cancel(self, key: _K) -> bool:
+        """Remove ``key``. Returns True if it was scheduled."""
+        container = self._where.pop(key, None)
+        if container is None:
+            return False
+        del container[key]
+        return True
+
+    def advance(self, now: int) -> list[tuple[_K, int]]:
+        """
+        Move the wheel forward to tick ``now``.
+
+        Returns:
+            ``(key, deadline)`` for every key whose deadline is ``<= now``,
+            removed from the wheel.
+        """
+        fired = self._take(self._due)
+        while self._now < now:
+            if not self._where:
+                self._now = now
+                break
+            self._now += 1
+            tick = self._now
+            for level in range(1, self._levels):
+                if tick & ((1 << (self._bits * level)) - 1):
+                    break
+                slot = self._wheels[level][(tick >> (self._bits * level)) & self._mask]
+                for key, deadline in self._take(slot):
+                    self._place(key, deadline)
+            else:
+                for key, deadline in self._take(self._overflow):
+                    self._place(key, deadline)
+            fired += self._take(self._wheels[0][tick & self._mask])
+            fired += self._take(self._due)
+        return fired
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _place(self, key: _K, deadline: int) -> None:
+        container = self._overflow
+        if deadline <= self._now:
+            container = self._due
+        else:
+            for level in range(self._levels):
+                shift = self._bits * (level + 1)
+                if deadline >> shift == self._now >> shift:
+                    index = (deadline >> (self._bits * level)) & self._mask
+                    container = self._wheels[level][index]
+                    break
+        container[key] = deadline
+        self._where[key] = container
+
+    def _take(self, container: dict[_K, int]) -> list[tuple[_K, int]]:
+        if not container:
+            return []
+        items = list(container.items())
+        container.clear()
+        for key, _ in items:
+            del self._where[key]
+        return items
+
+
+class BudgetResetScheduler:
+    """
+    Performs budget period resets on a background thread.
+
+    Created and owned by :class:`~aumos_governance.budget.manager.BudgetManager`
+    when :attr:`~aumos_governance.config.ResetSchedulerConfig.enabled` is
+    True. Each category is scheduled at its ``next_reset_at``; when that
+    passes, the scheduler applies the reset under the category lock and
+    schedules the next one. The manager's inline deadline check remains in
+    place, so a late tick never lets a check see a stale period.
+
+    Categories that another process attached to a shared tracker are not
+    scheduled here; their resets happen inline.
+
+    Args:
+        manager: The manager whose categories are reset.
+        tick_seconds: Wheel resolution and thread wake-up interval.
+    """
+
+    def __init__(self, manager: BudgetManager, tick_seconds: float = 1.0) -> None:
+        self._manager = manager
+        self._tick_seconds = tick_seconds
+        self._wheel: TimerWheel[str] = TimerWheel(self._tick(time.time()))
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._resets = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def schedule(self, category: str, deadline: float) -> None:
+        """Schedule ``category`` to reset at POSIX time ``deadline``."""
+        with self._lock:
+            if deadline >= NEVER_RESETS:
+                self._wheel.cancel(category)
+            else:
+                self._wheel.schedule(category, math.ceil(deadline / self._tick_seconds))
+
+    def run_pending(self, now: float | None = None) -> int:
+        """
+        Apply every reset that is due at ``now``.
+
+        Called by the background thread on every tick; may also be called
+        directly.
+
+        Args:
+            now: POSIX time to advance to. Defaults to the current time.
+
+        Returns:
+            The number of categories reset.
+        """
+        current = time.time() if now is None else now
+        with self._lock:
+            due = self._wheel.advance(self._tick(current))
+        reset = 0
+        for category, _ in due:
+            applied, deadline = self._manager._apply_due_reset(category, current)
+            if deadline is not None:
+                self.schedule(category, deadline)
+            reset += applied
+        with self._lock:
+            self._resets += reset
+        return reset
+
+    def start(self) -> None:
+        """Start the background thread. Calling it again is harmless."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="aumos-budget-reset", daemon=True
+        )
+        self._thread.start()
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self) -> dict[str, float]:
+        """
+        Return ``scheduled`` (categories on the wheel), ``resets`` (applied by
+        the scheduler so far) and ``tick_seconds``.
+        """
+        with self._lock:
+            return {
+                "scheduled": len(self._wheel),
+                "resets": self._resets,
+                "tick_seconds": self._tick_seconds,
+            }
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _tick(self, timestamp: float) -> int:
+        return int(timestamp // self._tick_seconds)
+
+    def _run(self) -> None:
+        """Scheduler thread: run due resets once per tick until closed."""
+        while not self._stop.wait(self._tick_seconds):
+            try:
+                self.run_pending()
+            except Exception:
+                logger.exception("Scheduled budget reset failed.")
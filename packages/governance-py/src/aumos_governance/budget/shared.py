@@ -0,0 +1,544 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+"""
+Budget counters shared between processes on one host.
+
+:class:`SharedMemoryCategoryTracker` keeps each category's limit, spent and
+reserved amounts in a fixed-layout table inside a memory-mapped file, so
+every worker process of a multi-process server (gunicorn, uvicorn with
+``--workers``) charges one budget instead of each holding its own copy.
+Point it at a memory-backed filesystem such as ``/dev/shm`` to keep the
+table in memory.
+
+Per-category locking uses POSIX byte-range locks (``fcntl.lockf``) on the
+same file, combined with a thread lock, so check-and-reserve stays atomic
+across both threads and processes. Byte-range locks belong to a process and
+do not exclude each other within it, so the thread locks are shared by every
+tracker in the process that opens the same file. Reads of ``spent`` and
+``reserved`` are plain loads from the mapping.
+
+Only the counters are shared. Transaction lists and reservation IDs remain
+per-process: a reservation must be settled by the process that made it.
+A process that exits without settling (a recycled or killed worker) cannot
+release its holds, so the table also records how much each process holds
+in each category, keyed by PID. Holds of processes that no longer exist are
+returned to ``reserved`` when a tracker attaches to the table and when a
+category is reset. Until then they keep counting against the budget. This
+relies on every process sharing one PID namespace; a reused PID defers the
+reclaim until that process exits too.
+
+POSIX only.
+"""
+from __future__ import annotations
+
+import fcntl
+import mmap
+import os
+import struct
+import threading
+from contextlib import AbstractContextManager
+from datetime import date
+from types import TracebackType
+
+from aumos_governance.budget.policy import reset_deadline
+from aumos_governance.budget.tracker import BudgetEnvelope, CategoryTracker, TransactionLog
+from aumos_governance.config import TransactionRetentionConfig
+
+_MAGIC = b"AUMOSBG2"
+_HEADER = struct.Struct("<8sII")
+_HEADER_SIZE = 64
+_SLOT_SIZE = 128
+_NAME_SIZE = 72
+_PERIOD_OFFSET = 72
+_PERIOD_SIZE = 16
+_VALUES_OFFSET = 88
+
+# Indexes of the float64 fields within a slot's value block.
+_LIMIT = 0
+_EFFECTIVE_LIMIT = 1
+_SPENT = 2
+_RESERVED = 3
+_LAST_RESET = 4
+
+# Thread locks by (device, inode, byte offset), shared by every tracker in
+# this process on the same file.
+_THREAD_LOCKS: dict[tuple[int, int, int], threading.Lock] = {}
+_THREAD_LOCKS_GUARD = threading.Lock()
+
+
+def _table_size(max_categories: int, max_processes: int) -> int:
+    """Bytes of a table: header, category slots, then one holder row per process."""
+    holder_row = 8 * (1 + max_categories)
+    return _HEADER_SIZE + max_categories * _SLOT_SIZE + max_processes * holder_row
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class _ProcessSharedLock:
+    """A thread lock combined with a byte-range lock on the shared file."""
+
+    __slots__ = ("_fd", "_offset", "_thread_lock")
+
+    def __init__(self, fd: int, offset: int) -> None:
+        self._fd = fd
+        self._offset = offset
+        stat = os.fstat(fd)
+        key = (stat.st_dev, stat.st_ino, offset)
+        with _THREAD_LOCKS_GUARD:
+            self._thread_lock = _THREAD_LOCKS.setdefault(key, threading.Lock())
+
+    def __enter__(self) -> bool:
+        # Byte-range locks are held per process, so threads of one process
+        # must be serialised separately.
+        self._thread_lock.acquire()
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, self._offset, os.SEEK_SET)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        return True
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, self._offset, os.SEEK_SET)
+        finally:
+            self._thread_lock.release()
+
+
+class SharedBudgetEnvelope(BudgetEnvelope):
+    """
+    A :class:`BudgetEnvelope` whose counters live in shared memory.
+
+    ``effective_limit``, ``spent``, ``reserved`` and ``last_reset`` read and
+    write the category's slot in the shared table, so every process attached
+    to the table observes the same values. ``transactions`` is per-process.
+    Created by :class:`SharedMemoryCategoryTracker`; do not instantiate
+    directly.
+    """
+
+    __slots__ = ("_values", "_base", "_deadline_ordinal", "_deadline")
+
+    def __init__(
+        self,
+        category: str,
+        limit: float,
+        period: str,
+        values: memoryview[float],
+        base: int,
+        transactions: TransactionLog,
+    ) -> None:
+        # BudgetEnvelope.__init__ would zero the shared counters, so only the
+        # per-process attributes are initialised here.
+        self.category = category
+        self.limit = limit
+        self.period = period
+        self.transactions = transactions
+        self._values = values
+        self._base = base
+        # Per-process memo of next_reset_at for the last_reset it was derived from.
+        self._deadline_ordinal = -1.0
+        self._deadline = 0
+
+    @property
+    def effective_limit(self) -> float:
+        return self._values[self._base + _EFFECTIVE_LIMIT]
+
+    @effective_limit.setter
+    def effective_limit(self, value: float) -> None:
+        self._values[self._base + _EFFECTIVE_LIMIT] = value
+
+    @property
+    def spent(self) -> float:
+        return self._values[self._base + _SPENT]
+
+    @spent.setter
+    def spent(self, value: float) -> None:
+        self._values[self._base + _SPENT] = value
+
+    @property
+    def reserved(self) -> float:
+        return self._values[self._base + _RESERVED]
+
+    @reserved.setter
+    def reserved(self, value: float) -> None:
+        self._values[self._base + _RESERVED] = value
+
+    @property
+    def last_reset(self) -> date:
+        return date.fromordinal(int(self._values[self._base + _LAST_RESET]))
+
+    @last_reset.setter
+    def last_reset(self, value: date) -> None:
+        self._values[self._base + _LAST_RESET] = float(value.toordinal())
+
+    @property
+    def next_reset_at(self) -> int:  # type: ignore[override]
+        # Another process may have reset the category; follow the shared date.
+        ordinal = self._values[self._base + _LAST_RESET]
+        if ordinal != self._deadline_ordinal:
+            self._deadline = reset_deadline(self.period, date.fromordinal(int(ordinal)))
+            self._deadline_ordinal = ordinal
+        return self._deadline
+
+
+class SharedMemoryCategoryTracker(CategoryTracker):
+    """
+    A :class:`CategoryTracker` whose counters are shared between processes.
+
+    Every process that opens the same ``path`` sees one consistent spent and
+    reserved total per category. Plug it into a manager with
+    ``BudgetManager(tracker=SharedMemoryCategoryTracker(path))``; the
+    manager's API and semantics are unchanged.
+
+    :meth:`create` attaches to a category that another process already
+    created, provided the limit and period match, so every worker can run the
+    same start-up code. Categories created elsewhere are also attached on
+    first lookup.
+
+    Example::
+
+        tracker = SharedMemoryCategoryTracker("/dev/shm/aumos-budgets")
+        manager = BudgetManager(tracker=tracker)
+        manager.create_budget("llm", limit=100.0, period="monthly")
+
+    Args:
+        path: File backing the shared table. Created if missing.
+        max_categories: Table capacity, fixed when the file is created.
+            Ignored when attaching to an existing file.
+        retention: Per-process transaction history retention, as for
+            :class:`~aumos_governance.budget.tracker.CategoryTracker`.
+        max_processes: How many processes can hold reservations at once,
+            fixed when the file is created. Ignored when attaching.
+
+    Raises:
+        ValueError: If ``path`` exists but is not a budget table.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_categories: int = 64,
+        retention: TransactionRetentionConfig | None = None,
+        max_processes: int = 128,
+    ) -> None:
+        super().__init__(retention)
+        if max_categories <= 0:
+            raise ValueError(f"max_categories must be > 0; got {max_categories}.")
+        if max_processes <= 0:
+            raise ValueError(f"max_processes must be > 0; got {max_processes}.")
+        self._path = os.fspath(path)
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._table_lock = _ProcessSharedLock(self._fd, 0)
+        try:
+            with self._table_lock:
+                self._max_categories, self._max_processes = self._initialise(
+                    max_categories, max_processes
+                )
+            size = _table_size(self._max_categories, self._max_processes)
+            self._map = mmap.mmap(self._fd, size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+        self._values = memoryview(self._map).cast("d")
+        self._slots: dict[str, int] = {}
+        # This process's holder row, found on its first reservation; a
+        # forked child finds its own.
+        self._holder_pid = 0
+        self._holder_base = 0
+        self._reclaim_all()
+
+    # ------------------------------------------------------------------
+    # CategoryTracker overrides
+    # ------------------------------------------------------------------
+
+    def create(self, category: str, limit: float, period: str) -> BudgetEnvelope:
+        """
+        Create a category in the shared table, or attach to an identical one.
+
+        Raises:
+            ValueError: If ``category`` already exists in this process, exists
+                in the table with a different limit or period, is empty or
+                too long, or the table is full.
+        """
+        if category in self._envelopes:
+            raise ValueError(
+                f"Budget category '{category}' already exists. "
+                "Use update() to modify it."
+            )
+        name = self._encode_name(category)
+        with self._table_lock:
+            slot = self._find_slot(name)
+            if slot is None:
+                slot = self._allocate_slot(name, limit, period)
+            else:
+                stored_limit = self._values[self._value_base(slot) + _LIMIT]
+                stored_period = self._read_period(slot)
+                if stored_limit != limit or stored_period != period:
+                    raise ValueError(
+                        f"Budget category '{category}' already exists in the shared "
+                        f"table with limit {stored_limit} and period '{stored_period}'."
+                    )
+            return self._attach(category, slot)
+
+    def get(self, category: str) -> BudgetEnvelope | None:
+        """Return the envelope for ``category``, attaching if another process created it."""
+        envelope = self._envelopes.get(category)
+        if envelope is not None:
+            return envelope
+        try:
+            name = self._encode_name(category)
+        except ValueError:
+            return None
+        with self._table_lock:
+            slot = self._find_slot(name)
+            if slot is None:
+                return None
+            return self._attach(category, slot)
+
+    def lock(self, category: str) -> AbstractContextManager[object]:
+        """
+        Return the process-shared lock guarding ``category``.
+
+        Raises:
+            KeyError: If ``category`` does not exist.
+        """
+        if category not in self._locks and self.get(category) is None:
+            raise KeyError(category)
+        return self._locks[category]
+
+    def reserve(self, category: str, amount: float) -> None:
+        """
+        Hold ``amount`` against a category and record it as held by this
+        process. Caller holds the category lock.
+
+        Raises:
+            KeyError: If ``category`` does not exist.
+            ValueError: If ``max_processes`` other processes already hold
+                reservations.
+        """
+        envelope = self._envelopes[category]
+        cell = self._holder_row() + 1 + self._slots[category]
+        envelope.reserved += amount
+        self._values[cell] += amount
+
+    def release(self, category: str, amount: float) -> None:
+        """Return a reserved ``amount`` held by this process. Caller holds the category lock."""
+        super().release(category, amount)
+        cell = self._holder_row() + 1 + self._slots[category]
+        self._values[cell] = max(0.0, self._values[cell] - amount)
+
+    def reset(self, category: str, new_effective_limit: float) -> None:
+        """
+        Reset a category as :class:`CategoryTracker` does, and return the
+        holds of processes that have exited. Caller holds the category lock.
+        """
+        super().reset(category, new_effective_limit)
+        self._reclaim(self._slots[category])
+
+    def all_categories(self) -> list[str]:
+        """Return every category in the shared table, in slot order."""
+        with self._table_lock:
+            names = (self._read_name(slot) for slot in range(self._max_categories))
+            return [name for name in names if name]
+
+    def snapshot(self) -> list[dict[str, object]]:
+        """Return plain-dict snapshots for every category in the shared table."""
+        envelopes = (self.get(category) for category in self.all_categories())
+        return [envelope.to_dict() for envelope in envelopes if envelope is not None]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def path(self) -> str:
+        """The file backing the shared table."""
+        return self._path
+
+    def close(self) -> None:
+        """
+        Detach from the shared table. Its contents are left in place for
+        other processes. The tracker must not be used afterwards.
+
+        Closing the file drops every byte-range lock this process holds on
+        it, including those of other trackers on the same path, so close a
+        tracker only while no other tracker in the process on that path is
+        inside a locked section.
+        """
+        self._envelopes.clear()
+        self._locks.clear()
+        self._values.release()
+        self._map.close()
+        os.close(self._fd)
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _initialise(self, max_categories: int, max_processes: int) -> tuple[int, int]:
+        """Create or validate the file header. Caller holds the table lock."""
+        size = os.fstat(self._fd).st_size
+        if size == 0:
+            os.ftruncate(self._fd, _table_size(max_categories, max_processes))
+            os.pwrite(self._fd, _HEADER.pack(_MAGIC, max_categories, max_processes), 0)
+            return max_categories, max_processes
+        if size < _HEADER.size:
+            raise ValueError(f"'{self._path}' is not a shared budget table.")
+        magic, categories, processes = _HEADER.unpack(os.pread(self._fd, _HEADER.size, 0))
+        if magic != _MAGIC or size != _table_size(categories, processes):
+            raise ValueError(f"'{self._path}' is not a shared budget table.")
+        return int(categories), int(processes)
+
+    @staticmethod
+    def _encode_name(category: str) -> bytes:
+        name = category.encode("utf-8")
+        if not name or len(name) > _NAME_SIZE:
+            raise ValueError(
+                f"Shared budget category names must be 1-{_NAME_SIZE} UTF-8 bytes; "
+                f"got {category!r}."
+            )
+        return name
+
+    @staticmethod
+    def _slot_offset(slot: int) -> int:
+        return _HEADER_SIZE + slot * _SLOT_SIZE
+
+    def _value_base(self, slot: int) -> int:
+        return (self._slot_offset(slot) + _VALUES_OFFSET) // 8
+
+    def _read_name(self, slot: int) -> str:
+        offset = self._slot_offset(slot)
+        return self._map[offset : offset + _NAME_SIZE].rstrip(b"\0").decode("utf-8")
+
+    def _read_period(self, slot: int) -> str:
+        offset = self._slot_offset(slot) + _PERIOD_OFFSET
+        return self._map[offset : offset + _PERIOD_SIZE].rstrip(b"\0").decode("ascii")
+
+    def _holder_base_of(self, row: int) -> int:
+        """Index of a holder row: the owner PID, then one amount per slot."""
+        offset = _HEADER_SIZE + self._max_categories * _SLOT_SIZE
+        return offset // 8 + row * (1 + self._max_categories)
+
+    def _holder_row(self) -> int:
+        """Return this process's holder row, claiming a free one if needed."""
+        pid = os.getpid()
+        if pid == self._holder_pid:
+            return self._holder_base
+        with self._table_lock:
+            free: int | None = None
+            for row in range(self._max_processes):
+                base = self._holder_base_of(row)
+                owner = int(self._values[base])
+                if owner == pid:
+                    break
+                if owner == 0 and free is None:
+                    free = base
+            else:
+                if free is None:
+                    raise ValueError(
+                        f"Shared budget table '{self._path}' already has "
+                        f"{self._max_processes} processes holding reservations."
+                    )
+                base = free
+                self._values[base] = float(pid)
+        self._holder_pid, self._holder_base = pid, base
+        return base
+
+    def _reclaim(self, slot: int) -> None:
+        """
+        Return the holds of exited processes on ``slot`` to its ``reserved``
+        and free their rows once they hold nothing. Caller holds the slot's
+        lock, which guards the slot's column of the holder table.
+        """
+        reserved = self._value_base(slot) + _RESERVED
+        with self._table_lock:
+            for row in range(self._max_processes):
+                base = self._holder_base_of(row)
+                owner = int(self._values[base])
+                if owner == 0 or _process_alive(owner):
+                    continue
+                cell = base + 1 + slot
+                held = self._values[cell]
+                if held:
+                    self._values[reserved] = max(0.0, self._values[reserved] - held)
+                    self._values[cell] = 0.0
+                if not any(self._values[base + 1 : base + 1 + self._max_categories]):
+                    self._values[base] = 0.0
+
+    def _reclaim_all(self) -> None:
+        """Reclaim the holds of exited processes in every category."""
+        with self._table_lock:
+            slots = [
+                slot
+                for slot in range(self._max_categories)
+                if self._map[self._slot_offset(slot)] != 0
+            ]
+        for slot in slots:
+            with _ProcessSharedLock(self._fd, self._slot_offset(slot)):
+                self._reclaim(slot)
+
+    def _find_slot(self, name: bytes) -> int | None:
+        """Return the slot holding ``name``. Caller holds the table lock."""
+        padded = name.ljust(_NAME_SIZE, b"\0")
+        for slot in range(self._max_categories):
+            offset = self._slot_offset(slot)
+            if self._map[offset : offset + _NAME_SIZE] == padded:
+                return slot
+        return None
+
+    def _allocate_slot(self, name: bytes, limit: float, period: str) -> int:
+        """Write a new category into a free slot. Caller holds the table lock."""
+        for slot in range(self._max_categories):
+            offset = self._slot_offset(slot)
+            if self._map[offset] != 0:
+                continue
+            base = self._value_base(slot)
+            self._values[base + _LIMIT] = limit
+            self._values[base + _EFFECTIVE_LIMIT] = limit
+            self._values[base + _SPENT] = 0.0
+            self._values[base + _RESERVED] = 0.0
+            self._values[base + _LAST_RESET] = float(date.today().toordinal())
+            period_offset = offset + _PERIOD_OFFSET
+            self._map[period_offset : period_offset + _PERIOD_SIZE] = period.encode(
+                "ascii"
+            ).ljust(_PERIOD_SIZE, b"\0")
+            # The name is written last: a non-empty name marks the slot live.
+            self._map[offset : offset + _NAME_SIZE] = name.ljust(_NAME_SIZE, b"\0")
+            return slot
+        raise ValueError(
+            f"Shared budget table '{self._path}' is full "
+            f"({self._max_categories} categories)."
+        )
+
+    def _attach(self, category: str, slot: int) -> BudgetEnvelope:
+        """Bind ``category`` in this process to ``slot``. Caller holds the table lock."""
+        existing = self._envelopes.get(category)
+        if existing is not None:
+            # Another thread attached while this one waited for the lock.
+            return existing
+        base = self._value_base(slot)
+        envelope = SharedBudgetEnvelope(
+            category=category,
+            limit=self._values[base + _LIMIT],
+            period=self._read_period(slot),
+            values=self._values,
+            base=base,
+            transactions=self._new_log(),
+        )
+        self._locks[category] = _ProcessSharedLock(self._fd, self._slot_offset(slot))
+        self._slots[category] = slot
+        self._envelopes[category] = envelope
+        return envelope
@@ -2,11 +2,20 @@
 # Copyright (c) 2026 MuVeraAI Corporation
 from __future__ import annotations
 
+import collections
+import heapq
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager
 from datetime import date, datetime, timezone
-from typing import Any
+from typing import IO, Any
 
 from pydantic import BaseModel, Field
 
+from aumos_governance.budget.policy import reset_deadline
+from aumos_governance.config import TransactionRetentionConfig
+from aumos_governance.persistence import StateBackend, StateEntry
+
 
 class SpendingTransaction(BaseModel, frozen=True):
     """
@@ -27,12 +36,191 @@ class SpendingTransaction(BaseModel, frozen=True):
     )
 
 
+class _SpillFile:
+    """
+    Append-only JSON-lines file receiving transactions evicted from memory.
+
+    Transactions are buffered and written ``batch_size`` at a time, or on
+    :meth:`flush`.
+    """
+
+    def __init__(self, path: str, batch_size: int = 256) -> None:
+        self._path = path
+        self._batch_size = batch_size
+        self._pending: list[SpendingTransaction] = []
+        self._file: IO[str] | None = None
+        self._lock = threading.Lock()
+
+    def append(self, transaction: SpendingTransaction) -> None:
+        """Buffer ``transaction``, writing the buffer out once it is full."""
+        with self._lock:
+            self._pending.append(transaction)
+            if len(self._pending) >= self._batch_size:
+                self._write_pending()
+
+    def write(self, transactions: list[SpendingTransaction]) -> None:
+        """Buffer ``transactions`` and write out everything buffered."""
+        with self._lock:
+            self._pending.extend(transactions)
+            self._write_pending()
+
+    def flush(self) -> None:
+        """Write out the buffered transactions."""
+        with self._lock:
+            self._write_pending()
+
+    def close(self) -> None:
+        """Flush and close the file. A later write reopens it."""
+        with self._lock:
+            self._write_pending()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _write_pending(self) -> None:
+        """Write the buffer, one JSON object per line. Caller holds the lock."""
+        if not self._pending:
+            return
+        lines = "".join(transaction.model_dump_json() + "\n" for transaction in self._pending)
+        self._pending.clear()
+        if self._file is None:
+            self._file = open(self._path, "a", encoding="utf-8")  # noqa: SIM115
+        self._file.write(lines)
+        self._file.flush()
+
+
+class TransactionLog:
+    """
+    Spending history of one budget category for the current period.
+
+    Keeps exact running aggregates — count, total, minimum, maximum and
+    per-hour buckets — for every transaction recorded, plus the transactions
+    themselves. With ``max_transactions`` set only that many of the most
+    recent transactions are retained, so memory stays constant however many
+    are recorded; evicted transactions go to the spill file when one is
+    configured.
+
+    Iterating, indexing and ``len()`` cover the retained transactions;
+    :attr:`count` covers every transaction of the period.
+
+    Attributes:
+        count: Transactions recorded this period.
+        total: Sum of their amounts.
+        minimum: Smallest amount, or None if nothing was recorded.
+        maximum: Largest amount, or None if nothing was recorded.
+    """
+
+    __slots__ = (
+        "count",
+        "total",
+        "minimum",
+        "maximum",
+        "_recent",
+        "_hourly",
+        "_hourly_buckets",
+        "_spill",
+    )
+
+    def __init__(
+        self,
+        max_transactions: int | None = None,
+        hourly_buckets: int = 744,
+        spill: _SpillFile | None = None,
+    ) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum: float | None = None
+        self.maximum: float | None = None
+        self._recent: collections.deque[SpendingTransaction] = collections.deque(
+            maxlen=max_transactions
+        )
+        # Hours since the epoch -> [count, total], oldest first.
+        self._hourly: dict[int, list[float]] = {}
+        self._hourly_buckets = hourly_buckets
+        self._spill = spill
+
+    def append(self, transaction: SpendingTransaction) -> None:
+        """Record ``transaction``, evicting (and spilling) the oldest if full."""
+        recent = self._recent
+        if self._spill is not None and len(recent) == recent.maxlen:
+            self._spill.append(recent[0])
+        recent.append(transaction)
+
+        amount = transaction.amount
+        self.count += 1
+        self.total += amount
+        if self.minimum is None or amount < self.minimum:
+            self.minimum = amount
+        if self.maximum is None or amount > self.maximum:
+            self.maximum = amount
+
+        hour = int(transaction.recorded_at.timestamp()) // 3600
+        bucket = self._hourly.get(hour)
+        if bucket is None:
+            bucket = self._hourly[hour] = [0, 0.0]
+            if len(self._hourly) > self._hourly_buckets:
+                del self._hourly[min(self._hourly)]
+        bucket[0] += 1
+        bucket[1] += amount
+
+    def clear(self) -> None:
+        """Start a new period, spilling the retained transactions first."""
+        if self._spill is not None and self._recent:
+            self._spill.write(list(self._recent))
+        self._recent.clear()
+        self._hourly.clear()
+        self.count = 0
+        self.total = 0.0
+        self.minimum = self.maximum = None
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the period's aggregates.
+
+        Returns:
+            Dict with ``count``, ``total``, ``min``, ``max``, ``mean``,
+            ``retained`` and ``hourly`` — a list of
+            ``{"hour", "count", "total"}`` dicts, oldest first, where
+            ``hour`` is the ISO-8601 start of the UTC hour.
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.minimum,
+            "max": self.maximum,
+            "mean": self.total / self.count if self.count else 0.0,
+            "retained": len(self._recent),
+            "hourly": [
+                {
+                    "hour": datetime.fromtimestamp(hour * 3600, tz=timezone.utc).isoformat(),
+                    "count": int(count),
+                    "total": total,
+                }
+                for hour, (count, total) in sorted(self._hourly.items())
+            ],
+        }
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def __iter__(self) -> Iterator[SpendingTransaction]:
+        return iter(self._recent)
+
+    def __getitem__(self, index: int) -> SpendingTransaction:
+        return self._recent[index]
+
+
 class BudgetEnvelope:
     """
     Tracks spending state for a single budget category.
 
     This is an internal data structure managed by :class:`CategoryTracker`.
     Do not instantiate directly — use :class:`CategoryTracker` instead.
+
+    Attributes:
+        next_reset_at: POSIX timestamp at which the current period ends,
+            recomputed whenever :attr:`last_reset` is assigned (see
+            :func:`~aumos_governance.budget.policy.reset_deadline`).
     """
 
     __slots__ = (
@@ -41,7 +229,9 @@ class BudgetEnvelope:
         "period",
         "effective_limit",
         "spent",
-        "last_reset",
+        "reserved",
+        "_last_reset",
+        "next_reset_at",
         "transactions",
     )
 
@@ -50,19 +240,34 @@ class BudgetEnvelope:
         category: str,
         limit: float,
         period: str,
+        transactions: TransactionLog | None = None,
     ) -> None:
         self.category = category
         self.limit = limit
         self.period = period
         self.effective_limit: float = limit
         self.spent: float = 0.0
-        self.last_reset: date = date.today()
-        self.transactions: list[SpendingTransaction] = []
+        self.reserved: float = 0.0
+        self.last_reset = date.today()
+        self.transactions = transactions if transactions is not None else TransactionLog()
+
+    @property
+    def last_reset(self) -> date:
+        """The date on which the current period started."""
+        return self._last_reset
+
+    @last_reset.setter
+    def last_reset(self, value: date) -> None:
+        self._last_reset = value
+        self.next_reset_at: int = reset_deadline(self.period, value)
 
     @property
     def remaining(self) -> float:
-        """Remaining budget (can be negative if overdraft occurred)."""
-        return self.effective_limit - self.spent
+        """
+        Remaining budget after spending and outstanding reservations
+        (can be negative if overdraft occurred).
+        """
+        return self.effective_limit - self.spent - self.reserved
 
     @property
     def utilization(self) -> float:
@@ -78,11 +283,12 @@ class BudgetEnvelope:
             "limit": self.limit,
             "effective_limit": self.effective_limit,
             "spent": self.spent,
+            "reserved": self.reserved,
             "remaining": self.remaining,
             "utilization": self.utilization,
             "period": self.period,
             "last_reset": self.last_reset.isoformat(),
-            "transaction_count": len(self.transactions),
+            "transaction_count": self.transactions.count,
         }
 
 
@@ -93,10 +299,39 @@ class CategoryTracker:
     Maintains a collection of :class:`BudgetEnvelope` objects indexed by
     category name. Provides the primitive operations that
     :class:`~aumos_governance.budget.manager.BudgetManager` builds on.
+
+    Each category has its own lock (see :meth:`lock`). The tracker's
+    primitives do not acquire it themselves; callers hold it around any
+    check-then-mutate sequence so that unrelated categories never contend.
+
+    Args:
+        retention: How much transaction history each category keeps.
+            Defaults to keeping every transaction of the current period.
+        backend: Optional :class:`~aumos_governance.persistence.StateBackend`.
+            Categories are restored from it on construction and every
+            create, spend and reset is reported to it as a ``budget.state``
+            entry. :meth:`create` attaches to a restored category with the
+            same limit and period, so start-up code can run unchanged.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        retention: TransactionRetentionConfig | None = None,
+        backend: StateBackend | None = None,
+    ) -> None:
         self._envelopes: dict[str, BudgetEnvelope] = {}
+        self._locks: dict[str, AbstractContextManager[object]] = {}
+        self._retention = retention or TransactionRetentionConfig()
+        self._spill: _SpillFile | None = None
+        if self._retention.spill_path is not None:
+            self._spill = _SpillFile(
+                self._retention.spill_path, self._retention.spill_batch_size
+            )
+        self._backend = backend
+        # Restored categories that create() has not attached to yet.
+        self._restored: set[str] = set()
+        if backend is not None:
+            self._restore(backend.load("budget"))
 
     def create(self, category: str, limit: float, period: str) -> BudgetEnvelope:
         """
@@ -111,21 +346,62 @@ class CategoryTracker:
             The newly created :class:`BudgetEnvelope`.
 
         Raises:
-            ValueError: If an envelope for ``category`` already exists.
+            ValueError: If an envelope for ``category`` already exists, unless
+                it was restored from the backend with the same limit and
+                period, in which case that envelope is returned.
         """
+        restored = self._attach_restored(category, limit, period)
+        if restored is not None:
+            return restored
         if category in self._envelopes:
             raise ValueError(
                 f"Budget category '{category}' already exists. "
                 "Use update() to modify it."
             )
-        envelope = BudgetEnvelope(category=category, limit=limit, period=period)
+        envelope = BudgetEnvelope(
+            category=category,
+            limit=limit,
+            period=period,
+            transactions=self._new_log(),
+        )
+        self._locks[category] = threading.Lock()
         self._envelopes[category] = envelope
+        if self._backend is not None:
+            self._backend.append(_state_entry(envelope))
         return envelope
 
     def get(self, category: str) -> BudgetEnvelope | None:
         """Return the envelope for ``category``, or None if not found."""
         return self._envelopes.get(category)
 
+    def lock(self, category: str) -> AbstractContextManager[object]:
+        """
+        Return the lock guarding ``category``.
+
+        Raises:
+            KeyError: If ``category`` does not exist.
+        """
+        return self._locks[category]
+
+    def reserve(self, category: str, amount: float) -> None:
+        """
+        Hold ``amount`` against a category without recording a transaction.
+
+        Raises:
+            KeyError: If ``category`` does not exist.
+        """
+        self._envelopes[category].reserved += amount
+
+    def release(self, category: str, amount: float) -> None:
+        """
+        Return a previously reserved ``amount`` to a category.
+
+        Raises:
+            KeyError: If ``category`` does not exist.
+        """
+        envelope = self._envelopes[category]
+        envelope.reserved = max(0.0, envelope.reserved - amount)
+
     def record(
         self,
         category: str,
@@ -158,6 +434,8 @@ class CategoryTracker:
         )
         envelope.spent += amount
         envelope.transactions.append(transaction)
+        if self._backend is not None:
+            self._backend.append(_state_entry(envelope))
         return transaction
 
     def reset(self, category: str, new_effective_limit: float) -> None:
@@ -176,6 +454,8 @@ class CategoryTracker:
         envelope.effective_limit = new_effective_limit
         envelope.last_reset = date.today()
         envelope.transactions.clear()
+        if self._backend is not None:
+            self._backend.append(_state_entry(envelope))
 
     def all_categories(self) -> list[str]:
         """Return all registered category names."""
@@ -184,3 +464,88 @@ class CategoryTracker:
     def snapshot(self) -> list[dict[str, Any]]:
         """Return a list of plain-dict snapshots for all envelopes."""
         return [env.to_dict() for env in self._envelopes.values()]
+
+    def utilizations(self) -> dict[str, float]:
+        """Return each category's utilization (see :attr:`BudgetEnvelope.utilization`)."""
+        result: dict[str, float] = {}
+        for category in self.all_categories():
+            envelope = self.get(category)
+            if envelope is not None:
+                result[category] = envelope.utilization
+        return result
+
+    def top_k_by_utilization(self, k: int) -> list[tuple[str, float]]:
+        """Return the ``k`` most utilized categories, highest first."""
+        return heapq.nlargest(k, self.utilizations().items(), key=lambda item: item[1])
+
+    def state_entries(self) -> Iterator[StateEntry]:
+        """Yield one ``budget.state`` entry per category."""
+        for envelope in list(self._envelopes.values()):
+            yield _state_entry(envelope)
+
+    def close(self) -> None:
+        """Close the spill file, if one is configured."""
+        if self._spill is not None:
+            self._spill.close()
+
+    def _attach_restored(
+        self, category: str, limit: float, period: str
+    ) -> BudgetEnvelope | None:
+        """
+        Return the restored envelope for ``category`` the first time
+        :meth:`create` is called for it, or None if it was not restored.
+
+        Raises:
+            ValueError: If it was restored with a different limit or period.
+        """
+        if category not in self._restored:
+            return None
+        envelope = self.get(category)
+        assert envelope is not None  # noqa: S101 — restored categories always exist
+        if envelope.limit != limit or envelope.period != period:
+            raise ValueError(
+                f"Budget category '{category}' was restored with limit "
+                f"{envelope.limit} and period '{envelope.period}'."
+            )
+        self._restored.discard(category)
+        return envelope
+
+    def _restore(self, entries: Iterable[StateEntry]) -> None:
+        """Recreate the categories described by backend entries."""
+        latest: dict[str, StateEntry] = {}
+        for state in entries:
+            latest[state["category"]] = state
+        for category, state in latest.items():
+            envelope = BudgetEnvelope(
+                category=category,
+                limit=state["limit"],
+                period=state["period"],
+                transactions=self._new_log(),
+            )
+            envelope.effective_limit = state["effective_limit"]
+            envelope.spent = state["spent"]
+            envelope.last_reset = date.fromisoformat(state["last_reset"])
+            self._locks[category] = threading.Lock()
+            self._envelopes[category] = envelope
+            self._restored.add(category)
+
+    def _new_log(self) -> TransactionLog:
+        """Return an empty :class:`TransactionLog` following the retention config."""
+        return TransactionLog(
+            max_transactions=self._retention.max_transactions,
+            hourly_buckets=self._retention.hourly_buckets,
+            spill=self._spill,
+        )
+
+
+def _state_entry(envelope: BudgetEnvelope) -> StateEntry:
+    """Return the ``budget.state`` entry describing ``envelope``."""
+    return {
+        "op": "budget.state",
+        "category": envelope.category,
+        "limit": envelope.limit,
+        "period": envelope.period,
+        "effective_limit": envelope.effective_limit,
+        "spent": envelope.spent,
+        "last_reset": envelope.last_reset.isoformat(),
+    }
@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+"""
+Bounded memoisation for trust and consent check results.
+
+A :class:`DecisionCache` is attached to a :class:`~aumos_governance.trust.manager.TrustManager`
+or :class:`~aumos_governance.consent.manager.ConsentManager` when
+:attr:`~aumos_governance.config.CacheConfig.enabled` is True. The owning
+manager is responsible for invalidation: every write that could change a
+cached answer for an agent drops all of that agent's entries. Entries may
+also carry a deadline (a POSIX timestamp) after which they are treated as
+missing, so time-dependent answers — consent expiry, trust decay — are never
+served stale.
+
+A value computed while a write for the same agent is in progress may reflect
+the state before that write. Managers read :meth:`DecisionCache.generation`
+before computing and pass it to :meth:`DecisionCache.put`, which discards the
+value if the agent has been invalidated in the meantime.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+_V = TypeVar("_V")
+
+# Invalidation counters are kept per slot of agent ids hashed into a fixed
+# table, so their memory does not grow with the number of agents.
+_GENERATION_SLOTS = 1024
+
+
+class _CacheEntry(Generic[_V]):
+    """Internal storage for a single cached value."""
+
+    __slots__ = ("value", "agent_id", "deadline")
+
+    def __init__(self, value: _V, agent_id: str, deadline: float | None) -> None:
+        self.value = value
+        self.agent_id = agent_id
+        self.deadline = deadline
+
+
+class DecisionCache(Generic[_V]):
+    """
+    Thread-safe LRU cache of check results, invalidated per agent.
+
+    Keys are arbitrary hashable tuples whose meaning is defined by the owning
+    manager; every entry is also tagged with the agent it belongs to so that
+    :meth:`invalidate_agent` can drop all of an agent's entries without a scan.
+
+    Example::
+
+        cache: DecisionCache[str] = DecisionCache(max_entries=2)
+        cache.put(("agent-1", "scope"), "agent-1", "result")
+        assert cache.get(("agent-1", "scope")) == "result"
+        cache.invalidate_agent("agent-1")
+        assert cache.get(("agent-1", "scope")) is None
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be > 0; got {max_entries}.")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, _CacheEntry[_V]] = OrderedDict()
+        self._by_agent: dict[str, set[Hashable]] = {}
+        self._generations = [0] * _GENERATION_SLOTS
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key: Hashable) -> _V | None:
+        """
+        Return the cached value for ``key``, or None on a miss.
+
+        An entry whose deadline has passed is removed and counted as a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.deadline is not None and time.time() >= entry.deadline:
+                self._remove(key, entry)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def generation(self, agent_id: str) -> int:
+        """
+        Return a token that changes whenever ``agent_id`` is invalidated.
+
+        Read it before computing a value to cache and pass it to :meth:`put`.
+        Agents share tokens, so an invalidation can also cause another
+        agent's value to be discarded; it is never served stale.
+        """
+        return self._generations[hash(agent_id) % _GENERATION_SLOTS]
+
+    def put(
+        self,
+        key: Hashable,
+        agent_id: str,
+        value: _V,
+        deadline: float | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Store ``value`` under ``key``, evicting the least recently used
+        entry if the cache is full.
+
+        Args:
+            key: The lookup key.
+            agent_id: The agent the entry belongs to, used for invalidation.
+            value: The value to cache.
+            deadline: Optional POSIX timestamp after which the entry expires.
+            generation: The agent's :meth:`generation` read before ``value``
+                was computed. If the agent has been invalidated since, the
+                value may be stale and is not stored.
+        """
+        with self._lock:
+            if (
+                generation is not None
+                and self._generations[hash(agent_id) % _GENERATION_SLOTS] != generation
+            ):
+                return
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._remove(key, existing)
+            self._entries[key] = _CacheEntry(value, agent_id, deadline)
+            self._by_agent.setdefault(agent_id, set()).add(key)
+            while len(self._entries) > self._max_entries:
+                old_key, old_entry = next(iter(self._entries.items()))
+                self._remove(old_key, old_entry)
+                self._evictions += 1
+
+    def invalidate_agent(self, agent_id: str) -> int:
+        """
+        Drop every entry belonging to ``agent_id``.
+
+        Returns:
+            The number of entries removed.
+        """
+        with self._lock:
+            self._generations[hash(agent_id) % _GENERATION_SLOTS] += 1
+            keys = self._by_agent.pop(agent_id, None)
+            if not keys:
+                return 0
+            for key in keys:
+                del self._entries[key]
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove every entry. Counters are preserved."""
+        with self._lock:
+            self._generations = [generation + 1 for generation in self._generations]
+            self._entries.clear()
+            self._by_agent.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return a snapshot of the cache counters.
+
+        Returns:
+            Dict with ``hits``, ``misses``, ``evictions``, ``expirations``,
+            ``invalidations``, ``size`` and ``max_entries``.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _remove(self, key: Hashable, entry: _CacheEntry[_V]) -> None:
+        """Remove ``key`` from the entry map and its agent index."""
+        del self._entries[key]
+        agent_keys = self._by_agent.get(entry.agent_id)
+        if agent_keys is not None:
+            agent_keys.discard(key)
+            if not agent_keys:
+                del self._by_agent[entry.agent_id]
@@ -2,7 +2,7 @@
 # Copyright (c) 2026 MuVeraAI Corporation
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field
 
@@ -27,6 +27,51 @@ class TrustConfig(BaseModel, frozen=True):
     decay_gradual_days: Annotated[int, Field(gt=0)] | None = 30
 
 
+class TransactionRetentionConfig(BaseModel, frozen=True):
+    """
+    How much spending history each budget category keeps in memory.
+
+    Exact running aggregates (count, total, min, max and per-hour buckets)
+    are always kept, whatever the retention.
+
+    Attributes:
+        max_transactions: Number of most recent transactions kept per
+            category. None (the default) keeps every transaction of the
+            current period.
+        hourly_buckets: Number of most recent hours kept in the per-hour
+            aggregates.
+        spill_path: Optional file to which transactions evicted by
+            ``max_transactions`` are appended as JSON lines. The file is
+            append-only and is never read back by the SDK.
+        spill_batch_size: Evicted transactions are buffered and written to
+            ``spill_path`` this many at a time, and whenever a period is
+            reset or the tracker is closed. Up to this many are lost if the
+            process dies first.
+    """
+
+    max_transactions: Annotated[int, Field(gt=0)] | None = None
+    hourly_buckets: Annotated[int, Field(gt=0)] = 744
+    spill_path: str | None = None
+    spill_batch_size: Annotated[int, Field(gt=0)] = 256
+
+
+class ResetSchedulerConfig(BaseModel, frozen=True):
+    """
+    Configuration for background budget period resets.
+
+    Attributes:
+        enabled: When True, the BudgetManager runs a
+            :class:`~aumos_governance.budget.scheduler.BudgetResetScheduler`
+            thread that resets categories at their period boundaries. Resets
+            due when a category is used are always applied inline as well.
+        tick_seconds: How often the scheduler thread wakes up, and the
+            resolution of its timer wheel.
+    """
+
+    enabled: bool = False
+    tick_seconds: Annotated[float, Field(gt=0)] = 1.0
+
+
 class BudgetConfig(BaseModel, frozen=True):
     """
     Configuration for the BudgetManager.
@@ -36,10 +81,14 @@ class BudgetConfig(BaseModel, frozen=True):
             recorded and tracked as a deficit rather than raising an error.
         rollover_on_reset: When True, unspent budget from the previous period
             is added to the next period's limit (capped at 2x the base limit).
+        retention: Per-category transaction history retention.
+        reset_scheduler: Background period resets.
     """
 
     allow_overdraft: bool = False
     rollover_on_reset: bool = False
+    retention: TransactionRetentionConfig = Field(default_factory=TransactionRetentionConfig)
+    reset_scheduler: ResetSchedulerConfig = Field(default_factory=ResetSchedulerConfig)
 
 
 class ConsentConfig(BaseModel, frozen=True):
@@ -55,6 +104,31 @@ class ConsentConfig(BaseModel, frozen=True):
     default_deny: bool = True
 
 
+class AuditSpillConfig(BaseModel, frozen=True):
+    """
+    On-disk retention for audit records evicted from memory.
+
+    Evicted records are appended to segment files in ``directory``; see
+    :mod:`aumos_governance.audit.spill`. Queries span the in-memory records
+    and the segments.
+
+    Attributes:
+        directory: Directory holding the segment files. None (the default)
+            disables spilling, and evicted records are discarded.
+        segment_max_bytes: Size at which the open segment is sealed and a
+            new one started.
+        segment_max_age_seconds: Optional age at which the open segment is
+            sealed, so each segment covers a bounded period.
+        batch_size: Evicted records are held in memory and written this many
+            at a time, and before any read of the segments or on close.
+    """
+
+    directory: str | None = None
+    segment_max_bytes: Annotated[int, Field(gt=0)] = 64 * 1024 * 1024
+    segment_max_age_seconds: Annotated[float, Field(gt=0)] | None = None
+    batch_size: Annotated[int, Field(gt=0)] = 256
+
+
 class AuditConfig(BaseModel, frozen=True):
     """
     Configuration for the AuditLogger.
@@ -64,10 +138,117 @@ class AuditConfig(BaseModel, frozen=True):
             Oldest records are evicted when this limit is reached.
         include_context: When True, the full action context is stored with
             each record. When False, only the decision summary is stored.
+        spill: Where evicted records go; by default they are discarded.
     """
 
     max_records: Annotated[int, Field(gt=0)] = 10_000
     include_context: bool = True
+    spill: AuditSpillConfig = Field(default_factory=AuditSpillConfig)
+
+
+class CacheConfig(BaseModel, frozen=True):
+    """
+    Configuration for the optional trust and consent decision cache.
+
+    When enabled, the engine memoises ``check_level`` results keyed on
+    (agent_id, scope, required_level) and ``check_consent`` results keyed on
+    (agent_id, data_type, purpose). Entries are invalidated by any write for
+    the same agent and expire at the next trust-decay boundary or consent
+    expiry, so cached answers always match an uncached evaluation.
+
+    Attributes:
+        enabled: Whether to memoise check results.
+        max_entries: Maximum entries held by each cache (trust and consent
+            are cached separately). Least recently used entries are evicted.
+    """
+
+    enabled: bool = False
+    max_entries: Annotated[int, Field(gt=0)] = 4096
+
+
+class WriteBehindConfig(BaseModel, frozen=True):
+    """
+    Configuration for write-behind audit delivery.
+
+    When enabled, the engine builds each decision first and queues its audit
+    entry; a background thread stores queued entries in batches. Decisions
+    still carry their final ``audit_record_id``. Call
+    :meth:`~aumos_governance.engine.GovernanceEngine.flush` before reading the
+    audit log if every decision so far must be visible, and
+    :meth:`~aumos_governance.engine.GovernanceEngine.close` at shutdown.
+
+    Attributes:
+        enabled: Whether audit entries are written behind the decision path.
+        queue_size: Maximum entries waiting to be stored.
+        batch_size: Maximum entries handed to the sink at once.
+        policy: What happens when the queue is full — ``"block"`` waits for
+            space, ``"drop_oldest"`` discards the oldest queued entry,
+            ``"drop_newest"`` discards the incoming entry. Drops are counted.
+        flush_interval_seconds: How long the writer waits for a batch to fill
+            before storing a partial one.
+    """
+
+    enabled: bool = False
+    queue_size: Annotated[int, Field(gt=0)] = 10_000
+    batch_size: Annotated[int, Field(gt=0)] = 256
+    policy: Literal["block", "drop_oldest", "drop_newest"] = "block"
+    flush_interval_seconds: Annotated[float, Field(gt=0)] = 0.05
+
+
+class StageConfig(BaseModel, frozen=True):
+    """
+    Configuration for the engine's evaluation stages.
+
+    Attributes:
+        collect_stats: When True, the engine counts invocations, denials and
+            cumulative wall-clock nanoseconds for every stage, reported by
+            :meth:`~aumos_governance.engine.GovernanceEngine.stage_stats`.
+            Off by default because timing every stage adds measurable
+            per-decision overhead.
+    """
+
+    collect_stats: bool = False
+
+
+class InstrumentationConfig(BaseModel, frozen=True):
+    """
+    Configuration for latency instrumentation.
+
+    Attributes:
+        enabled: When True, the engine records a latency histogram for every
+            manager operation, every evaluation entry point and every stage,
+            available from
+            :meth:`~aumos_governance.engine.GovernanceEngine.latency_stats`
+            and
+            :meth:`~aumos_governance.instrumentation.Instrumentation.render_prometheus`.
+            When False no timing code is installed at all.
+    """
+
+    enabled: bool = False
+
+
+class PersistenceConfig(BaseModel, frozen=True):
+    """
+    Configuration for durable trust, budget and consent state.
+
+    State is always held in memory; persistence only keeps a journal of
+    changes from which the engine restores that state when it starts. See
+    :mod:`aumos_governance.persistence`.
+
+    Attributes:
+        journal_path: File for a
+            :class:`~aumos_governance.persistence.JournalBackend`. When None
+            (the default) nothing is persisted.
+        fsync_interval_seconds: Maximum time between fsyncs of the journal.
+            Changes appended in between are lost if the machine (not just
+            the process) fails. 0 syncs after every written batch.
+        batch_size: Number of queued changes that wakes the journal writer
+            before the interval elapses.
+    """
+
+    journal_path: str | None = None
+    fsync_interval_seconds: Annotated[float, Field(ge=0)] = 1.0
+    batch_size: Annotated[int, Field(gt=0)] = 512
 
 
 class GovernanceConfig(BaseModel, frozen=True):
@@ -84,6 +265,7 @@ class GovernanceConfig(BaseModel, frozen=True):
             budget=BudgetConfig(allow_overdraft=False),
             consent=ConsentConfig(default_deny=True),
             audit=AuditConfig(max_records=5000),
+            cache=CacheConfig(enabled=True),
         )
         engine = GovernanceEngine(config=config)
     """
@@ -92,3 +274,8 @@ class GovernanceConfig(BaseModel, frozen=True):
     budget: BudgetConfig = Field(default_factory=BudgetConfig)
     consent: ConsentConfig = Field(default_factory=ConsentConfig)
     audit: AuditConfig = Field(default_factory=AuditConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    write_behind: WriteBehindConfig = Field(default_factory=WriteBehindConfig)
+    stages: StageConfig = Field(default_factory=StageConfig)
+    instrumentation: InstrumentationConfig = Field(default_factory=InstrumentationConfig)
+    persistence: PersistenceConfig = Field(default_factory=PersistenceConfig)
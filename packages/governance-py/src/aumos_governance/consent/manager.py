@@ -2,13 +2,29 @@
 # Copyright (c) 2026 MuVeraAI Corporation
 from __future__ import annotations
 
-from datetime import datetime
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import datetime, timezone
+from typing import Any
 
 from pydantic import BaseModel
 
+from aumos_governance.cache import DecisionCache
 from aumos_governance.config import ConsentConfig
-from aumos_governance.consent.store import ConsentRecord, ConsentStore
+from aumos_governance.consent.store import ConsentRecord, ConsentStore, _gc_paused
+from aumos_governance.deferred import Deferred
 from aumos_governance.errors import ConsentNotFoundError
+from aumos_governance.instrumentation import Instrumentation
+from aumos_governance.persistence import StateBackend, StateEntry
+
+# Operations timed when an Instrumentation is attached.
+_INSTRUMENTED = (
+    "record_consent",
+    "check_consent",
+    "check_consent_lean",
+    "revoke_consent",
+    "bulk_load",
+)
 
 
 class ConsentCheckResult(BaseModel, frozen=True):
@@ -40,7 +56,8 @@ class ConsentManager:
     Consent is always recorded explicitly by a human or trusted orchestrator.
     There is no proactive consent suggestion or inference.
 
-    All data is stored in-memory. A new ConsentManager starts empty.
+    All data is stored in-memory. A new ConsentManager starts empty, or with
+    the records restored from ``backend`` when one is given.
 
     Example::
 
@@ -55,9 +72,19 @@ class ConsentManager:
         assert result.granted is True
     """
 
-    def __init__(self, config: ConsentConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: ConsentConfig | None = None,
+        cache: DecisionCache[ConsentCheckResult] | None = None,
+        instrumentation: Instrumentation | None = None,
+        backend: StateBackend | None = None,
+    ) -> None:
         self._config = config or ConsentConfig()
-        self._store = ConsentStore()
+        self._store = ConsentStore(backend)
+        # Optional memo of check_consent results, invalidated per agent.
+        self._cache = cache
+        if instrumentation is not None:
+            instrumentation.instrument(self, "consent", _INSTRUMENTED)
 
     # ------------------------------------------------------------------
     # Public API
@@ -77,10 +104,16 @@ class ConsentManager:
         If a consent record for the same (agent_id, data_type, purpose)
         already exists it is replaced.
 
+        Data types and purposes are hierarchical, with ``.`` between levels;
+        a trailing ``*`` segment grants everything below that level, e.g.
+        ``data_type="pii.*"`` covers ``"pii.email"`` and ``"pii.phone"``.
+
         Args:
             agent_id: The agent being granted access.
-            data_type: The category of data being consented to.
-            purpose: Optional purpose string further scoping the consent.
+            data_type: The category of data being consented to, or a
+                wildcard pattern such as ``"pii.*"`` or ``"*"``.
+            purpose: Optional purpose string further scoping the consent,
+                which may also end in ``*``.
                 Pass None to record blanket consent for all purposes.
             granted_by: Identifier of the human or system granting consent.
             expires_at: Optional UTC datetime after which consent expires.
@@ -91,14 +124,10 @@ class ConsentManager:
 
         Raises:
             ValueError: If ``agent_id``, ``data_type``, or ``granted_by``
-                is an empty string.
+                is an empty string, or ``data_type`` or ``purpose`` has a
+                ``*`` segment other than the last.
         """
-        if not agent_id:
-            raise ValueError("agent_id must be a non-empty string.")
-        if not data_type:
-            raise ValueError("data_type must be a non-empty string.")
-        if not granted_by:
-            raise ValueError("granted_by must be a non-empty string.")
+        _check_grant(agent_id, data_type, purpose, granted_by)
 
         record = ConsentRecord(
             agent_id=agent_id,
@@ -108,6 +137,8 @@ class ConsentManager:
             expires_at=expires_at,
         )
         self._store.put(record)
+        if self._cache is not None:
+            self._cache.invalidate_agent(agent_id)
         return record
 
     def check_consent(
@@ -128,58 +159,63 @@ class ConsentManager:
                 A blanket consent record (purpose=None) satisfies any
                 purpose check.
 
+        Wildcard grants such as ``"pii.*"`` are honoured, and the most
+        specific matching grant is reported in ``record`` (see
+        :meth:`~aumos_governance.consent.store.ConsentStore.find`).
+
         Returns:
             A :class:`ConsentCheckResult` describing the outcome.
         """
-        record = self._store.find(
-            agent_id=agent_id,
-            data_type=data_type,
-            purpose=purpose,
+        cache = self._cache
+        if cache is None:
+            return self._evaluate_consent(agent_id, data_type, purpose)
+
+        cache_key = (agent_id, data_type, purpose)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        generation = cache.generation(agent_id)
+        result = self._evaluate_consent(agent_id, data_type, purpose)
+        expires_at = result.record.expires_at if result.record is not None else None
+        cache.put(
+            cache_key,
+            agent_id,
+            result,
+            expires_at.timestamp() if expires_at is not None else None,
+            generation,
         )
+        return result
 
-        if record is not None:
-            purpose_text = f" for purpose '{purpose}'" if purpose else ""
-            return ConsentCheckResult(
-                granted=True,
-                agent_id=agent_id,
-                data_type=data_type,
-                purpose=purpose,
-                reason=(
-                    f"Consent granted for agent '{agent_id}' to access "
-                    f"'{data_type}'{purpose_text} (granted by '{record.granted_by}')."
-                ),
-                record=record,
-            )
+    def check_consent_lean(
+        self,
+        agent_id: str,
+        data_type: str,
+        purpose: str | None = None,
+    ) -> tuple[bool, str | Deferred[str]]:
+        """
+        Allocation-light form of :meth:`check_consent`.
 
-        # No valid consent record found.
-        if self._config.default_deny:
-            purpose_text = f" for purpose '{purpose}'" if purpose else ""
-            return ConsentCheckResult(
-                granted=False,
-                agent_id=agent_id,
-                data_type=data_type,
-                purpose=purpose,
-                reason=(
-                    f"No valid consent record found for agent '{agent_id}' "
-                    f"accessing '{data_type}'{purpose_text}. "
-                    "Defaulting to deny."
-                ),
-                record=None,
-            )
+        Returns the verdict and a reason whose text is only rendered when it
+        is read. Used by :meth:`~aumos_governance.engine.GovernanceEngine.evaluate_lean`.
+        When a decision cache is attached the cached result is reused as-is.
 
-        # Permissive mode — absence of a record means allow.
-        purpose_text = f" for purpose '{purpose}'" if purpose else ""
-        return ConsentCheckResult(
-            granted=True,
-            agent_id=agent_id,
-            data_type=data_type,
-            purpose=purpose,
-            reason=(
-                f"No explicit consent record for agent '{agent_id}' "
-                f"accessing '{data_type}'{purpose_text}; "
-                "permissive mode allows by default."
-            ),
-            record=None,
+        Args:
+            agent_id: The agent requesting access.
+            data_type: The type of data being accessed.
+            purpose: The purpose for which access is needed.
+
+        Returns:
+            ``(granted, reason)``.
+        """
+        if self._cache is not None:
+            result = self.check_consent(agent_id, data_type, purpose)
+            return result.granted, result.reason
+        record = self._store.find(agent_id=agent_id, data_type=data_type, purpose=purpose)
+        default_deny = self._config.default_deny
+        granted_by = record.granted_by if record is not None else None
+        return (
+            record is not None or not default_deny,
+            Deferred(consent_reason, agent_id, data_type, purpose, granted_by, default_deny),
         )
 
     def revoke_consent(
@@ -212,6 +248,8 @@ class ConsentManager:
                 data_type=data_type,
                 purpose=purpose,
             )
+        if self._cache is not None:
+            self._cache.invalidate_agent(agent_id)
 
     def revoke_all_for_agent(self, agent_id: str) -> int:
         """
@@ -223,13 +261,17 @@ class ConsentManager:
         Returns:
             The number of records revoked.
         """
-        return self._store.remove_all_for_agent(agent_id)
+        removed = self._store.remove_all_for_agent(agent_id)
+        if self._cache is not None:
+            self._cache.invalidate_agent(agent_id)
+        return removed
 
     def list_consents(self, agent_id: str) -> list[ConsentRecord]:
         """
         Return all consent records for an agent.
 
-        Both active and expired records are returned. Use
+        Active records are returned together with any expired records that
+        have not been evicted yet. Use
         :meth:`~aumos_governance.consent.store.ConsentRecord.is_expired`
         to filter if needed.
 
@@ -240,3 +282,214 @@ class ConsentManager:
             List of :class:`~aumos_governance.consent.store.ConsentRecord` objects.
         """
         return self._store.list_for_agent(agent_id)
+
+    def bulk_load(self, grants: Iterable[ConsentRecord | Mapping[str, Any]]) -> int:
+        """
+        Record many consent grants at once.
+
+        Each grant is a :class:`~aumos_governance.consent.store.ConsentRecord`
+        or a mapping with the same fields (``agent_id``, ``data_type``,
+        ``granted_by`` and optionally ``purpose``, ``granted_at`` and
+        ``expires_at``), validated as :meth:`record_consent` would. Grants
+        are validated as they are read and stored together once all are
+        valid, so either every grant is recorded or none is. Each agent's
+        records are rebuilt once, rather than once per grant. Grants that
+        share a key replace each other in order.
+
+        Args:
+            grants: The grants to record.
+
+        Returns:
+            The number of grants recorded.
+
+        Raises:
+            ValueError: If any grant is invalid; the message names its
+                position. Nothing is recorded.
+        """
+        now = datetime.now(tz=timezone.utc)
+        records: list[ConsentRecord] = []
+        with _gc_paused():
+            for index, grant in enumerate(grants):
+                try:
+                    if not isinstance(grant, ConsentRecord):
+                        # One timestamp for the whole batch unless given.
+                        grant = ConsentRecord.model_validate({"granted_at": now, **grant})
+                    _check_grant(grant.agent_id, grant.data_type, grant.purpose, grant.granted_by)
+                except ValueError as exc:
+                    raise ValueError(
+                        f"Invalid consent grant at position {index}: {exc}"
+                    ) from exc
+                records.append(grant)
+            loaded = self._store.put_many(records)
+        if self._cache is not None:
+            self._cache.clear()
+        return loaded
+
+    def export_snapshot(self, path: str | os.PathLike[str]) -> int:
+        """
+        Write every consent record to a compact binary snapshot file.
+
+        See :meth:`~aumos_governance.consent.store.ConsentStore.export_snapshot`.
+
+        Args:
+            path: Destination file. Replaced atomically.
+
+        Returns:
+            The number of records written.
+        """
+        return self._store.export_snapshot(path)
+
+    def load_snapshot(self, path: str | os.PathLike[str]) -> int:
+        """
+        Add the consent records of a snapshot written by :meth:`export_snapshot`.
+
+        The file is memory-mapped and each agent's records are decoded the
+        first time the agent is checked or changed, so loading costs little
+        more than reading the list of agents. See
+        :meth:`~aumos_governance.consent.store.ConsentStore.load_snapshot`.
+
+        Args:
+            path: A snapshot file.
+
+        Returns:
+            The number of records loaded.
+
+        Raises:
+            ValueError: If the file is not a consent snapshot or is corrupt.
+        """
+        loaded = self._store.load_snapshot(path)
+        if self._cache is not None:
+            self._cache.clear()
+        return loaded
+
+    def release_snapshots(self) -> None:
+        """
+        Decode every agent still in a loaded snapshot and close the files.
+
+        Call this before modifying or truncating a file passed to
+        :meth:`load_snapshot`. See
+        :meth:`~aumos_governance.consent.store.ConsentStore.release_snapshots`.
+
+        Raises:
+            ValueError: If an undecoded agent's records are corrupt.
+        """
+        self._store.release_snapshots()
+
+    def count_active(self) -> int:
+        """Return the number of unexpired consent records across all agents."""
+        return self._store.count()
+
+    def purge_expired(self) -> int:
+        """
+        Evict every expired consent record.
+
+        Expired records are also evicted as consent is recorded or revoked;
+        call this periodically when writes are infrequent. Decisions are not
+        affected, since expired records never grant consent.
+
+        Returns:
+            The number of records evicted.
+        """
+        return self._store.purge_expired()
+
+    def state_entries(self) -> Iterator[StateEntry]:
+        """
+        Yield one ``consent.put`` entry per stored record, for compacting a
+        :class:`~aumos_governance.persistence.StateBackend`.
+        """
+        return self._store.state_entries()
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _evaluate_consent(
+        self,
+        agent_id: str,
+        data_type: str,
+        purpose: str | None,
+    ) -> ConsentCheckResult:
+        """Look up consent in the store and build the check result."""
+        record = self._store.find(
+            agent_id=agent_id,
+            data_type=data_type,
+            purpose=purpose,
+        )
+
+        granted_by = record.granted_by if record is not None else None
+        return ConsentCheckResult(
+            granted=record is not None or not self._config.default_deny,
+            agent_id=agent_id,
+            data_type=data_type,
+            purpose=purpose,
+            reason=consent_reason(
+                agent_id, data_type, purpose, granted_by, self._config.default_deny
+            ),
+            record=record,
+        )
+
+
+def consent_reason(
+    agent_id: str,
+    data_type: str,
+    purpose: str | None,
+    granted_by: str | None,
+    default_deny: bool,
+) -> str:
+    """
+    Render the human-readable reason for a consent check.
+
+    Shared by :meth:`ConsentManager.check_consent` and the deferred reasons
+    produced by :meth:`ConsentManager.check_consent_lean`.
+
+    Args:
+        agent_id: The agent requesting access.
+        data_type: The data type being accessed.
+        purpose: The purpose checked (may be None).
+        granted_by: ``granted_by`` of the matching record, or None when no
+            valid record was found.
+        default_deny: Whether a missing record denies access.
+
+    Returns:
+        The reason string.
+    """
+    purpose_text = f" for purpose '{purpose}'" if purpose else ""
+    if granted_by is not None:
+        return (
+            f"Consent granted for agent '{agent_id}' to access "
+            f"'{data_type}'{purpose_text} (granted by '{granted_by}')."
+        )
+    if default_deny:
+        return (
+            f"No valid consent record found for agent '{agent_id}' "
+            f"accessing '{data_type}'{purpose_text}. "
+            "Defaulting to deny."
+        )
+    return (
+        f"No explicit consent record for agent '{agent_id}' "
+        f"accessing '{data_type}'{purpose_text}; "
+        "permissive mode allows by default."
+    )
+
+
+def _check_grant(
+    agent_id: str, data_type: str, purpose: str | None, granted_by: str
+) -> None:
+    """Validate the fields of a consent grant; see :meth:`ConsentManager.record_consent`."""
+    if not agent_id:
+        raise ValueError("agent_id must be a non-empty string.")
+    if not data_type:
+        raise ValueError("data_type must be a non-empty string.")
+    if not granted_by:
+        raise ValueError("granted_by must be a non-empty string.")
+    _check_pattern("data_type", data_type)
+    if purpose is not None:
+        _check_pattern("purpose", purpose)
+
+
+def _check_pattern(name: str, value: str) -> None:
+    """Reject a ``*`` segment anywhere but at the end of a consent pattern."""
+    if "*" in value.split(".")[:-1]:
+        raise ValueError(
+            f"{name} '{value}' is invalid: '*' is only allowed as the last segment."
+        )
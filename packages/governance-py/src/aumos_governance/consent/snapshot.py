@@ -0,0 +1,260 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+"""
+Compact binary snapshots of consent records.
+
+A snapshot stores every distinct string (agent IDs, data types, purposes,
+``granted_by``) once in a string table; each record is then a fixed-width
+row of string indexes and microsecond timestamps. Rows are grouped by agent,
+and an agent table gives each agent's first row, row count and earliest
+expiry, so a reader can locate one agent's records without decoding the
+others.
+
+Layout (all integers little-endian)::
+
+    header      magic, string count, agent count, record count
+    offsets     string count + 1 uint32 offsets into the blob
+    blob        UTF-8 bytes of every string
+    agents      per agent: name index, first row, row count, earliest expiry
+    rows        per record: data type, purpose (-1 = None) and granted_by
+                indexes, granted_at and expires_at (or _NO_EXPIRY)
+
+:class:`ConsentSnapshot` memory-maps a snapshot file and decodes strings and
+rows on demand; :func:`write_snapshot` produces one.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aumos_governance.consent.store import ConsentRecord
+
+_MAGIC = b"AUMOSCN1"
+_HEADER = struct.Struct("<8sIII")
+_AGENT = struct.Struct("<IIIq")
+_ROW = struct.Struct("<IiIqq")
+_NO_EXPIRY = -(2**63)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# One record as decoded from a row:
+# (data_type, purpose, granted_by, granted_at, expires_at).
+SnapshotRow = tuple[str, str | None, str, datetime, datetime | None]
+
+
+def _micros(moment: datetime) -> int:
+    """Microseconds since the epoch; naive datetimes are taken as UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - _EPOCH) // timedelta(microseconds=1)
+
+
+def write_snapshot(
+    path: str | os.PathLike[str],
+    agents: Iterable[tuple[str, list[ConsentRecord]]],
+) -> int:
+    """
+    Write a snapshot of ``agents`` to ``path``.
+
+    The file is written next to ``path`` and renamed over it, so readers of
+    an existing snapshot never see a partial file.
+
+    Args:
+        path: Destination file.
+        agents: ``(agent_id, records)`` pairs; each agent must appear once.
+
+    Returns:
+        The number of records written.
+    """
+    strings: dict[str, int] = {}
+    # Imported grants typically share a handful of timestamps.
+    timestamps: dict[datetime, int] = {}
+
+    def intern(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    def micros(moment: datetime | None) -> int:
+        if moment is None:
+            return _NO_EXPIRY
+        value = timestamps.get(moment)
+        if value is None:
+            value = timestamps[moment] = _micros(moment)
+        return value
+
+    agent_table = bytearray()
+    rows = bytearray()
+    record_count = 0
+    for agent_id, records in agents:
+        if not records:
+            continue
+        earliest = min(
+            (micros(r.expires_at) for r in records if r.expires_at is not None),
+            default=_NO_EXPIRY,
+        )
+        agent_table += _AGENT.pack(intern(agent_id), record_count, len(records), earliest)
+        for record in records:
+            rows += _ROW.pack(
+                intern(record.data_type),
+                -1 if record.purpose is None else intern(record.purpose),
+                intern(record.granted_by),
+                micros(record.granted_at),
+                micros(record.expires_at),
+            )
+        record_count += len(records)
+
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = [0]
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+
+    temporary = f"{os.fspath(path)}.tmp"
+    with open(temporary, "wb") as snapshot:
+        snapshot.write(_HEADER.pack(
+            _MAGIC, len(encoded), len(agent_table) // _AGENT.size, record_count
+        ))
+        snapshot.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        snapshot.write(b"".join(encoded))
+        snapshot.write(agent_table)
+        snapshot.write(rows)
+        snapshot.flush()
+        os.fsync(snapshot.fileno())
+    os.replace(temporary, path)
+    return record_count
+
+
+class ConsentSnapshot:
+    """
+    A memory-mapped snapshot file.
+
+    Opening a snapshot reads its header, string offsets and agent table, and
+    checks that every agent's rows and name lie within the file. Strings are
+    decoded once, on first use, and shared by every row that refers to them;
+    rows are checked as they are decoded. The file must not be modified or
+    truncated until :meth:`close` — reading a mapping whose file has shrunk
+    kills the process with SIGBUS.
+
+    Args:
+        path: A file written by :func:`write_snapshot`.
+
+    Raises:
+        ValueError: If the file is not a consent snapshot, is truncated or
+            is corrupt.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._path = os.fspath(path)
+        with open(path, "rb") as snapshot:
+            size = os.fstat(snapshot.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"'{self._path}' is not a consent snapshot.")
+            self._map = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._open(size)
+        except ValueError:
+            self._map.close()
+            raise
+
+    def _open(self, size: int) -> None:
+        """Read and check the header, string offsets and agent table."""
+        magic, string_count, agent_count, record_count = _HEADER.unpack_from(self._map)
+        self.agent_count: int = agent_count
+        self.record_count: int = record_count
+        if magic != _MAGIC:
+            raise ValueError(f"'{self._path}' is not a consent snapshot.")
+        if size < _HEADER.size + 4 * (string_count + 1):
+            raise ValueError(f"Consent snapshot '{self._path}' is truncated.")
+        self._offsets = struct.unpack_from(f"<{string_count + 1}I", self._map, _HEADER.size)
+        self._blob = _HEADER.size + 4 * (string_count + 1)
+        self._agents = self._blob + self._offsets[-1]
+        self._rows = self._agents + self.agent_count * _AGENT.size
+        if self._rows + self.record_count * _ROW.size != size:
+            raise ValueError(f"Consent snapshot '{self._path}' is truncated.")
+        for name, first, count, _ in _AGENT.iter_unpack(self._map[self._agents : self._rows]):
+            if name >= string_count or first + count > record_count:
+                raise ValueError(f"Consent snapshot '{self._path}' is corrupt.")
+        self._strings: list[str | None] = [None] * string_count
+
+    @property
+    def closed(self) -> bool:
+        """Whether the mapping has been released."""
+        return self._map.closed
+
+    def close(self) -> None:
+        """
+        Release the mapping. Reading the snapshot afterwards raises
+        ``ValueError``; closing it again does nothing.
+        """
+        self._map.close()
+
+    def __enter__(self) -> ConsentSnapshot:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def agents(self) -> Iterator[tuple[str, int, int, float | None]]:
+        """
+        Yield ``(agent_id, first_row, row_count, earliest_expiry)`` per agent.
+
+        ``earliest_expiry`` is a POSIX timestamp, or None when none of the
+        agent's records expire.
+        """
+        table = memoryview(self._map)[self._agents : self._rows]
+        try:
+            for name, first, count, earliest in _AGENT.iter_unpack(table):
+                yield (
+                    self._string(name),
+                    first,
+                    count,
+                    None if earliest == _NO_EXPIRY else earliest / 1e6,
+                )
+        finally:
+            table.release()
+
+    def rows(self, first: int, count: int) -> list[SnapshotRow]:
+        """
+        Decode ``count`` rows starting at row ``first``.
+
+        Raises:
+            ValueError: If the rows are out of range, a row refers to a
+                string that does not exist or holds an impossible timestamp,
+                or the snapshot is closed.
+        """
+        if first < 0 or count < 0 or first + count > self.record_count:
+            raise ValueError(f"Rows {first}..{first + count} are not in '{self._path}'.")
+        start = self._rows + first * _ROW.size
+        string = self._string
+        strings = len(self._strings)
+        rows: list[SnapshotRow] = []
+        for data_type, purpose, granted_by, granted_at, expires_at in _ROW.iter_unpack(
+            self._map[start : start + count * _ROW.size]
+        ):
+            if data_type >= strings or granted_by >= strings or not -1 <= purpose < strings:
+                raise ValueError(f"Consent snapshot '{self._path}' is corrupt.")
+            try:
+                rows.append((
+                    string(data_type),
+                    None if purpose < 0 else string(purpose),
+                    string(granted_by),
+                    _EPOCH + timedelta(microseconds=granted_at),
+                    None if expires_at == _NO_EXPIRY
+                    else _EPOCH + timedelta(microseconds=expires_at),
+                ))
+            except OverflowError:
+                raise ValueError(f"Consent snapshot '{self._path}' is corrupt.") from None
+        return rows
+
+    def _string(self, index: int) -> str:
+        value = self._strings[index]
+        if value is None:
+            start = self._blob + self._offsets[index]
+            end = self._blob + self._offsets[index + 1]
+            value = self._strings[index] = str(self._map[start:end], "utf-8")
+        return value
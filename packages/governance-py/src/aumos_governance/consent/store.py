@@ -2,10 +2,22 @@
 # Copyright (c) 2026 MuVeraAI Corporation
 from __future__ import annotations
 
+import gc
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from types import MappingProxyType
 
 from pydantic import BaseModel, Field
 
+from aumos_governance.consent.snapshot import ConsentSnapshot, write_snapshot
+from aumos_governance.persistence import StateBackend, StateEntry
+
 
 class ConsentRecord(BaseModel, frozen=True):
     """
@@ -46,7 +58,9 @@ class ConsentRecord(BaseModel, frozen=True):
 
         Purpose matching is intentionally permissive: a record with
         ``purpose=None`` covers ALL purposes for that agent+data_type pair.
-        A record with a specific purpose only covers that exact purpose.
+        A record with a specific purpose only covers that exact purpose, or
+        every purpose below it when it ends in ``*``. Data types are matched
+        the same way, so a record for ``"pii.*"`` covers ``"pii.email"``.
 
         Args:
             agent_id: The agent ID to match.
@@ -60,13 +74,21 @@ class ConsentRecord(BaseModel, frozen=True):
             return False
         if self.agent_id != agent_id:
             return False
-        if self.data_type != data_type:
+        if not _covers(self.data_type, data_type):
             return False
         # A record with purpose=None covers all purposes.
         if self.purpose is None:
             return True
-        # A record with a specific purpose only matches that purpose.
-        return self.purpose == purpose
+        # A record with a specific purpose only matches that purpose or,
+        # for a wildcard, the purposes below it.
+        return purpose is not None and _covers(self.purpose, purpose)
+
+
+def _covers(pattern: str, value: str) -> bool:
+    """Return True if the granted ``pattern`` covers ``value``."""
+    if pattern == value or pattern == "*":
+        return True
+    return pattern.endswith(".*") and value.startswith(pattern[:-1])
 
 
 def _make_consent_key(
@@ -78,6 +100,246 @@ def _make_consent_key(
     return (agent_id, data_type, purpose)
 
 
+# ---------------------------------------------------------------------------
+# Per-agent consent trie
+# ---------------------------------------------------------------------------
+
+# Shared empty containers for trie nodes. Published nodes are never mutated,
+# so nodes without children or grants can all point at the same objects.
+_NO_GRANTS: dict[str | None, ConsentRecord] = {}
+_NO_CHILDREN: dict[str, _ConsentNode] = {}
+
+
+class _ConsentNode:
+    """
+    One data-type segment of an agent's consent trie.
+
+    The path from the root spells a data type: the node reached by
+    ``pii`` then ``email`` is ``"pii.email"``. ``exact`` holds the grants for
+    exactly that data type and ``wildcard`` the grants for ``"pii.email.*"``
+    (``"*"`` at the root), both keyed by purpose.
+
+    Nodes are never mutated once published; writers copy the path they
+    change (see :func:`_trie_put`).
+    """
+
+    __slots__ = ("children", "exact", "wildcard")
+
+    def __init__(
+        self,
+        children: dict[str, _ConsentNode] = _NO_CHILDREN,
+        exact: dict[str | None, ConsentRecord] = _NO_GRANTS,
+        wildcard: dict[str | None, ConsentRecord] = _NO_GRANTS,
+    ) -> None:
+        self.children = children
+        self.exact = exact
+        self.wildcard = wildcard
+
+    def is_empty(self) -> bool:
+        return not (self.children or self.exact or self.wildcard)
+
+
+_EMPTY_NODE = _ConsentNode()
+
+
+def _pattern(data_type: str) -> tuple[list[str], bool]:
+    """Split a granted data type into trie segments and a trailing-``*`` flag."""
+    segments = data_type.split(".")
+    if segments[-1] == "*":
+        return segments[:-1], True
+    return segments, False
+
+
+def _trie_put(
+    node: _ConsentNode,
+    segments: list[str],
+    wildcard: bool,
+    purpose: str | None,
+    record: ConsentRecord | None,
+    depth: int = 0,
+) -> _ConsentNode:
+    """
+    Return a copy of ``node`` with one grant set, or removed when ``record``
+    is None. Only the nodes on the grant's path are copied; nodes left empty
+    by a removal are pruned.
+    """
+    if depth == len(segments):
+        grants = dict(node.wildcard if wildcard else node.exact)
+        if record is None:
+            grants.pop(purpose, None)
+        else:
+            grants[purpose] = record
+        if wildcard:
+            return _ConsentNode(node.children, node.exact, grants or _NO_GRANTS)
+        return _ConsentNode(node.children, grants or _NO_GRANTS, node.wildcard)
+    segment = segments[depth]
+    child = _trie_put(
+        node.children.get(segment, _EMPTY_NODE), segments, wildcard, purpose, record, depth + 1
+    )
+    children = dict(node.children)
+    if child.is_empty():
+        children.pop(segment, None)
+    else:
+        children[segment] = child
+    return _ConsentNode(children or _NO_CHILDREN, node.exact, node.wildcard)
+
+
+def _trie_build(records: Iterable[ConsentRecord]) -> _ConsentNode:
+    """Build a trie from ``records`` in place, before it is published."""
+    root = _ConsentNode()
+    for record in records:
+        segments, wildcard = _pattern(record.data_type)
+        node = root
+        for segment in segments:
+            if node.children is _NO_CHILDREN:
+                node.children = {}
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _ConsentNode()
+            node = child
+        if wildcard:
+            if node.wildcard is _NO_GRANTS:
+                node.wildcard = {}
+            node.wildcard[record.purpose] = record
+        else:
+            if node.exact is _NO_GRANTS:
+                node.exact = {}
+            node.exact[record.purpose] = record
+    return root
+
+
+def _trie_get(
+    root: _ConsentNode, data_type: str, purpose: str | None
+) -> ConsentRecord | None:
+    """Return the grant stored under exactly ``(data_type, purpose)``."""
+    segments, wildcard = _pattern(data_type)
+    node = root
+    for segment in segments:
+        child = node.children.get(segment)
+        if child is None:
+            return None
+        node = child
+    return (node.wildcard if wildcard else node.exact).get(purpose)
+
+
+def _trie_records(root: _ConsentNode) -> list[ConsentRecord]:
+    """Return every grant under ``root``."""
+    records: list[ConsentRecord] = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.exact:
+            records += node.exact.values()
+        if node.wildcard:
+            records += node.wildcard.values()
+        if node.children:
+            stack += node.children.values()
+    return records
+
+
+def _trie_find(
+    root: _ConsentNode, data_type: str, purpose: str | None
+) -> ConsentRecord | None:
+    """
+    Return the most specific unexpired grant covering ``(data_type, purpose)``.
+
+    Data types are compared first: an exact grant beats ``"a.b.*"``, which
+    beats ``"a.*"``, which beats ``"*"``. Among grants for the same data
+    type the purpose decides in the same way (see :func:`_match_purpose`).
+    The walk visits one node per segment of ``data_type``.
+    """
+    levels: list[dict[str | None, ConsentRecord]] = []
+    node = root
+    for segment in data_type.split("."):
+        if node.wildcard:
+            levels.append(node.wildcard)
+        child = node.children.get(segment)
+        if child is None:
+            break
+        node = child
+    else:
+        if node.exact:
+            levels.append(node.exact)
+    for grants in reversed(levels):
+        record = _match_purpose(grants, purpose)
+        if record is not None:
+            return record
+    return None
+
+
+def _match_purpose(
+    grants: dict[str | None, ConsentRecord], purpose: str | None
+) -> ConsentRecord | None:
+    """
+    Return the most specific unexpired grant in ``grants`` covering ``purpose``.
+
+    Order: the exact purpose, then ``"a.b.*"``, ``"a.*"`` and ``"*"`` for a
+    purpose ``"a.b.c"``, then the blanket grant (purpose None). A check
+    without a purpose is only covered by a blanket grant.
+    """
+    if purpose is not None:
+        record = grants.get(purpose)
+        if record is not None and not record.is_expired():
+            return record
+        end = len(purpose)
+        while (end := purpose.rfind(".", 0, end)) != -1:
+            record = grants.get(purpose[:end] + ".*")
+            if record is not None and not record.is_expired():
+                return record
+        record = grants.get("*")
+        if record is not None and not record.is_expired():
+            return record
+    record = grants.get(None)
+    if record is not None and not record.is_expired():
+        return record
+    return None
+
+
+class _SnapshotAgent:
+    """
+    An agent whose records are still in a loaded snapshot file.
+
+    Stands in for the agent's trie until the agent is first used; see
+    :meth:`ConsentStore.load_snapshot`. Once the agent is decoded its records
+    are kept in ``decoded``, so lock-free readers still holding the
+    placeholder need not read the snapshot, which may since have been closed.
+    """
+
+    __slots__ = ("snapshot", "agent_id", "first", "count", "decoded")
+
+    def __init__(self, snapshot: ConsentSnapshot, agent_id: str, first: int, count: int) -> None:
+        self.snapshot = snapshot
+        self.agent_id = agent_id
+        self.first = first
+        self.count = count
+        self.decoded: list[ConsentRecord] | None = None
+
+    def records(self) -> list[ConsentRecord]:
+        """Decode and validate this agent's records."""
+        decoded = self.decoded
+        if decoded is not None:
+            return decoded
+        try:
+            rows = self.snapshot.rows(self.first, self.count)
+        except ValueError:
+            # The agent was decoded and its snapshot closed while we read.
+            if self.decoded is None:
+                raise
+            return self.decoded
+        agent_id = self.agent_id
+        return [
+            ConsentRecord(
+                agent_id=agent_id,
+                data_type=data_type,
+                purpose=purpose,
+                granted_by=granted_by,
+                granted_at=granted_at,
+                expires_at=expires_at,
+            )
+            for data_type, purpose, granted_by, granted_at, expires_at in rows
+        ]
+
+
 class ConsentStore:
     """
     In-memory store for consent records.
@@ -85,10 +347,57 @@ class ConsentStore:
     Records are keyed by (agent_id, data_type, purpose). A record with
     purpose=None represents blanket consent for all purposes of that
     agent+data_type combination.
+
+    Data types and purposes are hierarchical, with ``.`` separating levels.
+    A grant whose data type or purpose ends in ``*`` covers everything below
+    that level: ``"pii.*"`` covers ``"pii.email"`` and ``"pii.email.work"``
+    (but not ``"pii"`` itself), and ``"*"`` covers every data type. When
+    several grants cover a check, :meth:`find` returns the most specific
+    one, comparing data types first and purposes second.
+
+    Each agent's grants form a trie with one node per data-type segment, so
+    a lookup visits one node per segment however many grants exist. The
+    tries are never mutated once published: writers copy the path they
+    change and swap the agent's root under a lock, so readers never lock or
+    observe a partially applied write.
+
+    Grants with an ``expires_at`` are also held in a min-heap ordered by
+    expiry. Every write first evicts the grants that have expired since, and
+    :meth:`purge_expired` does the same on demand, so expired grants do not
+    accumulate and :meth:`count` reports only active grants.
+
+    Large numbers of grants are loaded with :meth:`put_many`, which builds
+    each agent's trie once, or from a binary snapshot written by
+    :meth:`export_snapshot` with :meth:`load_snapshot`, which defers
+    decoding each agent's records until the agent is first used.
+
+    When a ``backend`` is given the store starts with the records it holds
+    and reports every change to it.
     """
 
-    def __init__(self) -> None:
-        self._records: dict[tuple[str, str, str | None], ConsentRecord] = {}
+    def __init__(self, backend: StateBackend | None = None) -> None:
+        # agent_id -> root of that agent's consent trie, or a placeholder for
+        # an agent still in a loaded snapshot. The tries are never mutated
+        # once published; the dict changes one key at a time under
+        # _write_lock.
+        self._by_agent: dict[str, _ConsentNode | _SnapshotAgent] = {}
+        self._size = 0
+        # Min-heap of (expires_at timestamp, sequence, agent_id, data_type,
+        # purpose). Entries for replaced or removed grants stay until popped.
+        self._expiry: list[tuple[float, int, str, str, str | None]] = []
+        self._sequence = itertools.count()
+        # Stored grants that have an expiry, i.e. live heap entries.
+        self._expiring = 0
+        # Min-heap of (earliest expiry, sequence, agent_id, placeholder) for
+        # snapshot agents with expiring records; due agents are decoded and
+        # their records moved to _expiry.
+        self._snapshot_expiry: list[tuple[float, int, str, _SnapshotAgent]] = []
+        # Loaded snapshots that placeholders may still refer to.
+        self._snapshots: list[ConsentSnapshot] = []
+        self._write_lock = threading.Lock()
+        self._backend = backend
+        if backend is not None:
+            self._restore(backend.load("consent"))
 
     def put(self, record: ConsentRecord) -> None:
         """
@@ -100,8 +409,19 @@ class ConsentStore:
         Args:
             record: The :class:`ConsentRecord` to store.
         """
-        key = _make_consent_key(record.agent_id, record.data_type, record.purpose)
-        self._records[key] = record
+        segments, wildcard = _pattern(record.data_type)
+        with self._write_lock:
+            self._evict_expired(time.time())
+            current = self._root(record.agent_id)
+            previous = _trie_get(current, record.data_type, record.purpose)
+            self._by_agent[record.agent_id] = _trie_put(
+                current, segments, wildcard, record.purpose, record
+            )
+            if previous is not None:
+                self._forget(previous)
+            self._remember(record)
+            if self._backend is not None:
+                self._backend.append(_put_entry(record))
 
     def find(
         self,
@@ -110,13 +430,18 @@ class ConsentStore:
         purpose: str | None = None,
     ) -> ConsentRecord | None:
         """
-        Find an active consent record.
+        Find the most specific active consent record covering a request.
 
-        Lookup strategy:
-        1. Exact match: (agent_id, data_type, purpose).
-        2. Blanket match: (agent_id, data_type, None) — covers all purposes.
+        Lookup order, most specific first:
+        1. Data type: the exact data type, then each wildcard ancestor from
+           the deepest up (``"pii.email.*"``, ``"pii.*"``, ``"*"``).
+        2. Within one data type, purpose: the exact purpose, then each
+           wildcard ancestor (``"support.*"``, ``"*"``), then the blanket
+           record (purpose=None). A request without a purpose only matches
+           blanket records.
 
-        Returns the first matching non-expired record, or None.
+        Expired records are skipped. The cost is proportional to the depth of
+        ``data_type`` and ``purpose``, not to the number of grants.
 
         Args:
             agent_id: The agent ID to search for.
@@ -126,20 +451,127 @@ class ConsentStore:
         Returns:
             A :class:`ConsentRecord` if found and not expired, else None.
         """
-        # 1. Try exact match first.
-        if purpose is not None:
-            exact_key = _make_consent_key(agent_id, data_type, purpose)
-            exact = self._records.get(exact_key)
-            if exact is not None and not exact.is_expired():
-                return exact
+        root = self._by_agent.get(agent_id)
+        if root is None:
+            return None
+        if isinstance(root, _SnapshotAgent):
+            with self._write_lock:
+                root = self._root(agent_id)
+        return _trie_find(root, data_type, purpose)
+
+    def put_many(self, records: Iterable[ConsentRecord]) -> int:
+        """
+        Store or replace many consent records at once.
+
+        Equivalent to calling :meth:`put` for each record in order, but each
+        agent's trie is rebuilt once rather than copied per record.
+
+        Args:
+            records: The records to store.
+
+        Returns:
+            The number of records stored.
+        """
+        by_agent: dict[str, list[ConsentRecord]] = {}
+        for record in records:
+            by_agent.setdefault(record.agent_id, []).append(record)
+        with self._write_lock, _gc_paused():
+            self._evict_expired(time.time())
+            for agent_id, batch in by_agent.items():
+                self._merge(agent_id, batch)
+        return sum(len(batch) for batch in by_agent.values())
+
+    def export_snapshot(self, path: str | os.PathLike[str]) -> int:
+        """
+        Write every stored record to a binary snapshot file.
+
+        Strings are stored once each and records as fixed-width rows grouped
+        by agent (see :mod:`aumos_governance.consent.snapshot`). The file is
+        replaced atomically.
+
+        Args:
+            path: Destination file.
+
+        Returns:
+            The number of records written.
+        """
+        with self._write_lock:
+            agents = list(self._by_agent.items())
+        return write_snapshot(
+            path, ((agent_id, _records_of(value)) for agent_id, value in agents)
+        )
+
+    def load_snapshot(self, path: str | os.PathLike[str]) -> int:
+        """
+        Add the records of a snapshot written by :meth:`export_snapshot`.
+
+        The file is memory-mapped. Agents that have no records in the store
+        are registered without decoding their records; each is decoded the
+        first time it is read or written, or when one of its records
+        expires. Records of agents already in the store replace records with
+        the same (data_type, purpose). While any of its agents remain
+        undecoded the file stays mapped and must not be modified or
+        truncated; :meth:`release_snapshots` decodes them and closes it.
+        When none remain, the file is closed before this returns.
 
-        # 2. Try blanket (purpose=None) match.
-        blanket_key = _make_consent_key(agent_id, data_type, None)
-        blanket = self._records.get(blanket_key)
-        if blanket is not None and not blanket.is_expired():
-            return blanket
+        With a persistence backend every record is decoded and journalled
+        immediately.
 
-        return None
+        Args:
+            path: A snapshot file.
+
+        Returns:
+            The number of records loaded.
+
+        Raises:
+            ValueError: If the file is not a consent snapshot, or an agent's
+                records are out of range or refer to strings the file does
+                not hold. A record that is corrupt in other ways is reported
+                when its agent is decoded.
+        """
+        snapshot = ConsentSnapshot(path)
+        registered = False
+        try:
+            with self._write_lock:
+                for agent_id, first, count, earliest in snapshot.agents():
+                    placeholder = _SnapshotAgent(snapshot, agent_id, first, count)
+                    if agent_id in self._by_agent or self._backend is not None:
+                        self._merge(agent_id, placeholder.records())
+                        continue
+                    if not registered:
+                        self._snapshots.append(snapshot)
+                        registered = True
+                    self._by_agent[agent_id] = placeholder
+                    self._size += count
+                    if earliest is not None:
+                        heapq.heappush(
+                            self._snapshot_expiry,
+                            (earliest, next(self._sequence), agent_id, placeholder),
+                        )
+                self._evict_expired(time.time())
+        finally:
+            if not registered:
+                snapshot.close()
+        return snapshot.record_count
+
+    def release_snapshots(self) -> None:
+        """
+        Decode every agent still in a loaded snapshot and close the files.
+
+        Afterwards the snapshot files may be modified, truncated or removed.
+
+        Raises:
+            ValueError: If an undecoded agent's records are corrupt; the
+                files are left open.
+        """
+        with self._write_lock, _gc_paused():
+            for agent_id, value in list(self._by_agent.items()):
+                if isinstance(value, _SnapshotAgent):
+                    self._decode(agent_id, value)
+            self._snapshot_expiry.clear()
+            for snapshot in self._snapshots:
+                snapshot.close()
+            self._snapshots.clear()
 
     def remove(
         self,
@@ -158,11 +590,22 @@ class ConsentStore:
         Returns:
             True if a record was removed, False if none was found.
         """
-        key = _make_consent_key(agent_id, data_type, purpose)
-        if key in self._records:
-            del self._records[key]
-            return True
-        return False
+        with self._write_lock:
+            self._evict_expired(time.time())
+            current = self._root(agent_id)
+            previous = _trie_get(current, data_type, purpose)
+            if previous is None:
+                return False
+            self._discard(agent_id, current, data_type, purpose)
+            self._forget(previous)
+            if self._backend is not None:
+                self._backend.append({
+                    "op": "consent.remove",
+                    "agent_id": agent_id,
+                    "data_type": data_type,
+                    "purpose": purpose,
+                })
+        return True
 
     def remove_all_for_agent(self, agent_id: str) -> int:
         """
@@ -174,19 +617,30 @@ class ConsentStore:
         Returns:
             The number of records removed.
         """
-        keys_to_delete = [
-            key for key in self._records if key[0] == agent_id
-        ]
-        for key in keys_to_delete:
-            del self._records[key]
-        return len(keys_to_delete)
+        with self._write_lock:
+            self._evict_expired(time.time())
+            root = self._by_agent.pop(agent_id, None)
+            if root is None:
+                return 0
+            if isinstance(root, _SnapshotAgent):
+                # Its expiring records were never counted in _expiring.
+                removed = root.count
+                self._size -= removed
+            else:
+                removed = 0
+                for record in _trie_records(root):
+                    self._forget(record)
+                    removed += 1
+            if self._backend is not None:
+                self._backend.append({"op": "consent.remove_agent", "agent_id": agent_id})
+        return removed
 
     def list_for_agent(self, agent_id: str) -> list[ConsentRecord]:
         """
         Return all consent records for a specific agent.
 
-        Expired records are included — callers can filter using
-        :meth:`ConsentRecord.is_expired` if needed.
+        Records that have expired but not yet been evicted are included —
+        callers can filter using :meth:`ConsentRecord.is_expired` if needed.
 
         Args:
             agent_id: The agent ID to query.
@@ -194,12 +648,250 @@ class ConsentStore:
         Returns:
             List of :class:`ConsentRecord` objects.
         """
-        return [
-            record
-            for key, record in self._records.items()
-            if key[0] == agent_id
-        ]
+        root = self._by_agent.get(agent_id)
+        if root is None:
+            return []
+        if isinstance(root, _SnapshotAgent):
+            with self._write_lock:
+                root = self._root(agent_id)
+        return _trie_records(root)
 
     def count(self) -> int:
-        """Return the total number of stored consent records."""
-        return len(self._records)
+        """
+        Return the number of active (unexpired) consent records.
+
+        Evicts any grants that have expired since the last write first, which
+        costs O(log n) per evicted grant.
+        """
+        with self._write_lock:
+            self._evict_expired(time.time())
+            return self._size
+
+    def purge_expired(self, now: datetime | None = None) -> int:
+        """
+        Evict every grant whose ``expires_at`` is at or before ``now``.
+
+        Writes do this automatically; call it periodically to release
+        expired grants in a store that is rarely written.
+
+        Args:
+            now: The time to compare against. Defaults to the current time.
+
+        Returns:
+            The number of grants evicted.
+        """
+        timestamp = time.time() if now is None else now.timestamp()
+        with self._write_lock:
+            return self._evict_expired(timestamp)
+
+    def snapshot(self) -> Mapping[tuple[str, str, str | None], ConsentRecord]:
+        """
+        Return a read-only view of the current records.
+
+        The view is a consistent point-in-time snapshot keyed by
+        ``(agent_id, data_type, purpose)``; later writes do not affect it.
+        Building it copies every record reference, so it costs O(n).
+        """
+        with self._write_lock:
+            agents = list(self._by_agent.items())
+        return MappingProxyType({
+            (agent_id, record.data_type, record.purpose): record
+            for agent_id, value in agents
+            for record in _records_of(value)
+        })
+
+    def state_entries(self) -> Iterator[StateEntry]:
+        """
+        Yield one ``consent.put`` entry per stored record.
+
+        Takes no lock, so that a backend may call it while writers wait on
+        the backend: copying the values is atomic, each agent's trie is
+        immutable, and writers publish a change before journalling it.
+        """
+        agents = list(self._by_agent.values())
+        for value in agents:
+            for record in _records_of(value):
+                yield _put_entry(record)
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _root(self, agent_id: str) -> _ConsentNode:
+        """
+        Return ``agent_id``'s trie, decoding it from its snapshot first if
+        needed. Caller holds the write lock.
+        """
+        root = self._by_agent.get(agent_id, _EMPTY_NODE)
+        if isinstance(root, _SnapshotAgent):
+            root = self._decode(agent_id, root)
+        return root
+
+    def _decode(self, agent_id: str, placeholder: _SnapshotAgent) -> _ConsentNode:
+        """Replace a snapshot placeholder with a trie. Caller holds the write lock."""
+        records = placeholder.records()
+        root = _trie_build(records)
+        placeholder.decoded = records
+        self._by_agent[agent_id] = root
+        for record in records:
+            if record.expires_at is not None:
+                self._expiring += 1
+                heapq.heappush(self._expiry, _expiry_entry(record, next(self._sequence)))
+        return root
+
+    def _merge(self, agent_id: str, records: list[ConsentRecord]) -> None:
+        """Store ``records`` for one agent with a single rebuild. Caller holds the write lock."""
+        merged = {(r.data_type, r.purpose): r for r in _trie_records(self._root(agent_id))}
+        replaced = []
+        for record in records:
+            previous = merged.get((record.data_type, record.purpose))
+            if previous is not None:
+                replaced.append(previous)
+            merged[(record.data_type, record.purpose)] = record
+        self._by_agent[agent_id] = _trie_build(merged.values())
+        # Counted after publishing, as _forget may rebuild the expiry heap
+        # from the published tries.
+        for previous in replaced:
+            self._forget(previous)
+        for record in records:
+            self._remember(record)
+            if self._backend is not None:
+                self._backend.append(_put_entry(record))
+
+    def _discard(
+        self, agent_id: str, root: _ConsentNode, data_type: str, purpose: str | None
+    ) -> None:
+        """Remove one stored grant from ``agent_id``'s trie. Caller holds the write lock."""
+        segments, wildcard = _pattern(data_type)
+        root = _trie_put(root, segments, wildcard, purpose, None)
+        if root.is_empty():
+            del self._by_agent[agent_id]
+        else:
+            self._by_agent[agent_id] = root
+
+    def _remember(self, record: ConsentRecord) -> None:
+        """Count a newly stored record. Caller holds the write lock."""
+        self._size += 1
+        if record.expires_at is not None:
+            self._expiring += 1
+            heapq.heappush(self._expiry, _expiry_entry(record, next(self._sequence)))
+
+    def _forget(self, record: ConsentRecord) -> None:
+        """Uncount a record that was replaced or removed. Caller holds the write lock."""
+        self._size -= 1
+        if record.expires_at is not None:
+            self._expiring -= 1
+            # Drop stale heap entries once they outnumber the live ones.
+            if len(self._expiry) > 2 * self._expiring + 64:
+                self._rebuild_expiry()
+
+    def _rebuild_expiry(self) -> None:
+        """Rebuild the expiry heap from the stored records. Caller holds the write lock."""
+        self._expiry = [
+            _expiry_entry(record, next(self._sequence))
+            for root in self._by_agent.values()
+            if isinstance(root, _ConsentNode)
+            for record in _trie_records(root)
+            if record.expires_at is not None
+        ]
+        heapq.heapify(self._expiry)
+
+    def _evict_expired(self, now: float) -> int:
+        """Remove grants that expired at or before ``now``. Caller holds the write lock."""
+        # Decode snapshot agents with due records, moving those records onto
+        # the main heap.
+        pending = self._snapshot_expiry
+        while pending and pending[0][0] <= now:
+            _, _, agent_id, placeholder = heapq.heappop(pending)
+            if self._by_agent.get(agent_id) is placeholder:
+                self._decode(agent_id, placeholder)
+
+        heap = self._expiry
+        evicted = 0
+        while heap and heap[0][0] <= now:
+            expires, _, agent_id, data_type, purpose = heapq.heappop(heap)
+            current = self._root(agent_id)
+            record = _trie_get(current, data_type, purpose)
+            # Skip entries left behind by a replaced or removed grant.
+            if (
+                record is None
+                or record.expires_at is None
+                or record.expires_at.timestamp() != expires
+            ):
+                continue
+            self._discard(agent_id, current, data_type, purpose)
+            self._size -= 1
+            self._expiring -= 1
+            evicted += 1
+        return evicted
+
+    def _restore(self, entries: Iterable[StateEntry]) -> None:
+        """Rebuild the records from backend entries and publish them once."""
+        by_agent: dict[str, dict[tuple[str, str | None], ConsentRecord]] = {}
+        for state in entries:
+            op = state["op"]
+            if op == "consent.put":
+                record = ConsentRecord.model_validate(state["record"])
+                by_agent.setdefault(record.agent_id, {})[
+                    (record.data_type, record.purpose)
+                ] = record
+            elif op == "consent.remove":
+                records = by_agent.get(state["agent_id"])
+                if records is not None:
+                    records.pop((state["data_type"], state["purpose"]), None)
+            elif op == "consent.remove_agent":
+                by_agent.pop(state["agent_id"], None)
+        with self._write_lock:
+            self._by_agent = {
+                agent: _trie_build(records.values())
+                for agent, records in by_agent.items()
+                if records
+            }
+            self._size = sum(len(records) for records in by_agent.values())
+            self._rebuild_expiry()
+            self._expiring = len(self._expiry)
+            self._evict_expired(time.time())
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Pause cyclic garbage collection while loading many records.
+
+    Consent records and trie nodes form no reference cycles, but allocating
+    millions of them triggers repeated full collections over the growing
+    heap, which would otherwise dominate the load time.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _records_of(value: _ConsentNode | _SnapshotAgent) -> list[ConsentRecord]:
+    """Return an agent's records without publishing a decoded snapshot agent."""
+    if isinstance(value, _SnapshotAgent):
+        return value.records()
+    return _trie_records(value)
+
+
+def _expiry_entry(
+    record: ConsentRecord, sequence: int
+) -> tuple[float, int, str, str, str | None]:
+    """Return the expiry heap entry for a record that has an ``expires_at``."""
+    assert record.expires_at is not None  # noqa: S101 — callers check
+    return (
+        record.expires_at.timestamp(),
+        sequence,
+        record.agent_id,
+        record.data_type,
+        record.purpose,
+    )
+
+
+def _put_entry(record: ConsentRecord) -> StateEntry:
+    """Return the ``consent.put`` state entry describing ``record``."""
+    return {"op": "consent.put", "record": record.model_dump(mode="json")}
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+"""
+Deferred values for the allocation-light evaluation path.
+
+:meth:`~aumos_governance.engine.GovernanceEngine.evaluate_lean` records *how*
+to build reason strings, audit contexts and decision text instead of building
+them. A :class:`Deferred` holds a plain function and its arguments and calls
+it at most once, the first time the value is actually needed. Decisions whose
+reasons are never read therefore never pay for string formatting or Pydantic
+model construction.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+_T = TypeVar("_T")
+
+_UNRESOLVED: Any = object()
+
+
+class Deferred(Generic[_T]):
+    """
+    A value computed on first access and memoised afterwards.
+
+    ``str()`` of a deferred value resolves it, so a ``Deferred[str]`` can be
+    used anywhere reason text is rendered.
+
+    Example::
+
+        text = Deferred(lambda name: f"Hello {name}", "agent-1")
+        assert text.resolve() == "Hello agent-1"
+    """
+
+    __slots__ = ("_fn", "_args", "_value")
+
+    def __init__(self, fn: Callable[..., _T], *args: object) -> None:
+        self._fn = fn
+        self._args = args
+        self._value: _T = _UNRESOLVED
+
+    def resolve(self) -> _T:
+        """Return the value, computing it on the first call."""
+        if self._value is _UNRESOLVED:
+            self._value = self._fn(*self._args)
+            # Drop references held only for the computation.
+            self._args = ()
+        return self._value
+
+    @property
+    def resolved(self) -> bool:
+        """True once :meth:`resolve` has run."""
+        return self._value is not _UNRESOLVED
+
+    def __str__(self) -> str:
+        return str(self.resolve())
+
+    def __repr__(self) -> str:
+        if self.resolved:
+            return f"Deferred({self._value!r})"
+        return f"Deferred(<pending {getattr(self._fn, '__name__', self._fn)!s}>)"
+
+
+def resolve_text(part: str | Deferred[str]) -> str:
+    """Return ``part`` as a string, resolving it if it is deferred."""
+    return part if isinstance(part, str) else part.resolve()
@@ -2,17 +2,36 @@
 # Copyright (c) 2026 MuVeraAI Corporation
 from __future__ import annotations
 
-import asyncio
+import time
+import uuid
+from collections.abc import Hashable, Iterator, Sequence
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from aumos_governance.audit.logger import AuditLogger
-from aumos_governance.audit.record import GovernanceDecisionContext
+from aumos_governance.audit.record import DeferredAuditRecord, GovernanceDecisionContext
+from aumos_governance.audit.write_behind import AuditWriteBehind
 from aumos_governance.budget.manager import BudgetManager
+from aumos_governance.budget.tracker import SpendingTransaction
+from aumos_governance.cache import DecisionCache
 from aumos_governance.config import GovernanceConfig
-from aumos_governance.consent.manager import ConsentManager
+from aumos_governance.consent.manager import ConsentCheckResult, ConsentManager
+from aumos_governance.deferred import Deferred, resolve_text
+from aumos_governance.errors import ConfigurationError
+from aumos_governance.instrumentation import Instrumentation
+from aumos_governance.persistence import JournalBackend, StateBackend, StateEntry
+from aumos_governance.stages import (
+    BudgetStage,
+    ConsentStage,
+    GovernanceStage,
+    StageContext,
+    StageCounters,
+    StageVerdict,
+    TrustStage,
+)
 from aumos_governance.trust.manager import TrustManager
+from aumos_governance.trust.validator import TrustCheckResult
 from aumos_governance.types import GovernanceOutcome, TrustLevel
 
 
@@ -62,6 +81,10 @@ class GovernanceDecision(BaseModel, frozen=True):
         audit_record_id: The UUID of the :class:`~aumos_governance.audit.record.AuditRecord`
             written for this decision.
         action: The original :class:`GovernanceAction` that was evaluated.
+        reserved: True when the action's budget amount is being held under a
+            reservation keyed by ``audit_record_id``. Settle it with
+            :meth:`GovernanceEngine.settle` or release it with
+            :meth:`GovernanceEngine.cancel`.
     """
 
     outcome: GovernanceOutcome
@@ -69,6 +92,65 @@ class GovernanceDecision(BaseModel, frozen=True):
     reasons: list[str]
     audit_record_id: str
     action: GovernanceAction
+    reserved: bool = False
+
+
+class LeanDecision:
+    """
+    Allocation-light result of :meth:`GovernanceEngine.evaluate_lean`.
+
+    Carries the same information as :class:`GovernanceDecision` in a slotted
+    object. Reason strings are rendered the first time :attr:`reasons` is
+    read, and :meth:`to_model` materialises the equivalent
+    :class:`GovernanceDecision` on demand.
+
+    Attributes:
+        outcome: The final :class:`~aumos_governance.types.GovernanceOutcome`.
+        allowed: True when outcome is ``ALLOW`` or ``ALLOW_WITH_CAVEAT``.
+        audit_record_id: The ID of the audit entry written for this decision.
+        action: The original :class:`GovernanceAction` that was evaluated.
+        reserved: True when the budget amount is held under a reservation
+            keyed by ``audit_record_id``.
+    """
+
+    __slots__ = ("outcome", "allowed", "audit_record_id", "action", "reserved", "_reasons")
+
+    def __init__(
+        self,
+        outcome: GovernanceOutcome,
+        audit_record_id: str,
+        action: GovernanceAction,
+        reasons: list[str | Deferred[str]],
+        reserved: bool = False,
+    ) -> None:
+        self.outcome = outcome
+        self.allowed = outcome in (GovernanceOutcome.ALLOW, GovernanceOutcome.ALLOW_WITH_CAVEAT)
+        self.audit_record_id = audit_record_id
+        self.action = action
+        self.reserved = reserved
+        self._reasons = reasons
+
+    @property
+    def reasons(self) -> list[str]:
+        """Reason strings from each check performed, rendered on access."""
+        return [resolve_text(part) for part in self._reasons]
+
+    def to_model(self) -> GovernanceDecision:
+        """Return the equivalent frozen :class:`GovernanceDecision`."""
+        return GovernanceDecision(
+            outcome=self.outcome,
+            allowed=self.allowed,
+            reasons=self.reasons,
+            audit_record_id=self.audit_record_id,
+            action=self.action,
+            reserved=self.reserved,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"LeanDecision(outcome={self.outcome!r}, allowed={self.allowed}, "
+            f"audit_record_id={self.audit_record_id!r})"
+        )
 
 
 class GovernanceEngine:
@@ -85,8 +167,9 @@ class GovernanceEngine:
     Any failing check produces an immediate DENY outcome. The engine does
     NOT perform cross-protocol optimisation — each check is independent.
 
-    Use :meth:`evaluate` in async contexts, or :meth:`evaluate_sync` when
-    a synchronous call site cannot await.
+    :meth:`evaluate_sync` is the evaluation core; :meth:`evaluate` is a thin
+    awaitable wrapper around it for async call sites. Neither creates an
+    event loop or thread per decision.
 
     Example::
 
@@ -109,115 +192,620 @@ class GovernanceEngine:
         assert decision.allowed is True
     """
 
-    def __init__(self, config: GovernanceConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: GovernanceConfig | None = None,
+        persistence: StateBackend | None = None,
+    ) -> None:
         cfg = config or GovernanceConfig()
         self._config = cfg
-        self.trust = TrustManager(cfg.trust)
-        self.budget = BudgetManager(cfg.budget)
-        self.consent = ConsentManager(cfg.consent)
-        self.audit = AuditLogger(cfg.audit)
+        if persistence is not None and cfg.persistence.journal_path is not None:
+            raise ConfigurationError(
+                "Pass either a persistence backend or PersistenceConfig.journal_path, not both."
+            )
+        if cfg.persistence.journal_path is not None:
+            persistence = JournalBackend(
+                cfg.persistence.journal_path,
+                fsync_interval_seconds=cfg.persistence.fsync_interval_seconds,
+                batch_size=cfg.persistence.batch_size,
+            )
+        self._persistence = persistence
+        self._trust_cache: DecisionCache[TrustCheckResult] | None = None
+        self._consent_cache: DecisionCache[ConsentCheckResult] | None = None
+        if cfg.cache.enabled:
+            self._trust_cache = DecisionCache(cfg.cache.max_entries)
+            self._consent_cache = DecisionCache(cfg.cache.max_entries)
+        self.instrumentation: Instrumentation | None = None
+        if cfg.instrumentation.enabled:
+            self.instrumentation = Instrumentation()
+        inst = self.instrumentation
+        self.trust = TrustManager(
+            cfg.trust, cache=self._trust_cache, instrumentation=inst, backend=persistence
+        )
+        self.budget = BudgetManager(cfg.budget, instrumentation=inst, backend=persistence)
+        self.consent = ConsentManager(
+            cfg.consent,
+            cache=self._consent_cache,
+            instrumentation=inst,
+            backend=persistence,
+        )
+        self.audit = AuditLogger(cfg.audit, instrumentation=inst)
+        self._audit_writer: AuditWriteBehind | None = None
+        if cfg.write_behind.enabled:
+            self._audit_writer = AuditWriteBehind(cfg.write_behind, self.audit.log_entries)
+        self._collect_stage_stats = cfg.stages.collect_stats
+        # The single flag the stage loop checks before reading the clock.
+        self._time_stages = self._collect_stage_stats or inst is not None
+        # Replaced wholesale on registration so evaluations never see a
+        # partially updated sequence.
+        self._stages: tuple[tuple[GovernanceStage, StageCounters], ...] = tuple(
+            (stage, self._stage_counters(stage))
+            for stage in (
+                TrustStage(self.trust),
+                BudgetStage(self.budget),
+                ConsentStage(self.consent),
+            )
+        )
+        if inst is not None:
+            inst.instrument(
+                self, "engine", ("evaluate_sync", "evaluate_lean", "evaluate_many_sync")
+            )
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    async def evaluate(self, action: GovernanceAction) -> GovernanceDecision:
+    async def evaluate(
+        self,
+        action: GovernanceAction,
+        reserve: bool = False,
+    ) -> GovernanceDecision:
         """
         Evaluate a governance action asynchronously.
 
-        Runs each enabled check in sequence. Returns immediately on the
-        first failing check with a DENY outcome.
+        None of the governance checks perform I/O, so this coroutine simply
+        runs :meth:`evaluate_sync` on the calling thread. It exists so that
+        async call sites can ``await`` the engine uniformly.
 
         Args:
             action: The :class:`GovernanceAction` to evaluate.
+            reserve: See :meth:`evaluate_sync`.
 
         Returns:
             A :class:`GovernanceDecision` with the outcome and audit record ID.
         """
-        reasons: list[str] = []
-        outcome = GovernanceOutcome.ALLOW
+        return self.evaluate_sync(action, reserve=reserve)
 
-        # --- Step 1: Trust check ---
-        if action.required_trust_level is not None:
-            trust_result = self.trust.check_level(
-                agent_id=action.agent_id,
-                required_level=action.required_trust_level,
-                scope=action.scope,
-            )
-            reasons.append(trust_result.reason)
-            if not trust_result.allowed:
-                outcome = GovernanceOutcome.DENY
-                return self._record_and_build(action, outcome, reasons)
-
-        # --- Step 2: Budget check ---
-        if action.budget_category is not None:
-            budget_amount = action.budget_amount or 0.0
-            budget_result = self.budget.check_budget(
-                category=action.budget_category,
-                amount=budget_amount,
-            )
-            reasons.append(budget_result.reason)
-            if not budget_result.allowed:
-                outcome = GovernanceOutcome.DENY
-                return self._record_and_build(action, outcome, reasons)
-
-        # --- Step 3: Consent check ---
-        if action.data_type is not None:
-            consent_result = self.consent.check_consent(
-                agent_id=action.agent_id,
-                data_type=action.data_type,
-                purpose=action.purpose,
-            )
-            reasons.append(consent_result.reason)
-            if not consent_result.granted:
-                outcome = GovernanceOutcome.DENY
-                return self._record_and_build(action, outcome, reasons)
+    def evaluate_sync(
+        self,
+        action: GovernanceAction,
+        reserve: bool = False,
+    ) -> GovernanceDecision:
+        """
+        Evaluate a governance action synchronously.
 
-        # All checks passed.
-        return self._record_and_build(action, outcome, reasons)
+        This is the evaluation core: it runs each enabled check in sequence
+        and returns immediately on the first failing check with a DENY
+        outcome. It never creates an event loop or worker thread, so it is
+        safe to call both from plain synchronous code and from inside a
+        running event loop (e.g. Jupyter or an async web framework).
 
-    def evaluate_sync(self, action: GovernanceAction) -> GovernanceDecision:
+        Args:
+            action: The :class:`GovernanceAction` to evaluate.
+            reserve: When True, the budget step atomically checks and holds
+                ``budget_amount`` via :meth:`BudgetManager.reserve`, so
+                concurrent evaluations can never jointly approve more than
+                the remaining budget. The hold is released automatically if
+                a later check denies the action. An allowed decision then has
+                ``reserved=True`` and must be followed by :meth:`settle` or
+                :meth:`cancel` with its ``audit_record_id``.
+
+        Returns:
+            A :class:`GovernanceDecision` with the outcome and audit record ID.
         """
-        Synchronous wrapper for :meth:`evaluate`.
+        decision_id = str(uuid.uuid4()) if reserve else None
+        context = StageContext(decision_id=decision_id, reserve=reserve)
+        parts: list[str | Deferred[str]] = []
+        outcome = self._run_stages(action, context, parts)
+        reasons = [resolve_text(part) for part in parts]
+        return self._record_and_build(action, outcome, reasons, decision_id, context.reserved)
+
+    def evaluate_lean(
+        self,
+        action: GovernanceAction,
+        reserve: bool = False,
+    ) -> LeanDecision:
+        """
+        Evaluate a governance action on the allocation-light path.
 
-        Uses :func:`asyncio.run` when no event loop is running; falls back to
-        creating a dedicated event loop when one is already running (e.g.
-        inside Jupyter or certain web frameworks).
+        Runs the same sequential checks as :meth:`evaluate_sync` and reaches
+        the same outcome, but builds no Pydantic models and formats no reason
+        text up front: each check returns a verdict plus a
+        :class:`~aumos_governance.deferred.Deferred` reason, and the audit
+        entry is stored as a
+        :class:`~aumos_governance.audit.record.DeferredAuditRecord` that is
+        materialised when the audit log is read. Use this on hot paths where
+        most decisions are only inspected for :attr:`LeanDecision.allowed`.
 
         Args:
             action: The :class:`GovernanceAction` to evaluate.
+            reserve: See :meth:`evaluate_sync`.
 
         Returns:
-            A :class:`GovernanceDecision` with the outcome and audit record ID.
+            A :class:`LeanDecision`. Call :meth:`LeanDecision.to_model` for
+            the equivalent :class:`GovernanceDecision`.
         """
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
+        decision_id = str(uuid.uuid4())
+        context = StageContext(decision_id=decision_id, reserve=reserve, lean=True)
+        reasons: list[str | Deferred[str]] = []
+        outcome = self._run_stages(action, context, reasons)
+        return self._record_lean(action, outcome, reasons, decision_id, context.reserved)
+
+    def settle(
+        self,
+        decision_id: str,
+        actual_amount: float,
+        description: str | None = None,
+    ) -> SpendingTransaction | None:
+        """
+        Settle the budget reservation made by a ``reserve=True`` evaluation.
+
+        Releases the held amount and records ``actual_amount`` as spending
+        in the same category. See :meth:`BudgetManager.settle`.
+
+        Args:
+            decision_id: The decision's ``audit_record_id``.
+            actual_amount: The amount actually spent (zero records nothing).
+            description: Optional description stored with the transaction.
+
+        Returns:
+            The recorded transaction, or None when ``actual_amount`` is zero.
+
+        Raises:
+            ReservationNotFoundError: If no reservation is outstanding for
+                ``decision_id``.
+        """
+        return self.budget.settle(decision_id, actual_amount, description=description)
+
+    def cancel(self, decision_id: str) -> None:
+        """
+        Release the budget reservation made by a ``reserve=True`` evaluation
+        without recording any spending.
+
+        Args:
+            decision_id: The decision's ``audit_record_id``.
+
+        Raises:
+            ReservationNotFoundError: If no reservation is outstanding for
+                ``decision_id``.
+        """
+        self.budget.cancel(decision_id)
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Return hit/miss counters for the trust and consent decision caches.
+
+        Returns:
+            ``{"trust": {...}, "consent": {...}}`` with the counters from
+            :meth:`~aumos_governance.cache.DecisionCache.stats`, or an empty
+            dict when :attr:`~aumos_governance.config.CacheConfig.enabled`
+            is False.
+        """
+        if self._trust_cache is None or self._consent_cache is None:
+            return {}
+        return {
+            "trust": self._trust_cache.stats(),
+            "consent": self._consent_cache.stats(),
+        }
+
+    def register_stage(self, stage: GovernanceStage, before: str | None = None) -> None:
+        """
+        Add a custom :class:`~aumos_governance.stages.GovernanceStage`.
+
+        The stage joins the same sequence as the built-in checks: its reason
+        is included in the decision and audit record, a denial short-circuits
+        the remaining stages, and it is counted in :meth:`stage_stats`. The
+        built-in stages keep their fixed trust -> budget -> consent order.
+
+        Args:
+            stage: The stage to add. Its ``name`` must be unique.
+            before: Name of the stage to insert before (e.g. ``"trust"`` to
+                run first). None appends after every existing stage.
+
+        Raises:
+            ConfigurationError: If the name is empty or already registered,
+                or ``before`` names no registered stage.
+        """
+        names = [existing.name for existing, _ in self._stages]
+        if not stage.name or stage.name in names:
+            raise ConfigurationError(
+                f"Stage name {stage.name!r} is empty or already registered."
+            )
+        if before is not None and before not in names:
+            raise ConfigurationError(f"Cannot insert before unknown stage {before!r}.")
+        index = names.index(before) if before is not None else len(names)
+        stages = list(self._stages)
+        stages.insert(index, (stage, self._stage_counters(stage)))
+        self._stages = tuple(stages)
+
+    def unregister_stage(self, name: str) -> None:
+        """
+        Remove a custom stage added with :meth:`register_stage`.
+
+        Raises:
+            ConfigurationError: If ``name`` is a built-in stage or is not
+                registered.
+        """
+        if name in (TrustStage.name, BudgetStage.name, ConsentStage.name):
+            raise ConfigurationError(f"Built-in stage {name!r} cannot be removed.")
+        remaining = tuple(entry for entry in self._stages if entry[0].name != name)
+        if len(remaining) == len(self._stages):
+            raise ConfigurationError(f"No stage named {name!r} is registered.")
+        self._stages = remaining
+
+    def stage_names(self) -> list[str]:
+        """Return the registered stage names in evaluation order."""
+        return [stage.name for stage, _ in self._stages]
+
+    def stage_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Return per-stage counters in evaluation order.
+
+        Counters only advance while
+        :attr:`~aumos_governance.config.StageConfig.collect_stats` is True;
+        otherwise every counter stays at zero.
+
+        Returns:
+            ``{stage_name: {"invocations", "denials", "total_ns"}}``.
+            ``invocations`` counts actions the stage applied to (including
+            verdicts shared within a batch), ``denials`` those it denied and
+            ``total_ns`` the cumulative wall-clock time spent in it.
+        """
+        return {stage.name: counters.to_dict() for stage, counters in self._stages}
+
+    def latency_stats(self) -> dict[str, dict[str, float]]:
+        """
+        Return latency histogram snapshots for every instrumented operation.
+
+        Operations are named ``"<component>.<method>"`` (for example
+        ``"budget.check_budget"`` or ``"engine.evaluate_sync"``) and
+        ``"stage.<stage_name>"`` for evaluation stages.
+
+        Returns:
+            The result of
+            :meth:`~aumos_governance.instrumentation.Instrumentation.stats`,
+            or an empty dict when
+            :attr:`~aumos_governance.config.InstrumentationConfig.enabled`
+            is False.
+        """
+        if self.instrumentation is None:
+            return {}
+        return self.instrumentation.stats()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every queued write-behind audit entry has been stored and
+        every state change has been made durable by the persistence backend.
+
+        A no-op returning True when neither write-behind nor persistence is
+        enabled.
+
+        Args:
+            timeout: Maximum seconds to wait for each. None waits indefinitely.
+
+        Returns:
+            True if everything drained, False if ``timeout`` elapsed first.
+        """
+        drained = True
+        if self._audit_writer is not None:
+            drained = self._audit_writer.flush(timeout)
+        if self._persistence is not None:
+            drained = self._persistence.flush(timeout) and drained
+        return drained
+
+    def checkpoint(self) -> None:
+        """
+        Compact the persistence backend to the current state.
+
+        Replaces the backend's history with one entry per trust assignment,
+        consent record and budget category, so the next start-up reads only
+        the live state. Safe to call while evaluations continue. A no-op when
+        no backend is configured.
+        """
+        if self._persistence is not None:
+            self._persistence.rewrite(self._state_entries)
+
+    def close(self, timeout: float | None = None) -> bool:
+        """
+        Flush queued audit entries, stop the write-behind thread, close the
+        audit logger (see :meth:`AuditLogger.close
+        <aumos_governance.audit.logger.AuditLogger.close>`), close the budget
+        manager (see :meth:`BudgetManager.close
+        <aumos_governance.budget.manager.BudgetManager.close>`) and close the
+        persistence backend, including one passed to the constructor.
 
-        if loop is not None and loop.is_running():
-            # We are inside a running event loop — use a thread pool executor
-            # to run a new loop in a worker thread.
-            import concurrent.futures
+        Call at shutdown; with write-behind enabled, evaluating after
+        :meth:`close` raises ``RuntimeError``.
 
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(asyncio.run, self.evaluate(action))
-                return future.result()
+        Args:
+            timeout: Maximum seconds to wait for the flush.
+
+        Returns:
+            True if the queue drained before the writer stopped (always True
+            when write-behind is disabled).
+        """
+        drained = True
+        if self._audit_writer is not None:
+            drained = self._audit_writer.close(timeout)
+        self.audit.close()
+        self.budget.close(timeout)
+        if self._persistence is not None:
+            self._persistence.close(timeout)
+        return drained
+
+    def write_behind_stats(self) -> dict[str, int]:
+        """
+        Return the write-behind audit queue counters.
+
+        Returns:
+            The counters from
+            :meth:`~aumos_governance.audit.write_behind.AuditWriteBehind.stats`,
+            or an empty dict when write-behind is disabled.
+        """
+        if self._audit_writer is None:
+            return {}
+        return self._audit_writer.stats()
+
+    async def evaluate_many(
+        self,
+        actions: Sequence[GovernanceAction],
+        cumulative_budget: bool = False,
+    ) -> list[GovernanceDecision]:
+        """
+        Evaluate a batch of governance actions asynchronously.
+
+        Awaitable wrapper around :meth:`evaluate_many_sync`; see that method
+        for the batch semantics.
+
+        Args:
+            actions: The actions to evaluate, in order.
+            cumulative_budget: See :meth:`evaluate_many_sync`.
+
+        Returns:
+            One :class:`GovernanceDecision` per action, in input order.
+        """
+        return self.evaluate_many_sync(actions, cumulative_budget=cumulative_budget)
+
+    def evaluate_many_sync(
+        self,
+        actions: Sequence[GovernanceAction],
+        cumulative_budget: bool = False,
+    ) -> list[GovernanceDecision]:
+        """
+        Evaluate a batch of governance actions synchronously.
 
-        return asyncio.run(self.evaluate(action))
+        Each action runs through the same sequential trust -> budget ->
+        consent pipeline as :meth:`evaluate_sync` and receives the same
+        outcome and reasons it would have received on its own. The batch
+        differs only in how work is shared:
+
+        - Each distinct ``(agent_id, scope, required_trust_level)`` trust
+          lookup and each distinct ``(agent_id, data_type, purpose)`` consent
+          lookup is resolved once and reused for every action sharing it.
+        - Audit records for the whole batch are appended in one bulk
+          :meth:`~aumos_governance.audit.logger.AuditLogger.log_many` call.
+
+        If a check raises (e.g. an unknown budget category), the decisions
+        reached before it are still audited and the exception propagates,
+        exactly as a loop over :meth:`evaluate_sync` would behave.
+
+        Args:
+            actions: The actions to evaluate, in order.
+            cumulative_budget: When False (the default), every budget check
+                sees the category's current spending, as sequential
+                :meth:`evaluate_sync` calls would. When True, the amounts of
+                actions already allowed earlier in the batch are counted
+                against their category, so the batch as a whole cannot be
+                approved beyond the remaining budget. No spending is recorded
+                in either mode.
+
+        Returns:
+            One :class:`GovernanceDecision` per action, in input order.
+        """
+        shared: dict[tuple[str, Hashable], StageVerdict] = {}
+        committed: dict[str, float] | None = {} if cumulative_budget else None
+        evaluated: list[tuple[GovernanceAction, GovernanceOutcome, list[str]]] = []
+
+        try:
+            for action in actions:
+                parts: list[str | Deferred[str]] = []
+                outcome = self._run_stages(
+                    action, StageContext(committed=committed), parts, shared
+                )
+                if (
+                    committed is not None
+                    and outcome == GovernanceOutcome.ALLOW
+                    and action.budget_category is not None
+                ):
+                    committed[action.budget_category] = committed.get(
+                        action.budget_category, 0.0
+                    ) + (action.budget_amount or 0.0)
+                evaluated.append((action, outcome, [resolve_text(part) for part in parts]))
+        finally:
+            writer = self._audit_writer
+            if writer is not None:
+                record_ids = [
+                    self._submit_audit(writer, action, outcome, reasons, str(uuid.uuid4()))
+                    for action, outcome, reasons in evaluated
+                ]
+            else:
+                records = self.audit.log_many(
+                    (
+                        outcome,
+                        self._decision_text(action, outcome),
+                        reasons,
+                        self._build_context(action),
+                    )
+                    for action, outcome, reasons in evaluated
+                )
+                record_ids = [record.record_id for record in records]
+
+        return [
+            self._build_decision(action, outcome, reasons, record_id)
+            for (action, outcome, reasons), record_id in zip(evaluated, record_ids, strict=True)
+        ]
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _state_entries(self) -> Iterator[StateEntry]:
+        """Yield the current trust, consent and budget state for :meth:`checkpoint`."""
+        yield from self.trust.state_entries()
+        yield from self.consent.state_entries()
+        yield from self.budget.state_entries()
+
+    def _run_stages(
+        self,
+        action: GovernanceAction,
+        context: StageContext,
+        reasons: list[str | Deferred[str]],
+        shared: dict[tuple[str, Hashable], StageVerdict] | None = None,
+    ) -> GovernanceOutcome:
+        """
+        Run every applicable stage in order, appending each reason.
+
+        Stops at the first denial and rolls back the stages that already
+        passed, in reverse order. The same rollback happens if a stage
+        raises. ``shared`` memoises verdicts by :meth:`GovernanceStage.batch_key`
+        within one batch.
+        """
+        passed: list[GovernanceStage] = []
+        timed = self._time_stages
+        try:
+            for stage, counters in self._stages:
+                if not stage.applies(action):
+                    continue
+                if timed:
+                    started = time.perf_counter_ns()
+                key = stage.batch_key(action) if shared is not None else None
+                if shared is None or key is None:
+                    allowed, reason = stage.check(action, context)
+                else:
+                    verdict = shared.get((stage.name, key))
+                    if verdict is None:
+                        verdict = stage.check(action, context)
+                        shared[(stage.name, key)] = verdict
+                    allowed, reason = verdict
+                if timed:
+                    elapsed = time.perf_counter_ns() - started
+                    if self._collect_stage_stats:
+                        counters.record(elapsed, allowed)
+                    if counters.histogram is not None:
+                        counters.histogram.record(elapsed)
+                reasons.append(reason)
+                if not allowed:
+                    self._rollback(passed, action, context)
+                    return GovernanceOutcome.DENY
+                passed.append(stage)
+        except BaseException:
+            self._rollback(passed, action, context)
+            raise
+        return GovernanceOutcome.ALLOW
+
+    def _stage_counters(self, stage: GovernanceStage) -> StageCounters:
+        """Return fresh counters for ``stage``, with a histogram if instrumented."""
+        if self.instrumentation is None:
+            return StageCounters()
+        return StageCounters(self.instrumentation.histogram(f"stage.{stage.name}"))
+
+    @staticmethod
+    def _rollback(
+        passed: list[GovernanceStage],
+        action: GovernanceAction,
+        context: StageContext,
+    ) -> None:
+        """Roll back ``passed`` stages, most recent first."""
+        for stage in reversed(passed):
+            stage.rollback(action, context)
+
     def _record_and_build(
         self,
         action: GovernanceAction,
         outcome: GovernanceOutcome,
         reasons: list[str],
+        record_id: str | None = None,
+        reserved: bool = False,
     ) -> GovernanceDecision:
         """Write an audit record and construct the GovernanceDecision."""
-        context = GovernanceDecisionContext(
+        writer = self._audit_writer
+        if writer is not None:
+            record_id = self._submit_audit(
+                writer, action, outcome, reasons, record_id or str(uuid.uuid4())
+            )
+        else:
+            record_id = self.audit.log(
+                outcome=outcome,
+                decision=self._decision_text(action, outcome),
+                reasons=reasons,
+                context=self._build_context(action),
+                record_id=record_id,
+            ).record_id
+        return self._build_decision(action, outcome, reasons, record_id, reserved)
+
+    def _record_lean(
+        self,
+        action: GovernanceAction,
+        outcome: GovernanceOutcome,
+        reasons: list[str | Deferred[str]],
+        record_id: str,
+        reserved: bool = False,
+    ) -> LeanDecision:
+        """Write a deferred audit entry and construct the LeanDecision."""
+        writer = self._audit_writer
+        if writer is not None:
+            self._submit_audit(writer, action, outcome, reasons, record_id)
+        else:
+            self.audit.log_deferred(
+                record_id=record_id,
+                outcome=outcome,
+                decision=Deferred(self._decision_text, action, outcome),
+                reasons=reasons,
+                context=Deferred(self._build_context, action),
+                keys=(action.agent_id, action.action_type, action.resource),
+            )
+        return LeanDecision(outcome, record_id, action, reasons, reserved)
+
+    def _submit_audit(
+        self,
+        writer: AuditWriteBehind,
+        action: GovernanceAction,
+        outcome: GovernanceOutcome,
+        reasons: Sequence[str | Deferred[str]],
+        record_id: str,
+    ) -> str:
+        """Queue a deferred audit entry on the write-behind writer."""
+        context = (
+            Deferred(self._build_context, action)
+            if self._config.audit.include_context
+            else None
+        )
+        writer.submit(
+            DeferredAuditRecord(
+                record_id,
+                outcome,
+                Deferred(self._decision_text, action, outcome),
+                reasons,
+                context,
+                (action.agent_id, action.action_type, action.resource),
+            )
+        )
+        return record_id
+
+    @staticmethod
+    def _build_context(action: GovernanceAction) -> GovernanceDecisionContext:
+        """Build the audit context for ``action``."""
+        return GovernanceDecisionContext(
             agent_id=action.agent_id,
             action_type=action.action_type,
             resource=action.resource,
@@ -228,24 +816,29 @@ class GovernanceEngine:
             extra=action.extra,
         )
 
-        decision_text = (
+    @staticmethod
+    def _decision_text(action: GovernanceAction, outcome: GovernanceOutcome) -> str:
+        """Return the one-line decision summary stored in the audit record."""
+        return (
             f"Action for agent '{action.agent_id}': "
             f"{outcome.upper() if isinstance(outcome, str) else str(outcome).upper()}"
         )
 
-        record = self.audit.log(
-            outcome=outcome,
-            decision=decision_text,
-            reasons=reasons,
-            context=context,
-        )
-
+    @staticmethod
+    def _build_decision(
+        action: GovernanceAction,
+        outcome: GovernanceOutcome,
+        reasons: list[str],
+        audit_record_id: str,
+        reserved: bool = False,
+    ) -> GovernanceDecision:
+        """Construct the GovernanceDecision returned to the caller."""
         allowed = outcome in (GovernanceOutcome.ALLOW, GovernanceOutcome.ALLOW_WITH_CAVEAT)
-
         return GovernanceDecision(
             outcome=outcome,
             allowed=allowed,
             reasons=reasons,
-            audit_record_id=record.record_id,
+            audit_record_id=audit_record_id,
             action=action,
+            reserved=reserved,
         )
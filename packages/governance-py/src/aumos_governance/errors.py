@@ -82,6 +82,18 @@ class BudgetNotFoundError(AumOSGovernanceError):
         self.category = category
 
 
+class ReservationNotFoundError(AumOSGovernanceError):
+    """Raised when settling or cancelling a budget reservation that does not exist."""
+
+    def __init__(self, reservation_id: str) -> None:
+        super().__init__(
+            f"No outstanding budget reservation with id '{reservation_id}'. "
+            "It may already have been settled or cancelled.",
+            code="RESERVATION_NOT_FOUND",
+        )
+        self.reservation_id = reservation_id
+
+
 class ConsentDeniedError(AumOSGovernanceError):
     """
     Raised when consent has not been granted for a data access request.
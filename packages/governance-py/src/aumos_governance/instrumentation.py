@@ -0,0 +1,259 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+"""
+Opt-in latency instrumentation.
+
+When :attr:`~aumos_governance.config.InstrumentationConfig.enabled` is True
+the engine creates one :class:`Instrumentation` and hands it to every
+manager. Each instrumented operation (``budget.check_budget``,
+``consent.check_consent``, ``engine.evaluate_sync``, one ``stage.<name>``
+per evaluation stage, ...) records its wall-clock duration into a
+:class:`LatencyHistogram`.
+
+Instrumentation works by replacing the public methods of the instrumented
+*instance* with timed wrappers. Uninstrumented objects are untouched, so the
+disabled path costs nothing beyond the engine's per-decision check of
+whether stage timing is on.
+
+Histograms use log-linear buckets in the style of HDR histograms: values
+below 16 ns get exact buckets and every power-of-two range above is split
+into 16 equal sub-buckets, bounding the relative error of any reported
+percentile to about 6%.
+"""
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_SUB_BUCKET_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+# Enough buckets for any duration that fits in 64 bits of nanoseconds.
+_BUCKET_COUNT = (64 - _SUB_BUCKET_BITS + 1) * _SUB_BUCKETS
+
+# Larger than any recorded duration; stands in for "no minimum yet".
+_NO_MIN = 1 << 64
+
+_PERCENTILES = (("p50_ns", 0.50), ("p90_ns", 0.90), ("p99_ns", 0.99), ("p999_ns", 0.999))
+
+
+def _bucket_index(value: int) -> int:
+    """Return the bucket holding ``value`` nanoseconds."""
+    if value < _SUB_BUCKETS:
+        return max(value, 0)
+    shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+    return (shift + 1) * _SUB_BUCKETS + (value >> shift) - _SUB_BUCKETS
+
+
+def _bucket_upper_bound(index: int) -> int:
+    """Return the largest value, in nanoseconds, that falls in bucket ``index``."""
+    if index < _SUB_BUCKETS:
+        return index
+    shift = index // _SUB_BUCKETS - 1
+    mantissa = _SUB_BUCKETS + index % _SUB_BUCKETS
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Thread-safe log-bucketed histogram of durations in nanoseconds.
+
+    Example::
+
+        histogram = LatencyHistogram()
+        histogram.record(1_250)
+        assert histogram.snapshot()["count"] == 1
+    """
+
+    __slots__ = ("_buckets", "_count", "_sum", "_min", "_max", "_lock")
+
+    def __init__(self) -> None:
+        self._buckets = [0] * _BUCKET_COUNT
+        self._count = 0
+        self._sum = 0
+        self._min = _NO_MIN
+        self._max = 0
+        self._lock = threading.Lock()
+
+    def record(self, value_ns: int) -> None:
+        """Record one duration of ``value_ns`` nanoseconds."""
+        # _bucket_index, inlined: this runs several times per decision.
+        if value_ns >= _SUB_BUCKETS:
+            shift = value_ns.bit_length() - _SUB_BUCKET_BITS - 1
+            index = ((shift + 1) << _SUB_BUCKET_BITS) + (value_ns >> shift) - _SUB_BUCKETS
+        else:
+            index = value_ns if value_ns > 0 else 0
+        with self._lock:
+            self._buckets[index] += 1
+            self._count += 1
+            self._sum += value_ns
+            if value_ns > self._max:
+                self._max = value_ns
+            if value_ns < self._min:
+                self._min = value_ns
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        Return summary statistics.
+
+        Returns:
+            Dict with ``count``, ``sum_ns``, ``min_ns``, ``max_ns``,
+            ``mean_ns`` and the ``p50_ns``, ``p90_ns``, ``p99_ns`` and
+            ``p999_ns`` percentiles. Percentiles are bucket upper bounds,
+            capped at the observed maximum.
+        """
+        with self._lock:
+            buckets = list(self._buckets)
+            count, total, low, high = self._count, self._sum, self._min, self._max
+        result: dict[str, float] = {
+            "count": count,
+            "sum_ns": total,
+            "min_ns": low if count else 0,
+            "max_ns": high,
+            "mean_ns": total / count if count else 0.0,
+        }
+        for key, quantile in _PERCENTILES:
+            result[key] = self._percentile(buckets, count, quantile, high)
+        return result
+
+    def cumulative_buckets(self) -> tuple[list[tuple[int, int]], int, int]:
+        """
+        Return ``([(upper_bound_ns, cumulative_count), ...], count, sum_ns)``
+        for every non-empty bucket, in ascending order.
+        """
+        with self._lock:
+            buckets = list(self._buckets)
+            count, total = self._count, self._sum
+        cumulative = 0
+        points: list[tuple[int, int]] = []
+        for index, bucket_count in enumerate(buckets):
+            if bucket_count:
+                cumulative += bucket_count
+                points.append((_bucket_upper_bound(index), cumulative))
+        return points, count, total
+
+    def reset(self) -> None:
+        """Discard every recorded value."""
+        with self._lock:
+            self._buckets = [0] * _BUCKET_COUNT
+            self._count = self._sum = self._max = 0
+            self._min = _NO_MIN
+
+    @staticmethod
+    def _percentile(buckets: list[int], count: int, quantile: float, high: int) -> int:
+        if count == 0:
+            return 0
+        rank = max(1, int(quantile * count + 0.5))
+        seen = 0
+        for index, bucket_count in enumerate(buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return min(_bucket_upper_bound(index), high)
+        return high
+
+
+class Instrumentation:
+    """
+    Registry of per-operation latency histograms.
+
+    Example::
+
+        instrumentation = Instrumentation()
+        manager = BudgetManager(instrumentation=instrumentation)
+        ...
+        print(instrumentation.stats()["budget.check_budget"]["p99_ns"])
+        print(instrumentation.render_prometheus())
+    """
+
+    def __init__(self) -> None:
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def histogram(self, operation: str) -> LatencyHistogram:
+        """Return the histogram for ``operation``, creating it if needed."""
+        histogram = self._histograms.get(operation)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(operation, LatencyHistogram())
+        return histogram
+
+    def wrap(self, operation: str, fn: _F) -> _F:
+        """Return ``fn`` wrapped to record each call's duration under ``operation``."""
+        record = self.histogram(operation).record
+        clock = time.perf_counter_ns
+
+        @functools.wraps(fn)
+        def timed(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            started = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(clock() - started)
+
+        return timed  # type: ignore[return-value]
+
+    def instrument(self, target: object, prefix: str, methods: Iterable[str]) -> None:
+        """
+        Replace ``methods`` on the ``target`` instance with timed wrappers
+        recording under ``"<prefix>.<method>"``.
+        """
+        for name in methods:
+            setattr(target, name, self.wrap(f"{prefix}.{name}", getattr(target, name)))
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Return a snapshot of every histogram, keyed by operation name.
+
+        See :meth:`LatencyHistogram.snapshot` for the fields.
+        """
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+        return {operation: histogram.snapshot() for operation, histogram in histograms}
+
+    def render_prometheus(self, metric: str = "aumos_governance_operation_duration_seconds") -> str:
+        """
+        Render every histogram in the Prometheus text exposition format.
+
+        All operations share one histogram family, distinguished by an
+        ``operation`` label. Bucket bounds are emitted in seconds and only
+        for non-empty buckets, followed by ``+Inf``, ``_sum`` and ``_count``.
+
+        Args:
+            metric: The metric family name.
+
+        Returns:
+            The exposition text, ending with a newline.
+        """
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+        lines = [
+            f"# HELP {metric} Duration of aumos-governance operations.",
+            f"# TYPE {metric} histogram",
+        ]
+        for operation, histogram in histograms:
+            points, count, total = histogram.cumulative_buckets()
+            label = operation.replace("\\", "\\\\").replace('"', '\\"')
+            for upper_ns, cumulative in points:
+                lines.append(
+                    f'{metric}_bucket{{operation="{label}",le="{upper_ns / 1e9:.9g}"}} '
+                    f"{cumulative}"
+                )
+            lines.append(f'{metric}_bucket{{operation="{label}",le="+Inf"}} {count}')
+            lines.append(f'{metric}_sum{{operation="{label}"}} {total / 1e9:.9g}')
+            lines.append(f'{metric}_count{{operation="{label}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Discard every recorded value, keeping the registered operations."""
+        with self._lock:
+            histograms = list(self._histograms.values())
+        for histogram in histograms:
+            histogram.reset()
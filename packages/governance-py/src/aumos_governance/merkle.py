@@ -0,0 +1,421 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+"""
+Append-only Merkle accumulator over hash-chained audit records.
+
+The hash chain proves that a log has not been altered, but proving that a
+single record belongs to it means walking the whole chain. A Merkle tree over
+the same records gives logarithmic proofs instead:
+
+- an *inclusion proof* shows that a record is the ``index``-th leaf of the
+  tree whose root is published;
+- a *consistency proof* shows that the tree of ``old_size`` leaves is a prefix
+  of the tree of ``new_size`` leaves, i.e. nothing already published was
+  rewritten.
+
+The tree follows RFC 6962 (Certificate Transparency): a leaf is
+``SHA-256(0x00 || record_hash bytes)``, an interior node is
+``SHA-256(0x01 || left || right)``, and a tree whose size is not a power of
+two splits at the largest power of two below its size. Proofs produced here
+therefore verify with any RFC 6962 / RFC 9162 verifier.
+
+:class:`MerkleAccumulator` keeps a *frontier*: the roots of the complete
+subtrees that make up the tree, one per set bit of its size. The frontier
+alone gives appends and the current root in O(log n) memory. To produce
+proofs the accumulator also keeps every complete subtree root in one flat
+``bytearray`` per level, about 64 bytes per leaf. Any proof is then
+assembled from O(log n) stored nodes. With ``retain_nodes=False`` only the
+frontier is kept.
+
+:func:`verify_inclusion` and :func:`verify_consistency` need nothing but the
+proof, the record hash and trusted roots.
+
+Audit logging is RECORDING ONLY.  This module contains no anomaly detection,
+pattern analysis, or counterfactual generation.
+"""
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from aumos_governance.errors import ConfigurationError
+
+_DIGEST_SIZE = 32
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+# RFC 6962 defines the hash of an empty tree as the hash of the empty string.
+_EMPTY_ROOT = hashlib.sha256(b"").digest()
+
+
+@dataclass(frozen=True)
+class InclusionProof:
+    """
+    Proof that a record is a leaf of a Merkle tree.
+
+    Attributes:
+        index: Position of the record's leaf (its chain position).
+        tree_size: Number of leaves in the tree the proof is for.
+        path: Hex digests of the sibling subtrees from the leaf up to the
+            root.
+    """
+
+    index: int
+    tree_size: int
+    path: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ConsistencyProof:
+    """
+    Proof that the tree of ``old_size`` leaves is a prefix of the tree of
+    ``new_size`` leaves.
+
+    Attributes:
+        old_size: Number of leaves in the older tree.
+        new_size: Number of leaves in the newer tree.
+        path: Hex digests of the subtrees needed to rebuild both roots.
+    """
+
+    old_size: int
+    new_size: int
+    path: tuple[str, ...]
+
+
+# ---------------------------------------------------------------------------
+# MerkleAccumulator
+# ---------------------------------------------------------------------------
+
+
+class MerkleAccumulator:
+    """
+    Incrementally maintained RFC 6962 Merkle tree of record hashes.
+
+    Leaves are appended in chain order and never removed. Appending costs
+    O(1) hashes amortised; :meth:`root`, :meth:`inclusion_proof` and
+    :meth:`consistency_proof` cost O(log n).
+
+    The accumulator is not thread-safe; callers serialise appends.
+
+    Example::
+
+        records = log.get_records()
+        tree = MerkleAccumulator()
+        tree.extend(record.record_hash for record in records)
+        proof = tree.inclusion_proof(3)
+        assert verify_inclusion(proof, records[3].record_hash, tree.root())
+
+    Args:
+        retain_nodes: Keep every complete subtree root so that proofs and
+            roots of earlier sizes can be produced. When False only the
+            frontier is kept and :meth:`root` is limited to the current size.
+    """
+
+    def __init__(self, retain_nodes: bool = True) -> None:
+        self._size = 0
+        # Roots of the complete subtrees making up the tree, largest first.
+        self._frontier: list[bytes] = []
+        # _levels[k] holds the roots of the aligned complete subtrees of 2**k
+        # leaves, 32 bytes each; None when nodes are not retained.
+        self._levels: list[bytearray] | None = [] if retain_nodes else None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def size(self) -> int:
+        """Number of leaves appended."""
+        return self._size
+
+    @property
+    def retains_nodes(self) -> bool:
+        """Whether proofs can be produced."""
+        return self._levels is not None
+
+    def append(self, record_hash: str) -> int:
+        """
+        Append the leaf for ``record_hash``.
+
+        Args:
+            record_hash: Hex SHA-256 ``record_hash`` of the next chain record.
+
+        Returns:
+            The leaf's index.
+        """
+        node = leaf_hash(record_hash)
+        levels = self._levels
+        index = self._size
+        level = 0
+        if levels is not None:
+            _store(levels, 0, node)
+        # Each trailing set bit of the old size is a complete subtree of the
+        # same height as ``node``; merge them, as in a binary counter.
+        carry = index
+        while carry & 1:
+            node = _node_hash(self._frontier.pop(), node)
+            level += 1
+            carry >>= 1
+            if levels is not None:
+                _store(levels, level, node)
+        self._frontier.append(node)
+        self._size = index + 1
+        return index
+
+    def extend(self, record_hashes: Iterable[str]) -> None:
+        """Append a leaf for each of ``record_hashes`` in order."""
+        for record_hash in record_hashes:
+            self.append(record_hash)
+
+    def root(self, size: int | None = None) -> str:
+        """
+        Return the hex root of the tree of the first ``size`` leaves.
+
+        Args:
+            size: Tree size; defaults to the current size. Earlier sizes
+                need retained nodes.
+
+        Raises:
+            ValueError: If ``size`` is negative or larger than the tree.
+            ConfigurationError: If ``size`` is not the current size and
+                nodes are not retained.
+        """
+        if size is None or size == self._size:
+            if not self._frontier:
+                return _EMPTY_ROOT.hex()
+            node = self._frontier[-1]
+            for left in reversed(self._frontier[:-1]):
+                node = _node_hash(left, node)
+            return node.hex()
+        self._check_size(size)
+        levels = self._require_nodes()
+        if size == 0:
+            return _EMPTY_ROOT.hex()
+        return _subtree(levels, 0, size).hex()
+
+    def inclusion_proof(self, index: int, size: int | None = None) -> InclusionProof:
+        """
+        Return the proof that leaf ``index`` is in the tree of ``size`` leaves.
+
+        Args:
+            index: Leaf position.
+            size: Tree size; defaults to the current size.
+
+        Raises:
+            ValueError: If ``index`` is not below ``size`` or ``size`` is
+                larger than the tree.
+            ConfigurationError: If nodes are not retained.
+        """
+        size = self._size if size is None else size
+        self._check_size(size)
+        if not 0 <= index < size:
+            raise ValueError(f"Leaf {index} is not in a tree of {size} leaves.")
+        levels = self._require_nodes()
+        path: list[bytes] = []
+        lo, hi = 0, size
+        while hi - lo > 1:
+            split = lo + _split(hi - lo)
+            if index < split:
+                path.append(_subtree(levels, split, hi))
+                hi = split
+            else:
+                path.append(_subtree(levels, lo, split))
+                lo = split
+        path.reverse()
+        return InclusionProof(index=index, tree_size=size, path=_hex(path))
+
+    def consistency_proof(
+        self, old_size: int, new_size: int | None = None
+    ) -> ConsistencyProof:
+        """
+        Return the proof that the tree of ``old_size`` leaves is a prefix of
+        the tree of ``new_size`` leaves.
+
+        Args:
+            old_size: Size of the older tree.
+            new_size: Size of the newer tree; defaults to the current size.
+
+        Raises:
+            ValueError: If ``old_size`` is negative or larger than
+                ``new_size``, or ``new_size`` is larger than the tree.
+            ConfigurationError: If nodes are not retained.
+        """
+        new_size = self._size if new_size is None else new_size
+        self._check_size(new_size)
+        if not 0 <= old_size <= new_size:
+            raise ValueError(
+                f"old_size must be between 0 and {new_size}, got {old_size}."
+            )
+        levels = self._require_nodes()
+        path: list[bytes] = []
+        if 0 < old_size < new_size:
+            # RFC 6962 SUBPROOF(old_size, D[0:new_size], True), unrolled.
+            lo, hi, m, complete = 0, new_size, old_size, True
+            while m != hi - lo:
+                split = _split(hi - lo)
+                if m <= split:
+                    path.append(_subtree(levels, lo + split, hi))
+                    hi = lo + split
+                else:
+                    path.append(_subtree(levels, lo, lo + split))
+                    lo += split
+                    m -= split
+                    complete = False
+            if not complete:
+                path.append(_subtree(levels, lo, hi))
+            path.reverse()
+        return ConsistencyProof(old_size=old_size, new_size=new_size, path=_hex(path))
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _check_size(self, size: int) -> None:
+        if not 0 <= size <= self._size:
+            raise ValueError(f"size must be between 0 and {self._size}, got {size}.")
+
+    def _require_nodes(self) -> list[bytearray]:
+        if self._levels is None:
+            raise ConfigurationError(
+                "This MerkleAccumulator keeps only its frontier; create it with "
+                "retain_nodes=True to produce proofs."
+            )
+        return self._levels
+
+
+# ---------------------------------------------------------------------------
+# Verification
+# ---------------------------------------------------------------------------
+
+
+def leaf_hash(record_hash: str) -> bytes:
+    """Return the RFC 6962 leaf hash of a hex ``record_hash``."""
+    return hashlib.sha256(_LEAF_PREFIX + bytes.fromhex(record_hash)).digest()
+
+
+def verify_inclusion(proof: InclusionProof, record_hash: str, root: str) -> bool:
+    """
+    Check that ``record_hash`` is leaf ``proof.index`` of the tree with ``root``.
+
+    Follows RFC 9162, section 2.1.3.2. Needs no access to the log.
+
+    Args:
+        proof: An :class:`InclusionProof`.
+        record_hash: Hex ``record_hash`` of the record being proven.
+        root: Trusted hex root of a tree of ``proof.tree_size`` leaves.
+
+    Returns:
+        True when the proof is valid.
+    """
+    index, last = proof.index, proof.tree_size - 1
+    if not 0 <= index <= last:
+        return False
+    try:
+        node = leaf_hash(record_hash)
+        path = [bytes.fromhex(digest) for digest in proof.path]
+    except ValueError:
+        return False
+    for sibling in path:
+        if last == 0:
+            return False
+        if index & 1 or index == last:
+            node = _node_hash(sibling, node)
+            while not index & 1 and index:
+                index >>= 1
+                last >>= 1
+        else:
+            node = _node_hash(node, sibling)
+        index >>= 1
+        last >>= 1
+    return last == 0 and node.hex() == root
+
+
+def verify_consistency(proof: ConsistencyProof, old_root: str, new_root: str) -> bool:
+    """
+    Check that the tree with ``old_root`` is a prefix of the tree with
+    ``new_root``.
+
+    Follows RFC 9162, section 2.1.4.2. Needs no access to the log.
+
+    Args:
+        proof: A :class:`ConsistencyProof`.
+        old_root: Trusted hex root of the tree of ``proof.old_size`` leaves.
+        new_root: Trusted hex root of the tree of ``proof.new_size`` leaves.
+
+    Returns:
+        True when the proof is valid.
+    """
+    old_size, new_size = proof.old_size, proof.new_size
+    if not 0 <= old_size <= new_size:
+        return False
+    if old_size == new_size:
+        return not proof.path and old_root == new_root
+    if old_size == 0:
+        return not proof.path
+    if not proof.path:
+        return False
+    try:
+        path = [bytes.fromhex(digest) for digest in proof.path]
+        if old_size & (old_size - 1) == 0:
+            path.insert(0, bytes.fromhex(old_root))
+    except ValueError:
+        return False
+
+    index, last = old_size - 1, new_size - 1
+    while index & 1:
+        index >>= 1
+        last >>= 1
+    old_node = new_node = path[0]
+    for sibling in path[1:]:
+        if last == 0:
+            return False
+        if index & 1 or index == last:
+            old_node = _node_hash(sibling, old_node)
+            new_node = _node_hash(sibling, new_node)
+            while not index & 1 and index:
+                index >>= 1
+                last >>= 1
+        else:
+            new_node = _node_hash(new_node, sibling)
+        index >>= 1
+        last >>= 1
+    return last == 0 and old_node.hex() == old_root and new_node.hex() == new_root
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+def _store(levels: list[bytearray], level: int, node: bytes) -> None:
+    if level == len(levels):
+        levels.append(bytearray())
+    levels[level] += node
+
+
+def _subtree(levels: list[bytearray], lo: int, hi: int) -> bytes:
+    """
+    Root of the subtree over leaves ``[lo, hi)``.
+
+    Complete, aligned subtrees are read from the stored levels; only the right
+    spine of an incomplete one is hashed, O(log n) nodes.
+    """
+    width = hi - lo
+    if width & (width - 1) == 0:
+        level = width.bit_length() - 1
+        start = (lo >> level) * _DIGEST_SIZE
+        return bytes(levels[level][start : start + _DIGEST_SIZE])
+    split = lo + _split(width)
+    return _node_hash(_subtree(levels, lo, split), _subtree(levels, split, hi))
+
+
+def _split(width: int) -> int:
+    """Largest power of two strictly below ``width`` (``width`` >= 2)."""
+    return 1 << ((width - 1).bit_length() - 1)
+
+
+def _hex(nodes: list[bytes]) -> tuple[str, ...]:
+    return tuple(node.hex() for node in nodes)
@@ -0,0 +1,283 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+"""
+Optional durability for trust, budget and consent state.
+
+State always lives in memory; the managers read and write their own dicts
+exactly as before. A :class:`StateBackend` only receives a *change entry*
+after each mutation and hands the entries back when a manager starts, so a
+restarted process resumes with the same trust levels, consent grants and
+budget totals.
+
+Entries are plain JSON-compatible dicts with an ``"op"`` key such as
+``"trust.set"`` or ``"budget.state"``. Every entry carries the complete new
+state of the item it names rather than a delta, so replaying an entry twice
+is harmless and :meth:`StateBackend.rewrite` can compact history while
+writes continue.
+
+What is restored:
+
+- trust assignments, including ``assigned_at`` and ``last_active``;
+- consent records, including expiry;
+- budget categories with their ``spent``, ``effective_limit`` and
+  ``last_reset``. Outstanding reservations and the per-category transaction
+  history are not persisted.
+
+:class:`JournalBackend` is the built-in implementation: an append-only
+JSON-lines file written by a background thread in batches (group commit),
+with a configurable fsync interval.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from typing import IO, Any
+
+logger = logging.getLogger("aumos.governance.persistence")
+
+StateEntry = dict[str, Any]
+
+
+class StateBackend(ABC):
+    """
+    Destination and source of state change entries.
+
+    Implementations must preserve the order of :meth:`append` calls and must
+    tolerate concurrent callers. Managers call :meth:`append` while holding
+    their own write lock, so it should not block for long.
+    """
+
+    @abstractmethod
+    def append(self, entry: StateEntry) -> None:
+        """Durably record ``entry`` (possibly asynchronously)."""
+
+    @abstractmethod
+    def load(self, component: str) -> Iterator[StateEntry]:
+        """
+        Yield every stored entry whose op starts with ``"<component>."``,
+        oldest first.
+        """
+
+    @abstractmethod
+    def rewrite(self, snapshot: Callable[[], Iterable[StateEntry]]) -> None:
+        """
+        Replace the stored history with the entries returned by ``snapshot``.
+
+        ``snapshot`` must be called while :meth:`append` is blocked, so that
+        no entry appended concurrently is lost.
+        """
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every appended entry is durable. The default returns True."""
+        return True
+
+    def close(self, timeout: float | None = None) -> None:  # noqa: B027 — optional hook
+        """Flush and release resources. The default does nothing."""
+
+
+class JournalBackend(StateBackend):
+    """
+    Append-only JSON-lines journal with group commit.
+
+    :meth:`append` serialises the entry and queues the line; a background
+    thread writes queued lines in batches and calls ``fsync`` at most every
+    ``fsync_interval_seconds`` (0 syncs after every batch). A line torn by a
+    crash is skipped on load.
+
+    Example::
+
+        backend = JournalBackend("/var/lib/app/governance.journal")
+        engine = GovernanceEngine(persistence=backend)
+        ...
+        engine.checkpoint()  # compact the journal to the current state
+        engine.close()
+
+    Args:
+        path: Journal file. Created if missing.
+        fsync_interval_seconds: Maximum time between fsyncs.
+        batch_size: Queued lines that wake the writer early.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        fsync_interval_seconds: float = 1.0,
+        batch_size: int = 512,
+    ) -> None:
+        self._path = os.fspath(path)
+        self._fsync_interval = fsync_interval_seconds
+        self._batch_size = batch_size
+        self._file: IO[str] = open(self._path, "a", encoding="utf-8")  # noqa: SIM115
+        self._pending: list[str] = []
+        self._cond = threading.Condition()
+        self._in_flight = False
+        self._dirty = False
+        self._last_sync = time.monotonic()
+        self._closed = False
+        self._appended = 0
+        self._written = 0
+        self._syncs = 0
+        self._thread = threading.Thread(
+            target=self._run, name="aumos-state-journal", daemon=True
+        )
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # StateBackend
+    # ------------------------------------------------------------------
+
+    def append(self, entry: StateEntry) -> None:
+        """
+        Queue ``entry`` for the journal.
+
+        Raises:
+            RuntimeError: If the journal has been closed.
+        """
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("State journal is closed.")
+            self._pending.append(line)
+            self._appended += 1
+            if len(self._pending) >= self._batch_size:
+                self._cond.notify_all()
+
+    def load(self, component: str) -> Iterator[StateEntry]:
+        """Yield the journal's entries for ``component`` in write order."""
+        self.flush()
+        # Entries are written with "op" first, so other components' lines
+        # are skipped without being decoded.
+        prefix = f'{{"op":"{component}.'
+        with open(self._path, encoding="utf-8") as journal:
+            for line in journal:
+                if not line.startswith(prefix):
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping torn state journal line.")
+
+    def rewrite(self, snapshot: Callable[[], Iterable[StateEntry]]) -> None:
+        """
+        Atomically replace the journal with ``snapshot()``.
+
+        The snapshot is written to a temporary file, synced and renamed over
+        the journal while appends wait.
+        """
+        self.flush()
+        with self._cond:
+            while self._in_flight:
+                self._cond.wait()
+            temporary = f"{self._path}.tmp"
+            with open(temporary, "w", encoding="utf-8") as compacted:
+                for entry in snapshot():
+                    compacted.write(json.dumps(entry, separators=(",", ":")) + "\n")
+                # Entries appended before the lock was taken are covered by
+                # the snapshot, which reflects every completed mutation.
+                self._pending.clear()
+                compacted.flush()
+                os.fsync(compacted.fileno())
+            self._file.close()
+            os.replace(temporary, self._path)
+            self._file = open(self._path, "a", encoding="utf-8")  # noqa: SIM115
+            self._dirty = False
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Write and fsync everything appended so far.
+
+        Returns:
+            False if ``timeout`` elapsed first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            self._write(self._take(), sync=True)
+            return True
+
+    def close(self, timeout: float | None = None) -> None:
+        """Flush, stop the writer thread and close the file."""
+        with self._cond:
+            if self._closed:
+                return
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        with self._cond:
+            self._file.close()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return ``appended``, ``written`` and ``pending`` entry counts and the
+        number of ``syncs`` performed.
+        """
+        with self._cond:
+            return {
+                "appended": self._appended,
+                "written": self._written,
+                "pending": len(self._pending),
+                "syncs": self._syncs,
+            }
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _take(self) -> list[str]:
+        lines, self._pending = self._pending, []
+        return lines
+
+    def _write(self, lines: list[str], sync: bool) -> None:
+        """
+        Write ``lines`` and fsync if asked or due.
+
+        Callers either hold the condition or have set ``_in_flight``, so only
+        one thread writes at a time.
+        """
+        if lines:
+            self._file.write("".join(lines))
+            self._file.flush()
+            self._written += len(lines)
+            self._dirty = True
+        if self._dirty and (
+            sync or time.monotonic() - self._last_sync >= self._fsync_interval
+        ):
+            os.fsync(self._file.fileno())
+            self._syncs += 1
+            self._dirty = False
+            self._last_sync = time.monotonic()
+
+    def _run(self) -> None:
+        """Writer thread: group-commit pending lines until closed."""
+        wait = self._fsync_interval if self._fsync_interval > 0 else 0.05
+        while True:
+            with self._cond:
+                if len(self._pending) < self._batch_size and not self._closed:
+                    self._cond.wait(wait)
+                if self._closed:
+                    return
+                lines = self._take()
+                if not lines and not self._dirty:
+                    continue
+                self._in_flight = True
+            # Appends keep queueing while the batch is written; flush() and
+            # rewrite() wait for _in_flight to clear before touching the file.
+            try:
+                self._write(lines, sync=False)
+            except Exception:
+                logger.exception("State journal write failed.")
+            finally:
+                with self._cond:
+                    self._in_flight = False
+                    self._cond.notify_all()
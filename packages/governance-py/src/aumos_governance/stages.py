@@ -0,0 +1,266 @@
+# SPDX-License-Identifier: BSL-1.1
+# Copyright (c) 2026 MuVeraAI Corporation
+"""
+Evaluation stages for the :class:`~aumos_governance.engine.GovernanceEngine`.
+
+Each check the engine performs is a :class:`GovernanceStage`. The built-in
+stages — :class:`TrustStage`, :class:`BudgetStage` and :class:`ConsentStage`
+— always run in that order. Applications may register additional stages
+(for example a rate limit) with
+:meth:`~aumos_governance.engine.GovernanceEngine.register_stage`; they take
+part in the same first-failure short circuit, contribute a reason to the
+decision and its audit record, and are counted in
+:meth:`~aumos_governance.engine.GovernanceEngine.stage_stats`.
+
+Example::
+
+    class RateLimitStage(GovernanceStage):
+        name = "rate_limit"
+
+        def __init__(self, per_agent: int) -> None:
+            self._per_agent = per_agent
+            self._seen: dict[str, int] = {}
+
+        def check(self, action, context):
+            count = self._seen.get(action.agent_id, 0) + 1
+            self._seen[action.agent_id] = count
+            if count > self._per_agent:
+                return False, f"Agent '{action.agent_id}' exceeded {self._per_agent} actions."
+            return True, f"Agent '{action.agent_id}' action {count} of {self._per_agent}."
+
+    engine.register_stage(RateLimitStage(per_agent=100), before="trust")
+"""
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
+from aumos_governance.deferred import Deferred
+from aumos_governance.instrumentation import LatencyHistogram
+
+if TYPE_CHECKING:
+    from aumos_governance.budget.manager import BudgetManager
+    from aumos_governance.consent.manager import ConsentManager
+    from aumos_governance.engine import GovernanceAction
+    from aumos_governance.trust.manager import TrustManager
+
+StageVerdict = tuple[bool, "str | Deferred[str]"]
+
+
+class StageContext:
+    """
+    Per-evaluation state shared by the stages of one decision.
+
+    Attributes:
+        decision_id: The audit record ID reserved for the decision, or None
+            when it is assigned by the audit logger.
+        reserve: Whether the budget amount should be held rather than only
+            checked (``evaluate(..., reserve=True)``).
+        reserved: Set by :class:`BudgetStage` once an amount is held.
+        lean: True on the allocation-light path; stages should return
+            deferred reasons where they can.
+        committed: Per-category amounts already approved earlier in a
+            ``cumulative_budget`` batch, or None.
+    """
+
+    __slots__ = ("decision_id", "reserve", "reserved", "lean", "committed")
+
+    def __init__(
+        self,
+        decision_id: str | None = None,
+        reserve: bool = False,
+        lean: bool = False,
+        committed: dict[str, float] | None = None,
+    ) -> None:
+        self.decision_id = decision_id
+        self.reserve = reserve
+        self.reserved = False
+        self.lean = lean
+        self.committed = committed
+
+
+class GovernanceStage(ABC):
+    """
+    One check in the engine's evaluation sequence.
+
+    Subclasses set a unique :attr:`name` and implement :meth:`check`. A stage
+    that denies ends the evaluation: later stages do not run, and
+    :meth:`rollback` is called on every stage that already passed.
+
+    Attributes:
+        name: Unique stage name, used for registration and statistics.
+    """
+
+    name: str = ""
+
+    def applies(self, action: GovernanceAction) -> bool:
+        """Return True if this stage should evaluate ``action``. Defaults to True."""
+        return True
+
+    @abstractmethod
+    def check(self, action: GovernanceAction, context: StageContext) -> StageVerdict:
+        """
+        Evaluate ``action``.
+
+        Args:
+            action: The action being evaluated.
+            context: State shared with the other stages of this evaluation.
+
+        Returns:
+            ``(allowed, reason)``. The reason may be a
+            :class:`~aumos_governance.deferred.Deferred` string.
+        """
+
+    def rollback(  # noqa: B027 — optional hook, deliberately a no-op
+        self, action: GovernanceAction, context: StageContext
+    ) -> None:
+        """
+        Undo side effects of a passed :meth:`check` after a later stage denied.
+
+        The default does nothing.
+        """
+
+    def batch_key(self, action: GovernanceAction) -> Hashable | None:
+        """
+        Return a key under which this stage's verdict may be shared within
+        one :meth:`~aumos_governance.engine.GovernanceEngine.evaluate_many`
+        batch, or None (the default) to evaluate every action separately.
+        """
+        return None
+
+
+class TrustStage(GovernanceStage):
+    """Built-in stage checking ``required_trust_level``."""
+
+    name = "trust"
+
+    def __init__(self, trust: TrustManager) -> None:
+        self._trust = trust
+
+    def applies(self, action: GovernanceAction) -> bool:
+        return action.required_trust_level is not None
+
+    def check(self, action: GovernanceAction, context: StageContext) -> StageVerdict:
+        required = action.required_trust_level
+        assert required is not None  # noqa: S101 — guaranteed by applies()
+        if context.lean:
+            return self._trust.check_level_lean(
+                agent_id=action.agent_id, required_level=required, scope=action.scope
+            )
+        result = self._trust.check_level(
+            agent_id=action.agent_id, required_level=required, scope=action.scope
+        )
+        return result.allowed, result.reason
+
+    def batch_key(self, action: GovernanceAction) -> Hashable | None:
+        return (action.agent_id, action.scope, action.required_trust_level)
+
+
+class BudgetStage(GovernanceStage):
+    """Built-in stage checking — or, when reserving, holding — ``budget_amount``."""
+
+    name = "budget"
+
+    def __init__(self, budget: BudgetManager) -> None:
+        self._budget = budget
+
+    def applies(self, action: GovernanceAction) -> bool:
+        return action.budget_category is not None
+
+    def check(self, action: GovernanceAction, context: StageContext) -> StageVerdict:
+        category = action.budget_category
+        assert category is not None  # noqa: S101 — guaranteed by applies()
+        amount = action.budget_amount or 0.0
+        committed = context.committed.get(category, 0.0) if context.committed else 0.0
+        reservation_id = context.decision_id if context.reserve else None
+
+        if context.lean:
+            allowed, reason = self._budget.check_budget_lean(
+                category=category,
+                amount=amount,
+                committed=committed,
+                reservation_id=reservation_id,
+            )
+            context.reserved = allowed and reservation_id is not None
+            return allowed, reason
+
+        if reservation_id is not None:
+            result = self._budget.reserve(
+                category=category, amount=amount, reservation_id=reservation_id
+            )
+            context.reserved = result.allowed
+        else:
+            result = self._budget.check_budget(
+                category=category, amount=amount, committed=committed
+            )
+        return result.allowed, result.reason
+
+    def rollback(self, action: GovernanceAction, context: StageContext) -> None:
+        if context.reserved and context.decision_id is not None:
+            self._budget.cancel(context.decision_id)
+            context.reserved = False
+
+
+class ConsentStage(GovernanceStage):
+    """Built-in stage checking consent for ``data_type``."""
+
+    name = "consent"
+
+    def __init__(self, consent: ConsentManager) -> None:
+        self._consent = consent
+
+    def applies(self, action: GovernanceAction) -> bool:
+        return action.data_type is not None
+
+    def check(self, action: GovernanceAction, context: StageContext) -> StageVerdict:
+        data_type = action.data_type
+        assert data_type is not None  # noqa: S101 — guaranteed by applies()
+        if context.lean:
+            return self._consent.check_consent_lean(
+                agent_id=action.agent_id, data_type=data_type, purpose=action.purpose
+            )
+        result = self._consent.check_consent(
+            agent_id=action.agent_id, data_type=data_type, purpose=action.purpose
+        )
+        return result.granted, result.reason
+
+    def batch_key(self, action: GovernanceAction) -> Hashable | None:
+        return (action.agent_id, action.data_type, action.purpose)
+
+
+class StageCounters:
+    """
+    Invocation, denial and timing counters for one stage.
+
+    Attributes:
+        histogram: Latency histogram fed while instrumentation is enabled,
+            else None.
+    """
+
+    __slots__ = ("invocations", "denials", "total_ns", "histogram", "_lock")
+
+    def __init__(self, histogram: LatencyHistogram | None = None) -> None:
+        self.invocations = 0
+        self.denials = 0
+        self.total_ns = 0
+        self.histogram = histogram
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ns: int, allowed: bool) -> None:
+        """Count one evaluation that took ``elapsed_ns``."""
+        with self._lock:
+            self.invocations += 1
+            self.total_ns += elapsed_ns
+            if not allowed:
+                self.denials += 1
+
+    def to_dict(self) -> dict[str, int]:
+        """Return a plain dict snapshot of the counters."""
+        with self._lock:
+            return {
+                "invocations": self.invocations,
+                "denials": self.denials,
+                "total_ns": self.total_ns,
+            }
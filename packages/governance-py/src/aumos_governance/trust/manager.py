@@ -2,17 +2,32 @@
 # Copyright (c) 2026 MuVeraAI Corporation
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterable, Iterator, Mapping
 from datetime import datetime, timezone
 
+from aumos_governance.cache import DecisionCache
 from aumos_governance.config import TrustConfig
+from aumos_governance.deferred import Deferred
 from aumos_governance.errors import TrustLevelError
+from aumos_governance.instrumentation import Instrumentation
+from aumos_governance.persistence import StateBackend, StateEntry
 from aumos_governance.trust.decay import calculate_decay
-from aumos_governance.trust.validator import TrustCheckResult, validate_trust
+from aumos_governance.trust.validator import TrustCheckResult, trust_reason, validate_trust
 from aumos_governance.types import TrustLevel
 
+# Operations timed when an Instrumentation is attached.
+_INSTRUMENTED = ("set_level", "get_level", "check_level", "check_level_lean")
+
 
 class _TrustEntry:
-    """Internal storage for a single agent's trust assignment."""
+    """
+    Internal storage for a single agent's trust assignment.
+
+    Entries are never modified once published in a snapshot, except for
+    ``last_active``: :meth:`TrustManager.touch` replaces that single
+    reference in place, which readers observe atomically.
+    """
 
     __slots__ = ("level", "scope", "assigned_at", "last_active", "assigned_by")
 
@@ -21,12 +36,13 @@ class _TrustEntry:
         level: TrustLevel,
         scope: str | None,
         assigned_by: str | None,
+        last_active: datetime | None = None,
     ) -> None:
         now = datetime.now(tz=timezone.utc)
         self.level = level
         self.scope = scope
         self.assigned_at = now
-        self.last_active = now
+        self.last_active = last_active if last_active is not None else now
         self.assigned_by = assigned_by
 
 
@@ -61,8 +77,13 @@ class TrustManager:
     Trust levels are ALWAYS assigned manually via :meth:`set_level`.
     There is no automatic promotion, scoring, or adaptive mechanism.
 
-    All data is stored in-memory. A new TrustManager starts empty;
-    unknown agents receive :attr:`~TrustConfig.default_level`.
+    All data is stored in-memory. A new TrustManager starts empty, or with
+    the assignments restored from ``backend`` when one is given; unknown
+    agents receive :attr:`~TrustConfig.default_level`.
+
+    Assignments are held in an immutable snapshot. Writers serialise on a
+    lock, build a new snapshot and swap the reference; readers never lock
+    and always see either the old or the new snapshot in full.
 
     Example::
 
@@ -72,10 +93,26 @@ class TrustManager:
         assert result.allowed is True
     """
 
-    def __init__(self, config: TrustConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: TrustConfig | None = None,
+        cache: DecisionCache[TrustCheckResult] | None = None,
+        instrumentation: Instrumentation | None = None,
+        backend: StateBackend | None = None,
+    ) -> None:
         self._config = config or TrustConfig()
-        # Keyed by (agent_id, scope). scope=None means global.
-        self._store: dict[tuple[str, str | None], _TrustEntry] = {}
+        # Keyed by (agent_id, scope). scope=None means global. Never mutated
+        # once published: writers replace it under _write_lock.
+        self._store: Mapping[tuple[str, str | None], _TrustEntry] = {}
+        self._write_lock = threading.Lock()
+        # Optional memo of check_level results, invalidated per agent.
+        self._cache = cache
+        # Optional durable copy of every change; see aumos_governance.persistence.
+        self._backend = backend
+        if backend is not None:
+            self._restore(backend.load("trust"))
+        if instrumentation is not None:
+            instrumentation.instrument(self, "trust", _INSTRUMENTED)
 
     # ------------------------------------------------------------------
     # Public API
@@ -111,17 +148,20 @@ class TrustManager:
         opts = options or SetLevelOptions()
         key = (agent_id, scope)
 
-        if key in self._store:
-            entry = self._store[key]
-            entry.level = level
-            entry.assigned_by = opts.assigned_by
-            entry.assigned_at = datetime.now(tz=timezone.utc)
-        else:
-            self._store[key] = _TrustEntry(
+        with self._write_lock:
+            previous = self._store.get(key)
+            store = dict(self._store)
+            entry = store[key] = _TrustEntry(
                 level=level,
                 scope=scope,
                 assigned_by=opts.assigned_by,
+                last_active=previous.last_active if previous is not None else None,
             )
+            self._store = store
+            if self._backend is not None:
+                self._backend.append(_set_entry(agent_id, entry))
+        if self._cache is not None:
+            self._cache.invalidate_agent(agent_id)
 
     def get_level(
         self,
@@ -184,13 +224,60 @@ class TrustManager:
         Returns:
             A :class:`~aumos_governance.trust.validator.TrustCheckResult`.
         """
+        cache = self._cache
+        if cache is not None:
+            cache_key = (agent_id, scope, required_level)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+            generation = cache.generation(agent_id)
+
         actual = self.get_level(agent_id, scope)
-        return validate_trust(
+        result = validate_trust(
             agent_id=agent_id,
             required_level=required_level,
             actual_level=actual,
             scope=scope,
         )
+        if cache is not None:
+            cache.put(
+                cache_key,
+                agent_id,
+                result,
+                self._next_decay_deadline(agent_id, scope),
+                generation,
+            )
+        return result
+
+    def check_level_lean(
+        self,
+        agent_id: str,
+        required_level: TrustLevel,
+        scope: str | None = None,
+    ) -> tuple[bool, str | Deferred[str]]:
+        """
+        Allocation-light form of :meth:`check_level`.
+
+        Returns the verdict and a reason whose text is only rendered when it
+        is read. Used by :meth:`~aumos_governance.engine.GovernanceEngine.evaluate_lean`.
+        When a decision cache is attached the cached result is reused as-is.
+
+        Args:
+            agent_id: Unique identifier of the agent.
+            required_level: Minimum required trust level.
+            scope: Optional scope for the check.
+
+        Returns:
+            ``(allowed, reason)``.
+        """
+        if self._cache is not None:
+            result = self.check_level(agent_id, required_level, scope)
+            return result.allowed, result.reason
+        actual = self.get_level(agent_id, scope)
+        return (
+            actual >= required_level,
+            Deferred(trust_reason, agent_id, required_level, actual, scope),
+        )
 
     def require_level(
         self,
@@ -242,9 +329,25 @@ class TrustManager:
         # Always touch global entry too when a scoped touch occurs.
         keys_to_touch.append((agent_id, None))
 
-        for key in keys_to_touch:
-            if key in self._store:
-                self._store[key].last_active = now
+        if self._backend is None:
+            store = self._store
+            for key in keys_to_touch:
+                entry = store.get(key)
+                if entry is not None:
+                    entry.last_active = now
+        else:
+            # Journalled under the write lock so the entry cannot be ordered
+            # before a concurrent set_level() of the same key.
+            backend = self._backend
+            with self._write_lock:
+                store = self._store
+                for key in keys_to_touch:
+                    entry = store.get(key)
+                    if entry is not None:
+                        entry.last_active = now
+                        backend.append(_set_entry(agent_id, entry))
+        if self._cache is not None:
+            self._cache.invalidate_agent(agent_id)
 
     def remove(self, agent_id: str, scope: str | None = None) -> bool:
         """
@@ -259,10 +362,17 @@ class TrustManager:
             True if an entry was removed, False if no entry existed.
         """
         key = (agent_id, scope)
-        if key in self._store:
-            del self._store[key]
-            return True
-        return False
+        with self._write_lock:
+            if key not in self._store:
+                return False
+            store = dict(self._store)
+            del store[key]
+            self._store = store
+            if self._backend is not None:
+                self._backend.append({"op": "trust.remove", "agent_id": agent_id, "scope": scope})
+        if self._cache is not None:
+            self._cache.invalidate_agent(agent_id)
+        return True
 
     def list_agents(self) -> list[str]:
         """
@@ -279,19 +389,85 @@ class TrustManager:
                 result.append(agent_id)
         return result
 
+    def state_entries(self) -> Iterator[StateEntry]:
+        """
+        Yield one ``trust.set`` entry per stored assignment.
+
+        Used to compact a :class:`~aumos_governance.persistence.StateBackend`;
+        see :meth:`~aumos_governance.engine.GovernanceEngine.checkpoint`.
+        """
+        for (agent_id, _), entry in self._store.items():
+            yield _set_entry(agent_id, entry)
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _restore(self, entries: Iterable[StateEntry]) -> None:
+        """Rebuild the store from backend entries and publish it once."""
+        store: dict[tuple[str, str | None], _TrustEntry] = {}
+        for state in entries:
+            key = (state["agent_id"], state["scope"])
+            if state["op"] == "trust.remove":
+                store.pop(key, None)
+                continue
+            entry = _TrustEntry(
+                level=TrustLevel(state["level"]),
+                scope=state["scope"],
+                assigned_by=state["assigned_by"],
+                last_active=datetime.fromisoformat(state["last_active"]),
+            )
+            entry.assigned_at = datetime.fromisoformat(state["assigned_at"])
+            store[key] = entry
+        with self._write_lock:
+            self._store = store
+
     def _resolve_entry(
         self,
         agent_id: str,
         scope: str | None,
     ) -> _TrustEntry | None:
         """Return the most specific trust entry for the given agent+scope."""
+        store = self._store
         if scope is not None:
-            scoped_key = (agent_id, scope)
-            if scoped_key in self._store:
-                return self._store[scoped_key]
-        global_key = (agent_id, None)
-        return self._store.get(global_key)
+            scoped = store.get((agent_id, scope))
+            if scoped is not None:
+                return scoped
+        return store.get((agent_id, None))
+
+    def _next_decay_deadline(self, agent_id: str, scope: str | None) -> float | None:
+        """
+        Return the POSIX timestamp at which decay next changes the effective
+        level for ``agent_id``/``scope``, or None if it never will without a
+        write (decay disabled, no stored entry, or every threshold crossed).
+        """
+        if not self._config.enable_decay:
+            return None
+        entry = self._resolve_entry(agent_id, scope)
+        if entry is None:
+            return None
+        thresholds = sorted(
+            days
+            for days in (self._config.decay_gradual_days, self._config.decay_cliff_days)
+            if days is not None
+        )
+        last_active = entry.last_active.timestamp()
+        now = datetime.now(tz=timezone.utc).timestamp()
+        for days in thresholds:
+            boundary = last_active + days * 86_400.0
+            if boundary > now:
+                return boundary
+        return None
+
+
+def _set_entry(agent_id: str, entry: _TrustEntry) -> StateEntry:
+    """Return the ``trust.set`` state entry describing ``entry``."""
+    return {
+        "op": "trust.set",
+        "agent_id": agent_id,
+        "scope": entry.scope,
+        "level": int(entry.level),
+        "assigned_by": entry.assigned_by,
+        "assigned_at": entry.assigned_at.isoformat(),
+        "last_active": entry.last_active.isoformat(),
+    }
@@ -52,26 +52,42 @@ def validate_trust(
         A frozen :class:`TrustCheckResult` describing the outcome.
     """
     allowed = actual_level >= required_level
-    scope_text = f" in scope '{scope}'" if scope else ""
-
-    if allowed:
-        reason = (
-            f"Agent '{agent_id}'{scope_text} has trust level "
-            f"{actual_level.label()} ({int(actual_level)}), which satisfies "
-            f"the required level {required_level.label()} ({int(required_level)})."
-        )
-    else:
-        reason = (
-            f"Agent '{agent_id}'{scope_text} has trust level "
-            f"{actual_level.label()} ({int(actual_level)}), which is below "
-            f"the required level {required_level.label()} ({int(required_level)})."
-        )
-
     return TrustCheckResult(
         allowed=allowed,
         agent_id=agent_id,
         required_level=required_level,
         actual_level=actual_level,
         scope=scope,
-        reason=reason,
+        reason=trust_reason(agent_id, required_level, actual_level, scope),
+    )
+
+
+def trust_reason(
+    agent_id: str,
+    required_level: TrustLevel,
+    actual_level: TrustLevel,
+    scope: str | None = None,
+) -> str:
+    """
+    Render the human-readable reason for a trust check.
+
+    Shared by :func:`validate_trust` and the deferred reasons produced by
+    :meth:`~aumos_governance.trust.manager.TrustManager.check_level_lean`,
+    so both paths yield identical text.
+
+    Args:
+        agent_id: Identifier of the agent being checked.
+        required_level: The minimum trust level required.
+        actual_level: The agent's effective trust level.
+        scope: Optional scope string.
+
+    Returns:
+        The reason string.
+    """
+    scope_text = f" in scope '{scope}'" if scope else ""
+    verdict = "satisfies" if actual_level >= required_level else "is below"
+    return (
+        f"Agent '{agent_id}'{scope_text} has trust level "
+        f"{actual_level.label()} ({int(actual_level)}), which {verdict} "
+        f"the required level {required_level.label()} ({int(required_level)})."
     )
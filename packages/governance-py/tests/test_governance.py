@@ -7,17 +7,61 @@ ConsentManager, and GovernanceEngine.
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import hashlib
+import json
+import multiprocessing
+import os
+import struct
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
 import pytest
 
+from aumos_governance.audit.logger import AuditLogger
+from aumos_governance.audit.query import AuditFilter, aggregate_outcomes, apply_filter
+from aumos_governance.audit.record import GovernanceDecisionContext, create_record
+from aumos_governance.audit.write_behind import AuditWriteBehind
+from aumos_governance.audit_chain import CheckpointStore, HashChainedAuditLog
+from aumos_governance.budget.columnar import ColumnarCategoryTracker
 from aumos_governance.budget.manager import BudgetManager
-from aumos_governance.consent.manager import ConsentManager
+from aumos_governance.budget.policy import NEVER_RESETS, reset_deadline
+from aumos_governance.budget.scheduler import TimerWheel
+from aumos_governance.budget.shared import SharedMemoryCategoryTracker
+from aumos_governance.config import (
+    AuditConfig,
+    AuditSpillConfig,
+    BudgetConfig,
+    CacheConfig,
+    GovernanceConfig,
+    InstrumentationConfig,
+    PersistenceConfig,
+    ResetSchedulerConfig,
+    StageConfig,
+    TransactionRetentionConfig,
+    WriteBehindConfig,
+)
+from aumos_governance.consent.manager import ConsentCheckResult, ConsentManager
+from aumos_governance.consent.snapshot import ConsentSnapshot
+from aumos_governance.consent.store import ConsentRecord, ConsentStore
 from aumos_governance.engine import GovernanceAction, GovernanceDecision, GovernanceEngine
 from aumos_governance.errors import (
     BudgetExceededError,
     BudgetNotFoundError,
+    ConfigurationError,
     ConsentNotFoundError,
+    ReservationNotFoundError,
     TrustLevelError,
 )
+from aumos_governance.instrumentation import Instrumentation, LatencyHistogram
+from aumos_governance.merkle import MerkleAccumulator, verify_consistency, verify_inclusion
+from aumos_governance.persistence import JournalBackend
+from aumos_governance.stages import GovernanceStage, StageContext
 from aumos_governance.trust.manager import TrustManager
 from aumos_governance.types import GovernanceOutcome, TrustLevel
 
@@ -448,3 +492,1917 @@ class TestGovernanceEngine:
         action = GovernanceAction(agent_id="unknown-agent")
         decision = asyncio.run(engine.evaluate(action))
         assert decision.allowed is True
+
+    def test_evaluate_sync_inside_running_loop_uses_calling_thread(
+        self, engine: GovernanceEngine
+    ) -> None:
+        seen: list[str] = []
+        original = engine.audit.log
+
+        def spy(*args: object, **kwargs: object) -> object:
+            seen.append(threading.current_thread().name)
+            return original(*args, **kwargs)
+
+        engine.audit.log = spy  # type: ignore[method-assign]
+
+        async def call_from_loop() -> GovernanceDecision:
+            return engine.evaluate_sync(GovernanceAction(agent_id="agent-001"))
+
+        decision = asyncio.run(call_from_loop())
+        assert decision.allowed is True
+        assert seen == [threading.current_thread().name]
+
+
+# ---------------------------------------------------------------------------
+# TestEvaluateMany
+# ---------------------------------------------------------------------------
+
+
+class TestEvaluateMany:
+    @pytest.fixture
+    def batch(self) -> list[GovernanceAction]:
+        return [
+            GovernanceAction(
+                agent_id="agent-001",
+                required_trust_level=TrustLevel.L2_SUGGEST,
+                budget_category="llm",
+                budget_amount=40.0,
+                data_type="user_data",
+                purpose="support",
+            ),
+            GovernanceAction(agent_id="agent-002", required_trust_level=TrustLevel.L2_SUGGEST),
+            GovernanceAction(agent_id="agent-001", data_type="health_data"),
+            GovernanceAction(agent_id="agent-001", budget_category="llm", budget_amount=70.0),
+            GovernanceAction(agent_id="agent-001", budget_category="llm", budget_amount=40.0),
+        ]
+
+    def test_matches_sequential_evaluation(
+        self, engine_with_agent: GovernanceEngine, batch: list[GovernanceAction]
+    ) -> None:
+        sequential = [engine_with_agent.evaluate_sync(action) for action in batch]
+        batched = engine_with_agent.evaluate_many_sync(batch)
+        assert [d.outcome for d in batched] == [d.outcome for d in sequential]
+        assert [d.reasons for d in batched] == [d.reasons for d in sequential]
+        assert [d.action for d in batched] == batch
+
+    def test_distinct_lookups_are_resolved_once(
+        self, engine_with_agent: GovernanceEngine
+    ) -> None:
+        calls: list[str] = []
+        check_level = engine_with_agent.trust.check_level
+        check_consent = engine_with_agent.consent.check_consent
+
+        def counting_check_level(*args: object, **kwargs: object) -> object:
+            calls.append("trust")
+            return check_level(*args, **kwargs)
+
+        def counting_check_consent(*args: object, **kwargs: object) -> object:
+            calls.append("consent")
+            return check_consent(*args, **kwargs)
+
+        engine_with_agent.trust.check_level = counting_check_level  # type: ignore[method-assign]
+        engine_with_agent.consent.check_consent = counting_check_consent  # type: ignore[method-assign]
+        action = GovernanceAction(
+            agent_id="agent-001",
+            required_trust_level=TrustLevel.L2_SUGGEST,
+            data_type="user_data",
+            purpose="support",
+        )
+        decisions = engine_with_agent.evaluate_many_sync([action] * 50)
+        assert all(d.allowed for d in decisions)
+        assert calls == ["trust", "consent"]
+
+    def test_audit_records_are_appended_in_input_order(
+        self, engine_with_agent: GovernanceEngine, batch: list[GovernanceAction]
+    ) -> None:
+        decisions = engine_with_agent.evaluate_many_sync(batch)
+        records = engine_with_agent.audit.latest(len(decisions))
+        assert [r.record_id for r in records] == [d.audit_record_id for d in decisions]
+
+    def test_cumulative_budget_counts_earlier_allowed_actions(
+        self, engine_with_agent: GovernanceEngine
+    ) -> None:
+        action = GovernanceAction(agent_id="agent-001", budget_category="llm", budget_amount=40.0)
+        independent = engine_with_agent.evaluate_many_sync([action] * 3)
+        cumulative = engine_with_agent.evaluate_many_sync([action] * 3, cumulative_budget=True)
+        assert [d.allowed for d in independent] == [True, True, True]
+        assert [d.allowed for d in cumulative] == [True, True, False]
+
+    def test_async_evaluate_many(
+        self, engine_with_agent: GovernanceEngine, batch: list[GovernanceAction]
+    ) -> None:
+        decisions = asyncio.run(engine_with_agent.evaluate_many(batch))
+        assert len(decisions) == 5
+
+
+# ---------------------------------------------------------------------------
+# TestDecisionCache
+# ---------------------------------------------------------------------------
+
+
+class TestDecisionCache:
+    @pytest.fixture
+    def cached_engine(self) -> GovernanceEngine:
+        return GovernanceEngine(GovernanceConfig(cache=CacheConfig(enabled=True)))
+
+    def test_cache_stats_empty_when_disabled(self, engine: GovernanceEngine) -> None:
+        assert engine.cache_stats() == {}
+
+    def test_repeated_checks_hit_the_cache(self, cached_engine: GovernanceEngine) -> None:
+        cached_engine.trust.set_level("agent-001", TrustLevel.L3_ACT_APPROVE)
+        cached_engine.consent.record_consent(
+            "agent-001", "user_data", "support", granted_by="admin"
+        )
+        action = GovernanceAction(
+            agent_id="agent-001",
+            required_trust_level=TrustLevel.L2_SUGGEST,
+            data_type="user_data",
+            purpose="support",
+        )
+        for _ in range(3):
+            assert cached_engine.evaluate_sync(action).allowed is True
+        stats = cached_engine.cache_stats()
+        assert stats["trust"]["misses"] == 1
+        assert stats["trust"]["hits"] == 2
+        assert stats["consent"]["hits"] == 2
+
+    def test_set_level_invalidates_cached_trust_result(
+        self, cached_engine: GovernanceEngine
+    ) -> None:
+        cached_engine.trust.set_level("agent-001", TrustLevel.L3_ACT_APPROVE)
+        assert cached_engine.trust.check_level("agent-001", TrustLevel.L3_ACT_APPROVE).allowed
+        cached_engine.trust.set_level("agent-001", TrustLevel.L1_MONITOR)
+        assert not cached_engine.trust.check_level("agent-001", TrustLevel.L3_ACT_APPROVE).allowed
+
+    def test_consent_writes_invalidate_cached_result(self, cached_engine: GovernanceEngine) -> None:
+        assert not cached_engine.consent.check_consent("agent-001", "user_data", "support").granted
+        cached_engine.consent.record_consent(
+            "agent-001", "user_data", "support", granted_by="admin"
+        )
+        assert cached_engine.consent.check_consent("agent-001", "user_data", "support").granted
+        cached_engine.consent.revoke_consent("agent-001", "user_data", "support")
+        assert not cached_engine.consent.check_consent("agent-001", "user_data", "support").granted
+        cached_engine.consent.record_consent("agent-001", "user_data", None, granted_by="admin")
+        assert cached_engine.consent.check_consent("agent-001", "user_data", "support").granted
+        cached_engine.consent.revoke_all_for_agent("agent-001")
+        assert not cached_engine.consent.check_consent("agent-001", "user_data", "support").granted
+
+    def test_revocation_during_a_consent_miss_is_not_cached_over(
+        self, cached_engine: GovernanceEngine, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        consent = cached_engine.consent
+        consent.record_consent("agent-001", "pii", None, granted_by="admin")
+        evaluate = consent._evaluate_consent
+
+        def evaluate_then_revoke(
+            agent_id: str, data_type: str, purpose: str | None
+        ) -> ConsentCheckResult:
+            result = evaluate(agent_id, data_type, purpose)
+            consent.revoke_consent("agent-001", "pii")
+            return result
+
+        monkeypatch.setattr(consent, "_evaluate_consent", evaluate_then_revoke)
+        assert consent.check_consent("agent-001", "pii").granted
+        monkeypatch.undo()
+        assert not consent.check_consent("agent-001", "pii").granted
+
+    def test_level_change_during_a_trust_miss_is_not_cached_over(
+        self, cached_engine: GovernanceEngine, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        trust = cached_engine.trust
+        trust.set_level("agent-001", TrustLevel.L3_ACT_APPROVE)
+        get_level = trust.get_level
+
+        def get_then_demote(agent_id: str, scope: str | None = None) -> TrustLevel:
+            level = get_level(agent_id, scope)
+            trust.set_level("agent-001", TrustLevel.L1_MONITOR)
+            return level
+
+        monkeypatch.setattr(trust, "get_level", get_then_demote)
+        assert trust.check_level("agent-001", TrustLevel.L3_ACT_APPROVE).allowed
+        monkeypatch.undo()
+        assert not trust.check_level("agent-001", TrustLevel.L3_ACT_APPROVE).allowed
+
+    def test_cached_consent_expires_with_the_grant(self, cached_engine: GovernanceEngine) -> None:
+        cached_engine.consent.record_consent(
+            "agent-001",
+            "user_data",
+            "support",
+            granted_by="admin",
+            expires_at=datetime.now(tz=timezone.utc) + timedelta(milliseconds=50),
+        )
+        assert cached_engine.consent.check_consent("agent-001", "user_data", "support").granted
+        time.sleep(0.06)
+        assert not cached_engine.consent.check_consent("agent-001", "user_data", "support").granted
+        assert cached_engine.cache_stats()["consent"]["expirations"] == 1
+
+    def test_least_recently_used_entries_are_evicted(self) -> None:
+        engine = GovernanceEngine(
+            GovernanceConfig(cache=CacheConfig(enabled=True, max_entries=2))
+        )
+        for agent_id in ("agent-a", "agent-b", "agent-c"):
+            engine.trust.check_level(agent_id, TrustLevel.L1_MONITOR)
+        stats = engine.cache_stats()["trust"]
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+
+
+# ---------------------------------------------------------------------------
+# TestBudgetReservations
+# ---------------------------------------------------------------------------
+
+
+class TestBudgetReservations:
+    def test_reserve_holds_amount_until_settled(self, engine_with_agent: GovernanceEngine) -> None:
+        action = GovernanceAction(agent_id="agent-001", budget_category="llm", budget_amount=60.0)
+        decision = engine_with_agent.evaluate_sync(action, reserve=True)
+        assert decision.allowed is True
+        assert decision.reserved is True
+        assert engine_with_agent.evaluate_sync(action, reserve=True).allowed is False
+
+        engine_with_agent.settle(decision.audit_record_id, 25.0)
+        result = engine_with_agent.budget.check_budget("llm", 0.0)
+        assert result.available == pytest.approx(75.0)
+        assert result.spent == pytest.approx(25.0)
+
+    def test_cancel_releases_without_spending(self, engine_with_agent: GovernanceEngine) -> None:
+        action = GovernanceAction(agent_id="agent-001", budget_category="llm", budget_amount=60.0)
+        decision = engine_with_agent.evaluate_sync(action, reserve=True)
+        engine_with_agent.cancel(decision.audit_record_id)
+        assert engine_with_agent.budget.check_budget("llm", 100.0).allowed is True
+
+    def test_later_denial_releases_reservation(self, engine_with_agent: GovernanceEngine) -> None:
+        action = GovernanceAction(
+            agent_id="agent-001",
+            budget_category="llm",
+            budget_amount=60.0,
+            data_type="health_data",
+        )
+        decision = engine_with_agent.evaluate_sync(action, reserve=True)
+        assert decision.allowed is False
+        assert decision.reserved is False
+        assert engine_with_agent.budget.check_budget("llm", 100.0).allowed is True
+
+    def test_unknown_reservation_raises(self, engine: GovernanceEngine) -> None:
+        with pytest.raises(ReservationNotFoundError):
+            engine.settle("missing", 1.0)
+        with pytest.raises(ReservationNotFoundError):
+            engine.cancel("missing")
+
+    def test_concurrent_reservations_never_overshoot(self) -> None:
+        engine = GovernanceEngine()
+        engine.budget.create_budget("shared", limit=500.0, period="monthly")
+        engine.budget.create_budget("other", limit=1_000_000.0, period="monthly")
+        action = GovernanceAction(agent_id="agent-001", budget_category="shared", budget_amount=1.0)
+        other = GovernanceAction(agent_id="agent-002", budget_category="other", budget_amount=1.0)
+        allowed_counts: list[int] = []
+        start = threading.Barrier(16)
+
+        def worker(index: int) -> None:
+            start.wait()
+            allowed = 0
+            for _ in range(100):
+                decision = engine.evaluate_sync(action if index % 4 else other, reserve=True)
+                if decision.allowed:
+                    if decision.action.budget_category == "shared":
+                        allowed += 1
+                    engine.settle(decision.audit_record_id, 1.0)
+            allowed_counts.append(allowed)
+
+        previous_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(previous_interval)
+
+        envelope = next(e for e in engine.budget.summary() if e["category"] == "shared")
+        assert sum(allowed_counts) == 500
+        assert envelope["spent"] == pytest.approx(500.0)
+        assert envelope["reserved"] == pytest.approx(0.0)
+
+
+# ---------------------------------------------------------------------------
+# TestEvaluateLean
+# ---------------------------------------------------------------------------
+
+
+_LEAN_ACTIONS = [
+    GovernanceAction(
+        agent_id="agent-001",
+        required_trust_level=TrustLevel.L2_SUGGEST,
+        budget_category="llm",
+        budget_amount=5.0,
+        data_type="user_data",
+        purpose="support",
+        action_type="tool_call",
+    ),
+    GovernanceAction(agent_id="agent-001", required_trust_level=TrustLevel.L5_AUTONOMOUS),
+    GovernanceAction(agent_id="agent-001", budget_category="llm", budget_amount=500.0),
+    GovernanceAction(agent_id="agent-001", data_type="health_data", scope="billing"),
+]
+
+
+class TestEvaluateLean:
+    @pytest.mark.parametrize("action", _LEAN_ACTIONS)
+    def test_matches_evaluate_sync(
+        self, engine_with_agent: GovernanceEngine, action: GovernanceAction
+    ) -> None:
+        expected = engine_with_agent.evaluate_sync(action)
+        lean = engine_with_agent.evaluate_lean(action)
+        model = lean.to_model()
+        assert isinstance(model, GovernanceDecision)
+        assert model.outcome == expected.outcome
+        assert model.allowed is expected.allowed
+        assert model.reasons == expected.reasons
+        assert model.audit_record_id == lean.audit_record_id
+
+    def test_audit_record_materialises_on_read(
+        self, engine_with_agent: GovernanceEngine
+    ) -> None:
+        sync_decision = engine_with_agent.evaluate_sync(_LEAN_ACTIONS[0])
+        lean = engine_with_agent.evaluate_lean(_LEAN_ACTIONS[0])
+        eager, deferred = engine_with_agent.audit.latest(2)
+        assert eager.record_id == sync_decision.audit_record_id
+        assert deferred.record_id == lean.audit_record_id
+        assert deferred.reasons == eager.reasons
+        assert deferred.decision == eager.decision
+        assert deferred.context == eager.context
+        assert deferred.timestamp >= eager.timestamp
+        assert engine_with_agent.audit.latest(1)[0] is deferred
+
+    def test_reasons_are_not_rendered_until_read(
+        self, engine_with_agent: GovernanceEngine
+    ) -> None:
+        lean = engine_with_agent.evaluate_lean(_LEAN_ACTIONS[0])
+        assert not any(part.resolved for part in lean._reasons)
+        assert lean.reasons[0].startswith("Agent 'agent-001'")
+        assert all(part.resolved for part in lean._reasons)
+
+    def test_reserve_and_consent_denial_release(
+        self, engine_with_agent: GovernanceEngine
+    ) -> None:
+        action = GovernanceAction(agent_id="agent-001", budget_category="llm", budget_amount=60.0)
+        lean = engine_with_agent.evaluate_lean(action, reserve=True)
+        assert lean.reserved is True
+        assert engine_with_agent.evaluate_lean(action, reserve=True).allowed is False
+        engine_with_agent.cancel(lean.audit_record_id)
+
+        denied = engine_with_agent.evaluate_lean(
+            action.model_copy(update={"data_type": "health_data"}), reserve=True
+        )
+        assert denied.allowed is False
+        assert denied.reserved is False
+        assert engine_with_agent.budget.check_budget("llm", 100.0).allowed is True
+
+
+# ---------------------------------------------------------------------------
+# TestWriteBehindAudit
+# ---------------------------------------------------------------------------
+
+
+class TestWriteBehindAudit:
+    def test_flush_makes_records_visible_with_preassigned_ids(self) -> None:
+        engine = GovernanceEngine(
+            GovernanceConfig(write_behind=WriteBehindConfig(enabled=True, batch_size=4))
+        )
+        engine.trust.set_level("agent-001", TrustLevel.L3_ACT_APPROVE)
+        action = GovernanceAction(
+            agent_id="agent-001", required_trust_level=TrustLevel.L2_SUGGEST
+        )
+        decisions = [engine.evaluate_sync(action) for _ in range(10)]
+        decisions += engine.evaluate_many_sync([action, action])
+        decisions.append(engine.evaluate_lean(action).to_model())
+        assert engine.flush(timeout=5.0) is True
+
+        records = engine.audit.query().records
+        assert [r.record_id for r in records] == [d.audit_record_id for d in decisions]
+        assert records[0].reasons == decisions[0].reasons
+        assert records[0].context is not None
+        assert records[0].context.agent_id == "agent-001"
+        stats = engine.write_behind_stats()
+        assert stats["written"] == len(decisions)
+        assert stats["dropped"] == 0
+        engine.close()
+
+    def test_block_policy_never_drops(self) -> None:
+        engine = GovernanceEngine(
+            GovernanceConfig(
+                write_behind=WriteBehindConfig(enabled=True, queue_size=2, batch_size=1)
+            )
+        )
+        action = GovernanceAction(agent_id="agent-001")
+        for _ in range(200):
+            engine.evaluate_sync(action)
+        assert engine.close(timeout=5.0) is True
+        assert engine.audit.count() == 200
+        assert engine.write_behind_stats()["dropped"] == 0
+
+    @pytest.mark.parametrize("policy", ["drop_oldest", "drop_newest"])
+    def test_drop_policies_count_discarded_entries(self, policy: str) -> None:
+        release = threading.Event()
+        stored: list[str] = []
+
+        def slow_sink(batch: object) -> None:
+            release.wait(5.0)
+            stored.extend(entry.record_id for entry in batch)  # type: ignore[attr-defined]
+
+        engine = GovernanceEngine()
+        writer = AuditWriteBehind(
+            WriteBehindConfig(enabled=True, queue_size=3, batch_size=1, policy=policy),
+            slow_sink,
+        )
+        records = [
+            engine.audit.log(outcome=GovernanceOutcome.ALLOW, decision=str(i)) for i in range(8)
+        ]
+        for record in records:
+            writer.submit(record)
+        release.set()
+        writer.close(timeout=5.0)
+
+        stats = writer.stats()
+        assert stats["dropped"] > 0
+        assert stats["written"] + stats["dropped"] == 8
+        assert len(stored) == stats["written"]
+        # drop_newest keeps the earliest entries, drop_oldest the latest.
+        kept_last = stored[-1] == records[-1].record_id
+        assert kept_last is (policy == "drop_oldest")
+
+    def test_closed_engine_rejects_evaluation(self) -> None:
+        engine = GovernanceEngine(GovernanceConfig(write_behind=WriteBehindConfig(enabled=True)))
+        engine.close()
+        with pytest.raises(RuntimeError):
+            engine.evaluate_sync(GovernanceAction(agent_id="agent-001"))
+
+
+# ---------------------------------------------------------------------------
+# TestSharedMemoryCategoryTracker
+# ---------------------------------------------------------------------------
+
+
+def _shared_budget_worker(path: str, attempts: int, results: object) -> None:
+    """Reserve 1.0 at a time from a shared budget; report how many succeeded."""
+    manager = BudgetManager(tracker=SharedMemoryCategoryTracker(path))
+    manager.create_budget("shared", limit=150.0, period="monthly")
+    allowed = 0
+    for attempt in range(attempts):
+        reservation_id = f"{id(manager)}-{attempt}"
+        if manager.reserve("shared", 1.0, reservation_id).allowed:
+            allowed += 1
+            manager.settle(reservation_id, 1.0)
+    results.put(allowed)  # type: ignore[attr-defined]
+
+
+def _abandoned_reservation_worker(path: str) -> None:
+    """Reserve from a shared budget and exit without settling."""
+    manager = BudgetManager(tracker=SharedMemoryCategoryTracker(path))
+    manager.reserve("shared", 40.0, "abandoned")
+    os._exit(0)
+
+
+class TestSharedMemoryCategoryTracker:
+    @pytest.fixture
+    def table_path(self, tmp_path: Path) -> str:
+        return str(tmp_path / "budgets")
+
+    def test_managers_share_counters(self, table_path: str) -> None:
+        first = BudgetManager(tracker=SharedMemoryCategoryTracker(table_path))
+        second = BudgetManager(tracker=SharedMemoryCategoryTracker(table_path))
+        first.create_budget("llm", limit=10.0, period="monthly")
+        second.create_budget("llm", limit=10.0, period="monthly")
+
+        first.record_spending("llm", 4.0)
+        assert second.check_budget("llm", 0.0).spent == pytest.approx(4.0)
+        assert second.reserve("llm", 6.0, "r-1").allowed is True
+        assert first.check_budget("llm", 0.1).allowed is False
+        with pytest.raises(BudgetExceededError):
+            first.record_spending("llm", 1.0)
+        second.cancel("r-1")
+        assert first.get_utilization("llm") == pytest.approx(0.4)
+
+    def test_lookup_attaches_categories_created_elsewhere(self, table_path: str) -> None:
+        creator = BudgetManager(tracker=SharedMemoryCategoryTracker(table_path))
+        creator.create_budget("tools", limit=5.0, period="daily")
+        reader = BudgetManager(tracker=SharedMemoryCategoryTracker(table_path))
+        assert reader.list_categories() == ["tools"]
+        assert reader.check_budget("tools", 5.0).allowed is True
+        with pytest.raises(ValueError):
+            reader.create_budget("tools", limit=6.0, period="daily")
+
+    def test_rejects_foreign_file(self, table_path: str) -> None:
+        with open(table_path, "wb") as handle:
+            handle.write(b"not a budget table")
+        with pytest.raises(ValueError):
+            SharedMemoryCategoryTracker(table_path)
+
+    def test_concurrent_processes_never_overshoot(self, table_path: str) -> None:
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("requires the fork start method")
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        workers = [
+            context.Process(target=_shared_budget_worker, args=(table_path, 100, results))
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+            assert worker.exitcode == 0
+
+        assert sum(results.get(timeout=5) for _ in workers) == 150
+
+        tracker = SharedMemoryCategoryTracker(table_path)
+        envelope = tracker.get("shared")
+        assert envelope is not None
+        assert envelope.spent == pytest.approx(150.0)
+        assert envelope.reserved == pytest.approx(0.0)
+        tracker.close()
+
+    def test_exited_process_reservations_are_reclaimed(self, table_path: str) -> None:
+        tracker = SharedMemoryCategoryTracker(table_path)
+        manager = BudgetManager(tracker=tracker)
+        manager.create_budget("shared", limit=100.0, period="monthly")
+        manager.reserve("shared", 10.0, "kept")
+
+        envelope = tracker.get("shared")
+        assert envelope is not None
+        context = multiprocessing.get_context("fork")
+        worker = context.Process(target=_abandoned_reservation_worker, args=(table_path,))
+        worker.start()
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+        assert envelope.reserved == pytest.approx(50.0)
+
+        # Attaching reclaims the abandoned hold...
+        SharedMemoryCategoryTracker(table_path).close()
+        assert envelope.reserved == pytest.approx(10.0)
+        # ...and so does resetting the period.
+        worker = context.Process(target=_abandoned_reservation_worker, args=(table_path,))
+        worker.start()
+        worker.join(timeout=30)
+        assert envelope.reserved == pytest.approx(50.0)
+        with tracker.lock("shared"):
+            tracker.reset("shared", 100.0)
+        assert envelope.reserved == pytest.approx(10.0)
+        manager.cancel("kept")
+        assert envelope.reserved == pytest.approx(0.0)
+        tracker.close()
+
+    def test_trackers_on_one_path_share_thread_locks(self, table_path: str) -> None:
+        first = SharedMemoryCategoryTracker(table_path)
+        first.create("shared", 10.0, "monthly")
+        second = SharedMemoryCategoryTracker(table_path)
+        second.get("shared")
+        with first.lock("shared"):
+            assert not second.lock("shared")._thread_lock.acquire(blocking=False)
+        first.close()
+        second.close()
+
+
+# ---------------------------------------------------------------------------
+# TestEvaluationStages
+# ---------------------------------------------------------------------------
+
+
+class _QuotaStage(GovernanceStage):
+    """Custom stage allowing a fixed number of actions per agent."""
+
+    name = "quota"
+
+    def __init__(self, per_agent: int) -> None:
+        self.per_agent = per_agent
+        self.seen: dict[str, int] = {}
+
+    def check(self, action: GovernanceAction, context: StageContext) -> tuple[bool, str]:
+        count = self.seen.get(action.agent_id, 0) + 1
+        self.seen[action.agent_id] = count
+        if count > self.per_agent:
+            return False, f"quota exceeded for {action.agent_id}"
+        return True, f"quota {count}/{self.per_agent}"
+
+
+class TestEvaluationStages:
+    def test_builtin_order_is_fixed(self, engine: GovernanceEngine) -> None:
+        assert engine.stage_names() == ["trust", "budget", "consent"]
+
+    def test_stats_are_not_collected_by_default(self, engine_with_agent: GovernanceEngine) -> None:
+        engine_with_agent.evaluate_sync(
+            GovernanceAction(agent_id="agent-001", required_trust_level=TrustLevel.L1_MONITOR)
+        )
+        assert engine_with_agent.stage_stats()["trust"]["invocations"] == 0
+
+    def test_custom_stage_short_circuits_and_is_audited(self) -> None:
+        engine = GovernanceEngine(GovernanceConfig(stages=StageConfig(collect_stats=True)))
+        engine.trust.set_level("agent-001", TrustLevel.L3_ACT_APPROVE)
+        engine.register_stage(_QuotaStage(1), before="trust")
+        assert engine.stage_names()[0] == "quota"
+        action = GovernanceAction(
+            agent_id="agent-001", required_trust_level=TrustLevel.L2_SUGGEST
+        )
+        first = engine.evaluate_sync(action)
+        second = engine.evaluate_sync(action)
+        assert first.allowed is True
+        assert first.reasons[0] == "quota 1/1"
+        assert second.allowed is False
+        assert second.reasons == ["quota exceeded for agent-001"]
+        assert engine.audit.latest(1)[0].reasons == second.reasons
+
+        stats = engine.stage_stats()
+        assert stats["quota"]["invocations"] == 2
+        assert stats["quota"]["denials"] == 1
+        assert stats["trust"]["invocations"] == 1
+        assert stats["consent"]["invocations"] == 0
+
+    def test_later_denial_rolls_back_reservation(
+        self, engine_with_agent: GovernanceEngine
+    ) -> None:
+        engine_with_agent.register_stage(_QuotaStage(0))
+        action = GovernanceAction(agent_id="agent-001", budget_category="llm", budget_amount=80.0)
+        for evaluate in (engine_with_agent.evaluate_sync, engine_with_agent.evaluate_lean):
+            decision = evaluate(action, reserve=True)
+            assert decision.allowed is False
+            assert decision.reserved is False
+        assert engine_with_agent.budget.check_budget("llm", 100.0).allowed is True
+
+    def test_custom_stage_runs_per_action_in_batches(
+        self, engine_with_agent: GovernanceEngine
+    ) -> None:
+        engine_with_agent.register_stage(_QuotaStage(2))
+        action = GovernanceAction(agent_id="agent-001")
+        decisions = engine_with_agent.evaluate_many_sync([action] * 3)
+        assert [d.allowed for d in decisions] == [True, True, False]
+
+    def test_invalid_registration_raises(self, engine: GovernanceEngine) -> None:
+        with pytest.raises(ConfigurationError):
+            engine.register_stage(_QuotaStage(1), before="missing")
+        engine.register_stage(_QuotaStage(1))
+        with pytest.raises(ConfigurationError):
+            engine.register_stage(_QuotaStage(1))
+        with pytest.raises(ConfigurationError):
+            engine.unregister_stage("budget")
+        engine.unregister_stage("quota")
+        assert engine.stage_names() == ["trust", "budget", "consent"]
+
+
+# ---------------------------------------------------------------------------
+# Latency instrumentation
+# ---------------------------------------------------------------------------
+
+
+class TestInstrumentation:
+    def test_histogram_percentiles_are_bucket_bounded(self) -> None:
+        histogram = LatencyHistogram()
+        for value in range(1, 1001):
+            histogram.record(value * 1_000)
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 1000
+        assert snapshot["min_ns"] == 1_000
+        assert snapshot["max_ns"] == 1_000_000
+        assert snapshot["p50_ns"] == pytest.approx(500_000, rel=0.07)
+        assert snapshot["p99_ns"] == pytest.approx(990_000, rel=0.07)
+        histogram.reset()
+        assert histogram.snapshot()["count"] == 0
+
+    def test_disabled_engine_installs_no_wrappers(self, engine: GovernanceEngine) -> None:
+        assert engine.instrumentation is None
+        assert engine.latency_stats() == {}
+        assert "check_budget" not in vars(engine.budget)
+
+    def test_engine_records_operations_and_stages(self) -> None:
+        engine = GovernanceEngine(
+            GovernanceConfig(instrumentation=InstrumentationConfig(enabled=True))
+        )
+        engine.trust.set_level("agent-001", TrustLevel.L3_ACT_APPROVE)
+        engine.budget.create_budget("llm", limit=10.0)
+        action = GovernanceAction(
+            agent_id="agent-001",
+            required_trust_level=TrustLevel.L2_SUGGEST,
+            budget_category="llm",
+            budget_amount=1.0,
+        )
+        engine.evaluate_sync(action)
+        engine.evaluate_lean(action)
+
+        stats = engine.latency_stats()
+        assert stats["engine.evaluate_sync"]["count"] == 1
+        assert stats["engine.evaluate_lean"]["count"] == 1
+        assert stats["budget.check_budget"]["count"] == 1
+        assert stats["budget.check_budget_lean"]["count"] == 1
+        assert stats["stage.trust"]["count"] == 2
+        assert stats["audit.log"]["count"] == 1
+        # Stage counters stay off unless requested separately.
+        assert engine.stage_stats()["trust"]["invocations"] == 0
+
+    def test_prometheus_rendering(self) -> None:
+        instrumentation = Instrumentation()
+        manager = BudgetManager(instrumentation=instrumentation)
+        manager.create_budget("llm", limit=10.0)
+        manager.check_budget("llm", 1.0)
+        manager.check_budget("llm", 2.0)
+        text = instrumentation.render_prometheus()
+        metric = "aumos_governance_operation_duration_seconds"
+        assert text.startswith(f"# HELP {metric}")
+        assert f"# TYPE {metric} histogram" in text
+        assert f'{metric}_bucket{{operation="budget.check_budget",le="+Inf"}} 2' in text
+        assert f'{metric}_count{{operation="budget.check_budget"}} 2' in text
+        assert text.endswith("\n")
+
+
+# ---------------------------------------------------------------------------
+# Copy-on-write snapshots
+# ---------------------------------------------------------------------------
+
+
+class TestPolicySnapshots:
+    def test_set_level_publishes_new_snapshot_and_keeps_last_active(self) -> None:
+        trust_manager = TrustManager()
+        trust_manager.set_level("agent-001", TrustLevel.L2_SUGGEST)
+        before = trust_manager._store
+        entry = before[("agent-001", None)]
+        trust_manager.set_level("agent-001", TrustLevel.L4_ACT_REPORT)
+        assert trust_manager._store is not before
+        assert before[("agent-001", None)].level == TrustLevel.L2_SUGGEST
+        assert trust_manager._store[("agent-001", None)].last_active == entry.last_active
+
+    def test_consent_snapshot_is_point_in_time(self) -> None:
+        store = ConsentStore()
+        store.put(ConsentRecord(agent_id="a", data_type="pii", granted_by="admin"))
+        snapshot = store.snapshot()
+        store.put(ConsentRecord(agent_id="b", data_type="pii", granted_by="admin"))
+        assert store.remove_all_for_agent("a") == 1
+        assert list(snapshot) == [("a", "pii", None)]
+        assert store.count() == 1
+        with pytest.raises(TypeError):
+            snapshot[("c", "pii", None)] = snapshot[("a", "pii", None)]  # type: ignore[index]
+
+    def test_readers_never_fail_during_concurrent_writes(self) -> None:
+        trust = TrustManager()
+        consent = ConsentManager()
+        stop = threading.Event()
+        errors: list[BaseException] = []
+
+        def writer() -> None:
+            for i in range(2_000):
+                trust.set_level(f"agent-{i % 50}", TrustLevel.L3_ACT_APPROVE, scope=f"s{i % 3}")
+                consent.record_consent(f"agent-{i % 50}", "pii", None, granted_by="admin")
+                if i % 7 == 0:
+                    trust.remove(f"agent-{(i * 3) % 50}", scope=f"s{i % 3}")
+                    consent.revoke_all_for_agent(f"agent-{(i * 5) % 50}")
+            stop.set()
+
+        def reader() -> None:
+            try:
+                while not stop.is_set():
+                    trust.list_agents()
+                    trust.check_level("agent-7", TrustLevel.L1_MONITOR, scope="s1")
+                    consent.list_consents("agent-7")
+                    consent.check_consent("agent-7", "pii")
+            except BaseException as exc:  # pragma: no cover - surfaced below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        threads.append(threading.Thread(target=writer))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+
+
+# ---------------------------------------------------------------------------
+# Transaction retention
+# ---------------------------------------------------------------------------
+
+
+class TestTransactionRetention:
+    def test_default_keeps_every_transaction(self) -> None:
+        manager = BudgetManager()
+        manager.create_budget("llm", limit=1_000.0)
+        for amount in (1.0, 2.0, 3.0):
+            manager.record_spending("llm", amount)
+        envelope = manager._tracker.get("llm")
+        assert envelope is not None
+        assert [t.amount for t in envelope.transactions] == [1.0, 2.0, 3.0]
+
+    def test_bounded_log_keeps_exact_aggregates(self) -> None:
+        manager = BudgetManager(
+            BudgetConfig(retention=TransactionRetentionConfig(max_transactions=2))
+        )
+        manager.create_budget("llm", limit=1_000.0)
+        for amount in (5.0, 1.0, 3.0, 2.0):
+            manager.record_spending("llm", amount)
+        envelope = manager._tracker.get("llm")
+        assert envelope is not None
+        assert [t.amount for t in envelope.transactions] == [3.0, 2.0]
+
+        stats = manager.spending_stats("llm")
+        assert stats["count"] == 4
+        assert stats["total"] == 11.0
+        assert stats["min"] == 1.0
+        assert stats["max"] == 5.0
+        assert stats["retained"] == 2
+        assert sum(bucket["count"] for bucket in stats["hourly"]) == 4  # type: ignore[attr-defined]
+        assert manager.summary()[0]["transaction_count"] == 4
+
+    def test_evicted_transactions_are_spilled(self, tmp_path: Path) -> None:
+        spill = tmp_path / "spill.jsonl"
+        retention = TransactionRetentionConfig(max_transactions=1, spill_path=str(spill))
+        manager = BudgetManager(BudgetConfig(retention=retention))
+        manager.create_budget("llm", limit=1_000.0)
+        for amount in (1.0, 2.0, 3.0):
+            manager.record_spending("llm", amount, description=f"call {amount}")
+        manager._tracker.close()
+        lines = [json.loads(line) for line in spill.read_text().splitlines()]
+        assert [line["amount"] for line in lines] == [1.0, 2.0]
+        assert lines[0]["category"] == "llm"
+
+    def test_spilled_transactions_are_written_in_batches(self, tmp_path: Path) -> None:
+        spill = tmp_path / "spill.jsonl"
+        retention = TransactionRetentionConfig(
+            max_transactions=1, spill_path=str(spill), spill_batch_size=2
+        )
+        manager = BudgetManager(BudgetConfig(retention=retention))
+        manager.create_budget("llm", limit=1_000.0)
+        for amount in (1.0, 2.0, 3.0, 4.0):
+            manager.record_spending("llm", amount)
+        # Three evicted, one batch of two written.
+        assert len(spill.read_text().splitlines()) == 2
+        # A period reset writes the retained transaction and the buffer.
+        with manager._tracker.lock("llm"):
+            manager._tracker.reset("llm", 1_000.0)
+        assert len(spill.read_text().splitlines()) == 4
+        manager.close()
+
+    def test_unknown_category_stats_raise(self) -> None:
+        with pytest.raises(BudgetNotFoundError):
+            BudgetManager().spending_stats("missing")
+
+
+# ---------------------------------------------------------------------------
+# Budget period resets
+# ---------------------------------------------------------------------------
+
+
+class TestBudgetResets:
+    def test_envelope_carries_reset_deadline(self) -> None:
+        manager = BudgetManager()
+        manager.create_budget("daily", limit=10.0, period="daily")
+        manager.create_budget("forever", limit=10.0, period="lifetime")
+        daily = manager._tracker.get("daily")
+        forever = manager._tracker.get("forever")
+        assert daily is not None and forever is not None
+        assert daily.next_reset_at == reset_deadline("daily", date.today())
+        assert forever.next_reset_at == NEVER_RESETS
+
+    def test_check_budget_applies_due_reset(self) -> None:
+        manager = BudgetManager()
+        manager.create_budget("llm", limit=10.0, period="daily")
+        manager.record_spending("llm", 8.0)
+        envelope = manager._tracker.get("llm")
+        assert envelope is not None
+        envelope.last_reset = date.today() - timedelta(days=2)
+        result = manager.check_budget("llm", 5.0)
+        assert result.allowed is True
+        assert result.spent == 0.0
+        assert envelope.last_reset == date.today()
+
+    def test_scheduler_resets_due_categories(self) -> None:
+        manager = BudgetManager(
+            BudgetConfig(reset_scheduler=ResetSchedulerConfig(enabled=True, tick_seconds=3600))
+        )
+        try:
+            manager.create_budget("daily", limit=10.0, period="daily")
+            manager.create_budget("forever", limit=10.0, period="lifetime")
+            manager.record_spending("daily", 4.0)
+            manager.record_spending("forever", 4.0)
+            scheduler = manager._scheduler
+            assert scheduler is not None
+            assert scheduler.stats()["scheduled"] == 1
+
+            daily = manager._tracker.get("daily")
+            assert daily is not None
+            assert scheduler.run_pending(now=daily.next_reset_at - 1) == 0
+            assert scheduler.run_pending(now=daily.next_reset_at + 1) == 1
+            assert daily.spent == 0.0
+            assert manager.check_budget("forever", 1.0).spent == 4.0
+            assert scheduler.stats()["scheduled"] == 1
+        finally:
+            manager.close()
+
+    def test_timer_wheel_fires_in_order_across_levels(self) -> None:
+        wheel: TimerWheel[str] = TimerWheel(now=1_000, levels=2, slot_bits=2)
+        wheel.schedule("soon", 1_002)
+        wheel.schedule("later", 1_013)
+        wheel.schedule("far", 1_500)
+        wheel.schedule("cancelled", 1_003)
+        assert wheel.cancel("cancelled") is True
+        assert wheel.advance(1_001) == []
+        assert wheel.advance(1_012) == [("soon", 1_002)]
+        assert wheel.advance(1_013) == [("later", 1_013)]
+        assert wheel.advance(1_499) == []
+        assert wheel.advance(2_000) == [("far", 1_500)]
+        assert len(wheel) == 0
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+
+class TestPersistence:
+    @pytest.fixture
+    def journal_config(self, tmp_path: Path) -> GovernanceConfig:
+        journal = tmp_path / "state.journal"
+        return GovernanceConfig(persistence=PersistenceConfig(journal_path=str(journal)))
+
+    def test_state_survives_restart(self, journal_config: GovernanceConfig) -> None:
+        engine = GovernanceEngine(journal_config)
+        engine.trust.set_level("agent-a", TrustLevel.L3_ACT_APPROVE)
+        engine.trust.set_level("agent-b", TrustLevel.L2_SUGGEST, scope="billing")
+        engine.trust.set_level("agent-c", TrustLevel.L4_ACT_REPORT)
+        engine.trust.remove("agent-c")
+        engine.budget.create_budget("llm", limit=10.0, period="monthly")
+        engine.budget.record_spending("llm", 2.5)
+        engine.budget.record_spending("llm", 1.5)
+        engine.consent.record_consent("agent-a", "user_data", "support", granted_by="admin")
+        engine.consent.record_consent("agent-b", "user_data", None, granted_by="admin")
+        engine.consent.revoke_all_for_agent("agent-b")
+        engine.close()
+
+        restarted = GovernanceEngine(journal_config)
+        try:
+            assert restarted.trust.get_level("agent-a") == TrustLevel.L3_ACT_APPROVE
+            assert restarted.trust.get_level("agent-b", scope="billing") == TrustLevel.L2_SUGGEST
+            assert restarted.trust.list_agents() == ["agent-a", "agent-b"]
+            assert restarted.budget.check_budget("llm", 1.0).spent == 4.0
+            restarted.budget.create_budget("llm", limit=10.0, period="monthly")
+            with pytest.raises(ValueError):
+                restarted.budget.create_budget("llm", limit=10.0, period="monthly")
+            assert restarted.budget.check_budget("llm", 1.0).spent == 4.0
+            assert restarted.consent.check_consent("agent-a", "user_data", "support").granted
+            assert restarted.consent.list_consents("agent-b") == []
+        finally:
+            restarted.close()
+
+    def test_checkpoint_compacts_the_journal(
+        self, tmp_path: Path, journal_config: GovernanceConfig
+    ) -> None:
+        journal = tmp_path / "state.journal"
+        engine = GovernanceEngine(journal_config)
+        engine.budget.create_budget("llm", limit=100.0, period="monthly")
+        for _ in range(50):
+            engine.budget.record_spending("llm", 1.0)
+        engine.trust.set_level("agent-a", TrustLevel.L3_ACT_APPROVE)
+        engine.checkpoint()
+        engine.budget.record_spending("llm", 1.0)
+        engine.close()
+
+        lines = journal.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+        restarted = GovernanceEngine(journal_config)
+        try:
+            assert restarted.budget.check_budget("llm", 1.0).spent == 51.0
+            assert restarted.trust.get_level("agent-a") == TrustLevel.L3_ACT_APPROVE
+        finally:
+            restarted.close()
+
+    def test_checkpoint_runs_concurrently_with_consent_writes(
+        self, journal_config: GovernanceConfig
+    ) -> None:
+        engine = GovernanceEngine(journal_config)
+        stop = threading.Event()
+
+        def checkpoint() -> None:
+            while not stop.is_set():
+                engine.checkpoint()
+
+        def grant(writer: int) -> None:
+            for index in range(300):
+                engine.consent.record_consent(
+                    agent_id=f"agent-{writer}-{index % 20}",
+                    data_type=f"type-{index}",
+                    purpose=None,
+                    granted_by="admin",
+                )
+                if index % 3 == 0:
+                    engine.consent.revoke_consent(f"agent-{writer}-{index % 20}", f"type-{index}")
+
+        checkpointer = threading.Thread(target=checkpoint, daemon=True)
+        writers = [threading.Thread(target=grant, args=(n,), daemon=True) for n in range(2)]
+        checkpointer.start()
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join(timeout=10)
+        stop.set()
+        checkpointer.join(timeout=10)
+        assert not any(thread.is_alive() for thread in [checkpointer, *writers])
+
+        expected = engine.consent.count_active()
+        engine.close()
+        restarted = GovernanceEngine(journal_config)
+        try:
+            assert expected == 400
+            assert restarted.consent.count_active() == expected
+        finally:
+            restarted.close()
+
+    def test_torn_final_line_is_skipped(self, tmp_path: Path) -> None:
+        journal = tmp_path / "state.journal"
+        backend = JournalBackend(journal, fsync_interval_seconds=0)
+        manager = TrustManager(backend=backend)
+        manager.set_level("agent-a", TrustLevel.L3_ACT_APPROVE)
+        backend.close()
+        with journal.open("a", encoding="utf-8") as handle:
+            handle.write('{"op":"trust.set","agent_id":"agent-b","sco')
+
+        backend = JournalBackend(journal)
+        try:
+            restored = TrustManager(backend=backend)
+            assert restored.list_agents() == ["agent-a"]
+        finally:
+            backend.close()
+
+    def test_backend_and_journal_path_are_exclusive(self, tmp_path: Path) -> None:
+        backend = JournalBackend(tmp_path / "a.journal")
+        try:
+            with pytest.raises(ConfigurationError):
+                GovernanceEngine(
+                    GovernanceConfig(
+                        persistence=PersistenceConfig(journal_path=str(tmp_path / "b.journal"))
+                    ),
+                    persistence=backend,
+                )
+        finally:
+            backend.close()
+
+
+# ---------------------------------------------------------------------------
+# Columnar budgets
+# ---------------------------------------------------------------------------
+
+
+class TestColumnarBudgets:
+    @pytest.fixture
+    def managers(self) -> tuple[BudgetManager, BudgetManager]:
+        pytest.importorskip("numpy")
+
+        managers = (BudgetManager(), BudgetManager(tracker=ColumnarCategoryTracker()))
+        for manager in managers:
+            for i in range(10):
+                manager.create_budget(f"tenant-{i}", limit=float(10 + i), period="monthly")
+            manager.create_budget("empty", limit=0.0, period="lifetime")
+            for i in range(10):
+                manager.record_spending(f"tenant-{i}", float(i) + 0.5)
+        return managers
+
+    def test_matches_the_default_tracker(
+        self, managers: tuple[BudgetManager, BudgetManager]
+    ) -> None:
+        plain, columnar = managers
+        assert columnar.list_categories() == plain.list_categories()
+        assert columnar.summary() == plain.summary()
+        assert columnar.utilizations() == plain.utilizations()
+        assert columnar.top_k_by_utilization(3) == plain.top_k_by_utilization(3)
+        assert columnar.top_k_by_utilization(100) == plain.top_k_by_utilization(100)
+        assert columnar.top_k_by_utilization(0) == []
+        assert columnar.check_budget("tenant-9", 1.0) == plain.check_budget("tenant-9", 1.0)
+
+    def test_uncharged_categories_have_no_envelope_objects(self) -> None:
+        pytest.importorskip("numpy")
+
+        tracker = ColumnarCategoryTracker()
+        manager = BudgetManager(tracker=tracker)
+        for i in range(5_000):
+            manager.create_budget(f"category-{i}", limit=1.0)
+        manager.record_spending("category-4999", 0.5)
+        assert list(tracker._envelopes) == ["category-4999"]
+        assert manager.top_k_by_utilization(1) == [("category-4999", 0.5)]
+        assert tracker.columns()["spent"].sum() == 0.5
+
+    def test_record_spending_many_is_all_or_nothing(
+        self, managers: tuple[BudgetManager, BudgetManager]
+    ) -> None:
+        for manager in managers:
+            with pytest.raises(BudgetExceededError):
+                manager.record_spending_many(["tenant-0", "tenant-1", "tenant-0"], [5.0, 1.0, 5.0])
+            assert manager.check_budget("tenant-0", 1.0).spent == 0.5
+            assert manager.check_budget("tenant-1", 1.0).spent == 1.5
+
+            transactions = manager.record_spending_many(
+                ["tenant-0", "tenant-1", "tenant-0"], [4.0, 1.0, 5.0]
+            )
+            assert [t.category for t in transactions] == ["tenant-0", "tenant-1", "tenant-0"]
+            assert manager.check_budget("tenant-0", 0.1).spent == 9.5
+            with pytest.raises(BudgetNotFoundError):
+                manager.record_spending_many(["missing"], [1.0])
+
+    def test_restores_from_persistence(self, tmp_path: Path) -> None:
+        pytest.importorskip("numpy")
+
+        backend = JournalBackend(tmp_path / "state.journal")
+        manager = BudgetManager(tracker=ColumnarCategoryTracker(backend=backend))
+        manager.create_budget("llm", limit=10.0)
+        manager.record_spending("llm", 3.0)
+        backend.close()
+
+        backend = JournalBackend(tmp_path / "state.journal")
+        try:
+            restored = BudgetManager(tracker=ColumnarCategoryTracker(backend=backend))
+            restored.create_budget("llm", limit=10.0)
+            assert restored.check_budget("llm", 1.0).spent == 3.0
+        finally:
+            backend.close()
+
+
+def _consent_record(
+    agent_id: str, data_type: str, expires_in: float | None = None
+) -> ConsentRecord:
+    """A grant expiring ``expires_in`` seconds from now, or never."""
+    expires_at = None
+    if expires_in is not None:
+        expires_at = datetime.now(tz=timezone.utc) + timedelta(seconds=expires_in)
+    return ConsentRecord(
+        agent_id=agent_id, data_type=data_type, granted_by="admin", expires_at=expires_at
+    )
+
+
+class TestConsentIndexes:
+    def test_agent_operations_only_touch_that_agent(self) -> None:
+        store = ConsentStore()
+        for agent in ("agent-a", "agent-b"):
+            for data_type in ("email", "phone", "address"):
+                store.put(_consent_record(agent, data_type))
+        assert {r.data_type for r in store.list_for_agent("agent-a")} == {
+            "email", "phone", "address"
+        }
+        assert store.remove_all_for_agent("agent-a") == 3
+        assert store.list_for_agent("agent-a") == []
+        assert store.find("agent-a", "email") is None
+        assert store.find("agent-b", "email") is not None
+        assert store.count() == 3
+        assert len(store.snapshot()) == 3
+
+    def test_expired_grants_are_evicted(self) -> None:
+        store = ConsentStore()
+        store.put(_consent_record("agent-a", "email", expires_in=-1))
+        store.put(_consent_record("agent-a", "phone", expires_in=60))
+        store.put(_consent_record("agent-b", "email"))
+        # The expired grant was evicted by the following writes.
+        assert [r.data_type for r in store.list_for_agent("agent-a")] == ["phone"]
+        assert store.count() == 2
+
+        later = datetime.now(tz=timezone.utc) + timedelta(seconds=120)
+        assert store.purge_expired(now=later) == 1
+        assert store.list_for_agent("agent-a") == []
+        assert store.count() == 1
+        assert store.purge_expired(now=later) == 0
+
+    def test_replaced_grant_is_not_evicted_by_old_expiry(self) -> None:
+        store = ConsentStore()
+        store.put(_consent_record("agent-a", "email", expires_in=60))
+        store.put(_consent_record("agent-a", "email"))
+        later = datetime.now(tz=timezone.utc) + timedelta(seconds=120)
+        assert store.purge_expired(now=later) == 0
+        assert store.find("agent-a", "email") is not None
+        assert store.count() == 1
+
+    def test_manager_purge_and_count(self) -> None:
+        manager = ConsentManager()
+        past = datetime.now(tz=timezone.utc) - timedelta(seconds=1)
+        manager.record_consent("agent-a", "email", None, granted_by="admin", expires_at=past)
+        assert manager.purge_expired() == 1
+        manager.record_consent("agent-a", "phone", None, granted_by="admin")
+        assert manager.count_active() == 1
+
+
+class TestHierarchicalConsent:
+    def test_wildcard_data_type_covers_descendants_only(self) -> None:
+        manager = ConsentManager()
+        manager.record_consent("agent-a", "pii.*", None, granted_by="admin")
+        assert manager.check_consent("agent-a", "pii.email").granted
+        assert manager.check_consent("agent-a", "pii.email.work", "support").granted
+        assert not manager.check_consent("agent-a", "pii").granted
+        assert not manager.check_consent("agent-a", "billing.invoice").granted
+
+    def test_most_specific_grant_wins(self) -> None:
+        manager = ConsentManager()
+        manager.record_consent("agent-a", "*", None, granted_by="root")
+        manager.record_consent("agent-a", "pii.*", None, granted_by="pii-owner")
+        manager.record_consent("agent-a", "pii.*", "support.*", granted_by="support-lead")
+        manager.record_consent("agent-a", "pii.email", "marketing", granted_by="marketer")
+
+        def granted_by(data_type: str, purpose: str | None) -> str | None:
+            record = manager.check_consent("agent-a", data_type, purpose).record
+            return record.granted_by if record is not None else None
+
+        assert granted_by("pii.email", "marketing") == "marketer"
+        # The exact data type has no grant for this purpose, so the wildcard
+        # data type applies, where the purpose wildcard beats the blanket.
+        assert granted_by("pii.email", "support.billing") == "support-lead"
+        assert granted_by("pii.phone", "analytics") == "pii-owner"
+        assert granted_by("logs", None) == "root"
+
+    def test_expired_specific_grant_falls_back(self) -> None:
+        manager = ConsentManager()
+        past = datetime.now(tz=timezone.utc) - timedelta(seconds=1)
+        manager.record_consent("agent-a", "pii.*", None, granted_by="general")
+        manager.record_consent("agent-a", "pii.email", None, granted_by="specific", expires_at=past)
+        record = manager.check_consent("agent-a", "pii.email").record
+        assert record is not None and record.granted_by == "general"
+
+        manager.revoke_consent("agent-a", "pii.*")
+        assert not manager.check_consent("agent-a", "pii.email").granted
+
+    def test_wildcard_must_be_last_segment(self) -> None:
+        manager = ConsentManager()
+        with pytest.raises(ValueError):
+            manager.record_consent("agent-a", "pii.*.email", None, granted_by="admin")
+        with pytest.raises(ValueError):
+            manager.record_consent("agent-a", "pii", "*.billing", granted_by="admin")
+
+    def test_engine_consent_stage_uses_wildcards(self, engine: GovernanceEngine) -> None:
+        engine.trust.set_level("agent-a", TrustLevel.L3_ACT_APPROVE)
+        engine.consent.record_consent("agent-a", "pii.*", "support", granted_by="admin")
+        allowed = engine.evaluate_sync(
+            GovernanceAction(agent_id="agent-a", data_type="pii.email", purpose="support")
+        )
+        denied = engine.evaluate_sync(
+            GovernanceAction(agent_id="agent-a", data_type="pii.email", purpose="sales")
+        )
+        assert allowed.allowed
+        assert not denied.allowed
+
+
+def _consent_grants(agents: int) -> list[dict[str, object]]:
+    """Two grants per agent for ``bulk_load``; odd-numbered agents' expire in an hour."""
+    soon = datetime.now(tz=timezone.utc) + timedelta(hours=1)
+    return [
+        {
+            "agent_id": f"agent-{agent}",
+            "data_type": data_type,
+            "purpose": purpose,
+            "granted_by": "importer",
+            "expires_at": soon if agent % 2 else None,
+        }
+        for agent in range(agents)
+        for data_type, purpose in (("pii.*", None), ("logs", "support"))
+    ]
+
+
+class TestConsentBulkLoad:
+    def test_bulk_load_is_all_or_nothing(self) -> None:
+        manager = ConsentManager()
+        assert manager.bulk_load(_consent_grants(50)) == 100
+        assert manager.count_active() == 100
+        assert manager.check_consent("agent-3", "pii.email").granted
+        assert not manager.check_consent("agent-3", "logs").granted
+
+        invalid = [*_consent_grants(2), {"agent_id": "agent-x", "data_type": "", "granted_by": "x"}]
+        with pytest.raises(ValueError, match="position 4"):
+            manager.bulk_load(invalid)
+        assert manager.count_active() == 100
+
+    def test_snapshot_round_trip(self, tmp_path: Path) -> None:
+        source = ConsentManager()
+        source.bulk_load(_consent_grants(20))
+        assert source.export_snapshot(tmp_path / "consent.snap") == 40
+
+        loaded = ConsentManager()
+        loaded.record_consent("agent-0", "billing", None, granted_by="admin")
+        assert loaded.load_snapshot(tmp_path / "consent.snap") == 40
+        assert loaded.count_active() == 41
+
+        def contents(manager: ConsentManager, agent_id: str) -> list[tuple[object, ...]]:
+            return sorted(
+                (r.data_type, r.purpose or "", r.granted_at, r.expires_at or r.granted_at)
+                for r in manager.list_consents(agent_id)
+            )
+
+        for agent in range(1, 20):
+            assert contents(loaded, f"agent-{agent}") == contents(source, f"agent-{agent}")
+        assert loaded.check_consent("agent-0", "billing").granted
+        assert loaded.check_consent("agent-0", "pii.email").granted
+        assert loaded.revoke_all_for_agent("agent-5") == 2
+        assert loaded.count_active() == 39
+
+    def test_truncated_snapshot_is_rejected(self, tmp_path: Path) -> None:
+        path = tmp_path / "consent.snap"
+        source = ConsentManager()
+        source.bulk_load(_consent_grants(5))
+        source.export_snapshot(path)
+        data = path.read_bytes()
+        # Cut inside the string offset table (after the 20-byte header), then
+        # inside the rows.
+        for size in (28, len(data) - 1):
+            path.write_bytes(data[:size])
+            with pytest.raises(ValueError, match="truncated"):
+                ConsentManager().load_snapshot(path)
+
+    def test_corrupt_snapshot_indexes_are_rejected(self, tmp_path: Path) -> None:
+        path = tmp_path / "consent.snap"
+        source = ConsentManager()
+        source.bulk_load(_consent_grants(5))
+        source.export_snapshot(path)
+        data = path.read_bytes()
+        snapshot = ConsentSnapshot(path)
+        agents, rows = snapshot._agents, snapshot._rows
+        snapshot.close()
+
+        # The last agent's row count, then the first agent's name index.
+        for offset, value in ((rows - 12, 7), (agents, 999)):
+            corrupt = bytearray(data)
+            struct.pack_into("<I", corrupt, offset, value)
+            path.write_bytes(corrupt)
+            with pytest.raises(ValueError, match="corrupt"):
+                ConsentManager().load_snapshot(path)
+
+        # A row's data type index is only checked when its agent is decoded.
+        corrupt = bytearray(data)
+        struct.pack_into("<I", corrupt, rows, 999)
+        path.write_bytes(corrupt)
+        manager = ConsentManager()
+        assert manager.load_snapshot(path) == 10
+        with pytest.raises(ValueError, match="corrupt"):
+            manager.check_consent("agent-0", "pii.email")
+        assert manager.check_consent("agent-1", "pii.email").granted
+
+    def test_release_snapshots_closes_the_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "consent.snap"
+        source = ConsentManager()
+        source.bulk_load(_consent_grants(5))
+        source.export_snapshot(path)
+
+        manager = ConsentManager()
+        manager.load_snapshot(path)
+        snapshot = manager._store._snapshots[0]
+        entries = manager._store.state_entries()
+        next(entries)
+        manager.release_snapshots()
+        assert snapshot.closed
+        assert manager._store._snapshots == []
+        # A reader that took the placeholders before the release still sees
+        # every record.
+        assert len(list(entries)) == 9
+
+        path.write_bytes(b"")
+        assert manager.count_active() == 10
+        assert manager.check_consent("agent-4", "pii.email").granted
+
+        # Nothing refers to a snapshot whose agents were all merged.
+        source.export_snapshot(path)
+        manager.load_snapshot(path)
+        assert manager._store._snapshots == []
+
+    def test_load_snapshot_with_backend_journals_records(self, tmp_path: Path) -> None:
+        source = ConsentManager()
+        source.bulk_load(_consent_grants(3))
+        source.export_snapshot(tmp_path / "consent.snap")
+
+        backend = JournalBackend(tmp_path / "state.journal")
+        ConsentManager(backend=backend).load_snapshot(tmp_path / "consent.snap")
+        backend.close()
+        backend = JournalBackend(tmp_path / "state.journal")
+        try:
+            assert ConsentManager(backend=backend).count_active() == 6
+        finally:
+            backend.close()
+
+    def test_rejects_other_files(self, tmp_path: Path) -> None:
+        path = tmp_path / "not-a-snapshot"
+        path.write_bytes(b"{}\n" * 20)
+        with pytest.raises(ValueError, match="not a consent snapshot"):
+            ConsentManager().load_snapshot(path)
+
+
+# ---------------------------------------------------------------------------
+# TestAuditIndexes
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def logger() -> AuditLogger:
+    """An audit logger that has evicted 70 of its 120 varied decisions."""
+    logger = AuditLogger(AuditConfig(max_records=50))
+    outcomes = (GovernanceOutcome.ALLOW, GovernanceOutcome.DENY)
+    for i in range(120):
+        logger.log(
+            outcome=outcomes[i % 3 == 0],
+            decision=f"decision {i}",
+            context=GovernanceDecisionContext(
+                agent_id=f"agent-{i % 4}",
+                action_type="tool_call" if i % 2 else "read",
+                resource=f"res-{i % 5}",
+            ),
+        )
+    return logger
+
+
+class TestAuditIndexes:
+    def test_indexed_query_matches_linear_filter_after_eviction(self, logger: AuditLogger) -> None:
+        everything = logger.query().records
+        assert len(everything) == 50
+        assert everything[0].decision == "decision 70"
+        middle = everything[25].timestamp
+        filters = [
+            AuditFilter(agent_id="agent-1"),
+            AuditFilter(agent_id="agent-2", outcome=GovernanceOutcome.DENY),
+            AuditFilter(action_type="read", resource="res-3", limit=2, offset=1),
+            AuditFilter(resource="res-0", since=middle),
+            AuditFilter(outcome=GovernanceOutcome.ALLOW, until=middle, limit=3),
+            AuditFilter(agent_id="agent-9"),
+        ]
+        for audit_filter in filters:
+            expected = apply_filter(everything, audit_filter)
+            assert logger.query(audit_filter) == expected
+
+    def test_latest_and_clear_keep_cursors_increasing(self, logger: AuditLogger) -> None:
+        assert [r.decision for r in logger.latest(2)] == ["decision 118", "decision 119"]
+        cursor = logger.query_page(limit=1).next_cursor
+        assert cursor == 70
+        assert logger.clear() == 50
+        assert logger.query(AuditFilter(agent_id="agent-1")).total_matched == 0
+        page = logger.query_page(after=cursor)
+        assert page.records == []
+        assert page.next_cursor == 119
+        logger.log(outcome=GovernanceOutcome.ALLOW, decision="after clear")
+        assert logger.query_page(after=page.next_cursor).records[0].decision == "after clear"
+
+    def test_keyset_pages_and_iter_query(self, logger: AuditLogger) -> None:
+        audit_filter = AuditFilter(agent_id="agent-3")
+        expected = logger.query(audit_filter).records
+
+        paged = []
+        page = logger.query_page(audit_filter, limit=4)
+        paged += page.records
+        while page.has_more:
+            page = logger.query_page(audit_filter, after=page.next_cursor, limit=4)
+            paged += page.records
+        assert paged == expected
+
+        assert list(logger.iter_query(audit_filter)) == expected
+        limited = AuditFilter(agent_id="agent-3", offset=2, limit=3)
+        assert list(logger.iter_query(limited)) == expected[2:5]
+
+        # A cursor that has been evicted resumes at the oldest stored record.
+        first = logger.query_page(limit=1)
+        for _ in range(60):
+            logger.log(outcome=GovernanceOutcome.ALLOW, decision="filler")
+        resumed = logger.query_page(after=first.next_cursor, limit=1)
+        assert resumed.records[0].decision == "filler"
+
+    def test_deferred_entries_are_indexed(self, engine_with_agent: GovernanceEngine) -> None:
+        action = GovernanceAction(agent_id="agent-001", action_type="tool_call", resource="db")
+        lean = engine_with_agent.evaluate_lean(action)
+        matched = engine_with_agent.audit.query(AuditFilter(resource="db"))
+        assert [r.record_id for r in matched.records] == [lean.audit_record_id]
+        assert engine_with_agent.audit.query(AuditFilter(resource="other")).records == []
+
+    def test_out_of_order_timestamps_fall_back_to_scanning(self) -> None:
+        logger = AuditLogger()
+        now = datetime.now(tz=timezone.utc)
+        late = create_record(GovernanceOutcome.ALLOW, "late")
+        early = create_record(GovernanceOutcome.ALLOW, "early").model_copy(
+            update={"timestamp": now - timedelta(hours=1)}
+        )
+        logger.log_entries([late, early])
+        result = logger.query(AuditFilter(since=now - timedelta(minutes=1)))
+        assert [r.decision for r in result.records] == ["late"]
+        assert logger.query(AuditFilter(until=now - timedelta(minutes=1))).total_matched == 1
+
+
+# ---------------------------------------------------------------------------
+# TestAuditSpill
+# ---------------------------------------------------------------------------
+
+
+def _log_decisions(logger: AuditLogger, count: int, start: int = 0) -> list[object]:
+    """Log ``count`` decisions numbered from ``start`` across four agents."""
+    return [
+        logger.log(
+            outcome=GovernanceOutcome.DENY if i % 3 == 0 else GovernanceOutcome.ALLOW,
+            decision=f"decision {i}",
+            context=GovernanceDecisionContext(agent_id=f"agent-{i % 4}", resource="db"),
+        )
+        for i in range(start, start + count)
+    ]
+
+
+class TestAuditSpill:
+    @pytest.fixture
+    def spill_config(self, tmp_path: Path) -> AuditConfig:
+        spill = AuditSpillConfig(directory=str(tmp_path), segment_max_bytes=4096)
+        return AuditConfig(max_records=10, spill=spill)
+
+    def test_queries_span_memory_and_segments(
+        self, tmp_path: Path, spill_config: AuditConfig
+    ) -> None:
+        logger = AuditLogger(spill_config)
+        records = _log_decisions(logger, 100)
+        assert logger.count() == 100
+        assert len(list(tmp_path.glob("audit-*.meta.json"))) >= 2
+        assert logger.query().records == records
+
+        middle = records[50].timestamp
+        for audit_filter in (
+            AuditFilter(agent_id="agent-1"),
+            AuditFilter(outcome=GovernanceOutcome.DENY, limit=5, offset=3),
+            AuditFilter(agent_id="agent-2", since=middle),
+            AuditFilter(resource="db", until=middle, limit=7),
+        ):
+            assert logger.query(audit_filter) == apply_filter(records, audit_filter)
+
+        assert logger.latest(15) == records[-15:]
+        assert list(logger.iter_query(AuditFilter(agent_id="agent-3"))) == [
+            r for r in records if r.context.agent_id == "agent-3"
+        ]
+        paged = []
+        page = logger.query_page(limit=7)
+        paged += page.records
+        while page.has_more:
+            page = logger.query_page(after=page.next_cursor, limit=7)
+            paged += page.records
+        assert paged == records
+        assert page.next_cursor == 99
+
+    def test_segments_are_skipped_by_time_and_agent(
+        self, tmp_path: Path, spill_config: AuditConfig
+    ) -> None:
+        logger = AuditLogger(spill_config)
+        records = _log_decisions(logger, 100)
+        assert logger.count() == 100
+        spill = logger._spill
+        assert spill is not None
+        every = spill.candidates(AuditFilter(), -1, 90)
+        assert len(every) >= 2
+        assert spill.candidates(AuditFilter(agent_id="agent-unknown"), -1, 90) == []
+        assert spill.candidates(AuditFilter(since=records[89].timestamp), -1, 90) == every[-1:]
+
+    def test_close_and_reopen_keeps_records_and_cursors(self, spill_config: AuditConfig) -> None:
+        logger = AuditLogger(spill_config)
+        records = _log_decisions(logger, 30)
+        logger.close()
+        assert logger.count() == 30
+
+        reopened = AuditLogger(spill_config)
+        assert reopened.query().records == records
+        records += _log_decisions(reopened, 5, start=30)
+        assert reopened.query_page(after=29).records == records[30:]
+        assert reopened.count() == 35
+
+    def test_unsealed_segment_is_recovered(
+        self, tmp_path: Path, spill_config: AuditConfig
+    ) -> None:
+        large_segments = AuditSpillConfig(directory=str(tmp_path), segment_max_bytes=10**6)
+        logger = AuditLogger(AuditConfig(max_records=10, spill=large_segments))
+        records = _log_decisions(logger, 25)
+        assert logger.count() == 25
+        spill = logger._spill
+        assert spill is not None and spill._file is not None
+        spill._file.write(b'{"record_id": "torn')
+        spill._file.flush()
+        assert not list(tmp_path.glob("audit-*.meta.json"))
+
+        reopened = AuditLogger(spill_config)
+        assert reopened.count() == 15
+        assert reopened.query().records == records[:15]
+        assert len(list(tmp_path.glob("audit-*.meta.json"))) == 1
+
+    def test_evictions_are_written_in_batches(self, tmp_path: Path) -> None:
+        spill = AuditSpillConfig(directory=str(tmp_path), batch_size=4)
+        logger = AuditLogger(AuditConfig(max_records=10, spill=spill))
+        records = _log_decisions(logger, 15)
+        # Five evicted, one batch of four written.
+        (segment,) = tmp_path.glob("audit-*.jsonl")
+        assert len(segment.read_bytes().splitlines()) == 4
+        assert logger.latest(15) == records
+        assert len(segment.read_bytes().splitlines()) == 5
+        # Clearing drops records 5-14; later evictions start a new segment.
+        logger.clear()
+        records += _log_decisions(logger, 12, start=15)
+        assert logger.query().records == records[:5] + records[15:]
+
+
+# ---------------------------------------------------------------------------
+# TestAuditStats
+# ---------------------------------------------------------------------------
+
+
+class TestAuditStats:
+    def test_running_counts_match_aggregate_after_eviction(self, logger: AuditLogger) -> None:
+        records = logger.query().records
+        stats = logger.stats()
+        expected = aggregate_outcomes(records)
+        assert {key: stats[key] for key in expected} == expected
+        assert stats["by_agent"] == Counter(r.context.agent_id for r in records)
+        assert stats["by_action_type"] == Counter(r.context.action_type for r in records)
+        assert "window" not in stats
+
+        logger.clear()
+        assert logger.stats()["total"] == 0
+        assert logger.stats()["by_agent"] == {}
+
+    def test_sliding_window_counts_recent_minutes(self) -> None:
+        logger = AuditLogger()
+        now = datetime.now(tz=timezone.utc)
+        old = [
+            create_record(GovernanceOutcome.DENY, "old").model_copy(
+                update={"timestamp": now - timedelta(hours=2)}
+            )
+            for _ in range(5)
+        ]
+        logger.log_entries(old)
+        logger.log(GovernanceOutcome.DENY, "recent")
+        logger.log(GovernanceOutcome.ALLOW, "recent")
+        logger.log(GovernanceOutcome.ALLOW, "recent")
+
+        stats = logger.stats(window_minutes=5)
+        assert stats["total"] == 8
+        assert stats["deny"] == 6
+        window = stats["window"]
+        assert (window["total"], window["deny"], window["allow"]) == (3, 1, 2)
+        assert window["denial_rate"] == pytest.approx(1 / 3)
+        assert sum(minute["total"] for minute in window["per_minute"].values()) == 3
+        assert logger.stats(window_minutes=180)["window"]["total"] == 8
+
+        with pytest.raises(ValueError, match="window_minutes"):
+            logger.stats(window_minutes=0)
+
+
+# ---------------------------------------------------------------------------
+# TestChainVerification
+# ---------------------------------------------------------------------------
+
+
+def _verification_results(log: HashChainedAuditLog) -> list[tuple[bool, str | None]]:
+    """Verify ``log`` serially and in chunks, with one and two workers."""
+    return [
+        log.verify_chain(),
+        log.verify_chain(workers=1, chunk_size=7),
+        log.verify_chain(workers=2, chunk_size=7),
+    ]
+
+
+class TestChainVerification:
+    @pytest.fixture
+    def log(self) -> HashChainedAuditLog:
+        log = HashChainedAuditLog()
+        for i in range(40):
+            log.append(f"agent-{i % 3}", "tool_call", "allow", {"n": i})
+        return log
+
+    def test_intact_chain_verifies_in_parallel(self, log: HashChainedAuditLog) -> None:
+        assert _verification_results(log) == [(True, None)] * 3
+
+    def test_parallel_reports_the_same_first_break(self, log: HashChainedAuditLog) -> None:
+        chain = log._chain
+        chain[30] = dataclasses.replace(chain[30], decision="deny")
+        chain[12] = dataclasses.replace(chain[12], details={"n": -1})
+        results = _verification_results(log)
+        assert results[0][0] is False
+        assert "Record 12 " in (results[0][1] or "")
+        assert "record_hash mismatch" in (results[0][1] or "")
+        assert results[1:] == [results[0]] * 2
+
+    def test_broken_link_precedes_later_tampering(self, log: HashChainedAuditLog) -> None:
+        chain = log._chain
+        chain[25] = dataclasses.replace(chain[25], action="write")
+        del chain[9]
+        results = _verification_results(log)
+        assert "Record 9 " in (results[0][1] or "")
+        assert "previous_hash mismatch" in (results[0][1] or "")
+        assert results[1:] == [results[0]] * 2
+
+    def test_verifies_in_process_while_other_threads_run(
+        self, log: HashChainedAuditLog, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def no_pool(*args: object, **kwargs: object) -> None:
+            raise AssertionError("forked while another thread was running")
+
+        monkeypatch.setattr("aumos_governance.audit_chain.ProcessPoolExecutor", no_pool)
+        chain = log._chain
+        chain[30] = dataclasses.replace(chain[30], decision="deny")
+        stop = threading.Event()
+        thread = threading.Thread(target=stop.wait)
+        thread.start()
+        try:
+            valid, error = log.verify_chain(workers=2, chunk_size=7)
+        finally:
+            stop.set()
+            thread.join()
+        assert not valid
+        assert "Record 30 " in (error or "")
+
+    def test_rejects_invalid_worker_count(self, log: HashChainedAuditLog) -> None:
+        with pytest.raises(ValueError, match="workers"):
+            log.verify_chain(workers=0)
+
+    def test_windowed_chain_verifies_from_eviction_anchor(self) -> None:
+        log = HashChainedAuditLog(max_size=10)
+        for i in range(25):
+            log.append("agent-1", "tool_call", "allow", {"n": i})
+        assert log.verify_chain() == (True, None)
+        checkpoint = log.last_checkpoint
+        assert checkpoint is not None
+        assert checkpoint.index == 24
+
+        log._chain[0] = dataclasses.replace(log._chain[0], previous_hash="0" * 64)
+        valid, error = log.verify_chain()
+        assert not valid
+        assert "Record 15 " in (error or "")
+
+    def test_record_hash_matches_golden_digest(self) -> None:
+        digest = HashChainedAuditLog._compute_record_hash(
+            record_id="00000000-0000-4000-8000-000000000001",
+            timestamp="2026-01-01T00:00:00+00:00",
+            agent_id="agent-\u00e9",
+            action="tool_call",
+            decision="allow",
+            details={
+                "tool": "search",
+                "score": 0.5,
+                "tags": ["a", " "],
+                "nested": {"z": None, "a": True},
+            },
+            previous_hash="0" * 64,
+        )
+        assert digest == "16cfc49b8b9903c227d8fecb900e2fba110e0fcde000453b65b4e4adbf854bb7"
+
+    @pytest.mark.parametrize(
+        "details",
+        [
+            {},
+            {"n": 1, "a": [1.5, 1e16, 1e-07, float("nan"), 2**70, -0.0]},
+            {"\u65e5\u672c": "\u00e9\u2028\x00\x1f\"\\", "emoji": "\U0001f600"},
+            {"z": {"b": None, "a": [True, False, {}]}, "a": ()},
+        ],
+    )
+    def test_record_hash_matches_json_dumps(self, details: dict[str, object]) -> None:
+        fields: dict[str, object] = {
+            "record_id": "r-\u00e9",
+            "timestamp": "2026-01-01T00:00:00+00:00",
+            "agent_id": "agent\n1",
+            "action": "tool_call",
+            "decision": "deny",
+            "details": details,
+            "previous_hash": "f" * 64,
+        }
+        expected = hashlib.sha256(
+            json.dumps(fields, separators=(",", ":"), sort_keys=False).encode("utf-8")
+        ).hexdigest()
+        assert HashChainedAuditLog._compute_record_hash(**fields) == expected  # type: ignore[arg-type]
+
+
+class TestChainCheckpoints:
+    KEY = b"checkpoint-secret"
+
+    @pytest.fixture
+    def log(self) -> HashChainedAuditLog:
+        return HashChainedAuditLog(max_size=100, checkpoint_key=self.KEY)
+
+    def test_resumes_from_checkpoint_and_skips_verified_records(
+        self, log: HashChainedAuditLog
+    ) -> None:
+        for i in range(20):
+            log.append("agent-1", "tool_call", "allow", {"n": i})
+        assert log.verify_chain() == (True, None)
+        checkpoint = log.last_checkpoint
+        assert checkpoint is not None and checkpoint.signature
+
+        # Altering a record already covered by the checkpoint is not re-hashed.
+        log._chain[5] = dataclasses.replace(log._chain[5], decision="deny")
+        for i in range(5):
+            log.append("agent-2", "read", "allow", {"n": i})
+        assert log.verify_chain(since=checkpoint) == (True, None)
+        assert log.last_checkpoint is not None
+        assert log.last_checkpoint.index == 24
+        assert log.verify_chain()[0] is False
+
+        log._chain[22] = dataclasses.replace(log._chain[22], action="write")
+        valid, error = log.verify_chain(since=checkpoint, workers=2, chunk_size=2)
+        assert not valid
+        assert "Record 22 " in (error or "")
+
+    def test_rejects_forged_or_mismatched_checkpoints(self, log: HashChainedAuditLog) -> None:
+        for i in range(10):
+            log.append("agent-1", "tool_call", "allow", {"n": i})
+        log.verify_chain()
+        checkpoint = log.last_checkpoint
+        assert checkpoint is not None
+
+        forged = dataclasses.replace(checkpoint, index=3)
+        valid, error = log.verify_chain(since=forged)
+        assert not valid
+        assert "signature mismatch" in (error or "")
+
+        other = HashChainedAuditLog(checkpoint_key=self.KEY)
+        for i in range(10):
+            other.append("agent-1", "tool_call", "allow", {"n": i})
+        valid, error = other.verify_chain(since=checkpoint)
+        assert not valid
+        assert "does not match the checkpoint" in (error or "")
+
+    def test_checkpoint_older_than_window_verifies_window(self, log: HashChainedAuditLog) -> None:
+        for i in range(50):
+            log.append("agent-1", "tool_call", "allow", {"n": i})
+        log.verify_chain()
+        checkpoint = log.last_checkpoint
+        for i in range(120):
+            log.append("agent-1", "tool_call", "allow", {"n": i})
+        assert log.verify_chain(since=checkpoint) == (True, None)
+        assert log.last_checkpoint is not None
+        assert log.last_checkpoint.index == 169
+
+    def test_store_round_trips_latest_checkpoint(
+        self, tmp_path: Path, log: HashChainedAuditLog
+    ) -> None:
+        store = CheckpointStore(tmp_path / "checkpoints.jsonl")
+        assert store.latest() is None
+        for i in range(5):
+            log.append("agent-1", "tool_call", "allow", {"n": i})
+        log.verify_chain()
+        first = log.last_checkpoint
+        assert first is not None
+        store.save(first)
+        with open(tmp_path / "checkpoints.jsonl", "a") as handle:
+            handle.write('{"index": 9, "rec')
+        log.append("agent-1", "tool_call", "allow")
+        log.verify_chain(since=store.latest())
+        second = log.last_checkpoint
+        assert second is not None
+        store.save(second)
+        assert store.latest() == second
+        assert second.index == 5
+
+
+# ---------------------------------------------------------------------------
+# TestMerkleProofs
+# ---------------------------------------------------------------------------
+
+
+def _reference_root(record_hashes: list[str]) -> str:
+    """RFC 6962 Merkle tree hash, computed recursively from the leaves."""
+
+    def mth(leaves: list[bytes]) -> bytes:
+        if len(leaves) == 1:
+            return hashlib.sha256(b"\x00" + leaves[0]).digest()
+        split = 1 << ((len(leaves) - 1).bit_length() - 1)
+        return hashlib.sha256(b"\x01" + mth(leaves[:split]) + mth(leaves[split:])).digest()
+
+    return mth([bytes.fromhex(h) for h in record_hashes]).hex()
+
+
+class TestMerkleProofs:
+
+    def test_roots_and_proofs_match_reference_tree(self) -> None:
+        log = HashChainedAuditLog(merkle=MerkleAccumulator())
+        records = [log.append("agent-1", "tool_call", "allow", {"n": i}) for i in range(37)]
+        hashes = [record.record_hash for record in records]
+        roots = {size: log.merkle_root(size) for size in range(1, 38)}
+        for size in (1, 2, 5, 16, 37):
+            assert roots[size] == _reference_root(hashes[:size])
+
+        proof = log.inclusion_proof(records[20].record_id)
+        assert proof.index == 20 and proof.tree_size == 37
+        assert verify_inclusion(proof, hashes[20], roots[37])
+        assert not verify_inclusion(proof, hashes[21], roots[37])
+        assert not verify_inclusion(proof, hashes[20], roots[36])
+        for index in range(21):
+            assert verify_inclusion(
+                log.inclusion_proof(records[index].record_id, 21), hashes[index], roots[21]
+            )
+
+        for old_size in range(1, 37):
+            consistency = log.consistency_proof(old_size)
+            assert verify_consistency(consistency, roots[old_size], roots[37])
+        assert not verify_consistency(log.consistency_proof(13), roots[12], roots[37])
+
+    def test_proofs_cover_history_of_windowed_log(self) -> None:
+        merkle = MerkleAccumulator()
+        log = HashChainedAuditLog(max_size=8, merkle=merkle)
+        records = [log.append("agent-1", "tool_call", "allow") for _ in range(30)]
+        with pytest.raises(ValueError, match="No retained record"):
+            log.inclusion_proof(records[3].record_id)
+        proof = merkle.inclusion_proof(3)
+        assert verify_inclusion(proof, records[3].record_hash, log.merkle_root())
+        assert log.inclusion_proof(records[29].record_id).index == 29
+
+    def test_frontier_only_accumulator_and_missing_accumulator(self) -> None:
+        full, frontier = MerkleAccumulator(), MerkleAccumulator(retain_nodes=False)
+        log = HashChainedAuditLog()
+        for _ in range(11):
+            record_hash = log.append("agent-1", "tool_call", "allow").record_hash
+            full.append(record_hash)
+            frontier.append(record_hash)
+        assert frontier.root() == full.root()
+        with pytest.raises(ConfigurationError):
+            frontier.inclusion_proof(0)
+        with pytest.raises(ConfigurationError):
+            log.merkle_root()
+        with pytest.raises(ValueError, match="empty"):
+            HashChainedAuditLog(merkle=full)